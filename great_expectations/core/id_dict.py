@@ -1,3 +1,4 @@
+import copy
 import hashlib
 import json
 
@@ -23,6 +24,51 @@ class IDDict(dict):
         ).hexdigest()
 
 
+class FrozenIDDict(IDDict):
+    """Immutable IDDict, whose id is computed only once.
+
+    Being immutable, a FrozenIDDict is hashable (by its id) and may be shared freely; copying it (e.g., in order to
+    derive new kwargs from it) returns an ordinary, mutable IDDict.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._id = None
+
+    def to_id(self, id_keys=None, id_ignore_keys=None):
+        if id_keys is not None or id_ignore_keys is not None:
+            return super().to_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+
+        if self._id is None:
+            self._id = super().to_id()
+
+        return self._id
+
+    def __hash__(self):
+        return hash(self.to_id())
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} object does not support mutation")
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    __ior__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __copy__(self) -> IDDict:
+        return IDDict(self)
+
+    def __deepcopy__(self, memo) -> IDDict:
+        return IDDict(copy.deepcopy(dict(self), memo))
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
 class BatchKwargs(IDDict):
     pass
 
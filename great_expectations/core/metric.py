@@ -294,3 +294,42 @@ class ValidationMetricIdentifier(MetricIdentifier):
             metric_name=metric_id.metric_name,
             metric_kwargs_id=metric_id.metric_kwargs_id,
         )
+
+
+class BatchMetricIdentifier(MetricIdentifier):
+    """A BatchMetricIdentifier serves as a key to store and retrieve the metrics of a Batch, whose data is identified by
+    its fingerprint (rather than by its batch_id), so that the metrics can be reused by any run, which loads the same
+    data."""
+
+    def __init__(self, batch_fingerprint, metric_name, metric_kwargs_id) -> None:
+        super().__init__(metric_name, metric_kwargs_id)
+        self._batch_fingerprint = batch_fingerprint
+
+    @property
+    def batch_fingerprint(self):
+        return self._batch_fingerprint
+
+    def to_tuple(self):
+        return tuple(
+            (self.batch_fingerprint, self.metric_name, self.metric_kwargs_id or "__")
+        )
+
+    def to_fixed_length_tuple(self):
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 3:
+            raise GreatExpectationsError(
+                "BatchMetricIdentifier tuple must have exactly three components."
+            )
+        metric_id = MetricIdentifier.from_tuple(tuple_[-2:])
+        return cls(
+            batch_fingerprint=tuple_[0],
+            metric_name=metric_id.metric_name,
+            metric_kwargs_id=metric_id.metric_kwargs_id,
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
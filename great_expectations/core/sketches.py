@@ -0,0 +1,260 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_HYPERLOGLOG_PRECISION = 14
+DEFAULT_TDIGEST_COMPRESSION = 100
+
+
+class HyperLogLog:
+    """Mergeable HyperLogLog sketch, which estimates the number of distinct values using 2 ** precision registers
+    (i.e., in constant memory), with a relative standard error of about 1.04 / sqrt(2 ** precision).
+
+    Values are hashed to 64 bits: the leading "precision" bits of each hash select a register, which keeps the longest
+    run of leading zeros (plus one) observed among the remaining bits.  Sketches of the same precision built over
+    separate parts of the data can be merged into the sketch of the whole data (by taking register-wise maxima).
+    """
+
+    def __init__(self, precision: int = DEFAULT_HYPERLOGLOG_PRECISION) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError(
+                f"HyperLogLog precision must be between 4 and 18 (got {precision})."
+            )
+
+        self._precision = precision
+        self._registers = np.zeros(2**precision, dtype=np.uint8)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def num_registers(self) -> int:
+        return len(self._registers)
+
+    @property
+    def relative_error(self) -> float:
+        """The relative standard error of the estimate."""
+        return self.get_relative_error(precision=self._precision)
+
+    @staticmethod
+    def get_relative_error(precision: int = DEFAULT_HYPERLOGLOG_PRECISION) -> float:
+        """Returns the relative standard error of the estimates of sketches of the given precision."""
+        return 1.04 / math.sqrt(2**precision)
+
+    def update(self, values: pd.Series) -> "HyperLogLog":
+        """Adds the (non-null) values of the Series to the sketch."""
+        values = values[values.notnull()]
+        if len(values) > 0:
+            self.update_hashes(
+                hashes=pd.util.hash_pandas_object(values, index=False).to_numpy(
+                    dtype=np.uint64
+                )
+            )
+
+        return self
+
+    def update_hashes(self, hashes: np.ndarray) -> "HyperLogLog":
+        """Adds the values with the given (uniformly distributed, unsigned 64-bit) hashes to the sketch."""
+        num_remaining_bits: int = 64 - self._precision
+        register_indices: np.ndarray = (hashes >> np.uint64(num_remaining_bits)).astype(
+            np.int64
+        )
+        remaining_bits: np.ndarray = hashes & np.uint64((1 << num_remaining_bits) - 1)
+        ranks: np.ndarray = (
+            num_remaining_bits - _bit_length(values=remaining_bits) + 1
+        ).astype(np.uint8)
+        np.maximum.at(self._registers, register_indices, ranks)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Merges the other sketch (of the same precision) into this one."""
+        if other.precision != self._precision:
+            raise ValueError(
+                f"Cannot merge HyperLogLog sketches of different precisions ({self._precision} and {other.precision})."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def estimate(self) -> int:
+        """Estimates the number of distinct values added to the sketch."""
+        num_registers: int = self.num_registers
+        alpha: float = 0.7213 / (1 + 1.079 / num_registers)
+        estimate: float = (
+            alpha
+            * num_registers**2
+            / np.sum(np.power(2.0, -self._registers.astype(np.float64)))
+        )
+        num_empty_registers: int = int(np.count_nonzero(self._registers == 0))
+        if estimate <= 2.5 * num_registers and num_empty_registers > 0:
+            # Small range correction (linear counting)
+            estimate = num_registers * math.log(num_registers / num_empty_registers)
+
+        return int(round(estimate))
+
+    @classmethod
+    def from_series(
+        cls, values: pd.Series, precision: Optional[int] = None
+    ) -> "HyperLogLog":
+        if precision is None:
+            precision = DEFAULT_HYPERLOGLOG_PRECISION
+
+        return cls(precision=precision).update(values=values)
+
+
+class TDigest:
+    """Mergeable t-digest sketch, which summarizes a distribution of numbers by at most about "compression" centroids
+    (weighted means), so that its quantiles can be estimated in constant memory.
+
+    Centroids are small near the tails of the distribution and large near its median (their sizes are bounded by the
+    arcsine scale function), so that extreme quantiles are estimated with a small relative error.  As long as no more
+    than "compression" values have been added, every value is kept as a centroid of its own, and quantiles are exact.
+    Sketches built over separate parts of the data can be merged into the sketch of the whole data.
+    """
+
+    def __init__(self, compression: int = DEFAULT_TDIGEST_COMPRESSION) -> None:
+        if compression < 20:
+            raise ValueError(
+                f"TDigest compression must be at least 20 (got {compression})."
+            )
+
+        self._compression = compression
+        self._means = np.empty(0, dtype=np.float64)
+        self._weights = np.empty(0, dtype=np.float64)
+        self._buffer: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._buffer_size = 0
+        self._min = math.inf
+        self._max = -math.inf
+
+    @property
+    def compression(self) -> int:
+        return self._compression
+
+    @property
+    def count(self) -> int:
+        """The number of values added to the sketch."""
+        self._compress()
+        return int(self._weights.sum())
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether every value added to the sketch is still kept as a centroid of its own."""
+        self._compress()
+        return bool(np.all(self._weights == 1))
+
+    @property
+    def centroids(self) -> Tuple[np.ndarray, np.ndarray]:
+        """The means and the weights of the centroids, in ascending order of means."""
+        self._compress()
+        return self._means.copy(), self._weights.copy()
+
+    def update(self, values: pd.Series) -> "TDigest":
+        """Adds the (non-null, numeric) values of the Series to the sketch."""
+        values = values[values.notnull()]
+        if len(values) > 0:
+            self.update_values(values=values.to_numpy(dtype=np.float64))
+
+        return self
+
+    def update_values(self, values: np.ndarray) -> "TDigest":
+        """Adds the (non-null) values of the array to the sketch."""
+        if len(values) > 0:
+            self._add_centroids(means=values, weights=np.ones(len(values)))
+
+        return self
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """Merges the other sketch into this one."""
+        means, weights = other.centroids
+        if len(means) > 0:
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+            self._add_centroids(means=means, weights=weights)
+
+        return self
+
+    def quantile(self, q: float) -> float:
+        """Estimates the q-th quantile (0 <= q <= 1) of the values added to the sketch (NaN if there are none)."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantiles must be between 0 and 1 (got {q}).")
+
+        self._compress()
+        total_weight: float = self._weights.sum()
+        if total_weight == 0:
+            return np.nan
+
+        # Interpolate between the centers (in cumulative weight) of adjacent centroids, anchoring the ends of the
+        # distribution at the exact minimum and maximum.
+        centers: np.ndarray = np.cumsum(self._weights) - self._weights / 2
+        return float(
+            np.interp(
+                q * total_weight,
+                np.concatenate(([0.0], centers, [total_weight])),
+                np.concatenate(([self._min], self._means, [self._max])),
+            )
+        )
+
+    @classmethod
+    def from_series(
+        cls, values: pd.Series, compression: Optional[int] = None
+    ) -> "TDigest":
+        if compression is None:
+            compression = DEFAULT_TDIGEST_COMPRESSION
+
+        return cls(compression=compression).update(values=values)
+
+    def _add_centroids(self, means: np.ndarray, weights: np.ndarray) -> None:
+        self._min = min(self._min, float(np.min(means)))
+        self._max = max(self._max, float(np.max(means)))
+        self._buffer.append((means, weights))
+        self._buffer_size += len(means)
+        if self._buffer_size >= 10 * self._compression:
+            self._compress()
+
+    def _compress(self) -> None:
+        if not self._buffer:
+            return
+
+        means: np.ndarray = np.concatenate(
+            [self._means] + [means for means, _ in self._buffer]
+        )
+        weights: np.ndarray = np.concatenate(
+            [self._weights] + [weights for _, weights in self._buffer]
+        )
+        self._buffer = []
+        self._buffer_size = 0
+
+        order: np.ndarray = np.argsort(means, kind="mergesort")
+        means = means[order]
+        weights = weights[order]
+        if len(means) > self._compression:
+            # Centroids, the quantiles of whose centers fall into the same half-unit interval of the arcsine scale
+            # function k(q) = compression / (2 * pi) * arcsin(2 * q - 1), are merged into one.
+            total_weight: float = weights.sum()
+            quantiles: np.ndarray = (np.cumsum(weights) - weights / 2) / total_weight
+            scale: np.ndarray = (
+                self._compression / (2 * math.pi) * np.arcsin(2 * quantiles - 1)
+            )
+            _, group_indices = np.unique(np.floor(2 * scale), return_inverse=True)
+            group_weights: np.ndarray = np.bincount(group_indices, weights=weights)
+            means = np.bincount(group_indices, weights=means * weights) / group_weights
+            weights = group_weights
+
+        self._means = means
+        self._weights = weights
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Returns the number of bits needed to represent each of the (unsigned 64-bit) values."""
+    values = values.copy()
+    bit_lengths: np.ndarray = np.zeros(len(values), dtype=np.int64)
+    for shift in (32, 16, 8, 4, 2, 1):
+        is_wider: np.ndarray = values >= np.uint64(1 << shift)
+        bit_lengths[is_wider] += shift
+        values[is_wider] >>= np.uint64(shift)
+
+    bit_lengths += values > 0
+    return bit_lengths
@@ -0,0 +1,218 @@
+"""
+Process-wide registry of shared SqlAlchemy engines, so that execution engines and store backends connecting to the same
+database (with the same credentials and engine options) share a single connection pool, rather than each opening their
+own (and paying for the connection and authentication handshakes anew).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from great_expectations.util import get_sqlalchemy_url, import_make_url
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+
+    make_url = import_make_url()
+except ImportError:
+    sa = None
+    make_url = None
+
+# Shared engines hold on to their connections for long, so that connections are tested for liveness upon checkout.
+DEFAULT_POOL_PRE_PING = True
+
+
+class _RegisteredEngine:
+    def __init__(self, key: str, engine: "sa.engine.Engine") -> None:
+        self.key = key
+        self.engine = engine
+        self.ref_count = 0
+
+
+class SqlAlchemyEngineRegistry:
+    """Registry of shared, pooled SqlAlchemy engines, keyed by the normalized URL (password masked), and a hash of the
+    credentials (password, and any other secrets, e.g., of key-pair authentication) and of the create_engine options.
+
+    Engines are reference counted: each "get_engine()" must be balanced by a "release()" (e.g., in the "close()" of the
+    execution engine or store backend); an engine is disposed once it is no longer used.  "close()" disposes of all
+    engines (e.g., at the end of a process, or of a test).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._registered_engines: Dict[str, _RegisteredEngine] = {}
+
+    def get_engine(
+        self,
+        url: Any,
+        engine_factory: Optional[Callable[..., "sa.engine.Engine"]] = None,
+        secrets: Optional[dict] = None,
+        **create_engine_kwargs,
+    ) -> "sa.engine.Engine":
+        """Returns the shared engine of the url (and secrets, and create_engine options), creating it if need be.
+
+        Args:
+            url: the SqlAlchemy URL (or connection string) of the database
+            engine_factory: creates the engine, given the create_engine_kwargs (by default, "sqlalchemy.create_engine()")
+            secrets: credentials, which are not part of the url (e.g., the private key path and passphrase)
+            **create_engine_kwargs: options of the engine (e.g., "pool_size", "pool_recycle", "pool_pre_ping")
+
+        Returns:
+            the shared SqlAlchemy Engine
+        """
+        create_engine_kwargs.setdefault("pool_pre_ping", DEFAULT_POOL_PRE_PING)
+        key: str = self.get_key(
+            url=url, secrets=secrets, create_engine_kwargs=create_engine_kwargs
+        )
+        with self._lock:
+            registered_engine: Optional[
+                _RegisteredEngine
+            ] = self._registered_engines.get(key)
+            if registered_engine is None:
+                if engine_factory is None:
+                    engine = sa.create_engine(url, **create_engine_kwargs)
+                else:
+                    engine = engine_factory(**create_engine_kwargs)
+                registered_engine = _RegisteredEngine(key=key, engine=engine)
+                self._registered_engines[key] = registered_engine
+                logger.debug(f"Registered shared SqlAlchemy engine {repr(engine.url)}")
+
+            registered_engine.ref_count += 1
+            return registered_engine.engine
+
+    def release(self, engine: "sa.engine.Engine") -> None:
+        """Releases an engine returned by "get_engine()"; it is disposed, once it has been released by all users."""
+        with self._lock:
+            for key, registered_engine in self._registered_engines.items():
+                if registered_engine.engine is engine:
+                    registered_engine.ref_count -= 1
+                    if registered_engine.ref_count <= 0:
+                        del self._registered_engines[key]
+                        engine.dispose()
+                    return
+
+        # Engines not (or no longer) registered are owned by their user.
+        engine.dispose()
+
+    def close(self) -> None:
+        """Disposes of all registered engines (closing their pooled connections)."""
+        with self._lock:
+            for registered_engine in self._registered_engines.values():
+                registered_engine.engine.dispose()
+            self._registered_engines.clear()
+
+    def __contains__(self, engine: "sa.engine.Engine") -> bool:
+        with self._lock:
+            return any(
+                registered_engine.engine is engine
+                for registered_engine in self._registered_engines.values()
+            )
+
+    def __len__(self) -> int:
+        return len(self._registered_engines)
+
+    @staticmethod
+    def get_key(
+        url: Any, secrets: Optional[dict] = None, create_engine_kwargs: dict = None
+    ) -> str:
+        """Returns the key of the url (the password of which is masked), and of the hash of the credentials and of the
+        create_engine options (so that no secret is held in the key itself)."""
+        url = make_url(url)
+        digest: str = hashlib.sha256(
+            json.dumps(
+                {
+                    "password": url.password,
+                    "secrets": secrets or {},
+                    "create_engine_kwargs": create_engine_kwargs or {},
+                },
+                sort_keys=True,
+                default=repr,
+            ).encode("utf-8")
+        ).hexdigest()
+        return f"{repr(url)}#{digest}"
+
+
+sqlalchemy_engine_registry = SqlAlchemyEngineRegistry()
+
+
+def create_sqlalchemy_engine(
+    url: Any,
+    shared: bool = False,
+    engine_factory: Optional[Callable[..., "sa.engine.Engine"]] = None,
+    secrets: Optional[dict] = None,
+    **create_engine_kwargs,
+) -> "sa.engine.Engine":
+    """Creates the SqlAlchemy engine of the url, or obtains it from the SqlAlchemyEngineRegistry (if shared).
+
+    Args:
+        url: the SqlAlchemy URL (or connection string) of the database
+        shared: whether the engine is shared (it must then be released, rather than disposed, by its user)
+        engine_factory: creates the engine, given the create_engine_kwargs (by default, "sqlalchemy.create_engine()")
+        secrets: credentials, which are not part of the url (e.g., the private key path and passphrase)
+        **create_engine_kwargs: options of the engine (e.g., "pool_size", "pool_recycle", "pool_pre_ping")
+
+    Returns:
+        the SqlAlchemy Engine
+    """
+    if shared:
+        return sqlalchemy_engine_registry.get_engine(
+            url=url,
+            engine_factory=engine_factory,
+            secrets=secrets,
+            **create_engine_kwargs,
+        )
+
+    if engine_factory is None:
+        return sa.create_engine(url, **create_engine_kwargs)
+
+    return engine_factory(**create_engine_kwargs)
+
+
+def create_key_pair_auth_sqlalchemy_engine(
+    drivername: str,
+    credentials: dict,
+    secrets: dict,
+    get_key_pair_auth_url: Callable[[str, dict], Tuple[Any, dict]],
+    shared: bool = False,
+    **create_engine_kwargs,
+) -> "sa.engine.Engine":
+    """Creates the SqlAlchemy engine of key-pair authentication (see "create_sqlalchemy_engine()").
+
+    Decrypting the private key is slow; shared engines only do so once, when they are created.
+
+    Args:
+        drivername: the name of the driver class
+        credentials: the database credentials, other than the secrets
+        secrets: the private key path and passphrase
+        get_key_pair_auth_url: returns the url with the serialized key-pair authentication, and a dictionary of engine
+            kwargs (the "connect_args" of which are added to those of the create_engine_kwargs), given the drivername
+            and all credentials
+        shared: whether the engine is shared
+        **create_engine_kwargs: options of the engine
+
+    Returns:
+        the SqlAlchemy Engine
+    """
+
+    def _create_key_pair_auth_engine(**kwargs) -> "sa.engine.Engine":
+        (
+            options,
+            key_pair_create_engine_kwargs,
+        ) = get_key_pair_auth_url(drivername, {**credentials, **secrets})
+        kwargs["connect_args"] = {
+            **kwargs.get("connect_args", {}),
+            **key_pair_create_engine_kwargs["connect_args"],
+        }
+        return sa.create_engine(options, **kwargs)
+
+    return create_sqlalchemy_engine(
+        get_sqlalchemy_url(drivername, **credentials),
+        shared=shared,
+        engine_factory=_create_key_pair_auth_engine,
+        secrets=secrets,
+        **create_engine_kwargs,
+    )
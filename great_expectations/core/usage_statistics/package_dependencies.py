@@ -70,6 +70,8 @@ class GEDependencies:
             "azure-storage-blob",
             "black",
             "boto3",
+            "duckdb",
+            "duckdb-engine",
             "feather-format",
             "flake8",
             "flask",
@@ -69,6 +69,7 @@ from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import Store, TupleStoreBackend
+from great_expectations.data_context.store.batch_metrics_store import BatchMetricsStore
 from great_expectations.data_context.store.expectations_store import ExpectationsStore
 from great_expectations.data_context.store.profiler_store import ProfilerStore
 from great_expectations.data_context.store.validations_store import ValidationsStore
@@ -582,6 +583,15 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
         self.config["stores"][store_name] = store_config
         return self._build_store_from_config(store_name, store_config)
 
+    def close(self) -> None:
+        """Releases the resources held by the Stores of the DataContext (e.g., the engines of database-backed Stores).
+
+        The DataContext should not be used after it has been closed.
+        """
+        for store in self._stores.values():
+            if isinstance(store, Store):
+                store.close()
+
     def add_validation_operator(
         self, validation_operator_name: str, validation_operator_config: dict
     ) -> "ValidationOperator":
@@ -859,6 +869,28 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
                 f'Attempted to access the Profiler store named "{profiler_store_name}", which is not a configured store.'
             )
 
+    @property
+    def batch_metrics_store_name(self) -> Optional[str]:
+        """The name of the (opt-in) Batch Metrics Store, in which resolved metrics are persisted between runs."""
+        return getattr(
+            self.project_config_with_variables_substituted,
+            "batch_metrics_store_name",
+            None,
+        )
+
+    @property
+    def batch_metrics_store(self) -> Optional[BatchMetricsStore]:
+        batch_metrics_store_name: Optional[str] = self.batch_metrics_store_name
+        if batch_metrics_store_name is None:
+            return None
+
+        try:
+            return self.stores[batch_metrics_store_name]
+        except KeyError:
+            raise ge_exceptions.StoreConfigurationError(
+                f'Attempted to access the Batch Metrics store named "{batch_metrics_store_name}", which is not a configured store.'
+            )
+
     @staticmethod
     def _default_profilers_exist(directory_path: Optional[str]) -> bool:
         if not directory_path:
@@ -2029,6 +2061,7 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
             evaluation_parameter_store_name,
             checkpoint_store_name
             profiler_store_name
+            batch_metrics_store_name
         """
         active_store_names: List[str] = [
             self.expectations_store_name,
@@ -2050,6 +2083,9 @@ class BaseDataContext(EphemeralDataContext, ConfigPeer):
                 "Profiler store is not configured; omitting it from active stores"
             )
 
+        if self.batch_metrics_store_name is not None:
+            active_store_names.append(self.batch_metrics_store_name)
+
         return [
             store for store in self.list_stores() if store["name"] in active_store_names
         ]
@@ -21,6 +21,7 @@ from .metric_store import (  # isort:skip
     EvaluationParameterStore,
     MetricStore,
 )
+from .batch_metrics_store import BatchMetricsStore  # isort:skip
 from .expectations_store import ExpectationsStore  # isort:skip
 from .validations_store import ValidationsStore  # isort:skip
 from .query_store import SqlAlchemyQueryStore  # isort:skip
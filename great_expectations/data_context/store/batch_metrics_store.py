@@ -0,0 +1,126 @@
+import json
+from typing import Any
+
+import numpy as np
+
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store.database_store_backend import (
+    DatabaseStoreBackend,
+)
+from great_expectations.data_context.store.store import Store
+from great_expectations.util import (
+    filter_properties_dict,
+    load_class,
+    verify_dynamic_loading_support,
+)
+
+
+class BatchMetricsStore(Store):
+    """
+    A BatchMetricsStore (BMS) persists resolved metric values between runs, keyed by the fingerprint of the data of
+    the Batch they were computed from, so that re-validating an unchanged Batch reuses the metrics already computed.
+
+    Metric values are stored as JSON (like by the MetricStore), so that reading a shared store backend never runs code.
+    Values composed of JSON types, NumPy scalars, and NumPy arrays (of booleans, numbers, or strings) are restored as
+    they were; other values (e.g., dates, or Decimal values returned by databases) cannot be stored, and are computed
+    again.
+    """
+
+    _key_class = BatchMetricIdentifier
+
+    def __init__(self, store_backend=None, store_name=None) -> None:
+        if store_backend is not None:
+            store_backend_module_name = store_backend.get(
+                "module_name", "great_expectations.data_context.store"
+            )
+            store_backend_class_name = store_backend.get(
+                "class_name", "InMemoryStoreBackend"
+            )
+            verify_dynamic_loading_support(module_name=store_backend_module_name)
+            store_backend_class = load_class(
+                store_backend_class_name, store_backend_module_name
+            )
+
+            if issubclass(store_backend_class, DatabaseStoreBackend):
+                # Provide defaults for this common case
+                if "table_name" not in store_backend:
+                    store_backend["table_name"] = "ge_batch_metrics"
+                if "key_columns" not in store_backend:
+                    store_backend["key_columns"] = [
+                        "batch_fingerprint",
+                        "metric_name",
+                        "metric_kwargs_id",
+                    ]
+
+        super().__init__(store_backend=store_backend, store_name=store_name)
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": store_backend,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    def serialize(self, key, value):
+        return json.dumps({"value": _encode_metric_value(value)})
+
+    def deserialize(self, key, value):
+        if value:
+            return _decode_metric_value(json.loads(value)["value"])
+
+    @property
+    def config(self) -> dict:
+        return self._config
+
+
+# Kinds of the NumPy dtypes stored: booleans, signed and unsigned integers, floats, and strings.
+_NUMPY_DTYPE_KINDS = "biufU"
+
+_NDARRAY_KEY = "__ndarray__"
+
+
+def _encode_metric_value(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    if isinstance(value, np.generic) and value.dtype.kind in _NUMPY_DTYPE_KINDS:
+        return value.item()
+
+    if isinstance(value, np.ndarray) and value.dtype.kind in _NUMPY_DTYPE_KINDS:
+        return {_NDARRAY_KEY: value.tolist(), "dtype": value.dtype.str}
+
+    if isinstance(value, list):
+        return [_encode_metric_value(element) for element in value]
+
+    if (
+        isinstance(value, dict)
+        and _NDARRAY_KEY not in value
+        and all(isinstance(name, str) for name in value)
+    ):
+        return {name: _encode_metric_value(element) for name, element in value.items()}
+
+    raise TypeError(
+        f"Metric values of type {type(value).__name__} cannot be stored in a BatchMetricsStore."
+    )
+
+
+def _decode_metric_value(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_metric_value(element) for element in value]
+
+    if isinstance(value, dict):
+        if _NDARRAY_KEY in value:
+            dtype: np.dtype = np.dtype(value["dtype"])
+            if dtype.kind not in _NUMPY_DTYPE_KINDS:
+                raise ValueError(
+                    f"Arrays of dtype {dtype} cannot be loaded from a BatchMetricsStore."
+                )
+
+            return np.array(value[_NDARRAY_KEY], dtype=dtype)
+
+        return {name: _decode_metric_value(element) for name, element in value.items()}
+
+    return value
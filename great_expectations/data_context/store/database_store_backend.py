@@ -4,6 +4,11 @@ from pathlib import Path
 from typing import Dict, Tuple
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.sqlalchemy_engine_registry import (
+    create_key_pair_auth_sqlalchemy_engine,
+    create_sqlalchemy_engine,
+    sqlalchemy_engine_registry,
+)
 from great_expectations.data_context.store.store_backend import StoreBackend
 from great_expectations.util import (
     filter_properties_dict,
@@ -39,6 +44,7 @@ class DatabaseStoreBackend(StoreBackend):
         store_name=None,
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
+        shared_engine: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -61,6 +67,10 @@ class DatabaseStoreBackend(StoreBackend):
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
+        # Whether the engine is shared (see SqlAlchemyExecutionEngine), and to be released by "close()".
+        self._shared_engine = shared_engine and engine is None
+        # An engine passed in is owned by the caller; engines created (or acquired) here are released by "close()".
+        self._owns_engine = engine is None
 
         if engine is not None:
             if credentials is not None:
@@ -72,11 +82,15 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = create_sqlalchemy_engine(
+                connection_string, shared=self._shared_engine, **kwargs
+            )
         elif url is not None:
             parsed_url = make_url(url)
             self.drivername = parsed_url.drivername
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = create_sqlalchemy_engine(
+                url, shared=self._shared_engine, **kwargs
+            )
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
@@ -137,6 +151,8 @@ class DatabaseStoreBackend(StoreBackend):
         }
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        if shared_engine:
+            self._config["shared_engine"] = shared_engine
 
     @property
     def store_backend_id(self) -> str:
@@ -169,17 +185,37 @@ class DatabaseStoreBackend(StoreBackend):
         if connect_args:
             create_engine_kwargs["connect_args"] = connect_args
 
+        self.drivername = drivername
         if "private_key_path" in credentials:
-            options, create_engine_kwargs = self._get_sqlalchemy_key_pair_auth_url(
-                drivername, credentials
+            secrets: dict = {
+                key: credentials.pop(key)
+                for key in ("private_key_path", "private_key_passphrase")
+            }
+            return create_key_pair_auth_sqlalchemy_engine(
+                drivername=drivername,
+                credentials=credentials,
+                secrets=secrets,
+                get_key_pair_auth_url=self._get_sqlalchemy_key_pair_auth_url,
+                shared=self._shared_engine,
+                **create_engine_kwargs,
             )
-        else:
-            options = get_sqlalchemy_url(drivername, **credentials)
 
-        self.drivername = drivername
+        options = get_sqlalchemy_url(drivername, **credentials)
+        return create_sqlalchemy_engine(
+            options, shared=self._shared_engine, **create_engine_kwargs
+        )
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
-        return engine
+    def close(self) -> None:
+        """Releases the engine created by the store backend (if shared, it is disposed, once no execution engine or
+        store backend uses it); an engine passed in is left to the caller.  Only the first call has an effect."""
+        if not self._owns_engine:
+            return
+
+        self._owns_engine = False
+        if self._shared_engine:
+            sqlalchemy_engine_registry.release(self.engine)
+        else:
+            self.engine.dispose()
 
     def _get_sqlalchemy_key_pair_auth_url(
         self, drivername: str, credentials: dict
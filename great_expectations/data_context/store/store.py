@@ -180,6 +180,10 @@ class Store:
                 return self._store_backend.has_key(key.to_fixed_length_tuple())
             return self._store_backend.has_key(key.to_tuple())
 
+    def close(self) -> None:
+        """Releases the resources held by the store backend."""
+        self._store_backend.close()
+
     def self_check(self, pretty_print) -> None:
         NotImplementedError(
             f"The test method is not implemented for Store class {self.__class__.__name__}."
@@ -200,6 +200,10 @@ class StoreBackend(metaclass=ABCMeta):
 
         return False
 
+    def close(self) -> None:
+        """Releases the resources held by the store backend (e.g., its database engine); nothing, by default."""
+        pass
+
     @property
     def config(self) -> dict:
         raise NotImplementedError
@@ -787,6 +787,7 @@ class ExecutionEngineConfigSchema(Schema):
         keys=fields.Str(), values=fields.Str(), required=False, allow_none=True
     )
     caching = fields.Boolean(required=False, allow_none=True)
+    metric_cache = fields.Dict(required=False, allow_none=True)
     batch_spec_defaults = fields.Dict(required=False, allow_none=True)
     force_reuse_spark_context = fields.Boolean(required=False, allow_none=True)
     # BigQuery Service Account Credentials
@@ -800,11 +801,11 @@ class ExecutionEngineConfigSchema(Schema):
         if data["class_name"][0] == "$":
             return
         if ("connection_string" in data or "credentials" in data) and not (
-            data["class_name"] == "SqlAlchemyExecutionEngine"
+            data["class_name"] in ["SqlAlchemyExecutionEngine", "DuckDBExecutionEngine"]
         ):
             raise ge_exceptions.InvalidConfigError(
                 f"""Your current configuration uses the "connection_string" key in an execution engine, but only
-SqlAlchemyExecutionEngine requires this attribute (your execution engine is "{data['class_name']}").  Please update your
+SqlAlchemyExecutionEngine (and DuckDBExecutionEngine) requires this attribute (your execution engine is "{data['class_name']}").  Please update your
 configuration to continue.
                 """
             )
@@ -1246,19 +1247,30 @@ class ProgressBarsConfigSchema(Schema):
 class ConcurrencyConfig(DictDot):
     """WARNING: This class is experimental."""
 
-    def __init__(self, enabled: bool = False) -> None:
+    def __init__(
+        self, enabled: bool = False, max_metric_resolution_workers: int = 1
+    ) -> None:
         """Initialize a concurrency configuration to control multithreaded execution.
 
         Args:
             enabled: Whether or not multithreading is enabled.
+            max_metric_resolution_workers: Max number of independent metric groups (e.g., bundled queries for separate
+                compute domains) that an ExecutionEngine may resolve concurrently.  The default of 1 resolves them
+                sequentially; values greater than 1 only take effect if multithreading is enabled.
         """
         self._enabled = enabled
+        self._max_metric_resolution_workers = max_metric_resolution_workers
 
     @property
     def enabled(self):
         """Whether or not multithreading is enabled."""
         return self._enabled
 
+    @property
+    def max_metric_resolution_workers(self) -> int:
+        """Max number of independent metric groups to resolve concurrently with multithreading."""
+        return self._max_metric_resolution_workers
+
     @property
     def max_database_query_concurrency(self) -> int:
         """Max number of concurrent database queries to execute with mulithreading."""
@@ -1292,6 +1304,7 @@ class ConcurrencyConfigSchema(Schema):
     """WARNING: This class is experimental."""
 
     enabled = fields.Boolean(default=False)
+    max_metric_resolution_workers = fields.Integer(default=1)
 
 
 class GeCloudConfig(DictDot):
@@ -1358,6 +1371,7 @@ class DataContextConfigSchema(Schema):
     evaluation_parameter_store_name = fields.Str()
     checkpoint_store_name = fields.Str(required=False, allow_none=True)
     profiler_store_name = fields.Str(required=False, allow_none=True)
+    batch_metrics_store_name = fields.Str(required=False, allow_none=True)
     plugins_directory = fields.Str(allow_none=True)
     validation_operators = fields.Dict(
         keys=fields.Str(), values=fields.Dict(), required=False, allow_none=True
@@ -2071,6 +2085,7 @@ class DataContextConfig(BaseYamlConfig):
         evaluation_parameter_store_name: Optional[str] = None,
         checkpoint_store_name: Optional[str] = None,
         profiler_store_name: Optional[str] = None,
+        batch_metrics_store_name: Optional[str] = None,
         plugins_directory: Optional[str] = None,
         validation_operators=None,
         stores: Optional[Dict] = None,
@@ -2118,6 +2133,8 @@ class DataContextConfig(BaseYamlConfig):
             self.checkpoint_store_name = checkpoint_store_name
         if profiler_store_name is not None:
             self.profiler_store_name = profiler_store_name
+        if batch_metrics_store_name is not None:
+            self.batch_metrics_store_name = batch_metrics_store_name
         self.plugins_directory = plugins_directory
         if validation_operators is not None:
             self.validation_operators = validation_operators
@@ -1,3 +1,5 @@
+from .dask_execution_engine import DaskExecutionEngine
+from .duckdb_execution_engine import DuckDBExecutionEngine
 from .execution_engine import ExecutionEngine
 from .pandas_execution_engine import PandasExecutionEngine
 from .sparkdf_execution_engine import SparkDFExecutionEngine
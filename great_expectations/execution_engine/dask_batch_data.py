@@ -0,0 +1,64 @@
+import logging
+from typing import Any, Iterator, List, Optional
+
+import pandas as pd
+
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
+
+logger = logging.getLogger(__name__)
+
+
+class DaskBatchData(ChunkedPandasBatchData):
+    """ChunkedPandasBatchData, the chunks of which are the partitions of a (lazy) dask DataFrame.
+
+    Partitions are computed by the DaskExecutionEngine in parallel (see "to_delayed()"), rather than read one at a
+    time.  The index of a partition is only that of the whole batch, if the divisions of the dask DataFrame are known
+    (e.g., for dask DataFrames built from pandas DataFrames); otherwise (e.g., the index of each partition of a CSV
+    file starts at 0), unexpected index lists are computed from the whole batch, computed into memory, which is then
+    indexed by position, if the indexes of its partitions are not unique.
+    """
+
+    def __init__(self, execution_engine, dask_dataframe: Any) -> None:
+        super().__init__(
+            execution_engine=execution_engine,
+            chunk_reader=self._iter_partitions,
+            schema_reader=lambda: dask_dataframe._meta,
+        )
+        self._dask_dataframe = dask_dataframe
+
+    @property
+    def dask_dataframe(self) -> Any:
+        """The dask DataFrame, restricted to the projected columns (if any)."""
+        if self._projected_columns is None:
+            return self._dask_dataframe
+
+        return self._dask_dataframe[self._projected_columns]
+
+    @property
+    def has_global_index(self) -> bool:
+        return bool(self._dask_dataframe.known_divisions)
+
+    def to_delayed(self) -> List[Any]:
+        """Returns the partitions of the (projected) dask DataFrame as dask "Delayed" objects."""
+        return self.dask_dataframe.to_delayed()
+
+    def _iter_partitions(
+        self, columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        dask_dataframe = self._dask_dataframe
+        if columns is not None:
+            dask_dataframe = dask_dataframe[columns]
+
+        for partition_index in range(dask_dataframe.npartitions):
+            yield dask_dataframe.get_partition(partition_index).compute()
+
+    def _read(self) -> pd.DataFrame:
+        logger.warning(
+            "Computing the whole of a dask batch into memory, since a metric cannot be computed one partition at a time."
+        )
+        dataframe: pd.DataFrame = self.dask_dataframe.compute()
+        if not dataframe.index.is_unique:
+            # The partitions are indexed on their own; rows are identified by their position in the whole batch.
+            dataframe = dataframe.reset_index(drop=True)
+
+        return dataframe
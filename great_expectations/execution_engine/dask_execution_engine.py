@@ -0,0 +1,259 @@
+import datetime
+import logging
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.batch_spec import (
+    AzureBatchSpec,
+    BatchSpec,
+    GCSBatchSpec,
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.execution_engine.dask_batch_data import DaskBatchData
+from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+    _ChunkedMetricReducer,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import dask
+    import dask.dataframe as dd
+except ImportError:
+    dask = None
+    dd = None
+    logger.debug(
+        "Unable to load dask; install optional dask dependency for support of DaskExecutionEngine"
+    )
+
+
+class DaskExecutionEngine(PandasExecutionEngine):
+    """PandasExecutionEngine, which validates (lazy) dask DataFrames, out of core and in parallel.
+
+    Files (PathBatchSpec) are read with the dask.dataframe readers, and dask DataFrames can be passed as runtime
+    batch data.  The metrics of a dask batch are computed like those of a chunked pandas batch (see "chunk_size" of
+    PandasExecutionEngine), except that the partitions are reduced in parallel: all metrics of a batch, which can be
+    computed one partition at a time (row counts, unexpected counts and values of map expectations, their unexpected
+    indexes, if the divisions of the dask DataFrame are known, schema metrics, and column aggregates implementing the
+    partial aggregate protocol), are lowered to a single dask graph, which reduces every partition and merges the
+    partial results pairwise, and which is run by a single call of "dask.compute()".  Any other metric (including
+    conditions comparing rows with one another, such as uniqueness) is computed from the whole batch, computed into
+    memory.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Builds a DaskExecutionEngine.
+
+        Args:
+            npartitions (int): The number of partitions, into which pandas DataFrames passed as runtime batch data are
+                split (by default, they are validated as they are, like by PandasExecutionEngine).
+            scheduler (str): The dask scheduler computing the metrics (e.g., "threads", "processes", "synchronous"); by
+                default, the scheduler configured for dask (or the default scheduler of dask.dataframe) is used.
+        """
+        if dask is None:
+            raise ge_exceptions.ExecutionEngineError(
+                "DaskExecutionEngine requires the dask package (pip install 'dask[dataframe]')."
+            )
+
+        npartitions: Optional[int] = kwargs.pop("npartitions", None)
+        scheduler: Optional[str] = kwargs.pop("scheduler", None)
+        if npartitions is not None and npartitions < 1:
+            raise ge_exceptions.InvalidConfigError(
+                f'The "npartitions" of DaskExecutionEngine must be a positive number ({npartitions} was given).'
+            )
+
+        self._npartitions = npartitions
+        self._scheduler = scheduler
+
+        super().__init__(*args, **kwargs)
+
+        if npartitions is not None:
+            self._config["npartitions"] = npartitions
+        if scheduler is not None:
+            self._config["scheduler"] = scheduler
+
+    def load_batch_data(self, batch_id: str, batch_data: Any) -> None:
+        if isinstance(batch_data, dd.DataFrame):
+            batch_data = DaskBatchData(execution_engine=self, dask_dataframe=batch_data)
+
+        super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+
+    def get_batch_data_and_markers(
+        self, batch_spec: BatchSpec
+    ) -> Tuple[Any, BatchMarkers]:
+        dask_dataframe: Any
+        if isinstance(batch_spec, RuntimeDataBatchSpec) and isinstance(
+            batch_spec.batch_data, dd.DataFrame
+        ):
+            dask_dataframe = batch_spec.batch_data
+            batch_spec.batch_data = "DaskDataFrame"
+        elif (
+            isinstance(batch_spec, RuntimeDataBatchSpec)
+            and isinstance(batch_spec.batch_data, pd.DataFrame)
+            and self._npartitions is not None
+        ):
+            dask_dataframe = dd.from_pandas(
+                batch_spec.batch_data, npartitions=self._npartitions
+            )
+            batch_spec.batch_data = "PandasDataFrame"
+        elif isinstance(batch_spec, PathBatchSpec) and not isinstance(
+            batch_spec, (S3BatchSpec, AzureBatchSpec, GCSBatchSpec)
+        ):
+            reader_fn: Callable = self._get_reader_fn(
+                reader_method=batch_spec.reader_method, path=batch_spec.path
+            )
+            dask_dataframe = reader_fn(
+                batch_spec.path, **(batch_spec.reader_options or {})
+            )
+        else:
+            # Cloud objects (and anything else) are read into memory, like by PandasExecutionEngine.
+            return super().get_batch_data_and_markers(batch_spec=batch_spec)
+
+        batch_markers: BatchMarkers = BatchMarkers(
+            {
+                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            }
+        )
+
+        dask_dataframe = self._apply_splitting_and_sampling_methods(
+            batch_spec, dask_dataframe
+        )
+        if isinstance(dask_dataframe, pd.DataFrame):
+            # Some sampling methods (e.g., "_sample_using_limit") compute their sample.
+            return (
+                PandasBatchData(execution_engine=self, dataframe=dask_dataframe),
+                batch_markers,
+            )
+
+        # Dask batches are not fingerprinted (doing so would require an extra pass over their data).
+        return (
+            DaskBatchData(execution_engine=self, dask_dataframe=dask_dataframe),
+            batch_markers,
+        )
+
+    def _get_reader_fn(self, reader_method=None, path=None):
+        """Returns the dask.dataframe reader function of the reader_method (guessed from the path, if not given)."""
+        if reader_method is None and path is None:
+            raise ge_exceptions.ExecutionEngineError(
+                "Unable to determine dask reader function without reader_method or path."
+            )
+
+        reader_options = {}
+        if reader_method is None:
+            path_guess = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options = path_guess.get("reader_options") or {}
+            if "compression" in reader_options:
+                # Compressed files cannot be split into blocks; each of them is read as a single partition.
+                reader_options["blocksize"] = None
+
+        try:
+            reader_fn = getattr(dd, reader_method)
+        except AttributeError:
+            raise ge_exceptions.ExecutionEngineError(
+                f'Unable to find reader_method "{reader_method}" in dask.dataframe.'
+            )
+
+        if reader_options:
+            reader_fn = partial(reader_fn, **reader_options)
+        return reader_fn
+
+    def _reduce_chunked_metrics(
+        self, batch_id: str, reducers: List[_ChunkedMetricReducer]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Computes the metrics of a dask batch in a single dask graph: every partition is reduced (by copies of the
+        reducers) in a task of its own, and the partial results are merged pairwise, in the order of the partitions."""
+        batch_data: Any = self._batch_data_dict[batch_id]
+        if not isinstance(batch_data, DaskBatchData):
+            return super()._reduce_chunked_metrics(batch_id=batch_id, reducers=reducers)
+
+        reduce_partition = dask.delayed(_reduce_partition, pure=False)
+        merge_reductions = dask.delayed(_merge_reductions, pure=False)
+        try:
+            reductions: list = [
+                reduce_partition(
+                    partition=partition,
+                    batch_id=batch_id,
+                    reducers=reducers,
+                    approximate_metrics=self.approximate_metrics,
+                )
+                for partition in batch_data.to_delayed()
+            ]
+            while len(reductions) > 1:
+                reductions = [
+                    merge_reductions(*reductions[index : index + 2])
+                    if index + 1 < len(reductions)
+                    else reductions[index]
+                    for index in range(0, len(reductions), 2)
+                ]
+
+            reduced_reducers: List[_ChunkedMetricReducer]
+            schema: pd.DataFrame
+            ((reduced_reducers, schema),) = dask.compute(
+                *reductions, scheduler=self._scheduler
+            )
+
+            schema_engine = PandasExecutionEngine(
+                caching=False, approximate_metrics=self.approximate_metrics
+            )
+            schema_engine.load_batch_data(
+                batch_id=batch_id,
+                batch_data=batch_data.get_schema(projected_schema=schema),
+            )
+            return {
+                reducer.metric_configuration.id: reducer.finalize(
+                    execution_engine=schema_engine
+                )
+                for reducer in reduced_reducers
+            }
+        except Exception as e:
+            raise ge_exceptions.MetricResolutionError(
+                message=str(e),
+                failed_metrics=[reducer.metric_configuration for reducer in reducers],
+            )
+
+
+def _reduce_partition(
+    partition: pd.DataFrame,
+    batch_id: str,
+    reducers: List[_ChunkedMetricReducer],
+    approximate_metrics: bool,
+) -> Tuple[List[_ChunkedMetricReducer], pd.DataFrame]:
+    """Reduces the partition (loaded, under the batch_id, into an engine of its own) by copies of the reducers;
+    returns the copies and the (empty) schema of the partition."""
+    partition_engine = PandasExecutionEngine(
+        caching=False, approximate_metrics=approximate_metrics
+    )
+    partition_engine.load_batch_data(batch_id=batch_id, batch_data=partition)
+    partition_reducers: List[_ChunkedMetricReducer] = [
+        reducer.copy() for reducer in reducers
+    ]
+    # Map metrics shared by several reducers are evaluated only once per partition.
+    evaluated: Dict[Tuple[str, str, str], Any] = {}
+    for reducer in partition_reducers:
+        reducer.update(execution_engine=partition_engine, evaluated=evaluated)
+
+    return partition_reducers, partition.iloc[:0]
+
+
+def _merge_reductions(
+    left: Tuple[List[_ChunkedMetricReducer], pd.DataFrame],
+    right: Tuple[List[_ChunkedMetricReducer], pd.DataFrame],
+) -> Tuple[List[_ChunkedMetricReducer], pd.DataFrame]:
+    """Merges the reductions of two consecutive runs of partitions (left preceding right)."""
+    left_reducers, left_schema = left
+    right_reducers, right_schema = right
+    for left_reducer, right_reducer in zip(left_reducers, right_reducers):
+        left_reducer.merge(right_reducer)
+
+    return left_reducers, pd.concat([left_schema, right_schema])
@@ -0,0 +1,195 @@
+import logging
+import re
+from typing import Any, Optional, Tuple
+
+from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    SqlAlchemyDatasourceBatchSpec,
+)
+from great_expectations.exceptions import ExecutionEngineError
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.util import (
+    filter_properties_dict,
+    generate_temporary_table_name,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+except ImportError:
+    sa = None
+
+# DuckDB table functions, which scan files in place (in parallel, and without loading them into memory as a whole).
+DUCKDB_READER_METHODS = (
+    "read_csv",
+    "read_csv_auto",
+    "read_json",
+    "read_json_auto",
+    "read_parquet",
+)
+
+# Keys of PathBatchSpec, which describe how to read the file (rather than how to split or sample the batch).
+_PATH_BATCH_SPEC_KEYS = ("path", "reader_method", "reader_options")
+
+_OPTION_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+class DuckDBExecutionEngine(SqlAlchemyExecutionEngine):
+    """SqlAlchemyExecutionEngine, which validates local (or remote, given the respective DuckDB extensions) CSV,
+    parquet, and JSON files in an embedded DuckDB database, in process and without any external service.
+
+    Files (PathBatchSpec, as built by the filesystem data connectors) are exposed to the metrics as temporary views
+    over DuckDB table functions (e.g., "read_parquet", "read_csv_auto"), so that every metric query scans the file
+    itself, multi-threaded, and out of core; all metrics are computed by the SqlAlchemyExecutionEngine implementations.
+    Setting "create_temp_table" (for the engine, or in the batch_spec) materializes each batch in DuckDB instead.
+
+    DuckDB is accessed through its SQLAlchemy driver ("duckdb_engine" package).
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        database: str = ":memory:",
+        engine=None,
+        connection_string: Optional[str] = None,
+        create_temp_table: bool = False,
+        threads: Optional[int] = None,
+        memory_limit: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """Builds a DuckDBExecutionEngine.
+
+        Args:
+            name (str): The name of the DuckDBExecutionEngine
+            database (str): The path of the DuckDB database file (by default, an in-memory database is used); ignored,
+                if an engine, credentials, connection_string, or url are given.
+            engine (Engine): A SqlAlchemy Engine of a DuckDB database, which should be reused.
+            connection_string (str): A SqlAlchemy connection string (e.g., "duckdb:///path/to/database.duckdb").
+            create_temp_table (bool): If True, batches are materialized as temporary tables (rather than scanned in
+                place for every metric query).
+            threads (int): The number of threads DuckDB uses (by default, the number of cores).
+            memory_limit (str): The amount of memory DuckDB may use (e.g., "4GB"), beyond which it spills to disk.
+        """
+        if (
+            engine is None
+            and connection_string is None
+            and kwargs.get("credentials") is None
+            and kwargs.get("url") is None
+        ):
+            connection_string = f"duckdb:///{database}"
+
+        super().__init__(
+            name=name,
+            engine=engine,
+            connection_string=connection_string,
+            create_temp_table=create_temp_table,
+            **kwargs,
+        )
+
+        if threads is not None:
+            self.engine.execute(sa.text(f"SET threads TO {int(threads)}"))
+        if memory_limit is not None:
+            self.engine.execute(
+                sa.text(f"SET memory_limit = {_render_literal(value=memory_limit)}")
+            )
+
+        self._config.update(
+            {
+                "database": database if database != ":memory:" else None,
+                "create_temp_table": create_temp_table,
+                "threads": threads,
+                "memory_limit": memory_limit,
+            }
+        )
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    @staticmethod
+    def guess_reader_method_from_path(path: str) -> str:
+        """Returns the DuckDB table function, which reads the file at the given path (based on its extension)."""
+        if path.endswith((".csv", ".tsv", ".csv.gz", ".tsv.gz")):
+            return "read_csv_auto"
+        elif path.endswith(".parquet"):
+            return "read_parquet"
+        elif path.endswith((".json", ".jsonl", ".ndjson")):
+            return "read_json_auto"
+
+        raise ExecutionEngineError(
+            f'Unable to determine DuckDB reader method from path: "{path}".'
+        )
+
+    def get_batch_data_and_markers(
+        self, batch_spec: BatchSpec
+    ) -> Tuple[Any, BatchMarkers]:
+        if not isinstance(batch_spec, PathBatchSpec):
+            return super().get_batch_data_and_markers(batch_spec=batch_spec)
+
+        view_name: str = self._create_file_view(batch_spec=batch_spec)
+
+        # The view is validated like a table, so that splitting, sampling, and fingerprinting directives apply as well.
+        table_batch_spec = SqlAlchemyDatasourceBatchSpec(
+            {
+                key: value
+                for key, value in batch_spec.items()
+                if key not in _PATH_BATCH_SPEC_KEYS
+            }
+        )
+        table_batch_spec["table_name"] = view_name
+        return super().get_batch_data_and_markers(batch_spec=table_batch_spec)
+
+    def _create_file_view(self, batch_spec: PathBatchSpec) -> str:
+        """Creates a temporary view, which scans the file of the PathBatchSpec; returns the name of the view."""
+        reader_method: str = batch_spec.get(
+            "reader_method"
+        ) or self.guess_reader_method_from_path(path=batch_spec.path)
+        if reader_method not in DUCKDB_READER_METHODS:
+            raise ExecutionEngineError(
+                f'DuckDBExecutionEngine does not support reader_method "{reader_method}" (supported reader methods are: {", ".join(DUCKDB_READER_METHODS)}).'
+            )
+
+        reader_arguments = [_render_literal(value=batch_spec.path)]
+        for option_name, option_value in (
+            batch_spec.get("reader_options") or {}
+        ).items():
+            if not _OPTION_NAME_PATTERN.match(option_name):
+                raise ExecutionEngineError(
+                    f'Invalid DuckDB reader option name "{option_name}".'
+                )
+
+            reader_arguments.append(
+                f"{option_name}={_render_literal(value=option_value)}"
+            )
+
+        view_name: str = generate_temporary_table_name()
+        statement: str = f"CREATE TEMPORARY VIEW {view_name} AS SELECT * FROM {reader_method}({', '.join(reader_arguments)})"
+        # Colons (e.g., in URLs or Windows paths) must be escaped, lest they be taken for bind parameters.
+        self.engine.execute(sa.text(statement.replace(":", "\\:")))
+        return view_name
+
+
+def _render_literal(value: Any) -> str:
+    """Renders the value (of a reader option) as a DuckDB SQL literal."""
+    if value is None:
+        return "NULL"
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_render_literal(value=element) for element in value)}]"
+
+    if isinstance(value, dict):
+        rendered_items = ", ".join(
+            f"{_render_literal(value=str(key))}: {_render_literal(value=element)}"
+            for key, element in value.items()
+        )
+        return f"{{{rendered_items}}}"
+
+    escaped_value: str = str(value).replace("'", "''")
+    return f"'{escaped_value}'"
@@ -3,19 +3,26 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.metric import BatchMetricIdentifier
 from great_expectations.core.util import AzureUrl, DBFSPath, GCSUrl, S3Url
+from great_expectations.execution_engine.metric_cache import (
+    MetricCache,
+    MetricCacheStatistics,
+)
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
 )
-from great_expectations.util import filter_properties_dict
+from great_expectations.util import filter_properties_dict, load_class
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
@@ -151,9 +158,31 @@ class SplitDomainKwargs:
     accessor: dict
 
 
+@dataclass(frozen=True)
+class MetricApproximation:
+    """Describes how an ExecutionEngine, in which "approximate_metrics" is enabled, approximates a metric.
+
+    method: name of the dialect-native function (or of the in-Python sketch) used to approximate the metric
+    error_bound: typical error of the approximation, relative to the exact value (for counts) or as a fraction of the
+        number of values (i.e., the rank error, for quantiles)
+    """
+
+    method: str
+    error_bound: float
+
+    def to_json_dict(self) -> dict:
+        return {
+            "method": self.method,
+            "error_bound": self.error_bound,
+        }
+
+
 class ExecutionEngine(ABC):
     recognized_batch_spec_defaults = set()
 
+    # Name of the batch marker, under which the engine records the fingerprint of the data of a batch (if any).
+    batch_fingerprint_marker: Optional[str] = None
+
     def __init__(
         self,
         name=None,
@@ -161,19 +190,26 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        approximate_metrics: bool = False,
     ) -> None:
         self.name = name
         self._validator = validator
+        self._approximate_metrics = approximate_metrics
 
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
         if self._caching:
-            self._metric_cache = {}
+            self._metric_cache = self._build_metric_cache(metric_cache=metric_cache)
         else:
             self._metric_cache = NoOpDict()
 
+        # The (optional) Batch Metrics Store persists metrics between runs, keyed by the fingerprint of the batch data.
+        self._batch_metrics_store = None
+        self._batch_data_fingerprints: Dict[str, Optional[str]] = {}
+        self._batch_fingerprints: Dict[str, Optional[str]] = {}
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
         batch_spec_defaults_keys = set(batch_spec_defaults.keys())
@@ -202,10 +238,86 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": metric_cache if isinstance(metric_cache, dict) else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        if approximate_metrics:
+            self._config["approximate_metrics"] = approximate_metrics
+
+    @staticmethod
+    def _build_metric_cache(
+        metric_cache: Optional[Union[MetricCache, dict]] = None
+    ) -> MetricCache:
+        """Builds the cache of resolved metrics from a MetricCache instance or from its configuration, in which
+        "class_name" and "module_name" are optional (defaulting to the least-recently-used MetricCache)."""
+        if metric_cache is None:
+            return MetricCache()
+
+        if isinstance(metric_cache, MetricCache):
+            return metric_cache
+
+        metric_cache_config: dict = copy.deepcopy(metric_cache)
+        class_name: str = metric_cache_config.pop("class_name", MetricCache.__name__)
+        module_name: str = metric_cache_config.pop(
+            "module_name", MetricCache.__module__
+        )
+        metric_cache_class: type = load_class(
+            class_name=class_name, module_name=module_name
+        )
+        return metric_cache_class(**metric_cache_config)
+
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        """The cache of resolved metrics (None, if caching is disabled)."""
+        if not self._caching:
+            return None
+
+        return self._metric_cache
+
+    @property
+    def metric_cache_statistics(self) -> Optional[MetricCacheStatistics]:
+        """Hit, miss, and eviction counts and the current occupancy of the metric cache (None, if caching is disabled)."""
+        if not self._caching:
+            return None
+
+        return self._metric_cache.statistics
+
+    @property
+    def batch_metrics_store(self):
+        """The Batch Metrics Store, in which resolved metrics are persisted between runs (None, if not configured)."""
+        return self._batch_metrics_store
+
+    @batch_metrics_store.setter
+    def batch_metrics_store(self, batch_metrics_store) -> None:
+        self._batch_metrics_store = batch_metrics_store
+
+    @property
+    def approximate_metrics(self) -> bool:
+        """Whether expensive metrics (e.g., distinct value counts, quantiles) may be approximated."""
+        return self._approximate_metrics
+
+    def get_metric_approximation(
+        self, metric_name: str
+    ) -> Optional[MetricApproximation]:
+        """Returns how the metric is approximated, or None if the metric is computed exactly (which is always the case,
+        unless "approximate_metrics" is enabled).
+
+        Args:
+            metric_name: name of the metric (e.g., "column.distinct_values.count")
+
+        Returns:
+            MetricApproximation or None
+        """
+        if not self._approximate_metrics:
+            return None
+
+        return self._get_metric_approximations().get(metric_name)
+
+    def _get_metric_approximations(self) -> Dict[str, MetricApproximation]:
+        """Returns the metrics, which the engine approximates (if enabled), keyed by metric name."""
+        return {}
 
     def configure_validator(self, validator) -> None:
         """Optionally configure the validator as appropriate for the execution engine."""
@@ -284,9 +396,86 @@ class ExecutionEngine(ABC):
         """
         Loads the specified batch_data into the execution engine
         """
+        if self._caching and batch_id in self._batch_data_dict:
+            # Metrics computed from the data previously loaded under this batch_id are no longer valid.
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+
+        self._batch_data_fingerprints.pop(batch_id, None)
+        self._batch_fingerprints.pop(batch_id, None)
+
         self._batch_data_dict[batch_id] = batch_data
         self._active_batch_data_id = batch_id
 
+    def load_batch_fingerprint(
+        self, batch_id: str, batch_markers: Optional[dict]
+    ) -> None:
+        """
+        Records the fingerprint of the data of the specified (loaded) batch, if its batch_markers contain one
+        """
+        if self.batch_fingerprint_marker is None or not batch_markers:
+            return
+
+        data_fingerprint: Optional[str] = batch_markers.get(
+            self.batch_fingerprint_marker
+        )
+        if data_fingerprint is not None:
+            self._batch_data_fingerprints[batch_id] = data_fingerprint
+            self._batch_fingerprints.pop(batch_id, None)
+
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """
+        Returns the fingerprint, which identifies the data of the specified batch across runs (None, if not available)
+        """
+        if batch_id not in self._batch_data_dict:
+            return None
+
+        if batch_id not in self._batch_fingerprints:
+            self._batch_fingerprints[batch_id] = self._compute_batch_fingerprint(
+                batch_id=batch_id,
+                data_fingerprint=self._batch_data_fingerprints.get(batch_id),
+            )
+
+        return self._batch_fingerprints[batch_id]
+
+    def _compute_batch_fingerprint(
+        self, batch_id: str, data_fingerprint: Optional[str]
+    ) -> Optional[str]:
+        """Computes the fingerprint of the data of the specified batch from the fingerprint recorded in its markers
+        (if any); engines, which can fingerprint their batch data directly, override this method."""
+        return data_fingerprint
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        """
+        Removes the specified batch_data from the execution engine, along with the metrics cached for it
+        """
+        self._batch_data_dict.pop(batch_id, None)
+        self._batch_data_fingerprints.pop(batch_id, None)
+        self._batch_fingerprints.pop(batch_id, None)
+        if self._active_batch_data_id == batch_id:
+            self._active_batch_data_id = None
+
+        if self._caching:
+            self._metric_cache.invalidate_batch(batch_id=batch_id)
+
+    def project_batch_columns(
+        self, batch_id: str, columns: Optional[Iterable[str]]
+    ) -> None:
+        """
+        Informs the execution engine that only the given columns (all, if None) of the specified batch are referenced
+        by the metrics to be resolved; engines, which can avoid loading the other columns, override this method.
+        """
+        pass
+
+    def plan_batch_metrics(
+        self, batch_id: str, metric_configurations: List[MetricConfiguration]
+    ) -> Optional[dict]:
+        """
+        Informs the execution engine of the metrics of the specified batch, which are about to be resolved; engines,
+        which can prepare the batch for them (e.g., by materializing it), override this method, and return the batch
+        markers (if any) recording how the batch was prepared.
+        """
+        return None
+
     def _load_batch_data_from_dict(self, batch_data_dict) -> None:
         """
         Loads all data in batch_data_dict into load_batch_data
@@ -316,8 +505,50 @@ class ExecutionEngine(ABC):
 
         resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
 
+        # Resolved metrics are cached under the batch, whose data they were computed from (for invalidation purposes).
+        metric_batch_ids: Dict[Tuple[str, str, str], Optional[str]] = {}
+
+        # Keys, under which newly computed metrics are to be persisted in the Batch Metrics Store (if one is configured).
+        batch_metric_identifiers: Dict[Tuple[str, str, str], BatchMetricIdentifier] = {}
+
         metric_fn_bundle = []
+        metric_fn_direct = []
         for metric_to_resolve in metrics_to_resolve:
+            batch_id: Optional[str] = metric_to_resolve.metric_domain_kwargs.get(
+                "batch_id"
+            )
+            if self._caching and batch_id is not None:
+                # Only metrics, whose domain explicitly references a batch, are served from the cache, since the same
+                # id of a metric, whose domain defaults to the active batch, may designate data of different batches.
+                try:
+                    resolved_metrics[metric_to_resolve.id] = self._metric_cache[
+                        metric_to_resolve.id
+                    ]
+                    continue
+                except KeyError:
+                    pass
+
+            metric_batch_ids[metric_to_resolve.id] = (
+                batch_id if batch_id is not None else self.active_batch_data_id
+            )
+
+            if batch_id is not None and self._batch_metrics_store is not None:
+                batch_metric_identifier: Optional[
+                    BatchMetricIdentifier
+                ] = self._get_batch_metric_identifier(
+                    metric_configuration=metric_to_resolve
+                )
+                if batch_metric_identifier is not None:
+                    if self._batch_metrics_store.has_key(batch_metric_identifier):
+                        resolved_metrics[
+                            metric_to_resolve.id
+                        ] = self._batch_metrics_store.get(batch_metric_identifier)
+                        continue
+
+                    batch_metric_identifiers[
+                        metric_to_resolve.id
+                    ] = batch_metric_identifier
+
             metric_dependencies = {}
             for k, v in metric_to_resolve.metric_dependencies.items():
                 if v.id in metrics:
@@ -380,20 +611,57 @@ class ExecutionEngine(ABC):
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
                 )
 
-            try:
-                # NOTE: DH 20220328: This is where we can introduce the Batch Metrics Store (BMS)
-                resolved_metrics[metric_to_resolve.id] = metric_fn(
-                    **metric_provider_kwargs
-                )
-            except Exception as e:
-                raise ge_exceptions.MetricResolutionError(
-                    message=str(e), failed_metrics=(metric_to_resolve,)
+            if metric_fn_type != MetricFunctionTypes.VALUE:
+                # Partial functions (and Series) are only meaningful within the present run, and are not persisted.
+                batch_metric_identifiers.pop(metric_to_resolve.id, None)
+
+            metric_fn_direct.append(
+                (
+                    metric_to_resolve,
+                    metric_fn,
+                    metric_provider_kwargs,
                 )
+            )
+
+        # Metrics, which are not bundled, are independent of one another (their dependencies are already resolved), and
+        # thus may be computed concurrently, if the engine supports it; otherwise, they are computed one after another.
+        with self._build_metric_resolution_executor(
+            max_workers=len(metric_fn_direct)
+        ) as async_executor:
+            async_results: List[Tuple[MetricConfiguration, AsyncResult]] = []
+            for (
+                metric_to_resolve,
+                metric_fn,
+                metric_provider_kwargs,
+            ) in metric_fn_direct:
+                try:
+                    async_results.append(
+                        (
+                            metric_to_resolve,
+                            async_executor.submit(
+                                self._compute_metric,
+                                metric_to_resolve=metric_to_resolve,
+                                metric_fn=metric_fn,
+                                metric_provider_kwargs=metric_provider_kwargs,
+                            ),
+                        )
+                    )
+                except Exception as e:
+                    raise ge_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric_to_resolve,)
+                    )
+
+            for metric_to_resolve, async_result in async_results:
+                try:
+                    resolved_metrics[metric_to_resolve.id] = async_result.result()
+                except Exception as e:
+                    raise ge_exceptions.MetricResolutionError(
+                        message=str(e), failed_metrics=(metric_to_resolve,)
+                    )
 
         if len(metric_fn_bundle) > 0:
             try:
                 # an engine-specific way of computing metrics together
-                # NOTE: DH 20220328: This is where we can introduce the Batch Metrics Store (BMS)
                 new_resolved = self.resolve_metric_bundle(metric_fn_bundle)
                 resolved_metrics.update(new_resolved)
             except Exception as e:
@@ -401,16 +669,118 @@ class ExecutionEngine(ABC):
                     message=str(e), failed_metrics=[x[0] for x in metric_fn_bundle]
                 )
         if self._caching:
-            self._metric_cache.update(resolved_metrics)
+            self._metric_cache.update(
+                values={
+                    metric_id: resolved_metrics[metric_id]
+                    for metric_id in metric_batch_ids
+                    if metric_id in resolved_metrics
+                },
+                batch_ids=metric_batch_ids,
+            )
+
+        if batch_metric_identifiers:
+            self._persist_batch_metrics(
+                resolved_metrics=resolved_metrics,
+                batch_metric_identifiers=batch_metric_identifiers,
+            )
 
         return resolved_metrics
 
+    def _compute_metric(
+        self,
+        metric_to_resolve: MetricConfiguration,
+        metric_fn: Callable,
+        metric_provider_kwargs: dict,
+    ) -> Any:
+        """Computes the value of a (non-bundled) metric; engines override this method to attribute the work done by
+        the metric function (e.g., the queries it issues) to the metric."""
+        return metric_fn(**metric_provider_kwargs)
+
+    def pop_query_records(self) -> List[dict]:
+        """
+        Returns the queries issued by the execution engine since the last call (as JSON-serializable dictionaries, with
+        the ids of the metrics they served under "metric_ids"), and forgets them; engines, which record their queries,
+        override this method.
+        """
+        return []
+
+    def _get_batch_metric_identifier(
+        self, metric_configuration: MetricConfiguration
+    ) -> Optional[BatchMetricIdentifier]:
+        """Builds the key of the metric in the Batch Metrics Store, or returns None if the metric cannot be persisted
+        (because the data of its batch has no fingerprint, or because its domain refers to data outside of the batch).
+        """
+        metric_domain_kwargs: IDDict = metric_configuration.metric_domain_kwargs
+        if metric_domain_kwargs.get("table") is not None:
+            return None
+
+        batch_fingerprint: Optional[str] = self.get_batch_fingerprint(
+            batch_id=metric_domain_kwargs["batch_id"]
+        )
+        if batch_fingerprint is None:
+            return None
+
+        # The batch is identified by the fingerprint of its data, rather than by its batch_id, which is run-specific.
+        metric_kwargs: dict = {
+            "execution_engine": self.__class__.__name__,
+            "metric_domain_kwargs_id": metric_domain_kwargs.to_id(
+                id_ignore_keys=["batch_id"]
+            ),
+            "metric_value_kwargs_id": metric_configuration.metric_value_kwargs.to_id(),
+        }
+        # Approximated values must never be reused in place of exact ones (and vice versa).
+        approximation: Optional[MetricApproximation] = self.get_metric_approximation(
+            metric_name=metric_configuration.metric_name
+        )
+        if approximation is not None:
+            metric_kwargs["metric_approximation"] = approximation.to_json_dict()
+
+        metric_kwargs_id: str = IDDict(metric_kwargs).to_id()
+        return BatchMetricIdentifier(
+            batch_fingerprint=batch_fingerprint,
+            metric_name=metric_configuration.metric_name,
+            metric_kwargs_id=metric_kwargs_id,
+        )
+
+    def _persist_batch_metrics(
+        self,
+        resolved_metrics: Dict[Tuple[str, str, str], Any],
+        batch_metric_identifiers: Dict[Tuple[str, str, str], BatchMetricIdentifier],
+    ) -> None:
+        metric_id: Tuple[str, str, str]
+        batch_metric_identifier: BatchMetricIdentifier
+        for metric_id, batch_metric_identifier in batch_metric_identifiers.items():
+            if metric_id not in resolved_metrics:
+                continue
+
+            try:
+                self._batch_metrics_store.set(
+                    batch_metric_identifier, resolved_metrics[metric_id]
+                )
+            except Exception as e:
+                # Failing to persist a metric (e.g., one whose value cannot be serialized) must not fail its resolution.
+                logger.debug(
+                    f"Unable to persist metric {str(metric_id)} in the Batch Metrics Store: {str(e)}"
+                )
+
     def resolve_metric_bundle(
         self, metric_fn_bundle
     ) -> Dict[Tuple[str, str, str], Any]:
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
 
+    def _build_metric_resolution_executor(self, max_workers: int) -> AsyncExecutor:
+        """Builds the AsyncExecutor used to resolve independent metrics (or groups of metrics) of a single resolution
+        step.  Unless overridden by an engine that can safely issue concurrent computations, work is done synchronously.
+
+        Args:
+            max_workers: the number of independent units of work that are to be submitted to the executor
+
+        Returns:
+            AsyncExecutor instance, intended to be used as a context manager
+        """
+        return AsyncExecutor(concurrency_config=None, max_workers=1)
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
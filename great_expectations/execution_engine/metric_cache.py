@@ -0,0 +1,199 @@
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Optional, Set
+
+import numpy as np
+import pandas as pd
+
+_MISSING = object()
+
+# Default bounds of a MetricCache, so that long-running processes validating many batches do not retain every metric
+# value (in particular, the per-row Series of map metrics) for their whole lifetime.
+DEFAULT_METRIC_CACHE_MAX_ENTRIES = 100000
+DEFAULT_METRIC_CACHE_MAX_BYTES = 1024**3
+
+
+@dataclass
+class MetricCacheStatistics:
+    """Counters and current occupancy of a MetricCache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_in_bytes: int
+
+
+def estimate_size_in_bytes(value: Any) -> int:
+    """Estimates the memory footprint of a metric value (deeply for Pandas/NumPy objects and for containers)."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        memory_usage = value.memory_usage(deep=True)
+        if isinstance(memory_usage, pd.Series):
+            memory_usage = memory_usage.sum()
+        return int(memory_usage)
+
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(
+            estimate_size_in_bytes(element) for element in value
+        )
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size_in_bytes(key) + estimate_size_in_bytes(element)
+            for key, element in value.items()
+        )
+
+    try:
+        return sys.getsizeof(value)
+    except TypeError:
+        return 0
+
+
+class MetricCache:
+    """Least-recently-used cache of resolved metric values, keyed by metric id.
+
+    The cache can be bounded by the number of entries ("max_entries") and/or by the estimated total size of the cached
+    values ("max_bytes"); least-recently-used entries are evicted when either bound is exceeded.  Both bounds apply by
+    default (see "DEFAULT_METRIC_CACHE_MAX_ENTRIES" and "DEFAULT_METRIC_CACHE_MAX_BYTES"); None disables a bound.  Entries are associated
+    with the batch, whose data they were computed from, so that they can be invalidated when that batch is unloaded.
+
+    Custom policies can be supplied by subclassing MetricCache (e.g., overriding "estimate_size_in_bytes()" or
+    "_evict()") and passing the subclass (or its "class_name"/"module_name" configuration) to the ExecutionEngine.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+        max_bytes: Optional[int] = DEFAULT_METRIC_CACHE_MAX_BYTES,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+
+        self._values: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._batch_ids: Dict[Hashable, Optional[str]] = {}
+        self._keys_by_batch_id: Dict[Optional[str], Set[Hashable]] = {}
+        self._size_in_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        return self._max_bytes
+
+    @property
+    def statistics(self) -> MetricCacheStatistics:
+        return MetricCacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._values),
+            size_in_bytes=self._size_in_bytes,
+        )
+
+    def estimate_size_in_bytes(self, value: Any) -> int:
+        return estimate_size_in_bytes(value)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value (counting a hit), or "default" (counting a miss)."""
+        value: Any = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            self._misses += 1
+            return default
+
+        self._hits += 1
+        self._values.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, batch_id: Optional[str] = None) -> None:
+        if key in self._values:
+            self._remove(key=key)
+
+        size_in_bytes: int = 0
+        if self._max_bytes is not None:
+            size_in_bytes = self.estimate_size_in_bytes(value)
+            if size_in_bytes > self._max_bytes:
+                # A value, which could never fit, is not cached (rather than evicting every other entry for it).
+                return
+
+        self._values[key] = value
+        self._sizes[key] = size_in_bytes
+        self._batch_ids[key] = batch_id
+        self._keys_by_batch_id.setdefault(batch_id, set()).add(key)
+        self._size_in_bytes += size_in_bytes
+
+        self._evict()
+
+    def update(
+        self,
+        values: Dict[Hashable, Any],
+        batch_ids: Optional[Dict[Hashable, Optional[str]]] = None,
+    ) -> None:
+        if batch_ids is None:
+            batch_ids = {}
+
+        key: Hashable
+        value: Any
+        for key, value in values.items():
+            self.set(key=key, value=value, batch_id=batch_ids.get(key))
+
+    def invalidate_batch(self, batch_id: Optional[str]) -> int:
+        """Removes all entries computed from the data of the given batch; returns the number of removed entries."""
+        keys: Set[Hashable] = self._keys_by_batch_id.get(batch_id, set())
+        num_keys: int = len(keys)
+        for key in list(keys):
+            self._remove(key=key)
+
+        return num_keys
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._sizes.clear()
+        self._batch_ids.clear()
+        self._keys_by_batch_id.clear()
+        self._size_in_bytes = 0
+
+    def _evict(self) -> None:
+        key: Hashable
+        while self._values and (
+            (self._max_entries is not None and len(self._values) > self._max_entries)
+            or (self._max_bytes is not None and self._size_in_bytes > self._max_bytes)
+        ):
+            key = next(iter(self._values))
+            self._remove(key=key)
+            self._evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        self._values.pop(key)
+        self._size_in_bytes -= self._sizes.pop(key)
+        batch_id: Optional[str] = self._batch_ids.pop(key)
+        keys: Set[Hashable] = self._keys_by_batch_id[batch_id]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_batch_id[batch_id]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._values
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value: Any = self.get(key=key, default=_MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key=key, value=value)
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -1,7 +1,12 @@
+import logging
+from typing import Callable, Hashable, Iterable, Iterator, List, Optional
+
 import pandas as pd
 
 from great_expectations.execution_engine.execution_engine import BatchData
 
+logger = logging.getLogger(__name__)
+
 
 class PandasBatchData(BatchData):
     def __init__(self, execution_engine, dataframe: pd.DataFrame) -> None:
@@ -11,3 +16,150 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ProjectedPandasBatchData(PandasBatchData):
+    """PandasBatchData, whose DataFrame is read from its source lazily (upon the first access of the "dataframe"
+    property), restricted to the columns set by "project_columns()" (all columns, unless a projection is set).
+
+    "reader" reads the given columns (all columns, if None) of the source; "schema_reader" returns an empty DataFrame
+    with all columns of the source (and their dtypes, as far as the source stores them).  Without a "schema_reader",
+    projections are ignored.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        reader: Optional[Callable[[Optional[List[str]]], pd.DataFrame]],
+        schema_reader: Optional[Callable[[], pd.DataFrame]] = None,
+    ) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)
+        self._reader = reader
+        self._schema_reader = schema_reader
+        self._schema: Optional[pd.DataFrame] = None
+        self._projected_columns: Optional[List[str]] = None
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._dataframe is None:
+            self._dataframe = self._read()
+
+        return self._dataframe
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the DataFrame has been read into memory."""
+        return self._dataframe is not None
+
+    @property
+    def schema(self) -> Optional[pd.DataFrame]:
+        """Empty DataFrame with all columns of the source (None, if there is no "schema_reader")."""
+        if self._schema is None and self._schema_reader is not None:
+            self._schema = self._schema_reader()
+
+        return self._schema
+
+    @property
+    def projected_columns(self) -> Optional[List[str]]:
+        """The columns read from the source, in the order of the source (None, if all columns are read)."""
+        return self._projected_columns
+
+    def project_columns(self, columns: Optional[Iterable[str]]) -> bool:
+        """Restricts the columns read from the source to the given ones (ignoring names that are not columns of the
+        source); if "columns" is None, all columns are read.
+
+        Once the DataFrame has been read, a projection can only be widened (to also include the given columns), in
+        which case the DataFrame is read again; returns whether this is the case.
+        """
+        if self.schema is None:
+            return False
+
+        all_columns: List[Hashable] = list(self.schema.columns)
+        projected_columns: List[Hashable]
+        if columns is None:
+            projected_columns = all_columns
+        else:
+            columns = set(columns)
+            projected_columns = [column for column in all_columns if column in columns]
+            if not projected_columns:
+                # At least one column is read, so that the number of rows is known.
+                projected_columns = all_columns[:1]
+
+        is_widened: bool = False
+        if self.is_materialized:
+            if self._projected_columns is None or set(projected_columns) <= set(
+                self._projected_columns
+            ):
+                return False
+
+            columns = set(projected_columns) | set(self._projected_columns)
+            projected_columns = [column for column in all_columns if column in columns]
+            self._dataframe = None
+            is_widened = True
+
+        self._projected_columns = (
+            None if len(projected_columns) == len(all_columns) else projected_columns
+        )
+        return is_widened
+
+    def get_schema(self, projected_schema: pd.DataFrame) -> pd.DataFrame:
+        """Returns an empty DataFrame with all columns of the source, given an empty DataFrame of the columns read:
+        columns read have the dtypes of "projected_schema", and the other columns have the dtypes of the source."""
+        if self._projected_columns is None:
+            return projected_schema
+
+        return pd.DataFrame(
+            {
+                column: pd.Series(
+                    dtype=projected_schema[column].dtype
+                    if column in projected_schema.columns
+                    else dtype
+                )
+                for column, dtype in self.schema.dtypes.items()
+            },
+            index=projected_schema.index,
+        )
+
+    def _read(self) -> pd.DataFrame:
+        return self._reader(columns=self._projected_columns)
+
+
+class ChunkedPandasBatchData(ProjectedPandasBatchData):
+    """ProjectedPandasBatchData, whose DataFrame is never held in memory as a whole, but is read from its source one
+    chunk of rows at a time (every call of "chunk_reader" must return a new iterator over the chunks of the given
+    columns, the indexes of which continue one another, as if the chunks were slices of the whole DataFrame).
+
+    Accessing the "dataframe" property reads (and keeps) the whole DataFrame; this only happens for metrics, which
+    cannot be computed one chunk at a time.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        chunk_reader: Callable[..., Iterator[pd.DataFrame]],
+        schema_reader: Optional[Callable[[], pd.DataFrame]] = None,
+    ) -> None:
+        super().__init__(
+            execution_engine=execution_engine,
+            reader=None,
+            schema_reader=schema_reader,
+        )
+        self._chunk_reader = chunk_reader
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        if self._projected_columns is None:
+            return self._chunk_reader()
+
+        return self._chunk_reader(columns=self._projected_columns)
+
+    @property
+    def has_global_index(self) -> bool:
+        """Whether the indexes of the chunks are those of the rows in the whole DataFrame (so that lists of indexes
+        can be concatenated over the chunks)."""
+        return True
+
+    def _read(self) -> pd.DataFrame:
+        logger.warning(
+            "Reading the whole of a chunked batch into memory, since a metric cannot be computed one chunk at a time."
+        )
+        return pd.concat(list(self.iter_chunks()))
@@ -1,15 +1,19 @@
+import copy
 import datetime
 import hashlib
+import json
 import logging
 import pickle
 import warnings
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Iterable, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
@@ -19,16 +23,31 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.sketches import HyperLogLog
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
-from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.data_context.types.base import ConcurrencyConfig
+from great_expectations.execution_engine.execution_engine import (
+    ExecutionEngine,
+    MetricApproximation,
+    MetricDomainTypes,
+    MetricFunctionTypes,
+    MetricPartialFunctionTypes,
+)
+from great_expectations.execution_engine.metric_cache import MetricCache
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+    ProjectedPandasBatchData,
+)
 from great_expectations.execution_engine.split_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
 from great_expectations.execution_engine.split_and_sample.pandas_data_splitter import (
     PandasDataSplitter,
 )
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +70,16 @@ except ImportError:
         "Unable to load Azure connection object; install optional azure dependency for support"
     )
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+    logger.debug(
+        "Unable to load pyarrow; install optional pyarrow dependency for reading parquet files in chunks, and parquet and feather files by column"
+    )
+
 try:
     from google.api_core.exceptions import GoogleAPIError
     from google.auth.exceptions import DefaultCredentialsError
@@ -67,6 +96,67 @@ except ImportError:
 
 HASH_THRESHOLD = 1e9
 
+# Number of rows of a single column (or of the index) hashed at a time, and number of rows hashed in the "sampled" mode.
+DEFAULT_FINGERPRINT_CHUNK_SIZE = 100000
+DEFAULT_FINGERPRINT_SAMPLE_SIZE = 10000
+
+# Upper bound on the (shallow) size of the filtered domain DataFrames, which are cached for reuse by later metrics.
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES = 1e9
+
+# Pandas reader methods, which can read a file one chunk of rows at a time (in the streaming mode of the engine), and
+# only some of its columns (in the column projection mode of the engine); feather files can only be read by column.
+CSV_READER_METHODS = ("read_csv", "read_table")
+PARQUET_READER_METHOD = "read_parquet"
+FEATHER_READER_METHOD = "read_feather"
+
+# Metrics, which only depend on the names and types of the columns of a batch (for chunked batches, and batches read
+# by column, these are computed from an empty DataFrame with all columns of the batch).
+SCHEMA_METRICS = ("table.columns", "table.column_types")
+
+# Map metrics, the value of which, for every row, only depends on that row (and on aggregate metric dependencies); only
+# these are computed one chunk at a time.  Conditions comparing rows with one another (e.g., "column_values.unique",
+# "column_values.increasing"), as well as any map metric not listed here, are computed over the whole batch.
+ROW_WISE_MAP_METRICS = (
+    "column_pair_values.a_greater_than_b.condition",
+    "column_pair_values.equal.condition",
+    "column_pair_values.in_set.condition",
+    "column_values.between.condition",
+    "column_values.dateutil_parseable.condition",
+    "column_values.in_set.condition",
+    "column_values.json_parseable.condition",
+    "column_values.match_json_schema.condition",
+    "column_values.match_regex.condition",
+    "column_values.match_regex_list.condition",
+    "column_values.match_strftime_format.condition",
+    "column_values.nonnull.condition",
+    "column_values.not_in_set.condition",
+    "column_values.not_match_regex.condition",
+    "column_values.not_match_regex_list.condition",
+    "column_values.null.condition",
+    "column_values.value_length.between.condition",
+    "column_values.value_length.equals.condition",
+    "column_values.value_length.map",
+    "column_values.z_score.map",
+    "column_values.z_score.under_threshold.condition",
+    "multicolumn_sum.equal.condition",
+    "select_column_values.unique.within_record.condition",
+)
+
+
+class _DomainRecordsCache(MetricCache):
+    """Cache of DataFrames filtered by row conditions and/or "ignore_row_if" directives, and of the unexpected records
+    of map metric conditions (for reuse among metrics)."""
+
+    def estimate_size_in_bytes(self, value: Any) -> int:
+        if isinstance(value, tuple):
+            return sum(self.estimate_size_in_bytes(element) for element in value)
+
+        if not isinstance(value, (pd.DataFrame, pd.Series)):
+            return super().estimate_size_in_bytes(value)
+
+        # The values of "object" columns are shared with the unfiltered DataFrame; hence, they are not counted.
+        return int(np.sum(value.memory_usage(index=True, deep=False)))
+
 
 class PandasExecutionEngine(ExecutionEngine):
     """
@@ -107,6 +197,8 @@ Notes:
         "reader_options",
     }
 
+    batch_fingerprint_marker = "pandas_data_fingerprint"
+
     def __init__(self, *args, **kwargs) -> None:
         self.discard_subset_failing_expectations = kwargs.pop(
             "discard_subset_failing_expectations", False
@@ -114,6 +206,20 @@ Notes:
         boto3_options: dict = kwargs.pop("boto3_options", {})
         azure_options: dict = kwargs.pop("azure_options", {})
         gcs_options: dict = kwargs.pop("gcs_options", {})
+        fingerprint_options: dict = kwargs.pop("fingerprint_options", {})
+        domain_records_cache_max_bytes: Optional[int] = kwargs.pop(
+            "domain_records_cache_max_bytes", DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+        )
+        chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        column_projection: bool = kwargs.pop("column_projection", False)
+        if chunk_size is not None and chunk_size < 1:
+            raise ge_exceptions.InvalidConfigError(
+                f'The "chunk_size" of PandasExecutionEngine must be a positive number of rows ({chunk_size} was given).'
+            )
+        if fingerprint_options.get("mode", "exact") not in ["exact", "sampled"]:
+            raise ge_exceptions.InvalidConfigError(
+                f'The fingerprint "mode" of PandasExecutionEngine must be either "exact" or "sampled" ("{fingerprint_options["mode"]}" was given).'
+            )
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -121,6 +227,17 @@ Notes:
         self._azure = None
         self._gcs = None
 
+        # Filtered domain DataFrames are cached (unless caching is disabled or the cache is configured to hold 0 bytes).
+        self._domain_records_cache: Optional[_DomainRecordsCache] = None
+
+        # In the streaming mode (if "chunk_size" is given), CSV and parquet files are read "chunk_size" rows at a time.
+        self._chunk_size = chunk_size
+
+        # In the column projection mode, CSV, parquet, and feather files are read lazily, and only the columns referenced
+        # by the validated expectations are read (see "project_batch_columns()").  The schema metrics still cover all
+        # columns; the dtypes of the columns not read are those stored by the file (object, for CSV files).
+        self._column_projection = column_projection
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -131,6 +248,21 @@ Notes:
                 "gcs_options": gcs_options,
             }
         )
+        if fingerprint_options:
+            self._config["fingerprint_options"] = fingerprint_options
+        if domain_records_cache_max_bytes != DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES:
+            self._config[
+                "domain_records_cache_max_bytes"
+            ] = domain_records_cache_max_bytes
+        if chunk_size is not None:
+            self._config["chunk_size"] = chunk_size
+        if column_projection:
+            self._config["column_projection"] = column_projection
+
+        if self._caching and domain_records_cache_max_bytes != 0:
+            self._domain_records_cache = _DomainRecordsCache(
+                max_bytes=domain_records_cache_max_bytes
+            )
 
         self._data_splitter = PandasDataSplitter()
         self._data_sampler = PandasDataSampler()
@@ -194,6 +326,75 @@ Notes:
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"
             )
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
+        if self._domain_records_cache is not None:
+            self._domain_records_cache.invalidate_batch(batch_id=batch_id)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        super().unload_batch_data(batch_id=batch_id)
+        if self._domain_records_cache is not None:
+            self._domain_records_cache.invalidate_batch(batch_id=batch_id)
+
+    @property
+    def domain_records_cache(self) -> Optional[MetricCache]:
+        """The cache of filtered domain DataFrames (None, if disabled)."""
+        return self._domain_records_cache
+
+    def get_data_fingerprint(self, df: pd.DataFrame) -> str:
+        """Fingerprints the DataFrame according to the "fingerprint_options" of the engine.
+
+        By default ("mode": "exact"), DataFrames below HASH_THRESHOLD bytes are hashed at once, and larger
+        ones in chunks of "chunk_size" rows, using "max_workers" threads.  With "mode": "sampled", only "sample_size"
+        evenly spaced rows of any DataFrame are hashed, which is faster, but does not detect changes to other rows.
+        """
+        fingerprint_options: dict = self.config.get("fingerprint_options", {})
+        mode: str = fingerprint_options.get("mode", "exact")
+        if mode == "exact" and df.memory_usage().sum() < HASH_THRESHOLD:
+            return hash_pandas_dataframe(df)
+
+        return fingerprint_pandas_dataframe(
+            df=df,
+            chunk_size=fingerprint_options.get(
+                "chunk_size", DEFAULT_FINGERPRINT_CHUNK_SIZE
+            ),
+            sample_size=fingerprint_options.get(
+                "sample_size", DEFAULT_FINGERPRINT_SAMPLE_SIZE
+            )
+            if mode == "sampled"
+            else None,
+            max_workers=fingerprint_options.get("max_workers", 1),
+        )
+
+    def _get_metric_approximations(self) -> Dict[str, MetricApproximation]:
+        # Pandas has no native approximate aggregates; distinct values are counted using a (mergeable) sketch.
+        return {
+            "column.distinct_values.count": MetricApproximation(
+                method="HyperLogLog",
+                error_bound=HyperLogLog.get_relative_error(),
+            ),
+        }
+
+    def _compute_batch_fingerprint(
+        self, batch_id: str, data_fingerprint: Optional[str]
+    ) -> Optional[str]:
+        batch_data: PandasBatchData = self._batch_data_dict[batch_id]
+        if isinstance(batch_data, ProjectedPandasBatchData):
+            # Chunked batches, and batches read by column, are not fingerprinted (doing so would require an extra pass
+            # over their data, or reading all of their columns).
+            return None
+
+        df: pd.DataFrame = batch_data.dataframe
+        if data_fingerprint is None:
+            data_fingerprint = self.get_data_fingerprint(df=df)
+
+        # The hash of the values does not capture the column names and types, on which metric values also depend.
+        return IDDict(
+            {
+                "pandas_data_fingerprint": data_fingerprint,
+                "columns": [
+                    [str(column), str(dtype)] for column, dtype in df.dtypes.items()
+                ],
+            }
+        ).to_id()
 
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
@@ -256,7 +457,12 @@ Please check your config."""
             reader_fn = self._get_reader_fn(reader_method, s3_url.key)
             buf = BytesIO(s3_object["Body"].read())
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            df = self._read_batch_file(
+                reader_fn=reader_fn,
+                source=buf,
+                reader_options=reader_options,
+                batch_spec=batch_spec,
+            )
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -282,7 +488,12 @@ Please check your config."""
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
             buf = BytesIO(azure_object.readall())
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            df = self._read_batch_file(
+                reader_fn=reader_fn,
+                source=buf,
+                reader_options=reader_options,
+                batch_spec=batch_spec,
+            )
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -310,23 +521,35 @@ Please check your config."""
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
             buf = BytesIO(gcs_blob.download_as_bytes())
             buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            df = self._read_batch_file(
+                reader_fn=reader_fn,
+                source=buf,
+                reader_options=reader_options,
+                batch_spec=batch_spec,
+            )
 
         elif isinstance(batch_spec, PathBatchSpec):
             reader_method: str = batch_spec.reader_method
             reader_options: dict = batch_spec.reader_options
             path: str = batch_spec.path
             reader_fn: Callable = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            df = self._read_batch_file(
+                reader_fn=reader_fn,
+                source=path,
+                reader_options=reader_options,
+                batch_spec=batch_spec,
+            )
 
         else:
             raise ge_exceptions.BatchSpecError(
                 f"batch_spec must be of type RuntimeDataBatchSpec, PathBatchSpec, S3BatchSpec, or AzureBatchSpec, not {batch_spec.__class__.__name__}"
             )
 
+        if isinstance(df, ProjectedPandasBatchData):
+            return df, batch_markers
+
         df = self._apply_splitting_and_sampling_methods(batch_spec, df)
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        batch_markers["pandas_data_fingerprint"] = self.get_data_fingerprint(df=df)
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
@@ -350,6 +573,125 @@ Please check your config."""
 
         return batch_data
 
+    def _read_batch_file(
+        self,
+        reader_fn: Callable,
+        source: Union[str, BytesIO],
+        reader_options: dict,
+        batch_spec: BatchSpec,
+    ) -> Union[pd.DataFrame, ProjectedPandasBatchData]:
+        """Reads the file into a DataFrame or, in the streaming mode, returns ChunkedPandasBatchData, which reads the
+        file "chunk_size" rows at a time, or, in the column projection mode, returns ProjectedPandasBatchData, which
+        only reads the columns projected by the Validator (if the reader method supports it, and the batch is neither
+        split nor sampled, since splitters and samplers operate on the whole DataFrame).
+
+        Files fetched from cloud storage are read in chunks (or by column) from their (raw) contents, which are held in
+        memory.
+        """
+        reader_method: str = getattr(reader_fn, "func", reader_fn).__name__
+        chunk_reader: Optional[Callable[..., Iterator[pd.DataFrame]]] = None
+        reader: Optional[Callable[[Optional[List[str]]], pd.DataFrame]] = None
+        schema_reader: Optional[Callable[[], pd.DataFrame]] = None
+        if reader_method in CSV_READER_METHODS:
+            if not ({"chunksize", "iterator", "nrows"} & set(reader_options)):
+                chunk_reader = partial(
+                    _read_csv_chunks,
+                    reader_fn=reader_fn,
+                    source=source,
+                    reader_options=reader_options,
+                    chunk_size=self._chunk_size,
+                )
+            # Indexes read from the file would have to be projected, as well.
+            if not (
+                {"chunksize", "iterator", "usecols", "index_col"} & set(reader_options)
+            ):
+                reader = partial(
+                    _read_csv,
+                    reader_fn=reader_fn,
+                    source=source,
+                    reader_options=reader_options,
+                )
+                schema_reader = partial(
+                    _read_csv,
+                    reader_fn=reader_fn,
+                    source=source,
+                    reader_options={**reader_options, "nrows": 0},
+                    columns=None,
+                )
+        elif reader_method == PARQUET_READER_METHOD and pq is not None:
+            if set(reader_options) <= {"columns"}:
+                chunk_reader = partial(
+                    _read_parquet_chunks,
+                    source=source,
+                    columns=reader_options.get("columns"),
+                    chunk_size=self._chunk_size,
+                )
+            if "columns" not in reader_options:
+                reader = partial(
+                    _read_columns,
+                    reader_fn=reader_fn,
+                    source=source,
+                    reader_options=reader_options,
+                )
+                schema_reader = partial(_read_parquet_schema, source=source)
+        elif (
+            reader_method == FEATHER_READER_METHOD
+            and pa is not None
+            and "columns" not in reader_options
+        ):
+            reader = partial(
+                _read_columns,
+                reader_fn=reader_fn,
+                source=source,
+                reader_options=reader_options,
+            )
+            schema_reader = partial(_read_feather_schema, source=source)
+
+        if batch_spec.get("splitter_method") or batch_spec.get("sampling_method"):
+            chunk_reader = None
+            reader = None
+
+        if not self._column_projection:
+            reader = None
+            schema_reader = None
+
+        if self._chunk_size is not None and chunk_reader is not None:
+            return ChunkedPandasBatchData(
+                execution_engine=self,
+                chunk_reader=chunk_reader,
+                schema_reader=schema_reader,
+            )
+
+        if reader is not None:
+            return ProjectedPandasBatchData(
+                execution_engine=self, reader=reader, schema_reader=schema_reader
+            )
+
+        return reader_fn(source, **reader_options)
+
+    def project_batch_columns(
+        self, batch_id: str, columns: Optional[Iterable[str]]
+    ) -> None:
+        """Restricts the columns of the batch, which are read from its file, to the given ones (all, if None).
+
+        This only has an effect on batches read in the column projection mode (see "column_projection"), and only
+        widens the projection of batches, which have already been read (reading them again).
+        """
+        batch_data: Optional[PandasBatchData] = self._batch_data_dict.get(batch_id)
+        if not isinstance(batch_data, ProjectedPandasBatchData):
+            return
+
+        if batch_data.project_columns(columns=columns):
+            # The batch is read again; schema metrics (and domains) derived from fewer columns are stale.
+            if self._caching:
+                self._metric_cache.invalidate_batch(batch_id=batch_id)
+            if self._domain_records_cache is not None:
+                self._domain_records_cache.invalidate_batch(batch_id=batch_id)
+
+        logger.debug(
+            f"Reading columns {batch_data.projected_columns} of batch {batch_id} (all, if None)."
+        )
+
     @property
     def dataframe(self):
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -459,6 +801,7 @@ Please check your config."""
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.active_batch_data_id is not None:
+                batch_id = self.active_batch_data_id
                 data = self.active_batch_data.dataframe
             else:
                 raise ge_exceptions.ValidationError(
@@ -485,7 +828,13 @@ Please check your config."""
                 )
             else:
                 # Querying row condition
-                data = data.query(row_condition, parser=condition_parser)
+                data = self._get_cached_domain_records(
+                    key=(batch_id, row_condition, condition_parser),
+                    batch_id=batch_id,
+                    compute_fn=partial(
+                        data.query, row_condition, parser=condition_parser
+                    ),
+                )
 
         if "column" in domain_kwargs:
             return data
@@ -502,16 +851,20 @@ Please check your config."""
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
+                data = self._drop_domain_records_with_missing_values(
+                    data=data,
+                    batch_id=batch_id,
+                    domain_kwargs=domain_kwargs,
                     subset=[column_A_name, column_B_name],
+                    how="all",
                 )
             elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
+                data = self._drop_domain_records_with_missing_values(
+                    data=data,
+                    batch_id=batch_id,
+                    domain_kwargs=domain_kwargs,
                     subset=[column_A_name, column_B_name],
+                    how="any",
                 )
             else:
                 if ignore_row_if not in ["neither", "never"]:
@@ -535,16 +888,20 @@ Please check your config."""
 
             ignore_row_if = domain_kwargs["ignore_row_if"]
             if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
+                data = self._drop_domain_records_with_missing_values(
+                    data=data,
+                    batch_id=batch_id,
+                    domain_kwargs=domain_kwargs,
                     subset=column_list,
+                    how="all",
                 )
             elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
+                data = self._drop_domain_records_with_missing_values(
+                    data=data,
+                    batch_id=batch_id,
+                    domain_kwargs=domain_kwargs,
                     subset=column_list,
+                    how="any",
                 )
             else:
                 if ignore_row_if != "never":
@@ -556,6 +913,93 @@ Please check your config."""
 
         return data
 
+    def _drop_domain_records_with_missing_values(
+        self,
+        data: pd.DataFrame,
+        batch_id: str,
+        domain_kwargs: dict,
+        subset: List[str],
+        how: str,
+    ) -> pd.DataFrame:
+        return self._get_cached_domain_records(
+            key=(
+                batch_id,
+                domain_kwargs.get("row_condition"),
+                domain_kwargs.get("condition_parser"),
+                tuple(subset),
+                how,
+            ),
+            batch_id=batch_id,
+            compute_fn=partial(data.dropna, axis=0, how=how, subset=subset),
+        )
+
+    def _get_cached_domain_records(
+        self, key: tuple, batch_id: str, compute_fn: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Returns the filtered domain DataFrame from the cache, computing (and caching) it if it is not cached yet, so
+        that every distinct filtered view of a batch is materialized only once for all metrics sharing it."""
+        if self._domain_records_cache is None:
+            return compute_fn()
+
+        data: Optional[pd.DataFrame] = self._domain_records_cache.get(key=key)
+        if data is None:
+            data = compute_fn()
+            self._domain_records_cache.set(key=key, value=data, batch_id=batch_id)
+
+        return data
+
+    def get_unexpected_domain_records(
+        self,
+        condition_metric_id: Tuple[str, str, str],
+        unexpected_condition: pd.Series,
+        domain_kwargs: dict,
+        filter_column: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Returns the records of the domain, for which "unexpected_condition" (the boolean Series resolved for the map
+        metric condition with the given id) holds.  If "filter_column" is given, the records, in which it is null, are
+        dropped before the condition is applied (since the condition was computed over the non-null values only).
+
+        The unexpected records are cached by condition metric id, so that the metrics derived from the same condition
+        (unexpected values, value counts, index list, and rows) obtain, filter, and mask the domain only once.
+        """
+        if self._domain_records_cache is None:
+            return self._compute_unexpected_domain_records(
+                unexpected_condition=unexpected_condition,
+                domain_kwargs=domain_kwargs,
+                filter_column=filter_column,
+            )
+
+        key: tuple = ("unexpected_records", condition_metric_id, filter_column)
+        cached_value: Optional[tuple] = self._domain_records_cache.get(key=key)
+        # Cached records are only reused for the very condition Series they were computed with (a condition resolved
+        # again, e.g., after its batch has been reloaded, replaces them).
+        if cached_value is not None and cached_value[0] is unexpected_condition:
+            return cached_value[1]
+
+        data: pd.DataFrame = self._compute_unexpected_domain_records(
+            unexpected_condition=unexpected_condition,
+            domain_kwargs=domain_kwargs,
+            filter_column=filter_column,
+        )
+        self._domain_records_cache.set(
+            key=key,
+            value=(unexpected_condition, data),
+            batch_id=domain_kwargs.get("batch_id") or self.active_batch_data_id,
+        )
+        return data
+
+    def _compute_unexpected_domain_records(
+        self,
+        unexpected_condition: pd.Series,
+        domain_kwargs: dict,
+        filter_column: Optional[str] = None,
+    ) -> pd.DataFrame:
+        data: pd.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
+        if filter_column is not None:
+            data = data[data[filter_column].notnull()]
+
+        return data[unexpected_condition]
+
     def get_compute_domain(
         self,
         domain_kwargs: dict,
@@ -597,6 +1041,309 @@ Please check your config."""
 
         return data, split_domain_kwargs.compute, split_domain_kwargs.accessor
 
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], Any]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Resolves the metrics of every chunked batch (see "chunk_size") in a single pass over its chunks, the schema
+        metrics of batches read by column (see "column_projection") from all columns of their files, and all other
+        metrics as usual.
+
+        The map (Series-valued) metrics of a chunked batch are not computed upfront, but chunk by chunk, by the metrics
+        consuming them: unexpected counts, values, and indexes.  Row counts are summed over the chunks, column aggregate
+        metrics implementing the partial aggregate protocol merge the states of the chunks, and the schema metrics are
+        computed from the dtypes of the chunks.  Any other metric is computed from the whole (materialized) batch.
+        """
+        if metrics is None:
+            metrics = {}
+
+        resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
+        chunked_metric_reducers: Dict[str, List[_ChunkedMetricReducer]] = {}
+        projected_schema_metrics: Dict[str, List[MetricConfiguration]] = {}
+        other_metrics: List[MetricConfiguration] = []
+        for metric_to_resolve in metrics_to_resolve:
+            batch_id: Optional[str] = (
+                metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                or self.active_batch_data_id
+            )
+            batch_data: Optional[PandasBatchData] = self._batch_data_dict.get(batch_id)
+            if not isinstance(batch_data, ProjectedPandasBatchData):
+                other_metrics.append(metric_to_resolve)
+                continue
+
+            if not (
+                isinstance(batch_data, ChunkedPandasBatchData)
+                and not batch_data.is_materialized
+            ):
+                if (
+                    batch_data.projected_columns is not None
+                    and metric_to_resolve.metric_name in SCHEMA_METRICS
+                ):
+                    projected_schema_metrics.setdefault(batch_id, []).append(
+                        metric_to_resolve
+                    )
+                else:
+                    other_metrics.append(metric_to_resolve)
+
+                continue
+
+            if self._caching and metric_to_resolve.metric_domain_kwargs.get("batch_id"):
+                try:
+                    resolved_metrics[metric_to_resolve.id] = self._metric_cache[
+                        metric_to_resolve.id
+                    ]
+                    continue
+                except KeyError:
+                    pass
+
+            chunked_metric: Optional[
+                Union[_DeferredChunkedMetric, _ChunkedMetricReducer]
+            ] = self._build_chunked_metric(
+                metric_configuration=metric_to_resolve,
+                batch_data=batch_data,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+            if chunked_metric is None:
+                other_metrics.append(metric_to_resolve)
+            elif isinstance(chunked_metric, _DeferredChunkedMetric):
+                resolved_metrics[metric_to_resolve.id] = chunked_metric
+            else:
+                chunked_metric_reducers.setdefault(batch_id, []).append(chunked_metric)
+
+        for batch_id, reducers in chunked_metric_reducers.items():
+            reduced_metrics: Dict[
+                Tuple[str, str, str], Any
+            ] = self._reduce_chunked_metrics(batch_id=batch_id, reducers=reducers)
+            resolved_metrics.update(reduced_metrics)
+            if self._caching:
+                self._metric_cache.update(
+                    values=reduced_metrics,
+                    batch_ids={metric_id: batch_id for metric_id in reduced_metrics},
+                )
+
+        for batch_id, schema_metrics in projected_schema_metrics.items():
+            resolved_metrics.update(
+                self._resolve_projected_schema_metrics(
+                    batch_id=batch_id,
+                    metrics_to_resolve=schema_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if other_metrics:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=other_metrics,
+                    metrics=self._evaluate_deferred_chunked_metrics(
+                        metrics_to_resolve=other_metrics, metrics=metrics
+                    ),
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _build_chunked_metric(
+        self,
+        metric_configuration: MetricConfiguration,
+        batch_data: ChunkedPandasBatchData,
+        metrics: Dict[Tuple[str, str, str], Any],
+        runtime_configuration: Optional[dict],
+    ) -> Optional[Union["_DeferredChunkedMetric", "_ChunkedMetricReducer"]]:
+        """Returns the deferred value of a map metric of a chunked batch, the reducer computing the metric from the
+        chunks of the batch, or None if the metric cannot be computed one chunk at a time."""
+        metric_class, metric_fn = get_metric_provider(
+            metric_name=metric_configuration.metric_name, execution_engine=self
+        )
+        if metric_fn is None:
+            return None
+
+        metric_dependencies: Dict[str, Any] = {}
+        for name, dependency in metric_configuration.metric_dependencies.items():
+            if dependency.id in metrics:
+                metric_dependencies[name] = metrics[dependency.id]
+            elif self._caching and dependency.id in self._metric_cache:
+                metric_dependencies[name] = self._metric_cache[dependency.id]
+            else:
+                raise ge_exceptions.MetricError(
+                    message=f'Missing metric dependency: {str(name)} for metric "{metric_configuration.metric_name}".'
+                )
+
+        metric_provider_kwargs: dict = {
+            "cls": metric_class,
+            "metric_domain_kwargs": metric_configuration.metric_domain_kwargs,
+            "metric_value_kwargs": metric_configuration.metric_value_kwargs,
+            "metrics": metric_dependencies,
+            "runtime_configuration": runtime_configuration,
+        }
+        metric_fn_type = getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+        if metric_fn_type in [
+            MetricPartialFunctionTypes.MAP_SERIES,
+            MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+        ]:
+            if metric_configuration.metric_name not in ROW_WISE_MAP_METRICS:
+                return None
+
+            return _DeferredChunkedMetric(
+                metric_id=metric_configuration.id,
+                metric_fn=metric_fn,
+                metric_provider_kwargs=metric_provider_kwargs,
+            )
+
+        metric_name: str = metric_configuration.metric_name
+        # Unexpected counts, values, and indexes are reduced chunk by chunk, only if their condition is evaluated so
+        # (and indexes, only if those of the chunks identify the rows of the whole batch).
+        has_deferred_condition: bool = isinstance(
+            metric_dependencies.get("unexpected_condition"), _DeferredChunkedMetric
+        )
+        reducer_class: Optional[type] = None
+        if metric_name in SCHEMA_METRICS:
+            reducer_class = _SchemaMetricReducer
+        elif metric_name == "table.row_count" or (
+            metric_name.endswith(".unexpected_count") and has_deferred_condition
+        ):
+            reducer_class = _SumMetricReducer
+        elif (
+            (
+                metric_name.endswith(".unexpected_index_list")
+                and batch_data.has_global_index
+            )
+            or (
+                metric_name.endswith(".unexpected_values")
+                and "column" in metric_configuration.metric_domain_kwargs
+            )
+        ) and has_deferred_condition:
+            reducer_class = _ConcatenationMetricReducer
+
+        if reducer_class is not None:
+            return reducer_class(
+                metric_configuration=metric_configuration,
+                metric_fn=metric_fn,
+                metric_provider_kwargs=metric_provider_kwargs,
+            )
+
+        get_partial_aggregate: Optional[Callable] = getattr(
+            metric_class, "get_partial_aggregate", None
+        )
+        if get_partial_aggregate is None:
+            return None
+
+        partial_aggregate = get_partial_aggregate(
+            execution_engine=self,
+            metric_value_kwargs=metric_configuration.metric_value_kwargs,
+        )
+        # Estimates (e.g., sketches of distinct values) are only used, if the metric is approximated anyway.
+        if partial_aggregate is None or not (
+            partial_aggregate.is_exact
+            or self.get_metric_approximation(metric_name=metric_name) is not None
+        ):
+            return None
+
+        return _PartialAggregateMetricReducer(
+            metric_configuration=metric_configuration,
+            metric_fn=metric_fn,
+            metric_provider_kwargs=metric_provider_kwargs,
+            partial_aggregate=partial_aggregate,
+        )
+
+    def _reduce_chunked_metrics(
+        self, batch_id: str, reducers: List["_ChunkedMetricReducer"]
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Computes the metrics of the chunked batch in a single pass over its chunks, each of which is loaded (under
+        the same batch_id) into an engine of its own, so that domains are computed exactly as for a whole batch."""
+        batch_data: ChunkedPandasBatchData = self._batch_data_dict[batch_id]
+        chunk_engine = PandasExecutionEngine(
+            caching=False, approximate_metrics=self.approximate_metrics
+        )
+        try:
+            schema: Optional[pd.DataFrame] = None
+            for chunk in batch_data.iter_chunks():
+                chunk_engine.load_batch_data(batch_id=batch_id, batch_data=chunk)
+                schema = (
+                    chunk.iloc[:0]
+                    if schema is None
+                    else pd.concat([schema, chunk.iloc[:0]])
+                )
+                # Map metrics shared by several reducers are evaluated only once per chunk.
+                evaluated: Dict[Tuple[str, str, str], Any] = {}
+                for reducer in reducers:
+                    reducer.update(execution_engine=chunk_engine, evaluated=evaluated)
+
+            chunk_engine.load_batch_data(
+                batch_id=batch_id,
+                batch_data=schema
+                if schema is None
+                else batch_data.get_schema(projected_schema=schema),
+            )
+            return {
+                reducer.metric_configuration.id: reducer.finalize(
+                    execution_engine=chunk_engine
+                )
+                for reducer in reducers
+            }
+        except Exception as e:
+            raise ge_exceptions.MetricResolutionError(
+                message=str(e),
+                failed_metrics=[reducer.metric_configuration for reducer in reducers],
+            )
+
+    def _resolve_projected_schema_metrics(
+        self,
+        batch_id: str,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], Any],
+        runtime_configuration: Optional[dict],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Computes the schema metrics of a batch read by column from an empty DataFrame with all columns of its file,
+        which is loaded (under the same batch_id) into an engine of its own."""
+        batch_data: ProjectedPandasBatchData = self._batch_data_dict[batch_id]
+        schema_engine = PandasExecutionEngine(caching=False)
+        schema_engine.load_batch_data(
+            batch_id=batch_id,
+            batch_data=batch_data.get_schema(
+                projected_schema=batch_data.dataframe.iloc[:0]
+            ),
+        )
+        resolved_metrics: Dict[
+            Tuple[str, str, str], Any
+        ] = schema_engine.resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        if self._caching:
+            self._metric_cache.update(
+                values=resolved_metrics,
+                batch_ids={metric_id: batch_id for metric_id in resolved_metrics},
+            )
+
+        return resolved_metrics
+
+    def _evaluate_deferred_chunked_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], Any],
+    ) -> Dict[Tuple[str, str, str], Any]:
+        """Evaluates the deferred map metrics of chunked batches, on which the metrics to be resolved as usual depend,
+        over the whole (materialized) batches."""
+        evaluated: Dict[Tuple[str, str, str], Any] = {}
+        for metric_to_resolve in metrics_to_resolve:
+            for dependency in metric_to_resolve.metric_dependencies.values():
+                value: Any = metrics.get(dependency.id)
+                if isinstance(value, _DeferredChunkedMetric):
+                    evaluated[dependency.id] = value.evaluate(
+                        execution_engine=self, evaluated=evaluated
+                    )
+
+        if not evaluated:
+            return metrics
+
+        return {**metrics, **evaluated}
+
 
 def hash_pandas_dataframe(df):
     try:
@@ -606,3 +1353,372 @@ def hash_pandas_dataframe(df):
         obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
 
     return hashlib.md5(obj).hexdigest()
+
+
+def fingerprint_pandas_dataframe(
+    df: pd.DataFrame,
+    chunk_size: int = DEFAULT_FINGERPRINT_CHUNK_SIZE,
+    sample_size: Optional[int] = None,
+    max_workers: int = 1,
+) -> str:
+    """Fingerprints a DataFrame of any size with bounded memory.
+
+    The index and every column are hashed separately (on up to "max_workers" threads), "chunk_size" rows at a time, and
+    the resulting digests are combined with the shape, column names, and dtypes of the DataFrame.  If "sample_size" is
+    given, only that many evenly spaced rows are hashed.
+    """
+    num_rows: int = len(df.index)
+    if sample_size is not None and sample_size < num_rows:
+        positions: np.ndarray = np.unique(
+            np.linspace(0, num_rows - 1, num=sample_size, dtype=np.int64)
+        )
+        df = df.iloc[positions]
+
+    hashed_objects: List[Union[pd.Index, pd.Series]] = [df.index] + [
+        df.iloc[:, idx] for idx in range(df.shape[1])
+    ]
+    with AsyncExecutor(
+        concurrency_config=ConcurrencyConfig(enabled=True),
+        max_workers=min(max_workers, len(hashed_objects)),
+    ) as async_executor:
+        async_results: List[AsyncResult] = [
+            async_executor.submit(
+                _hash_pandas_object_in_chunks, obj=obj, chunk_size=chunk_size
+            )
+            for obj in hashed_objects
+        ]
+        digests: List[bytes] = [async_result.result() for async_result in async_results]
+
+    hasher = hashlib.md5()
+    hasher.update(
+        json.dumps(
+            {
+                "num_rows": num_rows,
+                "sample_size": sample_size,
+                "columns": [
+                    [str(column), str(dtype)] for column, dtype in df.dtypes.items()
+                ],
+            }
+        ).encode("utf-8")
+    )
+    for digest in digests:
+        hasher.update(digest)
+
+    return hasher.hexdigest()
+
+
+def _hash_pandas_object_in_chunks(
+    obj: Union[pd.Index, pd.Series], chunk_size: int
+) -> bytes:
+    hasher = hashlib.md5()
+    chunk: Union[pd.Index, pd.Series]
+    for start in range(0, len(obj), chunk_size):
+        if isinstance(obj, pd.Index):
+            chunk = obj[start : start + chunk_size]
+        else:
+            chunk = obj.iloc[start : start + chunk_size]
+
+        try:
+            hasher.update(pd.util.hash_pandas_object(chunk, index=False).values)
+        except TypeError:
+            # In case of facing unhashable objects (like dict), use pickle (value by value, so as not to depend on
+            # the chunk boundaries)
+            for value in chunk:
+                hasher.update(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    return hasher.digest()
+
+
+def _read_csv(
+    reader_fn: Callable,
+    source: Union[str, BytesIO],
+    reader_options: dict,
+    columns: Optional[List[str]],
+) -> pd.DataFrame:
+    if isinstance(source, BytesIO):
+        source.seek(0)
+
+    if columns is None:
+        return reader_fn(source, **reader_options)
+
+    return reader_fn(source, usecols=columns, **reader_options)
+
+
+def _read_csv_chunks(
+    reader_fn: Callable,
+    source: Union[str, BytesIO],
+    reader_options: dict,
+    chunk_size: int,
+    columns: Optional[List[str]] = None,
+) -> Iterator[pd.DataFrame]:
+    if isinstance(source, BytesIO):
+        source.seek(0)
+
+    if columns is not None:
+        reader_options = {**reader_options, "usecols": columns}
+
+    with reader_fn(source, chunksize=chunk_size, **reader_options) as reader:
+        yield from reader
+
+
+def _read_columns(
+    reader_fn: Callable,
+    source: Union[str, BytesIO],
+    reader_options: dict,
+    columns: Optional[List[str]],
+) -> pd.DataFrame:
+    """Reads the given columns (all, if None) of a parquet or feather file."""
+    if isinstance(source, BytesIO):
+        source.seek(0)
+
+    return reader_fn(source, columns=columns, **reader_options)
+
+
+def _read_parquet_schema(source: Union[str, BytesIO]) -> pd.DataFrame:
+    if isinstance(source, BytesIO):
+        source.seek(0)
+
+    return pq.read_schema(source).empty_table().to_pandas()
+
+
+def _read_feather_schema(source: Union[str, BytesIO]) -> pd.DataFrame:
+    if isinstance(source, BytesIO):
+        source.seek(0)
+
+    return pa.ipc.open_file(source).schema.empty_table().to_pandas()
+
+
+def _read_parquet_chunks(
+    source: Union[str, BytesIO], columns: Optional[List[str]], chunk_size: int
+) -> Iterator[pd.DataFrame]:
+    if isinstance(source, BytesIO):
+        source.seek(0)
+
+    parquet_file = pq.ParquetFile(source)
+    num_rows: int = 0
+    for record_batch in parquet_file.iter_batches(
+        batch_size=chunk_size, columns=columns
+    ):
+        chunk: pd.DataFrame = record_batch.to_pandas()
+        if isinstance(chunk.index, pd.RangeIndex):
+            # The default index of the whole DataFrame continues from one chunk to the next.
+            chunk.index = pd.RangeIndex(num_rows, num_rows + len(chunk))
+
+        num_rows += len(chunk)
+        yield chunk
+
+    if num_rows == 0:
+        yield parquet_file.schema_arrow.empty_table().to_pandas()
+
+
+def _evaluate_metric_fn(
+    metric_fn: Callable,
+    metric_provider_kwargs: dict,
+    execution_engine: PandasExecutionEngine,
+    evaluated: Dict[Tuple[str, str, str], Any],
+) -> Any:
+    """Calls the metric function on the data loaded into the engine, evaluating its deferred dependencies first."""
+    metric_dependencies: Dict[str, Any] = {
+        name: value.evaluate(execution_engine=execution_engine, evaluated=evaluated)
+        if isinstance(value, _DeferredChunkedMetric)
+        else value
+        for name, value in metric_provider_kwargs["metrics"].items()
+    }
+    return metric_fn(
+        **{
+            **metric_provider_kwargs,
+            "execution_engine": execution_engine,
+            "metrics": metric_dependencies,
+        }
+    )
+
+
+class _DeferredChunkedMetric:
+    """Value of a map (Series-valued) metric of a chunked batch, which is only evaluated (chunk by chunk, or over the
+    whole batch) by the metrics depending on it."""
+
+    def __init__(
+        self,
+        metric_id: Tuple[str, str, str],
+        metric_fn: Callable,
+        metric_provider_kwargs: dict,
+    ) -> None:
+        self._metric_id = metric_id
+        self._metric_fn = metric_fn
+        self._metric_provider_kwargs = metric_provider_kwargs
+
+    def evaluate(
+        self,
+        execution_engine: PandasExecutionEngine,
+        evaluated: Dict[Tuple[str, str, str], Any],
+    ) -> Any:
+        """Returns the value of the metric over the data loaded into the engine (memoized in "evaluated")."""
+        if self._metric_id not in evaluated:
+            evaluated[self._metric_id] = _evaluate_metric_fn(
+                metric_fn=self._metric_fn,
+                metric_provider_kwargs=self._metric_provider_kwargs,
+                execution_engine=execution_engine,
+                evaluated=evaluated,
+            )
+
+        return evaluated[self._metric_id]
+
+
+class _ChunkedMetricReducer:
+    """Computes a metric of a chunked batch from the chunks of the batch, which are passed to "update()" one by one."""
+
+    def __init__(
+        self,
+        metric_configuration: MetricConfiguration,
+        metric_fn: Callable,
+        metric_provider_kwargs: dict,
+    ) -> None:
+        self._metric_configuration = metric_configuration
+        self._metric_fn = metric_fn
+        self._metric_provider_kwargs = metric_provider_kwargs
+
+    @property
+    def metric_configuration(self) -> MetricConfiguration:
+        return self._metric_configuration
+
+    def update(
+        self,
+        execution_engine: PandasExecutionEngine,
+        evaluated: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        """Folds the chunk loaded into the engine into the state of the reducer."""
+        pass
+
+    def finalize(self, execution_engine: PandasExecutionEngine) -> Any:
+        """Returns the value of the metric (the engine holds an empty DataFrame with the dtypes of the whole batch)."""
+        raise NotImplementedError
+
+    def copy(self) -> "_ChunkedMetricReducer":
+        """Returns a reducer of the same metric in the initial state (e.g., to reduce another part of the chunks)."""
+        reducer: _ChunkedMetricReducer = copy.copy(self)
+        reducer._reset()
+        return reducer
+
+    def merge(self, other: "_ChunkedMetricReducer") -> None:
+        """Folds the state of the other reducer of the same metric, which has reduced the chunks following those
+        reduced by this reducer, into the state of the reducer."""
+        pass
+
+    def _reset(self) -> None:
+        pass
+
+    def _compute(
+        self,
+        execution_engine: PandasExecutionEngine,
+        evaluated: Dict[Tuple[str, str, str], Any],
+    ) -> Any:
+        return _evaluate_metric_fn(
+            metric_fn=self._metric_fn,
+            metric_provider_kwargs=self._metric_provider_kwargs,
+            execution_engine=execution_engine,
+            evaluated=evaluated,
+        )
+
+
+class _SchemaMetricReducer(_ChunkedMetricReducer):
+    """Metric depending only on the names and dtypes of the columns, which is computed from an empty DataFrame."""
+
+    def finalize(self, execution_engine: PandasExecutionEngine) -> Any:
+        return self._compute(execution_engine=execution_engine, evaluated={})
+
+
+class _SumMetricReducer(_ChunkedMetricReducer):
+    """Count, which is the sum of the counts over the chunks."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._sum = 0
+
+    def update(
+        self,
+        execution_engine: PandasExecutionEngine,
+        evaluated: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        self._sum += self._compute(
+            execution_engine=execution_engine, evaluated=evaluated
+        )
+
+    def finalize(self, execution_engine: PandasExecutionEngine) -> Any:
+        return self._sum
+
+    def merge(self, other: "_SumMetricReducer") -> None:
+        self._sum += other._sum
+
+    def _reset(self) -> None:
+        self._sum = 0
+
+
+class _ConcatenationMetricReducer(_ChunkedMetricReducer):
+    """List of unexpected values (or indexes), which is the concatenation of the lists over the chunks, truncated to
+    the "partial_unexpected_count" of the "result_format" (unless it is "COMPLETE")."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._values: list = []
+
+    def update(
+        self,
+        execution_engine: PandasExecutionEngine,
+        evaluated: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        self._values.extend(
+            self._compute(execution_engine=execution_engine, evaluated=evaluated)
+        )
+
+    def finalize(self, execution_engine: PandasExecutionEngine) -> Any:
+        result_format: dict = self._metric_configuration.metric_value_kwargs[
+            "result_format"
+        ]
+        if result_format["result_format"] == "COMPLETE":
+            return self._values
+
+        return self._values[: result_format["partial_unexpected_count"]]
+
+    def merge(self, other: "_ConcatenationMetricReducer") -> None:
+        self._values.extend(other._values)
+
+    def _reset(self) -> None:
+        self._values = []
+
+
+class _PartialAggregateMetricReducer(_ChunkedMetricReducer):
+    """Column aggregate metric, which folds the (column) domain of every chunk into its partial aggregate state."""
+
+    def __init__(self, partial_aggregate: Any, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._partial_aggregate = partial_aggregate
+
+    def update(
+        self,
+        execution_engine: PandasExecutionEngine,
+        evaluated: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=self._metric_configuration.metric_domain_kwargs,
+            domain_type=MetricDomainTypes.COLUMN,
+        )
+        column_name: str = accessor_domain_kwargs["column"]
+        if column_name not in self._metric_provider_kwargs["metrics"]["table.columns"]:
+            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The column "{column_name}" in BatchData does not exist.'
+            )
+
+        if getattr(self._metric_provider_kwargs["cls"], "filter_column_isnull", False):
+            df = df[df[column_name].notnull()]
+
+        self._partial_aggregate.update(column=df[column_name])
+
+    def finalize(self, execution_engine: PandasExecutionEngine) -> Any:
+        return self._partial_aggregate.finalize()
+
+    def merge(self, other: "_PartialAggregateMetricReducer") -> None:
+        self._partial_aggregate.merge(other=other._partial_aggregate)
+
+    def _reset(self) -> None:
+        # The reducer is copied before any update; hence, its partial aggregate is still in the initial state.
+        self._partial_aggregate = copy.deepcopy(self._partial_aggregate)
@@ -24,8 +24,11 @@ from great_expectations.exceptions import (
     ValidationError,
 )
 from great_expectations.exceptions import exceptions as ge_exceptions
-from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    ExecutionEngine,
+    MetricApproximation,
+    MetricDomainTypes,
+)
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
 from great_expectations.execution_engine.split_and_sample.sparkdf_data_sampler import (
     SparkDataSampler,
@@ -48,13 +51,15 @@ try:
 
     # noinspection SpellCheckingInspection
     import pyspark.sql.types as sparktypes
-    from pyspark import SparkContext
-    from pyspark.sql import DataFrame, SparkSession
+    from pyspark import SparkContext, StorageLevel
+    from pyspark.sql import Column, DataFrame, SparkSession
     from pyspark.sql.readwriter import DataFrameReader
 except ImportError:
     pyspark = None
     SparkContext = None
+    StorageLevel = None
     SparkSession = None
+    Column = None
     DataFrame = None
     DataFrameReader = None
     F = None
@@ -65,6 +70,17 @@ except ImportError:
         "Unable to load pyspark; install optional spark dependency for support."
     )
 
+# Maximum relative standard deviation of "approx_count_distinct()" and relative (rank) error of "approxQuantile()",
+# respectively, used to approximate metrics (if enabled).
+APPROXIMATE_COUNT_DISTINCT_RSD = 0.05
+APPROXIMATE_QUANTILE_RELATIVE_ERROR = 0.01
+
+# Storage level (the name of a "pyspark.StorageLevel" constant), at which batch DataFrames are persisted by default.
+DEFAULT_PERSIST_STORAGE_LEVEL = "MEMORY_AND_DISK"
+
+# Domain kwargs, which are turned into conditions of the aggregates, if "bundle_row_conditions" is enabled.
+ROW_CONDITION_DOMAIN_KEYS = ("row_condition", "condition_parser", "filter_conditions")
+
 
 # noinspection SpellCheckingInspection
 def apply_dateutil_parse(column):
@@ -158,6 +174,8 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self,
         *args,
         persist=True,
+        persist_storage_level: str = DEFAULT_PERSIST_STORAGE_LEVEL,
+        bundle_row_conditions: bool = False,
         spark_config=None,
         force_reuse_spark_context=False,
         **kwargs,
@@ -165,6 +183,15 @@ class SparkDFExecutionEngine(ExecutionEngine):
         # Creation of the Spark DataFrame is done outside this class
         self._persist = persist
 
+        # Unless "persist" is disabled, the DataFrame of every loaded batch is persisted (at "persist_storage_level"), so
+        # that the metric computations over the batch scan its source only once; DataFrames, which have been persisted
+        # by the engine (rather than cached by the user), are unpersisted when their batch is unloaded.
+        self._persisted_batch_ids = set()
+
+        # If enabled, the aggregate metrics of domains, which differ only by their row_condition and filter_conditions,
+        # are computed as conditional aggregates over their common unconditioned domain, in a single Spark job.
+        self._bundle_row_conditions = bundle_row_conditions
+
         if spark_config is None:
             spark_config = {}
 
@@ -179,6 +206,14 @@ class SparkDFExecutionEngine(ExecutionEngine):
         self._spark_config = spark_config
         self.spark = spark
 
+        storage_level = getattr(StorageLevel, persist_storage_level, None)
+        if not isinstance(storage_level, StorageLevel):
+            raise ge_exceptions.InvalidConfigError(
+                f'The "persist_storage_level" of SparkDFExecutionEngine must name a pyspark.StorageLevel ("{persist_storage_level}" was given).'
+            )
+
+        self._storage_level = storage_level
+
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
@@ -191,10 +226,30 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        if persist_storage_level != DEFAULT_PERSIST_STORAGE_LEVEL:
+            self._config["persist_storage_level"] = persist_storage_level
+        if bundle_row_conditions:
+            self._config["bundle_row_conditions"] = bundle_row_conditions
 
         self._data_splitter = SparkDataSplitter()
         self._data_sampler = SparkDataSampler()
 
+    def _get_metric_approximations(self) -> Dict[str, MetricApproximation]:
+        return {
+            "column.distinct_values.count": MetricApproximation(
+                method="approx_count_distinct",
+                error_bound=APPROXIMATE_COUNT_DISTINCT_RSD,
+            ),
+            "column.quantile_values": MetricApproximation(
+                method="approxQuantile",
+                error_bound=APPROXIMATE_QUANTILE_RELATIVE_ERROR,
+            ),
+            "column.median": MetricApproximation(
+                method="approxQuantile",
+                error_bound=APPROXIMATE_QUANTILE_RELATIVE_ERROR,
+            ),
+        }
+
     @property
     def dataframe(self):
         """If a batch has been loaded, returns a Spark Dataframe containing the data within the loaded batch"""
@@ -214,8 +269,43 @@ class SparkDFExecutionEngine(ExecutionEngine):
             raise GreatExpectationsError(
                 "SparkDFExecutionEngine requires batch data that is either a DataFrame or a SparkDFBatchData object"
             )
+
+        previous_batch_data: Optional[SparkDFBatchData] = self._batch_data_dict.get(
+            batch_id
+        )
+        if (
+            previous_batch_data is not None
+            and previous_batch_data.dataframe is not batch_data.dataframe
+        ):
+            self._unpersist_batch_data(batch_id=batch_id)
+
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+        if self._persist and not batch_data.dataframe.is_cached:
+            batch_data.dataframe.persist(self._storage_level)
+            self._persisted_batch_ids.add(batch_id)
+
+    def unload_batch_data(self, batch_id: str) -> None:
+        self._unpersist_batch_data(batch_id=batch_id)
+        super().unload_batch_data(batch_id=batch_id)
+
+    def _unpersist_batch_data(self, batch_id: str) -> None:
+        """Unpersists the DataFrame of the batch, if it has been persisted by the engine and no other loaded batch
+        shares it."""
+        if batch_id not in self._persisted_batch_ids:
+            return
+
+        self._persisted_batch_ids.discard(batch_id)
+        dataframe: DataFrame = self._batch_data_dict[batch_id].dataframe
+        if any(
+            other_batch_data.dataframe is dataframe
+            for other_batch_id, other_batch_data in self._batch_data_dict.items()
+            if other_batch_id != batch_id
+        ):
+            return
+
+        dataframe.unpersist()
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -419,27 +509,12 @@ Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
-        # Filtering by row condition.
-        row_condition = domain_kwargs.get("row_condition", None)
-        if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(
-                    f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
-                )
-
-        # Filtering by filter_conditions
-        filter_conditions: List[RowCondition] = domain_kwargs.get(
-            "filter_conditions", []
+        # Filtering by row condition and filter_conditions.
+        condition: Optional[Column] = self._build_domain_condition(
+            domain_kwargs=domain_kwargs
         )
-        if len(filter_conditions) > 0:
-            filter_condition = self._combine_row_conditions(filter_conditions)
-            data = data.filter(filter_condition.condition)
+        if condition is not None:
+            data = data.filter(condition)
 
         if "column" in domain_kwargs:
             return data
@@ -508,6 +583,67 @@ Please check your config."""
 
         return data
 
+    def _build_domain_condition(self, domain_kwargs: dict) -> Optional[Column]:
+        """Builds the Column, which selects the rows of the domain meeting its row_condition and filter_conditions
+        (None, if the domain has neither)."""
+        conditions: List[Column] = []
+
+        row_condition = domain_kwargs.get("row_condition", None)
+        if row_condition:
+            condition_parser = domain_kwargs.get("condition_parser", None)
+            if condition_parser == "spark":
+                conditions.append(F.expr(row_condition))
+            elif condition_parser == "great_expectations__experimental__":
+                conditions.append(parse_condition_to_spark(row_condition))
+            else:
+                raise GreatExpectationsError(
+                    f"unrecognized condition_parser {str(condition_parser)} for Spark execution engine"
+                )
+
+        filter_conditions: List[RowCondition] = domain_kwargs.get(
+            "filter_conditions", []
+        )
+        if len(filter_conditions) > 0:
+            filter_condition = self._combine_row_conditions(filter_conditions)
+            conditions.append(F.expr(filter_condition.condition))
+
+        if not conditions:
+            return None
+
+        return reduce(lambda a, b: a & b, conditions)
+
+    def split_domain_row_conditions(
+        self, domain_kwargs: dict
+    ) -> Tuple[dict, Optional[Column]]:
+        """Splits the row_condition and filter_conditions off the domain kwargs (if "bundle_row_conditions" is enabled),
+        so that an aggregate metric of the domain can be computed over the remaining (unconditioned) domain, as an
+        aggregate of values selected by the returned condition, in the same Spark job as the aggregates of domains,
+        which differ only by their conditions.
+
+        Args:
+            domain_kwargs (dict) - the (compute) domain kwargs of an aggregate metric
+
+        Returns:
+            A tuple including:
+              - the domain kwargs without conditions (the given ones, if there is no condition to split off)
+              - the Column of the conditions (None, if there is none, or if "bundle_row_conditions" is disabled)
+        """
+        if not self._bundle_row_conditions:
+            return domain_kwargs, None
+
+        condition: Optional[Column] = self._build_domain_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if condition is None:
+            return domain_kwargs, None
+
+        unconditioned_domain_kwargs: dict = {
+            key: value
+            for key, value in domain_kwargs.items()
+            if key not in ROW_CONDITION_DOMAIN_KEYS
+        }
+        return unconditioned_domain_kwargs, condition
+
     def _combine_row_conditions(
         self, row_conditions: List[RowCondition]
     ) -> RowCondition:
@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Optional, Union
 
 from great_expectations.execution_engine.execution_engine import BatchData
 from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
@@ -18,6 +18,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Value of "create_temp_table", which defers the decision whether to create a temporary table to the execution engine.
+AUTO_CREATE_TEMP_TABLE = "auto"
+
 
 class SqlAlchemyBatchData(BatchData):
     """A class which represents a SQL alchemy batch, with properties including the construction of the batch itself
@@ -34,7 +37,7 @@ class SqlAlchemyBatchData(BatchData):
         query: str = None,
         # Option 3
         selectable=None,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, str] = True,
         temp_table_schema_name: str = None,
         use_quoted_name: bool = False,
         source_schema_name: str = None,
@@ -61,7 +64,8 @@ class SqlAlchemyBatchData(BatchData):
                 create_temp_table (bool): \
                     When building the batch data object from a query, this flag determines whether a temporary table should
                     be created against which to validate data from the query. If False, a subselect statement will be used
-                    in each validation.
+                    in each validation. If "auto", a subselect statement is used, until the execution engine decides to
+                    create the temporary table (see "materialize_deferred_temp_table()").
                 temp_table_schema_name (str or None): \
                     The name of the schema in which a temporary table should be created. If None, the default schema will be
                     used if a temporary table is requested.
@@ -97,6 +101,9 @@ class SqlAlchemyBatchData(BatchData):
 
         self._schema_name = schema_name
         self._use_quoted_name = use_quoted_name
+        # The arguments of the temporary table, the creation of which is deferred to the execution engine (if any).
+        self._deferred_temp_table: Optional[dict] = None
+        self._uses_temp_table: bool = False
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
 
@@ -130,34 +137,19 @@ class SqlAlchemyBatchData(BatchData):
                     sa.MetaData(),
                     schema=schema_name,
                 )
-        elif create_temp_table:
-            generated_table_name = generate_temporary_table_name()
-            # mssql expects all temporary table names to have a prefix '#'
-            if dialect == GESqlDialect.MSSQL:
-                generated_table_name = f"#{generated_table_name}"
-            if selectable is not None:
-                if dialect in [GESqlDialect.ORACLE, GESqlDialect.MSSQL] and isinstance(
-                    selectable, str
-                ):
-                    # oracle, mssql query could already be passed as a string
-                    query = selectable
-                else:
-                    # compile selectable to sql statement
-                    query = selectable.compile(
-                        dialect=self.sql_engine_dialect,
-                        compile_kwargs={"literal_binds": True},
-                    )
-            self._create_temporary_table(
-                temp_table_name=generated_table_name,
+        elif create_temp_table and create_temp_table != AUTO_CREATE_TEMP_TABLE:
+            self._selectable = self._create_temp_table_selectable(
                 query=query,
+                selectable=selectable,
                 temp_table_schema_name=temp_table_schema_name,
             )
-            self._selectable = sa.Table(
-                generated_table_name,
-                sa.MetaData(),
-                schema=temp_table_schema_name,
-            )
         else:
+            if create_temp_table == AUTO_CREATE_TEMP_TABLE:
+                self._deferred_temp_table = {
+                    "query": query,
+                    "selectable": selectable,
+                    "temp_table_schema_name": temp_table_schema_name,
+                }
             if query:
                 self._selectable = sa.text(query)
             else:
@@ -188,6 +180,71 @@ class SqlAlchemyBatchData(BatchData):
     def use_quoted_name(self):
         return self._use_quoted_name
 
+    @property
+    def uses_temp_table(self) -> bool:
+        """Whether the batch is validated using a temporary table (only visible on the connection creating it)."""
+        return self._uses_temp_table
+
+    @property
+    def has_deferred_temp_table(self) -> bool:
+        """Whether the creation of a temporary table was deferred ("create_temp_table" of "auto") and is undecided."""
+        return self._deferred_temp_table is not None
+
+    @property
+    def deferred_temp_table_source(self):
+        """The query (string) or selectable, of which a temporary table may be created (if deferred), or None."""
+        if self._deferred_temp_table is None:
+            return None
+
+        return (
+            self._deferred_temp_table["query"]
+            or self._deferred_temp_table["selectable"]
+        )
+
+    def materialize_deferred_temp_table(self) -> None:
+        """Creates the deferred temporary table, against which all further queries of the batch are executed."""
+        self._selectable = self._create_temp_table_selectable(
+            **self._deferred_temp_table
+        )
+        self._deferred_temp_table = None
+
+    def cancel_deferred_temp_table(self) -> None:
+        """Keeps validating the batch using a subselect statement, rather than a temporary table."""
+        self._deferred_temp_table = None
+
+    def _create_temp_table_selectable(
+        self, query=None, selectable=None, temp_table_schema_name=None
+    ):
+        """Creates a temporary table of the query (or selectable), and returns it as a selectable."""
+        dialect: GESqlDialect = GESqlDialect(self._engine.dialect.name.lower())
+        generated_table_name = generate_temporary_table_name()
+        # mssql expects all temporary table names to have a prefix '#'
+        if dialect == GESqlDialect.MSSQL:
+            generated_table_name = f"#{generated_table_name}"
+        if selectable is not None:
+            if dialect in [GESqlDialect.ORACLE, GESqlDialect.MSSQL] and isinstance(
+                selectable, str
+            ):
+                # oracle, mssql query could already be passed as a string
+                query = selectable
+            else:
+                # compile selectable to sql statement
+                query = selectable.compile(
+                    dialect=self.sql_engine_dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+        self._create_temporary_table(
+            temp_table_name=generated_table_name,
+            query=query,
+            temp_table_schema_name=temp_table_schema_name,
+        )
+        self._uses_temp_table = True
+        return sa.Table(
+            generated_table_name,
+            sa.MetaData(),
+            schema=temp_table_schema_name,
+        )
+
     def _create_temporary_table(
         self, temp_table_name, query, temp_table_schema_name=None
     ) -> None:
@@ -195,83 +252,98 @@ class SqlAlchemyBatchData(BatchData):
         Create Temporary table based on sql query. This will be used as a basis for executing expectations.
         :param query:
         """
-        dialect_name: str = self.sql_engine_dialect.name.lower()
+        create_temporary_table(
+            engine=self._engine,
+            temp_table_name=temp_table_name,
+            query=query,
+            temp_table_schema_name=temp_table_schema_name,
+        )
 
-        try:
-            dialect: Union[GESqlDialect, str] = GESqlDialect(dialect_name)
-        except ValueError:
-            dialect: Union[GESqlDialect, str] = dialect_name
-
-        if dialect == GESqlDialect.BIGQUERY:
-            # BigQuery Table is created using with an expiration of 24 hours using Google's Data Definition Language
-            # https://stackoverflow.com/questions/20673986/how-to-create-temporary-table-in-google-bigquery
-            stmt = f"""CREATE OR REPLACE TABLE `{temp_table_name}`
-                    OPTIONS(
-                        expiration_timestamp=TIMESTAMP_ADD(
-                        CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)
-                    )
-                    AS {query}"""
-        elif dialect == GESqlDialect.DREMIO:
-            stmt = f"CREATE OR REPLACE VDS {temp_table_name} AS {query}"
-        elif dialect == GESqlDialect.SNOWFLAKE:
-            if temp_table_schema_name is not None:
-                temp_table_name = f"{temp_table_schema_name}.{temp_table_name}"
-
-            stmt = f"CREATE OR REPLACE TEMPORARY TABLE {temp_table_name} AS {query}"
-        elif dialect == GESqlDialect.MYSQL:
-            stmt = f"CREATE TEMPORARY TABLE {temp_table_name} AS {query}"
-        elif dialect == GESqlDialect.HIVE:
-            stmt = f"CREATE TEMPORARY TABLE `{temp_table_name}` AS {query}"
-        elif dialect == GESqlDialect.MSSQL:
-            # Insert "into #{temp_table_name}" in the custom sql query right before the "from" clause
-            # Split is case sensitive so detect case.
-            # Note: transforming query to uppercase/lowercase has unintended consequences (i.e.,
-            # changing column names), so this is not an option!
-            # noinspection PyUnresolvedReferences
-            if isinstance(query, sa.dialects.mssql.base.MSSQLCompiler):
-                query = query.string  # extracting string from MSSQLCompiler object
-
-            if "from" in query:
-                strsep = "from"
-            else:
-                strsep = "FROM"
-            querymod = query.split(strsep, maxsplit=1)
-            stmt = f"{querymod[0]}into {{temp_table_name}} from{querymod[1]}".format(
-                temp_table_name=temp_table_name
-            )
-        # TODO: <WILL> logger.warning is emitted in situations where a permanent TABLE is created in _create_temporary_table()
-        # Similar message may be needed in the future for Trino backend.
-        elif dialect == GESqlDialect.TRINO:
-            logger.warning(
-                f"GE has created permanent view {temp_table_name} as part of processing SqlAlchemyBatchData, which usually creates a TEMP TABLE."
-            )
-            stmt = f"CREATE TABLE {temp_table_name} AS {query}"
-        elif dialect == GESqlDialect.AWSATHENA:
-            logger.warning(
-                f"GE has created permanent TABLE {temp_table_name} as part of processing SqlAlchemyBatchData, which usually creates a TEMP TABLE."
-            )
-            stmt = f"CREATE TABLE {temp_table_name} AS {query}"
-        elif dialect == GESqlDialect.ORACLE:
-            # oracle 18c introduced PRIVATE temp tables which are transient objects
-            stmt_1 = "CREATE PRIVATE TEMPORARY TABLE {temp_table_name} ON COMMIT PRESERVE DEFINITION AS {query}".format(
-                temp_table_name=temp_table_name, query=query
-            )
-            # prior to oracle 18c only GLOBAL temp tables existed and only the data is transient
-            # this means an empty table will persist after the db session
-            stmt_2 = "CREATE GLOBAL TEMPORARY TABLE {temp_table_name} ON COMMIT PRESERVE ROWS AS {query}".format(
-                temp_table_name=temp_table_name, query=query
-            )
-        # Please note that Teradata is currently experimental (as of 0.13.43)
-        elif dialect == GESqlDialect.TERADATASQL:
-            stmt = 'CREATE VOLATILE TABLE "{temp_table_name}" AS ({query}) WITH DATA NO PRIMARY INDEX ON COMMIT PRESERVE ROWS'.format(
-                temp_table_name=temp_table_name, query=query
-            )
-        else:
-            stmt = f'CREATE TEMPORARY TABLE "{temp_table_name}" AS {query}'
-        if dialect == GESqlDialect.ORACLE:
-            try:
-                self._engine.execute(stmt_1)
-            except DatabaseError:
-                self._engine.execute(stmt_2)
+
+def create_temporary_table(
+    engine, temp_table_name, query, temp_table_schema_name=None
+) -> None:
+    """
+    Create Temporary table based on sql query, using the dialect-specific syntax of the engine (or connection).
+    :param query:
+    """
+    dialect_name: str = engine.dialect.name.lower()
+
+    try:
+        dialect: Union[GESqlDialect, str] = GESqlDialect(dialect_name)
+    except ValueError:
+        dialect: Union[GESqlDialect, str] = dialect_name
+
+    if dialect == GESqlDialect.BIGQUERY:
+        # BigQuery Table is created using with an expiration of 24 hours using Google's Data Definition Language
+        # https://stackoverflow.com/questions/20673986/how-to-create-temporary-table-in-google-bigquery
+        stmt = f"""CREATE OR REPLACE TABLE `{temp_table_name}`
+                OPTIONS(
+                    expiration_timestamp=TIMESTAMP_ADD(
+                    CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)
+                )
+                AS {query}"""
+    elif dialect == GESqlDialect.DREMIO:
+        stmt = f"CREATE OR REPLACE VDS {temp_table_name} AS {query}"
+    elif dialect == GESqlDialect.SNOWFLAKE:
+        if temp_table_schema_name is not None:
+            temp_table_name = f"{temp_table_schema_name}.{temp_table_name}"
+
+        stmt = f"CREATE OR REPLACE TEMPORARY TABLE {temp_table_name} AS {query}"
+    elif dialect == GESqlDialect.MYSQL:
+        stmt = f"CREATE TEMPORARY TABLE {temp_table_name} AS {query}"
+    elif dialect == GESqlDialect.HIVE:
+        stmt = f"CREATE TEMPORARY TABLE `{temp_table_name}` AS {query}"
+    elif dialect == GESqlDialect.MSSQL:
+        # Insert "into #{temp_table_name}" in the custom sql query right before the "from" clause
+        # Split is case sensitive so detect case.
+        # Note: transforming query to uppercase/lowercase has unintended consequences (i.e.,
+        # changing column names), so this is not an option!
+        # noinspection PyUnresolvedReferences
+        if isinstance(query, sa.dialects.mssql.base.MSSQLCompiler):
+            query = query.string  # extracting string from MSSQLCompiler object
+
+        if "from" in query:
+            strsep = "from"
         else:
-            self._engine.execute(stmt)
+            strsep = "FROM"
+        querymod = query.split(strsep, maxsplit=1)
+        stmt = f"{querymod[0]}into {{temp_table_name}} from{querymod[1]}".format(
+            temp_table_name=temp_table_name
+        )
+    # TODO: <WILL> logger.warning is emitted in situations where a permanent TABLE is created in _create_temporary_table()
+    # Similar message may be needed in the future for Trino backend.
+    elif dialect == GESqlDialect.TRINO:
+        logger.warning(
+            f"GE has created permanent view {temp_table_name} as part of processing SqlAlchemyBatchData, which usually creates a TEMP TABLE."
+        )
+        stmt = f"CREATE TABLE {temp_table_name} AS {query}"
+    elif dialect == GESqlDialect.AWSATHENA:
+        logger.warning(
+            f"GE has created permanent TABLE {temp_table_name} as part of processing SqlAlchemyBatchData, which usually creates a TEMP TABLE."
+        )
+        stmt = f"CREATE TABLE {temp_table_name} AS {query}"
+    elif dialect == GESqlDialect.ORACLE:
+        # oracle 18c introduced PRIVATE temp tables which are transient objects
+        stmt_1 = "CREATE PRIVATE TEMPORARY TABLE {temp_table_name} ON COMMIT PRESERVE DEFINITION AS {query}".format(
+            temp_table_name=temp_table_name, query=query
+        )
+        # prior to oracle 18c only GLOBAL temp tables existed and only the data is transient
+        # this means an empty table will persist after the db session
+        stmt_2 = "CREATE GLOBAL TEMPORARY TABLE {temp_table_name} ON COMMIT PRESERVE ROWS AS {query}".format(
+            temp_table_name=temp_table_name, query=query
+        )
+    # Please note that Teradata is currently experimental (as of 0.13.43)
+    elif dialect == GESqlDialect.TERADATASQL:
+        stmt = 'CREATE VOLATILE TABLE "{temp_table_name}" AS ({query}) WITH DATA NO PRIMARY INDEX ON COMMIT PRESERVE ROWS'.format(
+            temp_table_name=temp_table_name, query=query
+        )
+    else:
+        stmt = f'CREATE TEMPORARY TABLE "{temp_table_name}" AS {query}'
+    if dialect == GESqlDialect.ORACLE:
+        try:
+            engine.execute(stmt_1)
+        except DatabaseError:
+            engine.execute(stmt_2)
+    else:
+        engine.execute(stmt)
@@ -8,6 +8,7 @@ class GESqlDialect(enum.Enum):
     AWSATHENA = "awsathena"
     BIGQUERY = "bigquery"
     DREMIO = "dremio"
+    DUCKDB = "duckdb"
     HIVE = "hive"
     MSSQL = "mssql"
     MYSQL = "mysql"
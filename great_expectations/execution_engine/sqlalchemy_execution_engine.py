@@ -1,14 +1,17 @@
 import copy
 import datetime
+import json
 import logging
 import math
-import random
 import re
-import string
+import time
 import traceback
 import warnings
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from packaging import version
 
 from great_expectations._version import get_versions  # isort:skip
 
@@ -26,11 +29,17 @@ del get_versions  # isort:skip
 
 
 from great_expectations.core import IDDict
+from great_expectations.core.async_executor import AsyncExecutor, AsyncResult
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.core.sqlalchemy_engine_registry import (
+    create_key_pair_auth_sqlalchemy_engine,
+    create_sqlalchemy_engine,
+    sqlalchemy_engine_registry,
+)
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.exceptions import (
@@ -41,14 +50,23 @@ from great_expectations.exceptions import (
     InvalidConfigError,
 )
 from great_expectations.exceptions import exceptions as ge_exceptions
-from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
+    ExecutionEngine,
+    MetricApproximation,
     MetricDomainTypes,
+    MetricFunctionTypes,
     SplitDomainKwargs,
 )
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
+    create_temporary_table,
 )
+from great_expectations.execution_engine.sqlalchemy_dialect import GESqlDialect
+from great_expectations.execution_engine.sqlalchemy_query_recorder import (
+    SqlAlchemyQueryRecorder,
+)
+from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -56,6 +74,7 @@ from great_expectations.expectations.row_conditions import (
 )
 from great_expectations.util import (
     filter_properties_dict,
+    generate_temporary_table_name,
     get_sqlalchemy_selectable,
     get_sqlalchemy_url,
     import_library_module,
@@ -75,13 +94,20 @@ except ImportError:
 try:
     from sqlalchemy.engine import Dialect, Row
     from sqlalchemy.exc import OperationalError
-    from sqlalchemy.sql import Selectable
+    from sqlalchemy.sql import Selectable, operators, visitors
     from sqlalchemy.sql.elements import (
         BooleanClauseList,
+        ColumnClause,
+        FunctionFilter,
         Label,
+        Over,
         TextClause,
+        WithinGroup,
         quoted_name,
     )
+    from sqlalchemy.sql.functions import FunctionElement
+    from sqlalchemy.sql.selectable import ScalarSelect, SelectBase
+    from sqlalchemy.util import LRUCache
 except ImportError:
     Row = None
     Dialect = None
@@ -93,6 +119,16 @@ except ImportError:
     quoted_name = None
     OperationalError = None
     Label = None
+    operators = None
+    visitors = None
+    ColumnClause = None
+    FunctionFilter = None
+    Over = None
+    WithinGroup = None
+    FunctionElement = None
+    ScalarSelect = None
+    SelectBase = None
+    LRUCache = None
 
 
 try:
@@ -125,6 +161,7 @@ except (ImportError, KeyError, AttributeError):
     snowflake = None
 
 _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
+
 try:
     import sqlalchemy_bigquery as sqla_bigquery
 
@@ -212,7 +249,192 @@ def _get_dialect_type_module(dialect):
     return dialect
 
 
+# Aggregate functions ignore NULL inputs; hence, restricting their input to the rows satisfying a condition can be
+# expressed either as "FILTER (WHERE <condition>)" or by replacing each argument with "CASE WHEN <condition> THEN
+# <argument> END", which allows metrics of several conditional domains to be computed in a single scan.
+_CONDITIONABLE_AGGREGATE_FUNCTION_NAMES = {
+    "avg",
+    "bool_and",
+    "bool_or",
+    "corr",
+    "count",
+    "covar_pop",
+    "covar_samp",
+    "every",
+    "max",
+    "min",
+    "stddev",
+    "stddev_pop",
+    "stddev_samp",
+    "sum",
+    "var_pop",
+    "var_samp",
+    "variance",
+}
+
+
+def _supports_aggregate_filter_clause(dialect) -> bool:
+    """Returns True if the dialect supports the "FILTER (WHERE <condition>)" clause on aggregate functions."""
+    dialect_name: str = dialect.name.lower()
+    if dialect_name == "postgresql":
+        return True
+
+    if dialect_name == "sqlite":
+        # The aggregate FILTER clause is supported as of SQLite 3.30.0.
+        return (dialect.server_version_info or (0,)) >= (3, 30)
+
+    return False
+
+
+def _condition_aggregate_function(
+    function: "FunctionElement", condition: Any, use_filter_clause: bool
+) -> "FunctionElement":
+    if use_filter_clause:
+        return function.filter(condition)
+
+    arguments: list = []
+    for argument in function.clauses.clauses:
+        if isinstance(argument, ColumnClause) and argument.name == "*":
+            # count(*) counts every row; count(CASE WHEN <condition> THEN 1 END) counts every row satisfying condition.
+            arguments.append(sa.case([(condition, sa.literal_column("1"))]))
+        elif getattr(argument, "operator", None) is operators.distinct_op:
+            arguments.append(sa.distinct(sa.case([(condition, argument.element)])))
+        else:
+            arguments.append(sa.case([(condition, argument)]))
+
+    return getattr(sa.func, function.name)(*arguments, type_=function.type)
+
+
+def _references_rows_outside_of(element: Any, conditioned_ids: set) -> bool:
+    if id(element) in conditioned_ids:
+        return False
+
+    if isinstance(element, (ColumnClause, TextClause)):
+        return True
+
+    return any(
+        _references_rows_outside_of(element=child, conditioned_ids=conditioned_ids)
+        for child in element.get_children()
+    )
+
+
+def _condition_aggregate_metric_fn(
+    metric_fn: Any, condition: Any, use_filter_clause: bool
+) -> Optional[Any]:
+    """Rewrites an aggregate metric function so that it is computed only over the rows satisfying the condition.
+
+    Args:
+        metric_fn: SQLAlchemy expression of an aggregate metric (as returned by its metric provider function)
+        condition: SQLAlchemy boolean expression (e.g., as returned by "parse_condition_to_sqlalchemy()")
+        use_filter_clause: if True, conditions aggregates using "FILTER (WHERE ...)"; otherwise, using "CASE WHEN"
+
+    Returns:
+        Rewritten expression or None, if the expression cannot be shown to be equivalent to computing the original
+        expression over the rows satisfying the condition (e.g., if it references columns outside of an aggregate).
+    """
+    for element in visitors.iterate(metric_fn):
+        if isinstance(
+            element, (FunctionFilter, Over, WithinGroup, ScalarSelect, SelectBase)
+        ):
+            return None
+
+    conditioned_ids: set = set()
+
+    def replace(element: Any) -> Optional[Any]:
+        if (
+            isinstance(element, FunctionElement)
+            and not element.packagenames
+            and element.name.lower() in _CONDITIONABLE_AGGREGATE_FUNCTION_NAMES
+        ):
+            conditioned = _condition_aggregate_function(
+                function=element,
+                condition=condition,
+                use_filter_clause=use_filter_clause,
+            )
+            conditioned_ids.add(id(conditioned))
+            return conditioned
+
+        return None
+
+    conditioned_metric_fn = visitors.replacement_traverse(metric_fn, {}, replace)
+    if not conditioned_ids or _references_rows_outside_of(
+        element=conditioned_metric_fn, conditioned_ids=conditioned_ids
+    ):
+        return None
+
+    return conditioned_metric_fn
+
+
+# Dialect-native approximate aggregate functions, used to approximate metrics (if enabled), keyed by dialect name and
+# metric name.  The error bounds are the typical errors documented for the respective functions.
+SQLALCHEMY_METRIC_APPROXIMATIONS: Dict[str, Dict[str, MetricApproximation]] = {
+    "bigquery": {
+        "column.distinct_values.count": MetricApproximation(
+            method="approx_count_distinct", error_bound=0.01
+        ),
+    },
+    "mssql": {
+        "column.distinct_values.count": MetricApproximation(
+            method="approx_count_distinct", error_bound=0.02
+        ),
+    },
+    "snowflake": {
+        "column.distinct_values.count": MetricApproximation(
+            method="approx_count_distinct", error_bound=0.0162
+        ),
+        "column.quantile_values": MetricApproximation(
+            method="approx_percentile", error_bound=0.01
+        ),
+        "column.median": MetricApproximation(
+            method="approx_percentile", error_bound=0.01
+        ),
+    },
+    "trino": {
+        "column.distinct_values.count": MetricApproximation(
+            method="approx_distinct", error_bound=0.023
+        ),
+        "column.quantile_values": MetricApproximation(
+            method="approx_percentile", error_bound=0.01
+        ),
+        "column.median": MetricApproximation(
+            method="approx_percentile", error_bound=0.01
+        ),
+    },
+    "awsathena": {
+        "column.distinct_values.count": MetricApproximation(
+            method="approx_distinct", error_bound=0.023
+        ),
+        "column.quantile_values": MetricApproximation(
+            method="approx_percentile", error_bound=0.01
+        ),
+        "column.median": MetricApproximation(
+            method="approx_percentile", error_bound=0.01
+        ),
+    },
+}
+
+# Maximum number of compiled metric queries, cached by each SqlAlchemyExecutionEngine.
+DEFAULT_COMPILED_CACHE_SIZE = 1000
+
+# Batches created with "create_temp_table" of "auto" are materialized, if at least this many queries are planned for them
+# (a temporary table costs one evaluation of the batch selectable, and each query saves one).
+DEFAULT_TEMP_TABLE_MIN_QUERIES = 2
+
+# Batch selectables (rendered as SQL), which are expensive (joins, aggregates), or nondeterministic (random sampling), to
+# evaluate repeatedly.
+_COMPLEX_SELECTABLE_PATTERN = re.compile(
+    r"\b(JOIN|GROUP\s+BY|DISTINCT|UNION|INTERSECT|EXCEPT|OVER\s*\(|(COUNT|SUM|AVG|MIN|MAX|RANDOM|RAND)\s*\()",
+    re.IGNORECASE,
+)
+
+# Value sets (of set membership metrics) of at least this many values are loaded into temporary tables, rather than
+# rendered as literal "IN (...)" lists.
+DEFAULT_VALUE_SET_TEMP_TABLE_THRESHOLD = 1000
+
+
 class SqlAlchemyExecutionEngine(ExecutionEngine):
+    batch_fingerprint_marker = "sqlalchemy_data_fingerprint"
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -222,8 +444,20 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         connection_string: Optional[str] = None,
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
-        create_temp_table: bool = True,
+        create_temp_table: Union[bool, str] = True,
         concurrency: Optional[ConcurrencyConfig] = None,
+        metric_cache: Optional[Union[MetricCache, dict]] = None,
+        bundle_row_conditions: bool = False,
+        approximate_metrics: bool = False,
+        value_set_temp_table_threshold: Optional[
+            int
+        ] = DEFAULT_VALUE_SET_TEMP_TABLE_THRESHOLD,
+        compiled_cache_size: Optional[int] = DEFAULT_COMPILED_CACHE_SIZE,
+        temp_table_min_queries: int = DEFAULT_TEMP_TABLE_MIN_QUERIES,
+        temp_table_min_explain_cost: Optional[float] = None,
+        shared_engine: bool = False,
+        record_queries: bool = False,
+        explain_queries: bool = False,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ) -> None:
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -250,15 +484,87 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
-                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine.
+                concurrency (ConcurrencyConfig): Concurrency config used to configure the sqlalchemy engine and to
+                    control concurrent resolution of independent metric groups (e.g., queries for separate domains).
+                    If not provided, the concurrency config of the data_context (if any) is used.
+                metric_cache (MetricCache or dict): MetricCache instance (or its configuration) used to cache resolved
+                    metrics; by default, a least-recently-used MetricCache with the default bounds is used.
+                bundle_row_conditions (bool): If True, aggregate metrics of domains, which differ only by their
+                    row_condition, are computed in a single scan of the unconditioned domain (conditioning each
+                    aggregate using "FILTER (WHERE ...)", where supported by the dialect, or "CASE WHEN ... END").
+                approximate_metrics (bool): If True, expensive metrics (e.g., distinct value counts, quantiles) are
+                    approximated using the approximate aggregate functions of the dialect (where available).
+                value_set_temp_table_threshold (int): Value sets of set membership metrics (e.g.,
+                    "column_values.in_set") with at least this many values are loaded into a temporary table, and the
+                    metrics are computed using a semi-join (anti-join) with it, rather than a literal "IN (...)" list;
+                    None disables temporary tables for value sets.  Only used if temporary tables are enabled
+                    ("create_temp_table"), and not if metrics are resolved concurrently (over several connections, on
+                    which the temporary tables are not visible).
+                compiled_cache_size (int): The number of compiled metric queries, which are cached for reuse across
+                    batches, apart from the (smaller, and shared with any other statement) compiled cache of the
+                    engine; None caches metric queries in the compiled cache of the engine.  Only used with SQLAlchemy
+                    1.4 or later (earlier versions execute metric queries directly).
+                temp_table_min_queries (int): Batches, for which "create_temp_table" is "auto", are materialized as
+                    temporary tables, once the metrics to be resolved are known, if at least this many queries are
+                    planned for them, and if their selectable is expensive to evaluate (see "plan_batch_metrics()").
+                temp_table_min_explain_cost (float): If given, the selectable of a batch, for which
+                    "create_temp_table" is "auto", is considered expensive to evaluate, if its "EXPLAIN" cost is at
+                    least this high (where the dialect reports it), rather than if it contains joins or aggregates, or
+                    reads a view.
+                shared_engine (bool): If True, the SqlAlchemy engine (built from the credentials, connection_string,
+                    or url) is shared, through the process-wide SqlAlchemyEngineRegistry, with any execution engine or
+                    store backend connecting to the same database, with the same credentials and engine options (e.g.,
+                    "pool_size", "pool_recycle", "pool_pre_ping"); it is released by "close()".
+                record_queries (bool): If True, the queries issued while resolving metrics (including those issued
+                    directly by metric providers) and splitting batches are recorded, with their SQL text, bound
+                    parameters, duration, number of rows, and the ids of the metrics they served; the Validator
+                    attaches them to the "meta" of the results of the expectations they served (under
+                    "query_records").
+                explain_queries (bool): If True (and "record_queries" is enabled), the plan of each recorded SELECT
+                    query, as reported by "EXPLAIN", is recorded along with it (at the cost of explaining every
+                    query).
         """
-        super().__init__(name=name, batch_data_dict=batch_data_dict)
+        super().__init__(
+            name=name,
+            batch_data_dict=batch_data_dict,
+            metric_cache=metric_cache,
+            approximate_metrics=approximate_metrics,
+        )
         self._name = name
 
         self._credentials = credentials
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._bundle_row_conditions = bundle_row_conditions
+
+        self._value_set_temp_table_threshold = value_set_temp_table_threshold
+        # Temporary tables of value sets, keyed by the query creating their (typed) schema and by their values.
+        self._value_set_temp_tables: Dict[Tuple[str, frozenset], sa.Table] = {}
+
+        # Only SQLAlchemy 1.4 and later key compiled caches by the structure of statements (rather than by statements).
+        self._compiled_cache: Optional[LRUCache] = (
+            LRUCache(compiled_cache_size)
+            if compiled_cache_size
+            and version.parse(sa.__version__) >= version.parse("1.4")
+            else None
+        )
+
+        self._temp_table_min_queries = temp_table_min_queries
+        self._temp_table_min_explain_cost = temp_table_min_explain_cost
+
+        # Whether the engine was obtained from (and is to be released to) the SqlAlchemyEngineRegistry.
+        self._shared_engine = shared_engine and engine is None
+
+        if isinstance(concurrency, dict):
+            concurrency = ConcurrencyConfig(**concurrency)
+        elif concurrency is None:
+            if data_context is None or data_context.concurrency is None:
+                concurrency = ConcurrencyConfig()
+            else:
+                concurrency = data_context.concurrency
+
+        self._concurrency = concurrency
 
         if engine is not None:
             if credentials is not None:
@@ -268,22 +574,20 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 )
             self.engine = engine
         else:
-            concurrency: ConcurrencyConfig
-            if data_context is None or data_context.concurrency is None:
-                concurrency = ConcurrencyConfig()
-            else:
-                concurrency = data_context.concurrency
-
             concurrency.add_sqlalchemy_create_engine_parameters(kwargs)
 
             if credentials is not None:
                 self.engine = self._build_engine(credentials=credentials, **kwargs)
             elif connection_string is not None:
-                self.engine = sa.create_engine(connection_string, **kwargs)
+                self.engine = create_sqlalchemy_engine(
+                    connection_string, shared=self._shared_engine, **kwargs
+                )
             elif url is not None:
                 parsed_url = make_url(url)
                 self.drivername = parsed_url.drivername
-                self.engine = sa.create_engine(url, **kwargs)
+                self.engine = create_sqlalchemy_engine(
+                    url, shared=self._shared_engine, **kwargs
+                )
             else:
                 raise InvalidConfigError(
                     "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -326,6 +630,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             self.dialect_module = import_library_module(
                 module_name=_BIGQUERY_MODULE_NAME
             )
+        elif self.engine.dialect.name.lower() == "duckdb":
+            self.dialect_module = import_library_module(module_name="duckdb_engine")
         elif self.engine.dialect.name.lower() == "teradatasql":
             # WARNING: Teradata Support is experimental, functionality is not fully under test
             self.dialect_module = import_library_module(
@@ -344,9 +650,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "mssql",
             "snowflake",
             "mysql",
+            "duckdb",
         ]:
             self._engine_backup = self.engine
-            # sqlite/mssql temp tables only persist within a connection so override the engine
+            # sqlite/mssql/duckdb temp tables only persist within a connection so override the engine
             self.engine = self.engine.connect()
             if self._engine_backup.dialect.name.lower() == "sqlite" and not isinstance(
                 self._engine_backup, sa.engine.base.Connection
@@ -354,6 +661,12 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 raw_connection = self._engine_backup.raw_connection()
                 raw_connection.create_function("sqrt", 1, lambda x: math.sqrt(x))
 
+        self._query_recorder: Optional[SqlAlchemyQueryRecorder] = None
+        if record_queries:
+            self._query_recorder = SqlAlchemyQueryRecorder(
+                engine=self.engine, explain=explain_queries
+            )
+
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
             data_context, "_usage_statistics_handler", None
@@ -378,11 +691,32 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "metric_cache": metric_cache if isinstance(metric_cache, dict) else None,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        if bundle_row_conditions:
+            self._config["bundle_row_conditions"] = bundle_row_conditions
+        if approximate_metrics:
+            self._config["approximate_metrics"] = approximate_metrics
+        if shared_engine:
+            self._config["shared_engine"] = shared_engine
+        if record_queries:
+            self._config["record_queries"] = record_queries
+        if explain_queries:
+            self._config["explain_queries"] = explain_queries
+        if value_set_temp_table_threshold != DEFAULT_VALUE_SET_TEMP_TABLE_THRESHOLD:
+            self._config[
+                "value_set_temp_table_threshold"
+            ] = value_set_temp_table_threshold
+        if compiled_cache_size != DEFAULT_COMPILED_CACHE_SIZE:
+            self._config["compiled_cache_size"] = compiled_cache_size
+        if temp_table_min_queries != DEFAULT_TEMP_TABLE_MIN_QUERIES:
+            self._config["temp_table_min_queries"] = temp_table_min_queries
+        if temp_table_min_explain_cost is not None:
+            self._config["temp_table_min_explain_cost"] = temp_table_min_explain_cost
 
         self._data_splitter = SqlAlchemyDataSplitter()
         self._data_sampler = SqlAlchemyDataSampler()
@@ -399,6 +733,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self) -> Optional[str]:
         return self._url
 
+    @property
+    def concurrency(self) -> ConcurrencyConfig:
+        return self._concurrency
+
     @property
     def dialect(self) -> Dialect:
         return self.engine.dialect
@@ -412,6 +750,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         """
         return self.engine.dialect.name.lower()
 
+    def _get_metric_approximations(self) -> Dict[str, MetricApproximation]:
+        return SQLALCHEMY_METRIC_APPROXIMATIONS.get(self.dialect_name, {})
+
     def _build_engine(self, credentials: dict, **kwargs) -> "sa.engine.Engine":
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -431,16 +772,25 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         if connect_args:
             create_engine_kwargs["connect_args"] = connect_args
 
+        self.drivername = drivername
         if "private_key_path" in credentials:
-            options, create_engine_kwargs = self._get_sqlalchemy_key_pair_auth_url(
-                drivername, credentials
+            secrets: dict = {
+                key: credentials.pop(key)
+                for key in ("private_key_path", "private_key_passphrase")
+            }
+            return create_key_pair_auth_sqlalchemy_engine(
+                drivername=drivername,
+                credentials=credentials,
+                secrets=secrets,
+                get_key_pair_auth_url=self._get_sqlalchemy_key_pair_auth_url,
+                shared=self._shared_engine,
+                **create_engine_kwargs,
             )
-        else:
-            options = get_sqlalchemy_url(drivername, **credentials)
 
-        self.drivername = drivername
-        engine = sa.create_engine(options, **create_engine_kwargs)
-        return engine
+        options = get_sqlalchemy_url(drivername, **credentials)
+        return create_sqlalchemy_engine(
+            options, shared=self._shared_engine, **create_engine_kwargs
+        )
 
     def _get_sqlalchemy_key_pair_auth_url(
         self, drivername: str, credentials: dict
@@ -879,13 +1229,14 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         # We need a different query for each domain (where clause).
         queries: Dict[Tuple, dict] = {}
+        # Metrics are bundled in a stable order, so that equal bundles result in the same (cached) compiled query.
         for (
             metric_to_resolve,
             engine_fn,
             compute_domain_kwargs,
             accessor_domain_kwargs,
             metric_provider_kwargs,
-        ) in metric_fn_bundle:
+        ) in sorted(metric_fn_bundle, key=lambda bundle: str(bundle[0].id)):
             if not isinstance(compute_domain_kwargs, IDDict):
                 compute_domain_kwargs = IDDict(compute_domain_kwargs)
             domain_id = compute_domain_kwargs.to_id()
@@ -896,11 +1247,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     "domain_kwargs": compute_domain_kwargs,
                 }
             if self.engine.dialect.name == "clickhouse":
+                # Labels are made unique within the query (deterministically, so that the statement remains cacheable).
                 queries[domain_id]["select"].append(
                     engine_fn.label(
-                        metric_to_resolve.metric_name.join(
-                            random.choices(string.ascii_lowercase, k=2)
-                        )
+                        f"{metric_to_resolve.metric_name}_{len(queries[domain_id]['ids'])}"
                     )
                 )
             else:
@@ -908,47 +1258,332 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     engine_fn.label(metric_to_resolve.metric_name)
                 )
             queries[domain_id]["ids"].append(metric_to_resolve.id)
-        for query in queries.values():
-            domain_kwargs = query["domain_kwargs"]
-            selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs,
+
+        if self._bundle_row_conditions:
+            queries = self._bundle_row_condition_queries(queries=queries)
+
+        # Queries for separate domains are independent of one another, and may be issued concurrently (if enabled).
+        with self._build_metric_resolution_executor(
+            max_workers=len(queries)
+        ) as async_executor:
+            async_results: List[Tuple[dict, AsyncResult]] = [
+                (query, async_executor.submit(self._execute_bundled_query, query=query))
+                for query in queries.values()
+            ]
+            for query, async_result in async_results:
+                res: List[Row] = async_result.result()
+                for idx, id in enumerate(query["ids"]):
+                    resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+
+        return resolved_metrics
+
+    def _bundle_row_condition_queries(
+        self, queries: Dict[Tuple, dict]
+    ) -> Dict[Tuple, dict]:
+        """Merges the queries of domains, which differ only by their row_condition, into the query of their common
+        unconditioned domain, so that all of them are computed in a single scan.  Queries containing any metric, which
+        cannot be rewritten as an aggregate over the unconditioned domain, are left as they are.
+
+        Args:
+            queries: dictionary of queries (as built by "resolve_metric_bundle()"), keyed by domain id
+
+        Returns:
+            Dictionary of queries, keyed by domain id
+        """
+        use_filter_clause: bool = _supports_aggregate_filter_clause(
+            dialect=self.engine.dialect
+        )
+
+        # Group the domains by the domain remaining once their row_condition is dropped.
+        base_domains: Dict[Tuple, dict] = {}
+        domain_id: Tuple
+        query: dict
+        for domain_id, query in queries.items():
+            domain_kwargs: IDDict = query["domain_kwargs"]
+            row_condition: Optional[str] = domain_kwargs.get("row_condition")
+            if (
+                row_condition is not None
+                and domain_kwargs.get("condition_parser")
+                != "great_expectations__experimental__"
+            ):
+                continue
+
+            base_domain_kwargs = IDDict(
+                {
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key not in ["row_condition", "condition_parser"]
+                }
             )
-            assert len(query["select"]) == len(query["ids"])
-            try:
-                """
-                If a custom query is passed, selectable will be TextClause and not formatted
-                as a subquery wrapped in "(subquery) alias". TextClause must first be converted
-                to TextualSelect using sa.columns() before it can be converted to type Subquery
-                """
+            base_domain = base_domains.setdefault(
+                base_domain_kwargs.to_id(),
+                {
+                    "domain_kwargs": base_domain_kwargs,
+                    "base_domain_id": None,
+                    "conditioned_queries": {},
+                },
+            )
+            if row_condition is None:
+                base_domain["base_domain_id"] = domain_id
+                continue
+
+            condition = parse_condition_to_sqlalchemy(row_condition)
+            conditioned_select: list = []
+            for labeled_metric_fn in query["select"]:
+                conditioned_metric_fn = _condition_aggregate_metric_fn(
+                    metric_fn=labeled_metric_fn.element,
+                    condition=condition,
+                    use_filter_clause=use_filter_clause,
+                )
+                if conditioned_metric_fn is None:
+                    break
+
+                conditioned_select.append(
+                    conditioned_metric_fn.label(labeled_metric_fn.name)
+                )
+            else:
+                base_domain["conditioned_queries"][domain_id] = conditioned_select
+
+        for base_domain_id, base_domain in base_domains.items():
+            conditioned_queries: Dict[Tuple, list] = base_domain["conditioned_queries"]
+            # Merging saves scans only if it leaves fewer queries than there are to begin with.
+            if (
+                len(conditioned_queries) + (base_domain["base_domain_id"] is not None)
+                < 2
+            ):
+                continue
+
+            if base_domain["base_domain_id"] is None:
+                base_query = {
+                    "select": [],
+                    "ids": [],
+                    "domain_kwargs": base_domain["domain_kwargs"],
+                }
+                queries[base_domain_id] = base_query
+            else:
+                base_query = queries[base_domain["base_domain_id"]]
+
+            for domain_id, conditioned_select in conditioned_queries.items():
+                query = queries.pop(domain_id)
+                base_query["select"].extend(conditioned_select)
+                base_query["ids"].extend(query["ids"])
+
+            logger.debug(
+                f"SqlAlchemyExecutionEngine bundled {len(conditioned_queries)} row_condition domains into domain_id {base_domain_id}"
+            )
+
+        return queries
+
+    def _execute_bundled_query(self, query: dict) -> List[Row]:
+        """Executes a single query, computing all bundled metrics of one domain, and fetches its (single) result row.
+
+        Args:
+            query: dictionary with the metric functions ("select"), their metric ids ("ids"), and "domain_kwargs"
+
+        Returns:
+            List of row results.
+        """
+        domain_kwargs = query["domain_kwargs"]
+        selectable = self.get_domain_records(
+            domain_kwargs=domain_kwargs,
+        )
+        assert len(query["select"]) == len(query["ids"])
+        try:
+            """
+            If a custom query is passed, selectable will be TextClause and not formatted
+            as a subquery wrapped in "(subquery) alias". TextClause must first be converted
+            to TextualSelect using sa.columns() before it can be converted to type Subquery
+            """
+            with self._recording_queries(metric_ids=query["ids"]):
                 if TextClause and isinstance(selectable, TextClause):
-                    res = self.engine.execute(
+                    res = self.execute_metric_query(
                         sa.select(query["select"]).select_from(
                             selectable.columns().subquery()
                         )
                     ).fetchall()
                 else:
-                    res = self.engine.execute(
+                    res = self.execute_metric_query(
                         sa.select(query["select"]).select_from(selectable)
                     ).fetchall()
-                logger.debug(
-                    f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
-                )
-            except OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+                self._count_recorded_rows(rows=len(res))
+            logger.debug(
+                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
+            )
+        except OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(query["ids"]) == len(res[0]), "unexpected number of metrics returned"
+        return res
 
-        return resolved_metrics
+    def execute_metric_query(self, query: Selectable):
+        """Executes a metric query, the compiled form of which is cached in the compiled statement cache of the
+        SqlAlchemyExecutionEngine (see "compiled_cache_size"), if enabled, rather than in that of the engine.
+
+        Compiled statements are keyed by the structure of the query and the dialect (literal values are bound as
+        parameters), so that the queries of a suite, which are built anew for every batch, are compiled only once
+        for all batches sharing their selectable (e.g., batches split or sampled from the same table, or row_condition
+        domains differing only by their values).
+
+        Args:
+            query: the (metric) query
+
+        Returns:
+            The result of the query
+        """
+        if self._compiled_cache is None:
+            return self.engine.execute(query)
+
+        return self.engine.execution_options(
+            compiled_cache=self._compiled_cache
+        ).execute(query)
+
+    @property
+    def query_records(self) -> List[dict]:
+        """The queries recorded (see "record_queries") and not yet popped, as JSON-serializable dictionaries."""
+        if self._query_recorder is None:
+            return []
+
+        return [record.to_json_dict() for record in self._query_recorder.records]
+
+    def pop_query_records(self) -> List[dict]:
+        if self._query_recorder is None:
+            return []
+
+        return [record.to_json_dict() for record in self._query_recorder.pop_records()]
+
+    def _compute_metric(
+        self,
+        metric_to_resolve: MetricConfiguration,
+        metric_fn: Callable,
+        metric_provider_kwargs: dict,
+    ) -> Any:
+        # Queries issued by the metric provider itself (e.g., for medians and quantiles) are attributed to the metric.
+        with self._recording_queries(metric_ids=(metric_to_resolve.id,)):
+            return super()._compute_metric(
+                metric_to_resolve=metric_to_resolve,
+                metric_fn=metric_fn,
+                metric_provider_kwargs=metric_provider_kwargs,
+            )
+
+    @contextmanager
+    def _recording_queries(self, metric_ids: Iterable[Tuple[str, str, str]] = ()):
+        """Records the queries issued (by the current thread) within the context as serving the metrics, if enabled."""
+        if self._query_recorder is None:
+            yield
+            return
+
+        with self._query_recorder.recording(metric_ids=metric_ids):
+            yield
+
+    def _count_recorded_rows(self, rows: int) -> None:
+        if self._query_recorder is not None:
+            self._query_recorder.count_rows(rows=rows)
+
+    def get_value_set_selectable(
+        self, value_set: Iterable, column_name: str, selectable: Selectable
+    ) -> Optional[Selectable]:
+        """Returns a selection of the values of the value_set from a temporary table, with which the values of the
+        column can be compared using a semi-join (anti-join), or None if the value_set is to be rendered as a literal
+        "IN (...)" list (because it is smaller than "value_set_temp_table_threshold", or temporary tables cannot be
+        used).
+
+        The temporary table is created (using the dialect-specific syntax of temporary tables) with the type of the
+        column in the selectable, so that values are compared exactly as in a literal list; tables are reused for
+        equal value sets.
+
+        Args:
+            value_set: the values of the set membership metric
+            column_name: the name of the column compared with the values
+            selectable: the selectable of the domain of the metric, containing the column
+
+        Returns:
+            Selectable of the "value" column of the temporary table (or None)
+        """
+        if (
+            self._value_set_temp_table_threshold is None
+            or len(value_set) < self._value_set_temp_table_threshold
+            or not self._create_temp_table
+            or (
+                # Temporary tables are only visible on the connection creating them.
+                isinstance(self.engine, sa.engine.Engine)
+                and self._concurrency.enabled
+                and self._concurrency.max_metric_resolution_workers > 1
+            )
+        ):
+            return None
+
+        if TextClause and isinstance(selectable, TextClause):
+            selectable = selectable.columns().subquery()
+
+        schema_query = (
+            sa.select([sa.column(column_name).label("value")])
+            .select_from(selectable)
+            .where(sa.text("1 = 0"))
+            .compile(
+                dialect=self.engine.dialect, compile_kwargs={"literal_binds": True}
+            )
+        )
+        try:
+            key: Tuple[str, frozenset] = (str(schema_query), frozenset(value_set))
+        except TypeError:
+            # Unhashable values cannot be looked up; a new table is created for them.
+            key = None
+
+        value_set_table: Optional[sa.Table] = self._value_set_temp_tables.get(key)
+        if value_set_table is None:
+            temp_table_name: str = generate_temporary_table_name()
+            if self.engine.dialect.name.lower() == GESqlDialect.MSSQL.value:
+                temp_table_name = f"#{temp_table_name}"
+
+            create_temporary_table(
+                engine=self.engine, temp_table_name=temp_table_name, query=schema_query
+            )
+            value_set_table = sa.Table(
+                temp_table_name, sa.MetaData(), sa.Column("value")
+            )
+            # The values are bound as parameters of an "executemany" insert, rather than rendered in the statement.
+            self.engine.execute(
+                value_set_table.insert(), [{"value": value} for value in value_set]
+            )
+            logger.debug(
+                f"SqlAlchemyExecutionEngine loaded a value set of {len(value_set)} values into temporary table {temp_table_name}"
+            )
+            if key is not None:
+                self._value_set_temp_tables[key] = value_set_table
+
+        return sa.select([value_set_table.c.value])
+
+    def _build_metric_resolution_executor(self, max_workers: int) -> AsyncExecutor:
+        """Builds the AsyncExecutor used to resolve independent metrics (or groups of metrics) of a single resolution
+        step.  Work is done concurrently only if enabled in the concurrency config, if the engine is backed by a
+        connection pool (an engine, which has been replaced by a single connection, e.g., for temp table visibility,
+        cannot be shared across threads), and if no batch is validated using a temporary table (which is not visible
+        on the other connections of the pool).
+
+        Args:
+            max_workers: the number of independent units of work that are to be submitted to the executor
+
+        Returns:
+            AsyncExecutor instance, intended to be used as a context manager
+        """
+        if not isinstance(self.engine, sa.engine.Engine) or any(
+            isinstance(batch_data, SqlAlchemyBatchData) and batch_data.uses_temp_table
+            for batch_data in self._batch_data_dict.values()
+        ):
+            max_workers = 1
+
+        return AsyncExecutor(
+            concurrency_config=self._concurrency,
+            max_workers=min(
+                max_workers, self._concurrency.max_metric_resolution_workers
+            ),
+        )
 
     def close(self) -> None:
         """
@@ -968,11 +1603,20 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
+        if self._query_recorder is not None:
+            self._query_recorder.remove()
+
         if self._engine_backup:
             self.engine.close()
-            self._engine_backup.dispose()
+            engine = self._engine_backup
         else:
-            self.engine.dispose()
+            engine = self.engine
+
+        if self._shared_engine:
+            # The engine is disposed, once no other execution engine or store backend uses it.
+            sqlalchemy_engine_registry.release(engine)
+        else:
+            engine.dispose()
 
     def _get_splitter_method(self, splitter_method_name: str) -> Callable:
         """Get the appropriate splitter method from the method name.
@@ -1005,7 +1649,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             pattern = re.compile(r"(CAST\(EXTRACT\(.*?\))( AS STRING\))", re.IGNORECASE)
             split_query = re.sub(pattern, r"\1 AS VARCHAR)", split_query)
 
-        return self.engine.execute(split_query).fetchall()
+        with self._recording_queries():
+            rows: List[Row] = self.engine.execute(split_query).fetchall()
+            self._count_recorded_rows(rows=len(rows))
+
+        return rows
 
     def get_data_for_batch_identifiers(
         self, table_name: str, splitter_method_name: str, splitter_kwargs: dict
@@ -1094,6 +1742,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                         """
             )
 
+        query: Optional[str] = None
         batch_data: Optional[SqlAlchemyBatchData] = None
         batch_markers: BatchMarkers = BatchMarkers(
             {
@@ -1118,13 +1767,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 DeprecationWarning,
             )
 
-        create_temp_table: bool = batch_spec.get(
+        create_temp_table: Union[bool, str] = batch_spec.get(
             "create_temp_table", self._create_temp_table
         )
 
         if isinstance(batch_spec, RuntimeQueryBatchSpec):
             # query != None is already checked when RuntimeQueryBatchSpec is instantiated
-            query: str = batch_spec.query
+            query = batch_spec.query
 
             batch_spec.query = "SQLQuery"
             batch_data = SqlAlchemyBatchData(
@@ -1153,4 +1802,204 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 source_schema_name=source_schema_name,
             )
 
+        # Fingerprinting is opt-in, since (unlike for in-memory data) it requires querying the database; the columns
+        # listed (e.g., an "updated_at" column), together with the row count, must reflect any change to the data.
+        batch_fingerprint_columns: Optional[List[str]] = batch_spec.get(
+            "batch_fingerprint_columns"
+        )
+        if batch_fingerprint_columns is not None:
+            batch_markers[
+                "sqlalchemy_data_fingerprint"
+            ] = self._get_sqlalchemy_data_fingerprint(
+                batch_spec=batch_spec,
+                batch_data=batch_data,
+                batch_fingerprint_columns=batch_fingerprint_columns,
+                query=query,
+            )
+
         return batch_data, batch_markers
+
+    def _get_sqlalchemy_data_fingerprint(
+        self,
+        batch_spec: BatchSpec,
+        batch_data: SqlAlchemyBatchData,
+        batch_fingerprint_columns: List[str],
+        query: Optional[str] = None,
+    ) -> str:
+        """Fingerprints the data of a batch by its source (database, table or query, and batch_spec directives) and by
+        the row count and the maximum values of the specified columns."""
+        selectable = batch_data.selectable
+        if TextClause and isinstance(selectable, TextClause):
+            selectable = selectable.columns().subquery()
+
+        res: Row = self.engine.execute(
+            sa.select(
+                [sa.func.count()]
+                + [
+                    sa.func.max(sa.column(column_name))
+                    for column_name in batch_fingerprint_columns
+                ]
+            ).select_from(selectable)
+        ).fetchone()
+
+        return IDDict(
+            {
+                "url": repr(self.engine.engine.url),
+                "batch_spec": convert_to_json_serializable(
+                    data={
+                        key: value
+                        for key, value in batch_spec.items()
+                        if key not in ["batch_data", "query"]
+                    }
+                ),
+                "query": query,
+                "values": [str(value) for value in res],
+            }
+        ).to_id()
+
+    def plan_batch_metrics(
+        self, batch_id: str, metric_configurations: List[MetricConfiguration]
+    ) -> Optional[dict]:
+        """Decides, whether the selectable of a batch, for which "create_temp_table" is "auto", is materialized once as
+        a temporary table, rather than evaluated again (as a subselect statement) by every query of the metrics.
+
+        The batch is materialized, if at least "temp_table_min_queries" queries are planned for its metrics, and if its
+        selectable is expensive to evaluate: if its "EXPLAIN" cost is at least "temp_table_min_explain_cost" (if given,
+        and reported by the dialect), or else, if it contains joins or aggregates, reads a view, or samples at random
+        (in which case every evaluation would yield different records).
+
+        Args:
+            batch_id: the id of the batch
+            metric_configurations: the metrics of the batch, which are about to be resolved
+
+        Returns:
+            Batch markers, recording the decision and its timing (or None, if the batch is not materialized "auto")
+        """
+        batch_data: Optional[SqlAlchemyBatchData] = self._batch_data_dict.get(batch_id)
+        if (
+            not isinstance(batch_data, SqlAlchemyBatchData)
+            or not batch_data.has_deferred_temp_table
+        ):
+            return None
+
+        start_time: float = time.perf_counter()
+        planned_queries: int = self._estimate_query_count(
+            metric_configurations=metric_configurations
+        )
+        explain_cost: Optional[float] = None
+        if self._temp_table_min_explain_cost is not None:
+            explain_cost = self._get_explain_cost(
+                source=batch_data.deferred_temp_table_source
+            )
+
+        if explain_cost is not None:
+            expensive: bool = explain_cost >= self._temp_table_min_explain_cost
+        else:
+            expensive = self._is_complex_batch_selectable(batch_data=batch_data)
+
+        materialize: bool = (
+            expensive and planned_queries >= self._temp_table_min_queries
+        )
+        decision_time: float = time.perf_counter() - start_time
+
+        materialization_time: Optional[float] = None
+        if materialize:
+            start_time = time.perf_counter()
+            batch_data.materialize_deferred_temp_table()
+            materialization_time = time.perf_counter() - start_time
+            # Metrics of the batch, which had been computed from the subselect statement, remain valid.
+            logger.debug(
+                f"SqlAlchemyExecutionEngine materialized batch {batch_id} as a temporary table for {planned_queries} planned queries"
+            )
+        else:
+            batch_data.cancel_deferred_temp_table()
+
+        return {
+            "ge_temp_table_materialization": {
+                "materialized": materialize,
+                "planned_queries": planned_queries,
+                "expensive_selectable": expensive,
+                "explain_cost": explain_cost,
+                "decision_time": decision_time,
+                "materialization_time": materialization_time,
+            }
+        }
+
+    def _estimate_query_count(
+        self, metric_configurations: List[MetricConfiguration]
+    ) -> int:
+        """Estimates the number of queries resolving the metrics: one per metric computed by a query of its own, and one
+        per compute domain (i.e., ignoring the columns accessed) of the metrics bundled into a single query."""
+        query_count: int = 0
+        bundle_domain_ids: Set[Tuple] = set()
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            try:
+                _, metric_fn = get_metric_provider(
+                    metric_name=metric_configuration.metric_name, execution_engine=self
+                )
+            except ge_exceptions.MetricProviderError:
+                query_count += 1
+                continue
+
+            if metric_fn is None:
+                bundle_domain_ids.add(
+                    IDDict(
+                        {
+                            key: value
+                            for key, value in metric_configuration.metric_domain_kwargs.items()
+                            if key
+                            not in ("column", "column_A", "column_B", "column_list")
+                        }
+                    ).to_id()
+                )
+            elif (
+                getattr(metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE)
+                == MetricFunctionTypes.VALUE
+            ):
+                # Partial functions (map conditions, aggregate functions) only build the queries of other metrics.
+                query_count += 1
+
+        return query_count + len(bundle_domain_ids)
+
+    def _is_complex_batch_selectable(self, batch_data: SqlAlchemyBatchData) -> bool:
+        """Whether the (deferred) selectable of the batch contains joins or aggregates, samples at random, or reads a
+        view (the definition of which is opaque)."""
+        source = batch_data.deferred_temp_table_source
+        if not isinstance(source, str):
+            source = str(source.compile(dialect=self.engine.dialect))
+
+        if _COMPLEX_SELECTABLE_PATTERN.search(source):
+            return True
+
+        if batch_data.source_table_name is None:
+            return False
+
+        try:
+            return batch_data.source_table_name in sa.inspect(
+                self.engine
+            ).get_view_names(schema=batch_data.source_schema_name)
+        except Exception as e:
+            logger.debug(f"Unable to determine whether the batch reads a view: {e}")
+            return False
+
+    def _get_explain_cost(self, source: Union[str, Selectable]) -> Optional[float]:
+        """Returns the total cost estimated by "EXPLAIN" for the query (or selectable), or None, if not reported."""
+        if self.engine.dialect.name.lower() != GESqlDialect.POSTGRESQL.value:
+            return None
+
+        if not isinstance(source, str):
+            source = str(
+                source.compile(
+                    dialect=self.engine.dialect, compile_kwargs={"literal_binds": True}
+                )
+            )
+
+        try:
+            plan: Any = self.engine.execute(f"EXPLAIN (FORMAT JSON) {source}").scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return float(plan[0]["Plan"]["Total Cost"])
+        except Exception as e:
+            logger.debug(f"Unable to determine the EXPLAIN cost of the batch: {e}")
+            return None
@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from great_expectations.core.util import convert_to_json_serializable
+
+logger = logging.getLogger(__name__)
+
+try:
+    import sqlalchemy as sa
+    from sqlalchemy import event
+except ImportError:
+    sa = None
+    event = None
+
+# Prefix of the statement explaining the plan of a query, by dialect ("EXPLAIN" for any other dialect).
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN",
+    "mssql": None,
+    "oracle": None,
+}
+
+_QUERY_START_TIMES_KEY = "ge_query_start_times"
+
+
+@dataclass
+class QueryRecord:
+    """A query issued by a SqlAlchemyExecutionEngine, while recording queries (see "record_queries").
+
+    sql: the SQL text of the query, as sent to the database
+    parameters: the parameters bound to the query (or, for "executemany" queries, their number of parameter sets)
+    duration_seconds: the time taken by the database to execute the query (excluding the fetching of its rows)
+    rows: the number of rows returned (or affected) by the query, if known
+    metric_ids: the ids of the metrics, which the query served (none for queries splitting batches, for example)
+    explain: the plan of the query, as reported by "EXPLAIN" (if enabled, and supported by the dialect)
+    """
+
+    sql: str
+    parameters: Any
+    duration_seconds: float
+    rows: Optional[int] = None
+    metric_ids: List[Tuple[str, str, str]] = field(default_factory=list)
+    explain: Optional[List[list]] = None
+
+    def to_json_dict(self) -> dict:
+        try:
+            parameters: Any = convert_to_json_serializable(self.parameters)
+        except TypeError:
+            parameters = str(self.parameters)
+
+        return {
+            "sql": self.sql,
+            "parameters": parameters,
+            "duration_seconds": self.duration_seconds,
+            "rows": self.rows,
+            "metric_ids": [list(metric_id) for metric_id in self.metric_ids],
+            "explain": self.explain,
+        }
+
+
+class SqlAlchemyQueryRecorder:
+    """Records the queries issued through a SqlAlchemy engine (using its cursor execution events), while the issuing
+    thread is within "recording()".
+
+    Every query is attributed to the metrics being resolved by that thread (if any), so that queries issued directly by
+    metric providers are covered along with those of the execution engine.  Queries issued through the same (shared)
+    engine by threads not recording, or recording with another recorder, are ignored.
+    """
+
+    def __init__(self, engine: Any, explain: bool = False) -> None:
+        self._engine = engine
+        self._explain = explain
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._records: List[QueryRecord] = []
+
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @property
+    def records(self) -> List[QueryRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def pop_records(self) -> List[QueryRecord]:
+        """Returns the queries recorded so far, and forgets them."""
+        with self._lock:
+            records: List[QueryRecord] = self._records
+            self._records = []
+
+        return records
+
+    @contextmanager
+    def recording(
+        self, metric_ids: Iterable[Tuple[str, str, str]] = ()
+    ) -> Iterator[None]:
+        """Records the queries issued by the current thread within the context, as serving the metrics."""
+        previous_metric_ids: Optional[List[Tuple[str, str, str]]] = getattr(
+            self._local, "metric_ids", None
+        )
+        self._local.metric_ids = list(metric_ids)
+        try:
+            yield
+        finally:
+            self._local.metric_ids = previous_metric_ids
+
+    def count_rows(self, rows: int) -> None:
+        """Sets the number of rows returned by the last query recorded for the current thread (where the DBAPI does not
+        report the number of rows of a query, until they are fetched)."""
+        record: Optional[QueryRecord] = getattr(self._local, "last_record", None)
+        if record is not None:
+            record.rows = rows
+
+    def remove(self) -> None:
+        """Stops recording the queries of the engine."""
+        if event.contains(
+            self._engine, "before_cursor_execute", self._before_cursor_execute
+        ):
+            event.remove(
+                self._engine, "before_cursor_execute", self._before_cursor_execute
+            )
+            event.remove(
+                self._engine, "after_cursor_execute", self._after_cursor_execute
+            )
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        if getattr(self._local, "metric_ids", None) is None:
+            return
+
+        conn.info.setdefault(_QUERY_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        metric_ids: Optional[List[Tuple[str, str, str]]] = getattr(
+            self._local, "metric_ids", None
+        )
+        start_times: List[float] = conn.info.get(_QUERY_START_TIMES_KEY, [])
+        if metric_ids is None or not start_times:
+            return
+
+        duration_seconds: float = time.perf_counter() - start_times.pop()
+        rowcount: int = getattr(cursor, "rowcount", -1)
+        record = QueryRecord(
+            sql=statement,
+            parameters=len(parameters) if executemany else parameters,
+            duration_seconds=duration_seconds,
+            rows=rowcount if rowcount is not None and rowcount >= 0 else None,
+            metric_ids=metric_ids,
+        )
+        if self._explain and not executemany:
+            record.explain = self._get_explain(
+                conn=conn, statement=statement, parameters=parameters
+            )
+
+        self._local.last_record = record
+        with self._lock:
+            self._records.append(record)
+
+    @staticmethod
+    def _get_explain(conn, statement: str, parameters: Any) -> Optional[List[list]]:
+        """Returns the plan of the (SELECT) statement, explained through a cursor of its own (bypassing the events of
+        the engine), or None, if the dialect does not support "EXPLAIN"."""
+        explain_prefix: Optional[str] = EXPLAIN_PREFIXES.get(
+            conn.dialect.name.lower(), "EXPLAIN"
+        )
+        if explain_prefix is None or not statement.lstrip().upper().startswith(
+            ("SELECT", "WITH")
+        ):
+            return None
+
+        try:
+            cursor = conn.connection.cursor()
+            try:
+                cursor.execute(f"{explain_prefix} {statement}", parameters)
+                return convert_to_json_serializable(
+                    [list(row) for row in cursor.fetchall()]
+                )
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.debug(f"Unable to explain the query {statement}: {e}")
+            return None
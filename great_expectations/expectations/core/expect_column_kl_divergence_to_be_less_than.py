@@ -189,6 +189,8 @@ class ExpectColumnKlDivergenceToBeLessThan(ColumnExpectation):
         "partition_object",
         "threshold",
     )
+    # Without a "partition_object", the partition (and, hence, the metric dependencies) is derived from the data.
+    validation_dependencies_depend_on_data = True
 
     def validate_configuration(
         self, configuration: Optional[ExpectationConfiguration]
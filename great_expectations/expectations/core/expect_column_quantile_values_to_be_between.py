@@ -30,6 +30,7 @@ from great_expectations.rule_based_profiler.types import (
     PARAMETER_KEY,
     VARIABLES_KEY,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
 class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
@@ -715,9 +716,17 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             configuration, execution_engine, runtime_configuration
         )
         # column.quantile_values expects a "quantiles" key
-        all_dependencies["metrics"]["column.quantile_values"].metric_value_kwargs[
-            "quantiles"
-        ] = configuration.kwargs["quantile_ranges"]["quantiles"]
+        quantile_values_metric: MetricConfiguration = all_dependencies["metrics"][
+            "column.quantile_values"
+        ]
+        all_dependencies["metrics"]["column.quantile_values"] = MetricConfiguration(
+            metric_name=quantile_values_metric.metric_name,
+            metric_domain_kwargs=quantile_values_metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                **quantile_values_metric.metric_value_kwargs,
+                "quantiles": configuration.kwargs["quantile_ranges"]["quantiles"],
+            },
+        )
         return all_dependencies
 
     def _validate(
@@ -745,10 +754,17 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details: dict = {"success_details": success_details}
+        approximation_details: Optional[dict] = self._get_metric_approximation_details(
+            metric_name="column.quantile_values", execution_engine=execution_engine
+        )
+        if approximation_details is not None:
+            details.update(approximation_details)
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
@@ -53,6 +53,11 @@ try:
 except ImportError:
     sqlalchemy_redshift = None
 
+try:
+    import duckdb_engine
+except ImportError:
+    duckdb_engine = None
+
 _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
 BIGQUERY_GEO_SUPPORT = False
 try:
@@ -584,6 +589,16 @@ def _get_dialect_type_module(
     except (TypeError, AttributeError):
         pass
 
+    # DuckDB reflects the types of columns as PostgreSQL types
+    try:
+        if issubclass(
+            execution_engine.dialect_module.Dialect,
+            duckdb_engine.Dialect,
+        ):
+            return sa.dialects.postgresql
+    except (TypeError, AttributeError):
+        pass
+
     # Teradata types module
     try:
         if (
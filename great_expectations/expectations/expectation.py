@@ -169,6 +169,9 @@ class Expectation(metaclass=MetaExpectation):
         "result_format": "BASIC",
     }
     args_keys = None
+    # Set when "get_validation_dependencies" computes metrics from the data of the batch; such expectations cannot have
+    # their metric dependency graphs compiled into a ValidationPlan and reused for other batches.
+    validation_dependencies_depend_on_data = False
 
     def __init__(
         self, configuration: Optional[ExpectationConfiguration] = None
@@ -1781,7 +1784,31 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
 
         success = above_min and below_max
 
-        return {"success": success, "result": {"observed_value": metric_value}}
+        result: dict = {"observed_value": metric_value}
+        approximation_details: Optional[dict] = self._get_metric_approximation_details(
+            metric_name=metric_name, execution_engine=execution_engine
+        )
+        if approximation_details is not None:
+            result["details"] = approximation_details
+
+        return {"success": success, "result": result}
+
+    @staticmethod
+    def _get_metric_approximation_details(
+        metric_name: str, execution_engine: Optional[ExecutionEngine] = None
+    ) -> Optional[dict]:
+        """Returns the details (including the error bound) of the approximation of the metric, or None if the metric
+        was computed exactly."""
+        if execution_engine is None:
+            return None
+
+        approximation = execution_engine.get_metric_approximation(
+            metric_name=metric_name
+        )
+        if approximation is None:
+            return None
+
+        return {"approximation": approximation.to_json_dict()}
 
     @staticmethod
     def _isclose(
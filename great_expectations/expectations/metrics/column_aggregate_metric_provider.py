@@ -17,10 +17,12 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     sa,
 )
 from great_expectations.expectations.metrics import DeprecatedMetaMetricProvider
+from great_expectations.expectations.metrics.import_manager import F
 from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
     metric_value,
 )
+from great_expectations.expectations.metrics.partial_aggregates import PartialAggregate
 from great_expectations.expectations.metrics.table_metric_provider import (
     TableMetricProvider,
 )
@@ -33,12 +35,14 @@ def column_aggregate_value(
     engine: Type[ExecutionEngine],
     metric_fn_type="value",
     domain_type="column",
+    partial_aggregate: Optional[Type[PartialAggregate]] = None,
     **kwargs,
 ):
     """Return the column aggregate metric decorator for the specified engine.
 
     Args:
         engine:
+        partial_aggregate: the PartialAggregate class, which computes the same value from mergeable per-chunk states
         **kwargs:
 
     Returns:
@@ -50,6 +54,7 @@ def column_aggregate_value(
             @metric_value(
                 engine=PandasExecutionEngine,
                 metric_fn_type=metric_fn_type,
+                partial_aggregate=partial_aggregate,
                 domain_type=domain_type,
             )
             @wraps(metric_fn)
@@ -197,6 +202,13 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     # We do not copy here because if compute domain is different, it will be copied by get_compute_domain
                     compute_domain_kwargs = metric_domain_kwargs
 
+                (
+                    compute_domain_kwargs,
+                    condition,
+                ) = execution_engine.split_domain_row_conditions(
+                    domain_kwargs=compute_domain_kwargs
+                )
+
                 (
                     data,
                     compute_domain_kwargs,
@@ -213,6 +225,10 @@ def column_aggregate_partial(engine: Type[ExecutionEngine], **kwargs):
                     )
 
                 column = data[column_name]
+                if condition is not None:
+                    # Aggregates ignore nulls; hence, aggregating the values of the rows meeting the condition over the
+                    # unconditioned domain yields the aggregate over the conditioned domain.
+                    column = F.when(condition, column)
                 metric_aggregate = metric_fn(
                     cls,
                     column=column,
@@ -280,6 +296,34 @@ class ColumnAggregateMetricProvider(TableMetricProvider):
         )
         return dependencies
 
+    @classmethod
+    def get_partial_aggregate(
+        cls,
+        execution_engine: Optional[ExecutionEngine] = None,
+        metric_value_kwargs: Optional[dict] = None,
+    ) -> Optional[PartialAggregate]:
+        """Returns a new (empty) partial aggregate state, from which the metric can be computed one chunk of its
+        (column) domain at a time, or None if the metric does not implement the partial aggregate protocol.
+
+        Column values are expected to be passed to the state exactly as the metric implementation would see them.
+        """
+        engine_class: Type[ExecutionEngine] = (
+            PandasExecutionEngine
+            if execution_engine is None
+            else type(execution_engine)
+        )
+        for attr_name in dir(cls):
+            attr_obj = getattr(cls, attr_name)
+            partial_aggregate_class: Optional[Type[PartialAggregate]] = getattr(
+                attr_obj, "partial_aggregate", None
+            )
+            if partial_aggregate_class is not None and issubclass(
+                engine_class, attr_obj.metric_engine
+            ):
+                return partial_aggregate_class(**(metric_value_kwargs or {}))
+
+        return None
+
 
 class ColumnMetricProvider(
     ColumnAggregateMetricProvider, metaclass=DeprecatedMetaMetricProvider
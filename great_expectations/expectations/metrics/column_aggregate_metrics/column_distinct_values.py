@@ -1,17 +1,30 @@
 from typing import Any, Dict, Optional
 
+import great_expectations.exceptions as ge_exceptions
 from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import HyperLogLog
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.execution_engine import (
+    MetricApproximation,
+    MetricDomainTypes,
+)
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    APPROXIMATE_COUNT_DISTINCT_RSD,
+)
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.import_manager import F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.partial_aggregates import (
+    DistinctValuesCountPartialAggregate,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -81,8 +94,31 @@ class ColumnDistinctValues(ColumnAggregateMetricProvider):
 class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
     metric_name = "column.distinct_values.count"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
-    def _pandas(cls, column, **kwargs):
+    @metric_value(
+        engine=PandasExecutionEngine,
+        partial_aggregate=DistinctValuesCountPartialAggregate,
+    )
+    def _pandas(
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[str, Any],
+        runtime_configuration: Dict,
+    ):
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column_name = accessor_domain_kwargs["column"]
+        if column_name not in metrics["table.columns"]:
+            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The column "{column_name}" in BatchData does not exist.'
+            )
+
+        column = df[column_name]
+        if execution_engine.get_metric_approximation(cls.metric_name) is not None:
+            return HyperLogLog.from_series(values=column).estimate()
+
         return column.nunique()
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
@@ -94,20 +130,49 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
-        observed_value_counts = metrics["column.value_counts"]
-        return len(observed_value_counts)
+        observed_value_counts = metrics.get("column.value_counts")
+        if observed_value_counts is not None:
+            return len(observed_value_counts)
+
+        # Distinct values are counted in the database (approximately, if the dialect supports it) without fetching them.
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+        approximation: Optional[
+            MetricApproximation
+        ] = execution_engine.get_metric_approximation(cls.metric_name)
+        if approximation is None:
+            distinct_values_count = sa.func.count(sa.distinct(column))
+        else:
+            distinct_values_count = getattr(sa.func, approximation.method)(column)
+
+        return execution_engine.engine.execute(
+            sa.select([distinct_values_count])
+            .where(column != None)
+            .select_from(selectable)
+        ).scalar()
 
     @metric_value(engine=SparkDFExecutionEngine)
     def _spark(
         cls,
-        execution_engine: SqlAlchemyExecutionEngine,
+        execution_engine: SparkDFExecutionEngine,
         metric_domain_kwargs: Dict,
         metric_value_kwargs: Dict,
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
-        observed_value_counts = metrics["column.value_counts"]
-        return len(observed_value_counts)
+        observed_value_counts = metrics.get("column.value_counts")
+        if observed_value_counts is not None:
+            return len(observed_value_counts)
+
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = accessor_domain_kwargs["column"]
+        return df.select(
+            F.approx_count_distinct(column, rsd=APPROXIMATE_COUNT_DISTINCT_RSD)
+        ).collect()[0][0]
 
     @classmethod
     def _get_evaluation_dependencies(
@@ -126,8 +191,12 @@ class ColumnDistinctValuesCount(ColumnAggregateMetricProvider):
             runtime_configuration=runtime_configuration,
         )
 
-        if isinstance(
-            execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
+        # When approximating metrics, distinct values are counted without computing (and fetching) all value counts.
+        if (
+            isinstance(
+                execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
+            )
+            and not execution_engine.approximate_metrics
         ):
             dependencies["column.value_counts"] = MetricConfiguration(
                 metric_name="column.value_counts",
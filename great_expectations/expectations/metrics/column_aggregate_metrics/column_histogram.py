@@ -1,6 +1,7 @@
 import copy
 import logging
-from typing import Any, Dict
+import math
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -20,15 +21,27 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import Bucketizer, F, sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.partial_aggregates import (
+    HistogramPartialAggregate,
+)
 
 logger = logging.getLogger(__name__)
 
+# Dialects, in which arithmetic on floating point parameters follows IEEE 754 double precision, so that the bin edges
+# recomputed in SQL from the lower bound and the bin width are identical to the (equally spaced) bin edges requested.
+BIN_INDEX_HISTOGRAM_DIALECTS = (
+    "postgresql",
+    "sqlite",
+)
+
 
 class ColumnHistogram(ColumnAggregateMetricProvider):
     metric_name = "column.histogram"
     value_keys = ("bins",)
 
-    @metric_value(engine=PandasExecutionEngine)
+    @metric_value(
+        engine=PandasExecutionEngine, partial_aggregate=HistogramPartialAggregate
+    )
     def _pandas(
         cls,
         execution_engine: PandasExecutionEngine,
@@ -76,6 +89,16 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
         else:
             bins = list(bins)
 
+        if execution_engine.dialect_name in BIN_INDEX_HISTOGRAM_DIALECTS:
+            hist: Optional[list] = _get_column_histogram_using_bin_index(
+                execution_engine=execution_engine,
+                selectable=selectable,
+                column_name=column,
+                bins=bins,
+            )
+            if hist is not None:
+                return hist
+
         # If we have an infinite lower bound, don't express that in sql
         if (
             bins[0]
@@ -243,3 +266,103 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _is_infinity(value: Any, negative: bool) -> bool:
+    return (
+        value
+        == get_sql_dialect_floating_point_infinity_value(
+            schema="api_np", negative=negative
+        )
+    ) or (
+        value
+        == get_sql_dialect_floating_point_infinity_value(
+            schema="api_cast", negative=negative
+        )
+    )
+
+
+def _get_column_histogram_using_bin_index(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: Any,
+    column_name: str,
+    bins: list,
+) -> Optional[list]:
+    """Computes the histogram by evaluating the bin index of every value once and grouping the values by it, so that
+    the size of the query does not depend on the number of bins (unlike summing one "CASE" expression per bin).
+
+    Only equally spaced bin edges (optionally preceded by negative infinity and/or followed by positive infinity) are
+    supported; for any other bins, None is returned, and the histogram must be computed one bin at a time instead.
+
+    The bin semantics are identical to those of the per-bin implementation: each bin includes its lower edge and
+    excludes its upper edge, except for the last bin, which also includes its upper edge (unless it is unbounded).
+    """
+    is_lower_unbounded: bool = _is_infinity(value=bins[0], negative=True)
+    is_upper_unbounded: bool = _is_infinity(value=bins[-1], negative=False)
+    try:
+        edges: List[float] = [
+            float(edge)
+            for edge in bins[
+                int(is_lower_unbounded) : len(bins) - int(is_upper_unbounded)
+            ]
+        ]
+    except (TypeError, ValueError):
+        return None
+
+    num_bounded_bins: int = len(edges) - 1
+    if num_bounded_bins < 1 or not all(math.isfinite(edge) for edge in edges):
+        return None
+
+    lower_bound: float = edges[0]
+    upper_bound: float = edges[-1]
+    bin_width: float = (upper_bound - lower_bound) / num_bounded_bins
+    # The bin edges must be reproducible exactly (as "lower_bound + index * bin_width"), or values lying on an edge
+    # could be assigned to a neighboring bin.
+    if not bin_width > 0 or any(
+        edges[idx] != idx * bin_width + lower_bound for idx in range(num_bounded_bins)
+    ):
+        return None
+
+    column = sa.column(column_name)
+    # Casting to an integer either truncates or rounds (depending on the dialect); hence, the estimated index is
+    # corrected by comparing the value against the edges of the estimated bin.
+    estimated_index = sa.cast((column - lower_bound) / bin_width, sa.Integer)
+    bounded_bin_index = sa.case(
+        [
+            (column < estimated_index * bin_width + lower_bound, estimated_index - 1),
+            (
+                column >= (estimated_index + 1) * bin_width + lower_bound,
+                estimated_index + 1,
+            ),
+        ],
+        else_=estimated_index,
+    )
+    # The upper edge of the last bounded bin is included in it.
+    bounded_bin_index = sa.case(
+        [(bounded_bin_index >= num_bounded_bins, num_bounded_bins - 1)],
+        else_=bounded_bin_index,
+    )
+
+    whens: list = [(column < lower_bound, 0 if is_lower_unbounded else None)]
+    if is_upper_unbounded:
+        whens.append((column >= upper_bound, len(bins) - 2))
+    else:
+        whens.append((column > upper_bound, None))
+
+    bin_index = sa.case(whens, else_=bounded_bin_index + int(is_lower_unbounded)).label(
+        "bin_index"
+    )
+    bin_indices = (
+        sa.select([bin_index]).where(column != None).select_from(selectable).subquery()
+    )
+    query = (
+        sa.select([bin_indices.c.bin_index, sa.func.count()])
+        .where(bin_indices.c.bin_index != None)
+        .group_by(bin_indices.c.bin_index)
+    )
+
+    hist: List[int] = [0] * (len(bins) - 1)
+    for idx, count in execution_engine.engine.execute(query).fetchall():
+        hist[int(idx)] = int(count)
+
+    return hist
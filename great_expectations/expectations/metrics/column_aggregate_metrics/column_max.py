@@ -16,13 +16,18 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.partial_aggregates import (
+    MaxPartialAggregate,
+)
 
 
 class ColumnMax(ColumnAggregateMetricProvider):
     metric_name = "column.max"
     value_keys = ("parse_strings_as_datetimes",)
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, partial_aggregate=MaxPartialAggregate
+    )
     def _pandas(cls, column, **kwargs):
         parse_strings_as_datetimes: bool = (
             kwargs.get("parse_strings_as_datetimes") or False
@@ -9,6 +9,9 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.partial_aggregates import (
+    MeanPartialAggregate,
+)
 
 
 class ColumnMean(ColumnAggregateMetricProvider):
@@ -16,7 +19,9 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, partial_aggregate=MeanPartialAggregate
+    )
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         return column.mean()
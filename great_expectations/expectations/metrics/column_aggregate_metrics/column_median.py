@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -10,13 +10,25 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    MetricApproximation,
+    MetricDomainTypes,
+)
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    APPROXIMATE_QUANTILE_RELATIVE_ERROR,
+)
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.partial_aggregates import (
+    MedianPartialAggregate,
+)
+from great_expectations.expectations.metrics.util import (
+    get_sqlalchemy_column_values_at_positions,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 
@@ -25,7 +37,9 @@ class ColumnMedian(ColumnAggregateMetricProvider):
 
     metric_name = "column.median"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, partial_aggregate=MedianPartialAggregate
+    )
     def _pandas(cls, column, **kwargs):
         """Pandas Median Implementation"""
         column_null_elements_cond: pd.Series = column.isnull()
@@ -55,31 +69,46 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         nonnull_count = metrics.get("column_values.nonnull.count")
         if not nonnull_count:
             return None
-        element_values = sqlalchemy_engine.execute(
-            sa.select([column])
-            .order_by(column)
-            .where(column != None)
-            .offset(max(nonnull_count // 2 - 1, 0))
-            .limit(2)
-            .select_from(selectable)
-        )
 
-        column_values = list(element_values.fetchall())
+        approximation: Optional[
+            MetricApproximation
+        ] = execution_engine.get_metric_approximation(cls.metric_name)
+        if approximation is not None:
+            approximate_percentile_function = getattr(sa.func, approximation.method)
+            return sqlalchemy_engine.execute(
+                sa.select([approximate_percentile_function(column, 0.5)])
+                .where(column != None)
+                .select_from(selectable)
+            ).scalar()
 
-        if len(column_values) == 0:
+        # The center value(s) of the sorted non-null column values are fetched in a single query.
+        center_positions: List[int] = (
+            [nonnull_count // 2 - 1, nonnull_count // 2]
+            if nonnull_count % 2 == 0
+            else [nonnull_count // 2]
+        )
+        column_values: list = get_sqlalchemy_column_values_at_positions(
+            column=column,
+            positions=center_positions,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
+            ignore_nulls=True,
+        )
+
+        if any(column_value is None for column_value in column_values):
             column_median = None
         elif nonnull_count % 2 == 0:
             # An even number of column values: take the average of the two center values
             column_median = (
                 float(
-                    column_values[0][0]
-                    + column_values[1][0]  # left center value  # right center value
+                    column_values[0]
+                    + column_values[1]  # left center value  # right center value
                 )
                 / 2.0
             )  # Average center values
         else:
             # An odd number of column values, we can just take the center value
-            column_median = column_values[1][0]  # True center value
+            column_median = column_values[0]  # True center value
         return column_median
 
     @metric_value(engine=SparkDFExecutionEngine, metric_fn_type="value")
@@ -109,6 +138,12 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         # in the degenerate case when n_values = 0
 
         """Spark Median Implementation"""
+        if execution_engine.get_metric_approximation(cls.metric_name) is not None:
+            result = df.approxQuantile(
+                column, [0.5], APPROXIMATE_QUANTILE_RELATIVE_ERROR
+            )
+            return result[0] if result else None
+
         table_row_count = metrics.get("table.row_count")
         result = df.approxQuantile(
             column, [0.5, 0.5 + (1 / (2 + (2 * table_row_count)))], 0
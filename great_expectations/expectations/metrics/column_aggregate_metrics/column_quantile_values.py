@@ -1,9 +1,8 @@
 import ast
-import itertools
 import logging
 import traceback
 from collections.abc import Iterable
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -12,7 +11,13 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    MetricApproximation,
+    MetricDomainTypes,
+)
+from great_expectations.execution_engine.sparkdf_execution_engine import (
+    APPROXIMATE_QUANTILE_RELATIVE_ERROR,
+)
 from great_expectations.execution_engine.util import get_approximate_percentile_disc_sql
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
@@ -20,7 +25,13 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
 )
 from great_expectations.expectations.metrics.import_manager import sa
 from great_expectations.expectations.metrics.metric_provider import metric_value
-from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
+from great_expectations.expectations.metrics.partial_aggregates import (
+    QuantilesPartialAggregate,
+)
+from great_expectations.expectations.metrics.util import (
+    attempt_allowing_relative_error,
+    get_sqlalchemy_column_values_at_positions,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +75,9 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, partial_aggregate=QuantilesPartialAggregate
+    )
     def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
         """Quantile Function"""
         interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
@@ -102,7 +115,18 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         allow_relative_error = metric_value_kwargs.get("allow_relative_error", False)
         table_row_count = metrics.get("table.row_count")
-        if dialect.name.lower() == "mssql":
+        approximation: Optional[
+            MetricApproximation
+        ] = execution_engine.get_metric_approximation(cls.metric_name)
+        if approximation is not None:
+            return _get_column_quantiles_approximate(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+                approximate_percentile_function_name=approximation.method,
+            )
+        elif dialect.name.lower() == "mssql":
             return _get_column_quantiles_mssql(
                 column=column,
                 quantiles=quantiles,
@@ -146,6 +170,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 dialect=dialect,
                 selectable=selectable,
                 sqlalchemy_engine=sqlalchemy_engine,
+                table_row_count=table_row_count,
             )
         elif dialect.name.lower() == "sqlite":
             return _get_column_quantiles_sqlite(
@@ -170,6 +195,7 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 dialect=dialect,
                 selectable=selectable,
                 sqlalchemy_engine=sqlalchemy_engine,
+                table_row_count=table_row_count,
             )
 
     @metric_value(engine=SparkDFExecutionEngine)
@@ -192,7 +218,10 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         quantiles = metric_value_kwargs["quantiles"]
         column = accessor_domain_kwargs["column"]
         if allow_relative_error is False:
-            allow_relative_error = 0.0
+            if execution_engine.get_metric_approximation(cls.metric_name) is None:
+                allow_relative_error = 0.0
+            else:
+                allow_relative_error = APPROXIMATE_QUANTILE_RELATIVE_ERROR
         if (
             not isinstance(allow_relative_error, float)
             or allow_relative_error < 0
@@ -333,32 +362,31 @@ def _get_column_quantiles_sqlite(
     column, quantiles: Iterable, selectable, sqlalchemy_engine, table_row_count
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many calls to
-    "sqlalchemy_engine.execute()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    SQLite does not have the "percentile_disc" aggregate function; hence, the quantiles are obtained from the column
+    values at the corresponding positions of the sorted column, all of which are fetched in a single query.
     """
-    offsets: List[int] = [quantile * table_row_count - 1 for quantile in quantiles]
-    quantile_queries: List[Select] = [
-        sa.select([column])
-        .order_by(column.asc())
-        .offset(offset)
-        .limit(1)
-        .select_from(selectable)
-        for offset in offsets
-    ]
+    return _get_column_quantiles_using_window_function(
+        column=column,
+        quantiles=quantiles,
+        selectable=selectable,
+        sqlalchemy_engine=sqlalchemy_engine,
+        table_row_count=table_row_count,
+    )
 
-    quantile_result: Row
-    quantile_query: Select
+
+def _get_column_quantiles_using_window_function(
+    column, quantiles: Iterable, selectable, sqlalchemy_engine, table_row_count
+) -> list:
+    # The quantile is the value at (zero-based) position "floor(quantile * table_row_count) - 1" of the sorted column.
+    positions: List[int] = [
+        max(int(quantile * table_row_count - 1), 0) for quantile in quantiles
+    ]
     try:
-        quantiles_results: List[Row] = [
-            sqlalchemy_engine.execute(quantile_query).fetchone()
-            for quantile_query in quantile_queries
-        ]
-        return list(
-            itertools.chain.from_iterable(
-                [list(quantile_result) for quantile_result in quantiles_results]
-            )
+        return get_sqlalchemy_column_values_at_positions(
+            column=column,
+            positions=positions,
+            selectable=selectable,
+            sqlalchemy_engine=sqlalchemy_engine,
         )
     except ProgrammingError as pe:
         exception_message: str = "An SQL syntax Exception occurred."
@@ -398,6 +426,38 @@ def _get_column_quantiles_athena(
         raise pe
 
 
+def _get_column_quantiles_approximate(
+    column,
+    quantiles: Iterable,
+    selectable,
+    sqlalchemy_engine,
+    approximate_percentile_function_name: str,
+) -> list:
+    # Dialect-native approximate percentile functions (e.g., "approx_percentile") take the value and the quantile.
+    approximate_percentile_function = getattr(
+        sa.func, approximate_percentile_function_name
+    )
+    selects: list = [
+        approximate_percentile_function(column, float(quantile))
+        for quantile in quantiles
+    ]
+    quantiles_query: Select = (
+        sa.select(selects).where(column != None).select_from(selectable)
+    )
+
+    try:
+        quantiles_results: Row = sqlalchemy_engine.execute(quantiles_query).fetchone()
+        return list(quantiles_results)
+    except ProgrammingError as pe:
+        exception_message: str = "An SQL syntax Exception occurred."
+        exception_traceback: str = traceback.format_exc()
+        exception_message += (
+            f'{type(pe).__name__}: "{str(pe)}".  Traceback: "{exception_traceback}".'
+        )
+        logger.error(exception_message)
+        raise pe
+
+
 # Support for computing the quantiles column for PostGreSQL and Redshift is included in the same method as that for
 # the generic sqlalchemy compatible DBMS engine, because users often use the postgresql driver to connect to Redshift
 # The key functional difference is that Redshift does not support the aggregate function
@@ -409,6 +469,7 @@ def _get_column_quantiles_generic_sqlalchemy(
     dialect,
     selectable,
     sqlalchemy_engine,
+    table_row_count: Optional[int] = None,
 ) -> list:
     selects: List[WithinGroup] = [
         sa.func.percentile_disc(quantile).within_group(column.asc())
@@ -448,8 +509,17 @@ def _get_column_quantiles_generic_sqlalchemy(
                     f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles '
                     "without approximation error; set allow_relative_error to True to allow approximate quantiles."
                 )
-        else:
+        elif allow_relative_error or table_row_count is None:
             raise ValueError(
                 f'The SQL engine dialect "{str(dialect)}" does not support computing quantiles with '
                 "approximation error; set allow_relative_error to False to disable approximate quantiles."
             )
+        else:
+            # Dialects lacking "percentile_disc" can still compute exact quantiles using window functions.
+            return _get_column_quantiles_using_window_function(
+                column=column,
+                quantiles=quantiles,
+                selectable=selectable,
+                sqlalchemy_engine=sqlalchemy_engine,
+                table_row_count=table_row_count,
+            )
@@ -14,6 +14,9 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.partial_aggregates import (
+    StandardDeviationPartialAggregate,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 logger = logging.getLogger(__name__)
@@ -32,7 +35,10 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine,
+        partial_aggregate=StandardDeviationPartialAggregate,
+    )
     def _pandas(cls, column, **kwargs):
         """Pandas Standard Deviation implementation"""
         return column.std()
@@ -9,12 +9,17 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.partial_aggregates import (
+    SumPartialAggregate,
+)
 
 
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(
+        engine=PandasExecutionEngine, partial_aggregate=SumPartialAggregate
+    )
     def _pandas(cls, column, **kwargs):
         return column.sum()
 
@@ -1,5 +1,7 @@
 import warnings
 
+import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 
 from great_expectations.execution_engine import (
@@ -12,6 +14,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_distinct_strings
 
 
 class ColumnValuesBetween(ColumnMapMetricProvider):
@@ -63,7 +66,7 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
                     pass
 
             try:
-                temp_column = column.map(parse)
+                temp_column = map_distinct_strings(column=column, fn=parse)
             except TypeError:
                 temp_column = column
 
@@ -73,6 +76,28 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
         if min_value is not None and max_value is not None and min_value > max_value:
             raise ValueError("min_value cannot be greater than max_value")
 
+        # Numeric columns are compared with numeric bounds at once (which, for every value, agrees with "is_between").
+        if (
+            isinstance(temp_column.dtype, np.dtype)
+            and temp_column.dtype.kind in "iuf"
+            and all(
+                bound is None
+                or isinstance(bound, (int, float, np.integer, np.floating))
+                for bound in (min_value, max_value)
+            )
+        ):
+            is_in_bounds = pd.Series(True, index=temp_column.index)
+            if min_value is not None:
+                is_in_bounds &= (
+                    temp_column > min_value if strict_min else temp_column >= min_value
+                )
+            if max_value is not None:
+                is_in_bounds &= (
+                    temp_column < max_value if strict_max else temp_column <= max_value
+                )
+
+            return is_in_bounds
+
         def is_between(val):
             # TODO Might be worth explicitly defining comparisons between types (for example, between strings and ints).
             # Ensure types can be compared since some types in Python 3 cannot be logically compared.
@@ -5,6 +5,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_distinct_strings
 
 
 class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
@@ -25,4 +26,4 @@ class ColumnValuesDateutilParseable(ColumnMapMetricProvider):
             except (ValueError, OverflowError):
                 return False
 
-        return column.map(is_parseable)
+        return map_distinct_strings(column=column, fn=is_parseable)
@@ -73,6 +73,17 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
         if len(value_set) == 0:
             return False
 
+        # Large value sets are compared using a semi-join with a temporary table, rather than a literal list.
+        execution_engine = kwargs.get("_execution_engine")
+        if execution_engine is not None:
+            value_set_selectable = execution_engine.get_value_set_selectable(
+                value_set=value_set,
+                column_name=column.name,
+                selectable=kwargs["_table"],
+            )
+            if value_set_selectable is not None:
+                return column.in_(value_set_selectable)
+
         return column.in_(value_set)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -9,6 +9,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_isinstance
 
 
 class ColumnValuesInTypeList(ColumnMapMetricProvider):
@@ -43,4 +44,4 @@ class ColumnValuesInTypeList(ColumnMapMetricProvider):
         if len(comp_types) < 1:
             raise ValueError(f"No recognized numpy/python type in list: {type_list}")
 
-        return column.map(lambda x: isinstance(x, tuple(comp_types)))
+        return map_isinstance(column=column, types=tuple(comp_types))
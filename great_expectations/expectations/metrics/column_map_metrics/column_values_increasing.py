@@ -19,6 +19,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     column_condition_partial,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_partial
+from great_expectations.expectations.metrics.util import map_distinct_strings
 
 
 class ColumnValuesIncreasing(ColumnMapMetricProvider):
@@ -52,7 +53,7 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
             )
 
             try:
-                temp_column = column.map(parse)
+                temp_column = map_distinct_strings(column=column, fn=parse)
             except TypeError:
                 temp_column = column
         else:
@@ -9,6 +9,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_distinct_strings
 
 
 class ColumnValuesJsonParseable(ColumnMapMetricProvider):
@@ -23,7 +24,7 @@ class ColumnValuesJsonParseable(ColumnMapMetricProvider):
             except:
                 return False
 
-        return column.map(is_json)
+        return map_distinct_strings(column=column, fn=is_json)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
@@ -11,6 +11,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import map_distinct_strings
 
 
 class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
@@ -19,21 +20,17 @@ class ColumnValuesMatchJsonSchema(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, json_schema, **kwargs):
+        # The schema is checked, and its validator is built, only once (rather than by jsonschema.validate for every
+        # value); jsonschema.SchemaError is raised for an invalid schema.
+        validator_class = jsonschema.validators.validator_for(json_schema)
+        validator_class.check_schema(json_schema)
+        validator = validator_class(json_schema)
+
         def matches_json_schema(val):
-            try:
-                val_json = json.loads(val)
-                jsonschema.validate(val_json, json_schema)
-                # jsonschema.validate raises an error if validation fails.
-                # So if we make it this far, we know that the validation succeeded.
-                return True
-            except jsonschema.ValidationError:
-                return False
-            except jsonschema.SchemaError:
-                raise
-            except:
-                raise
+            val_json = json.loads(val)
+            return validator.is_valid(val_json)
 
-        return column.map(matches_json_schema)
+        return map_distinct_strings(column=column, fn=matches_json_schema)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, json_schema, **kwargs):
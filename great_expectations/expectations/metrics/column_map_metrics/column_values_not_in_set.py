@@ -77,6 +77,17 @@ please see: https://greatexpectations.io/blog/why_we_dont_do_transformations_for
         if value_set is None or len(value_set) == 0:
             return True
 
+        # Large value sets are compared using an anti-join with a temporary table, rather than a literal list.
+        execution_engine = kwargs.get("_execution_engine")
+        if execution_engine is not None:
+            value_set_selectable = execution_engine.get_value_set_selectable(
+                value_set=value_set,
+                column_name=column.name,
+                selectable=kwargs["_table"],
+            )
+            if value_set_selectable is not None:
+                return column.notin_(value_set_selectable)
+
         return column.notin_(tuple(value_set))
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
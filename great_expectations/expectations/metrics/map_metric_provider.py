@@ -401,6 +401,7 @@ def column_condition_partial(
                     _dialect=dialect,
                     _table=selectable,
                     _sqlalchemy_engine=sqlalchemy_engine,
+                    _execution_engine=execution_engine,
                     _metrics=metrics,
                 )
 
@@ -1372,7 +1373,7 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
-def _pandas_column_map_condition_values(
+def _pandas_map_condition_unexpected_records(
     cls,
     execution_engine: PandasExecutionEngine,
     metric_domain_kwargs: Dict,
@@ -1380,16 +1381,77 @@ def _pandas_column_map_condition_values(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    """Returns the records of the domain that match the map-style metric in the metrics dictionary.
+
+    The records are obtained (and cached) by the execution engine per condition metric, so that all metrics derived
+    from the same condition share them.
+    """
     (
         boolean_mapped_unexpected_values,
         compute_domain_kwargs,
         accessor_domain_kwargs,
-    ) = metrics["unexpected_condition"]
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
+    ) = metrics.get("unexpected_condition")
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
+
+    filter_column = None
+    if "column" in accessor_domain_kwargs:
+        column_name = accessor_domain_kwargs["column"]
+
+        if column_name not in metrics["table.columns"]:
+            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                message=f'Error: The column "{column_name}" in BatchData does not exist.'
+            )
+
+        ###
+        # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
+        # currently handle filter_column_isnull differently than other map_fn / map_condition
+        # cases.
+        ###
+        filter_column_isnull = kwargs.get(
+            "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+        )
+        if filter_column_isnull:
+            filter_column = column_name
+
+    elif "column_list" in accessor_domain_kwargs:
+        column_list = accessor_domain_kwargs["column_list"]
+
+        for column_name in column_list:
+            if column_name not in metrics["table.columns"]:
+                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
+                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                )
+
+    # The condition metric is the one, on which "_get_evaluation_dependencies()" makes the derived metrics depend.
+    condition_metric_id = MetricConfiguration(
+        f"{cls.condition_metric_name}.condition",
+        metric_domain_kwargs,
+        {k: v for k, v in metric_value_kwargs.items() if k != "result_format"},
+    ).id
+
+    return execution_engine.get_unexpected_domain_records(
+        condition_metric_id=condition_metric_id,
+        unexpected_condition=boolean_mapped_unexpected_values,
+        domain_kwargs=domain_kwargs,
+        filter_column=filter_column,
     )
 
+
+def _pandas_column_map_condition_values(
+    cls,
+    execution_engine: PandasExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    _, _, accessor_domain_kwargs = metrics["unexpected_condition"]
+
     if "column" not in accessor_domain_kwargs:
         raise ValueError(
             """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
@@ -1397,27 +1459,16 @@ def _pandas_column_map_condition_values(
 """
         )
 
-    column_name = accessor_domain_kwargs["column"]
-
-    if column_name not in metrics["table.columns"]:
-        raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-            message=f'Error: The column "{column_name}" in BatchData does not exist.'
-        )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    df = _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
 
-    domain_values = df[column_name]
-
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
+    domain_values = df[accessor_domain_kwargs["column"]]
 
     result_format = metric_value_kwargs["result_format"]
 
@@ -1700,52 +1751,17 @@ def _pandas_map_condition_index(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
+    df = _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    if "column" in accessor_domain_kwargs:
-        column_name = accessor_domain_kwargs["column"]
-
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-        ###
-        # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-        # currently handle filter_column_isnull differently than other map_fn / map_condition
-        # cases.
-        ###
-        filter_column_isnull = kwargs.get(
-            "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-        )
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
-
-    elif "column_list" in accessor_domain_kwargs:
-        column_list = accessor_domain_kwargs["column_list"]
-
-        for column_name in column_list:
-            if column_name not in metrics["table.columns"]:
-                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
-                )
-
     result_format = metric_value_kwargs["result_format"]
 
-    df = df[boolean_mapped_unexpected_values]
-
     if result_format["result_format"] == "COMPLETE":
         return list(df.index)
 
@@ -1761,16 +1777,7 @@ def _pandas_column_map_condition_value_counts(
     **kwargs,
 ):
     """Returns respective value counts for distinct column values"""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
-    )
-
-    column_name = accessor_domain_kwargs["column"]
+    _, _, accessor_domain_kwargs = metrics.get("unexpected_condition")
 
     if "column" not in accessor_domain_kwargs:
         raise ValueError(
@@ -1779,35 +1786,24 @@ def _pandas_column_map_condition_value_counts(
 """
         )
 
-    if column_name not in metrics["table.columns"]:
-        raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-            message=f'Error: The column "{column_name}" in BatchData does not exist.'
-        )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    df = _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
 
-    domain_values = df[column_name]
+    domain_values = df[accessor_domain_kwargs["column"]]
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
     try:
-        value_counts = domain_values[boolean_mapped_unexpected_values].value_counts()
+        value_counts = domain_values.value_counts()
     except ValueError:
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values]
-                .apply(tuple)
-                .value_counts()
-            )
+            value_counts = domain_values.apply(tuple).value_counts()
         except ValueError:
             pass
 
@@ -1829,52 +1825,17 @@ def _pandas_map_condition_rows(
     **kwargs,
 ):
     """Return values from the specified domain (ignoring the column constraint) that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
+    df = _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    if "column" in accessor_domain_kwargs:
-        column_name = accessor_domain_kwargs["column"]
-
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-        ###
-        # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-        # currently handle filter_column_isnull differently than other map_fn / map_condition
-        # cases.
-        ###
-        filter_column_isnull = kwargs.get(
-            "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-        )
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
-
-    elif "column_list" in accessor_domain_kwargs:
-        column_list = accessor_domain_kwargs["column_list"]
-
-        for column_name in column_list:
-            if column_name not in metrics["table.columns"]:
-                raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
-                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
-                )
-
     result_format = metric_value_kwargs["result_format"]
 
-    df = df[boolean_mapped_unexpected_values]
-
     if result_format["result_format"] == "COMPLETE":
         return df
 
@@ -1981,7 +1942,7 @@ def _sqlalchemy_map_condition_unexpected_count_value(
             .alias("UnexpectedCountSubquery")
         )
 
-        unexpected_count: Union[float, int] = execution_engine.engine.execute(
+        unexpected_count: Union[float, int] = execution_engine.execute_metric_query(
             sa.select(
                 [
                     unexpected_count_query.c.unexpected_count,
@@ -2058,7 +2019,7 @@ def _sqlalchemy_column_map_condition_values(
 
     return [
         val.unexpected_values
-        for val in execution_engine.engine.execute(query).fetchall()
+        for val in execution_engine.execute_metric_query(query).fetchall()
     ]
 
 
@@ -2114,7 +2075,7 @@ def _sqlalchemy_column_pair_map_condition_values(
 
     unexpected_list = [
         (val.unexpected_values_A, val.unexpected_values_B)
-        for val in execution_engine.engine.execute(query).fetchall()
+        for val in execution_engine.execute_metric_query(query).fetchall()
     ]
     return unexpected_list
 
@@ -2151,7 +2112,7 @@ def _sqlalchemy_column_pair_map_condition_filtered_row_count(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
 
-    return execution_engine.engine.execute(
+    return execution_engine.execute_metric_query(
         sa.select([sa.func.count()]).select_from(selectable)
     ).scalar()
 
@@ -2204,7 +2165,9 @@ def _sqlalchemy_multicolumn_map_condition_values(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
 
-    return [dict(val) for val in execution_engine.engine.execute(query).fetchall()]
+    return [
+        dict(val) for val in execution_engine.execute_metric_query(query).fetchall()
+    ]
 
 
 def _sqlalchemy_multicolumn_map_condition_filtered_row_count(
@@ -2241,7 +2204,7 @@ def _sqlalchemy_multicolumn_map_condition_filtered_row_count(
                 message=f'Error: The column "{column_name}" in BatchData does not exist.'
             )
     selectable = get_sqlalchemy_selectable(selectable)
-    return execution_engine.engine.execute(
+    return execution_engine.execute_metric_query(
         sa.select([sa.func.count()]).select_from(selectable)
     ).scalar()
 
@@ -2289,7 +2252,7 @@ def _sqlalchemy_column_map_condition_value_counts(
     if not MapMetricProvider.is_sqlalchemy_metric_selectable(map_metric_provider=cls):
         query = query.select_from(selectable)
 
-    return execution_engine.engine.execute(query).fetchall()
+    return execution_engine.execute_metric_query(query).fetchall()
 
 
 def _sqlalchemy_map_condition_rows(
@@ -2327,7 +2290,7 @@ def _sqlalchemy_map_condition_rows(
     if result_format["result_format"] != "COMPLETE":
         query = query.limit(result_format["partial_unexpected_count"])
     try:
-        return execution_engine.engine.execute(query).fetchall()
+        return execution_engine.execute_metric_query(query).fetchall()
     except OperationalError as oe:
         exception_message: str = f"An SQL execution Exception occurred: {str(oe)}."
         raise ge_exceptions.InvalidMetricAccessorDomainKwargsKeyError(
@@ -2346,6 +2309,12 @@ def _spark_map_condition_unexpected_count_aggregate_fn(
     unexpected_condition, compute_domain_kwargs, accessor_domain_kwargs = metrics.get(
         "unexpected_condition"
     )
+    compute_domain_kwargs, condition = execution_engine.split_domain_row_conditions(
+        domain_kwargs=compute_domain_kwargs
+    )
+    if condition is not None:
+        unexpected_condition = condition & unexpected_condition
+
     return (
         F.sum(F.when(unexpected_condition, 1).otherwise(0)),
         compute_domain_kwargs,
@@ -11,6 +11,7 @@ from great_expectations.execution_engine.execution_engine import (
     MetricPartialFunctionTypes,
 )
 from great_expectations.expectations.metrics import MetaMetricProvider
+from great_expectations.expectations.metrics.partial_aggregates import PartialAggregate
 from great_expectations.expectations.registry import (
     get_metric_provider,
     register_metric,
@@ -24,9 +25,14 @@ logger = logging.getLogger(__name__)
 def metric_value(
     engine: Type[ExecutionEngine],
     metric_fn_type: Union[str, MetricFunctionTypes] = MetricFunctionTypes.VALUE,
+    partial_aggregate: Optional[Type[PartialAggregate]] = None,
     **kwargs,
 ):
-    """The metric decorator annotates a method"""
+    """The metric decorator annotates a method
+
+    If the metric value can be computed map-reduce style, "partial_aggregate" names the PartialAggregate class, whose
+    mergeable states compute the same value as the method, one chunk of the domain at a time.
+    """
 
     def wrapper(metric_fn: Callable):
         @wraps(metric_fn)
@@ -35,6 +41,7 @@ def metric_value(
 
         inner_func.metric_engine = engine
         inner_func.metric_fn_type = MetricFunctionTypes(metric_fn_type)
+        inner_func.partial_aggregate = partial_aggregate
         inner_func.metric_definition_kwargs = kwargs
         return inner_func
 
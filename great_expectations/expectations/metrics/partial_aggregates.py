@@ -0,0 +1,319 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+from dateutil.parser import parse
+
+from great_expectations.core.sketches import HyperLogLog, TDigest
+
+
+class PartialAggregate(ABC):
+    """Mergeable partial state of an aggregate metric, which allows the metric to be computed map-reduce style.
+
+    The protocol consists of four steps:
+        1. init: a new PartialAggregate is constructed from the metric value kwargs of the metric (an empty state);
+        2. update: "update()" folds one chunk of the data (a column Series) into the state;
+        3. merge: "merge()" folds the state computed over another (disjoint) part of the data into the state;
+        4. finalize: "finalize()" returns the metric value of all of the data seen by the state.
+
+    Hence, the metric can be computed over the data one chunk at a time, or over partitions of the data in parallel,
+    and its states can be kept and combined later (e.g., across Batches), without ever rescanning the data.
+    """
+
+    is_exact = True
+
+    def __init__(self, **kwargs) -> None:
+        pass
+
+    @abstractmethod
+    def update(self, column: pd.Series) -> "PartialAggregate":
+        """Folds the values of the chunk into the state."""
+        pass
+
+    @abstractmethod
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """Folds the state computed over another part of the data into this state."""
+        pass
+
+    @abstractmethod
+    def finalize(self) -> Any:
+        """Returns the metric value of all of the data folded into the state."""
+        pass
+
+    def _validate_mergeable(self, other: "PartialAggregate") -> None:
+        if type(other) is not type(self):
+            raise ValueError(
+                f"Cannot merge {type(other).__name__} into {type(self).__name__}."
+            )
+
+
+class CountPartialAggregate(PartialAggregate):
+    """Number of rows (including null values)."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._count = 0
+
+    def update(self, column: pd.Series) -> "CountPartialAggregate":
+        self._count += len(column)
+        return self
+
+    def merge(self, other: "CountPartialAggregate") -> "CountPartialAggregate":
+        self._validate_mergeable(other=other)
+        self._count += other._count
+        return self
+
+    def finalize(self) -> int:
+        return self._count
+
+
+class NullCountPartialAggregate(CountPartialAggregate):
+    """Number of null values."""
+
+    def update(self, column: pd.Series) -> "NullCountPartialAggregate":
+        self._count += int(column.isnull().sum())
+        return self
+
+
+class NonNullCountPartialAggregate(CountPartialAggregate):
+    """Number of non-null values."""
+
+    def update(self, column: pd.Series) -> "NonNullCountPartialAggregate":
+        self._count += int(column.notnull().sum())
+        return self
+
+
+class SumPartialAggregate(PartialAggregate):
+    """Sum of the non-null values."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._sum = 0
+
+    def update(self, column: pd.Series) -> "SumPartialAggregate":
+        self._sum += column.sum()
+        return self
+
+    def merge(self, other: "SumPartialAggregate") -> "SumPartialAggregate":
+        self._validate_mergeable(other=other)
+        self._sum += other._sum
+        return self
+
+    def finalize(self) -> Any:
+        return self._sum
+
+
+class MinPartialAggregate(PartialAggregate):
+    """Minimum of the non-null values (NaN if there are none)."""
+
+    def __init__(self, parse_strings_as_datetimes: bool = False, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._parse_strings_as_datetimes = parse_strings_as_datetimes or False
+        self._value = None
+
+    def update(self, column: pd.Series) -> "MinPartialAggregate":
+        if self._parse_strings_as_datetimes:
+            try:
+                column = column.map(parse)
+            except TypeError:
+                pass
+
+        value = self._aggregate(column=column)
+        if not pd.isnull(value):
+            self._fold(value=value)
+
+        return self
+
+    def merge(self, other: "MinPartialAggregate") -> "MinPartialAggregate":
+        self._validate_mergeable(other=other)
+        if other._value is not None:
+            self._fold(value=other._value)
+
+        return self
+
+    def finalize(self) -> Any:
+        return np.nan if self._value is None else self._value
+
+    def _aggregate(self, column: pd.Series) -> Any:
+        return column.min()
+
+    def _fold(self, value: Any) -> None:
+        if self._value is None or value < self._value:
+            self._value = value
+
+
+class MaxPartialAggregate(MinPartialAggregate):
+    """Maximum of the non-null values (NaN if there are none)."""
+
+    def _aggregate(self, column: pd.Series) -> Any:
+        return column.max()
+
+    def _fold(self, value: Any) -> None:
+        if self._value is None or value > self._value:
+            self._value = value
+
+
+class MeanPartialAggregate(PartialAggregate):
+    """Mean of the non-null values (NaN if there are none).
+
+    The state consists of the count, the mean, and the sum of squared deviations from the mean of the values, which are
+    combined using the parallel form of Welford's algorithm (Chan et al.), so that merging states is numerically stable.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._count = 0
+        self._mean = 0.0
+        self._sum_of_squared_deviations = 0.0
+
+    def update(self, column: pd.Series) -> "MeanPartialAggregate":
+        values: np.ndarray = column[column.notnull()].to_numpy(dtype=np.float64)
+        if len(values) > 0:
+            mean: float = values.mean()
+            self._fold(
+                count=len(values),
+                mean=mean,
+                sum_of_squared_deviations=float(np.sum((values - mean) ** 2)),
+            )
+
+        return self
+
+    def merge(self, other: "MeanPartialAggregate") -> "MeanPartialAggregate":
+        self._validate_mergeable(other=other)
+        if other._count > 0:
+            self._fold(
+                count=other._count,
+                mean=other._mean,
+                sum_of_squared_deviations=other._sum_of_squared_deviations,
+            )
+
+        return self
+
+    def finalize(self) -> float:
+        return self._mean if self._count > 0 else np.nan
+
+    def _fold(self, count: int, mean: float, sum_of_squared_deviations: float) -> None:
+        total_count: int = self._count + count
+        delta: float = mean - self._mean
+        self._mean += delta * count / total_count
+        self._sum_of_squared_deviations += (
+            sum_of_squared_deviations + delta**2 * self._count * count / total_count
+        )
+        self._count = total_count
+
+
+class StandardDeviationPartialAggregate(MeanPartialAggregate):
+    """Sample standard deviation of the non-null values (NaN if there are fewer than two)."""
+
+    def finalize(self) -> float:
+        if self._count < 2:
+            return np.nan
+
+        return math.sqrt(self._sum_of_squared_deviations / (self._count - 1))
+
+
+class HistogramPartialAggregate(PartialAggregate):
+    """Counts of the non-null values falling into each of the given bins (as in "numpy.histogram")."""
+
+    def __init__(self, bins: Optional[List[float]] = None, **kwargs) -> None:
+        super().__init__(**kwargs)
+        if bins is None:
+            raise ValueError("HistogramPartialAggregate requires bins.")
+
+        self._bins = bins
+        self._counts = np.zeros(len(bins) - 1, dtype=np.int64)
+
+    def update(self, column: pd.Series) -> "HistogramPartialAggregate":
+        counts, _ = np.histogram(column[column.notnull()], self._bins, density=False)
+        self._counts += counts
+        return self
+
+    def merge(self, other: "HistogramPartialAggregate") -> "HistogramPartialAggregate":
+        self._validate_mergeable(other=other)
+        if list(other._bins) != list(self._bins):
+            raise ValueError("Cannot merge histograms of different bins.")
+
+        self._counts += other._counts
+        return self
+
+    def finalize(self) -> List[int]:
+        return list(self._counts)
+
+
+class QuantilesPartialAggregate(PartialAggregate):
+    """Quantiles of the non-null values, estimated using a t-digest.
+
+    As long as the t-digest keeps every value, the quantiles are exact (and interpolated the same way as by pandas).
+    """
+
+    is_exact = False
+
+    def __init__(
+        self,
+        quantiles: Optional[List[float]] = None,
+        allow_relative_error: Any = False,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._quantiles = quantiles
+        self._interpolation = allow_relative_error or "nearest"
+        self._digest = TDigest()
+
+    def update(self, column: pd.Series) -> "QuantilesPartialAggregate":
+        self._digest.update(values=column)
+        return self
+
+    def merge(self, other: "QuantilesPartialAggregate") -> "QuantilesPartialAggregate":
+        self._validate_mergeable(other=other)
+        self._digest.merge(other=other._digest)
+        return self
+
+    def finalize(self) -> List[float]:
+        return self._get_quantiles(quantiles=self._quantiles)
+
+    def _get_quantiles(self, quantiles: List[float]) -> List[float]:
+        if self._digest.is_exact:
+            means, _ = self._digest.centroids
+            return (
+                pd.Series(means, dtype=np.float64)
+                .quantile(quantiles, interpolation=self._interpolation)
+                .tolist()
+            )
+
+        return [self._digest.quantile(q=q) for q in quantiles]
+
+
+class MedianPartialAggregate(QuantilesPartialAggregate):
+    """Median of the non-null values, estimated using a t-digest (exact as long as the t-digest keeps every value)."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(quantiles=[0.5], allow_relative_error="linear", **kwargs)
+
+    def finalize(self) -> float:
+        return self._get_quantiles(quantiles=[0.5])[0]
+
+
+class DistinctValuesCountPartialAggregate(PartialAggregate):
+    """Number of distinct non-null values, estimated using a HyperLogLog sketch."""
+
+    is_exact = False
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._sketch = HyperLogLog()
+
+    def update(self, column: pd.Series) -> "DistinctValuesCountPartialAggregate":
+        self._sketch.update(values=column)
+        return self
+
+    def merge(
+        self, other: "DistinctValuesCountPartialAggregate"
+    ) -> "DistinctValuesCountPartialAggregate":
+        self._validate_mergeable(other=other)
+        self._sketch.merge(other=other._sketch)
+        return self
+
+    def finalize(self) -> int:
+        return self._sketch.estimate()
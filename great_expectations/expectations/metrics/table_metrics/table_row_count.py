@@ -58,10 +58,16 @@ class TableRowCount(TableMetricProvider):
     )
     def _spark(
         cls,
-        execution_engine: "SqlAlchemyExecutionEngine",
+        execution_engine: "SparkDFExecutionEngine",
         metric_domain_kwargs: Dict,
         metric_value_kwargs: Dict,
         metrics: Dict[str, Any],
         runtime_configuration: Dict,
     ):
-        return F.count(F.lit(1)), metric_domain_kwargs, {}
+        domain_kwargs, condition = execution_engine.split_domain_row_conditions(
+            domain_kwargs=metric_domain_kwargs
+        )
+        if condition is None:
+            return F.count(F.lit(1)), metric_domain_kwargs, {}
+
+        return F.count(F.when(condition, F.lit(1))), domain_kwargs, {}
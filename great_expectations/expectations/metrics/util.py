@@ -1,8 +1,9 @@
 import logging
 import warnings
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
@@ -71,6 +72,11 @@ try:
 except ImportError:
     trino = None
 
+try:
+    import duckdb_engine
+except ImportError:
+    duckdb_engine = None
+
 _BIGQUERY_MODULE_NAME = "sqlalchemy_bigquery"
 try:
     import sqlalchemy_bigquery as sqla_bigquery
@@ -118,6 +124,19 @@ except ImportError:
 
 
 def get_dialect_regex_expression(column, regex, dialect, positive=True):
+    try:
+        # DuckDB (its dialect derives from the postgres dialect, but "~" is a full match in DuckDB)
+        if issubclass(dialect.Dialect, duckdb_engine.Dialect):
+            if positive:
+                return sa.func.regexp_matches(column, literal(regex))
+            else:
+                return sa.not_(sa.func.regexp_matches(column, literal(regex)))
+    except (
+        AttributeError,
+        TypeError,
+    ):  # TypeError can occur if the driver was not installed and so is None
+        pass
+
     try:
         # postgres
         if issubclass(dialect.dialect, sa.dialects.postgresql.dialect):
@@ -306,6 +325,80 @@ def attempt_allowing_relative_error(dialect):
     return detected_redshift or detected_psycopg2
 
 
+def get_sqlalchemy_column_values_at_positions(
+    column,
+    positions: List[int],
+    selectable,
+    sqlalchemy_engine,
+    ignore_nulls: bool = False,
+) -> list:
+    """Returns the values at the given (zero-based) positions of the column, sorted in ascending order.
+
+    All positions are fetched in a single query, which numbers the sorted column values using the "ROW_NUMBER()" window
+    function; hence, this serves as the exact quantile (and median) implementation for dialects lacking a native
+    "percentile_disc" aggregate function (instead of issuing one "ORDER BY ... OFFSET ... LIMIT 1" query per position).
+    Databases without window functions (e.g., MySQL before 8.0, SQLite before 3.25) are issued the latter queries.
+
+    Args:
+        column: SQLAlchemy column, whose values are to be returned
+        positions: zero-based positions of the values to return in the sorted column
+        selectable: SQLAlchemy selectable (domain) containing the column
+        sqlalchemy_engine: SQLAlchemy engine (or connection) used to execute the query
+        ignore_nulls: if True, NULL values are excluded before numbering the column values
+
+    Returns:
+        List of values, in the order of the given positions (with None for positions past the last value)
+    """
+    if not _supports_window_functions(dialect=sqlalchemy_engine.dialect):
+        values_query: Select = sa.select([column]).select_from(selectable)
+        if ignore_nulls:
+            values_query = values_query.where(column != None)
+
+        values_query = values_query.order_by(column.asc()).limit(1)
+        values_by_position: Dict[int, Any] = {}
+        for position in set(positions):
+            row = sqlalchemy_engine.execute(values_query.offset(position)).fetchone()
+            values_by_position[position] = None if row is None else row[0]
+
+        return [values_by_position[position] for position in positions]
+
+    ranked_values_query: Select = sa.select(
+        [
+            column.label("column_value"),
+            sa.func.row_number().over(order_by=column.asc()).label("value_rank"),
+        ]
+    ).select_from(selectable)
+    if ignore_nulls:
+        ranked_values_query = ranked_values_query.where(column != None)
+
+    ranked_values = ranked_values_query.subquery()
+    ranks: List[int] = sorted({position + 1 for position in positions})
+    values_query: Select = sa.select(
+        [ranked_values.c.value_rank, ranked_values.c.column_value]
+    ).where(ranked_values.c.value_rank.in_(ranks))
+
+    values_by_rank: Dict[int, Any] = dict(
+        sqlalchemy_engine.execute(values_query).fetchall()
+    )
+    return [values_by_rank.get(position + 1) for position in positions]
+
+
+def _supports_window_functions(dialect: Dialect) -> bool:
+    """Returns False for the (versions of) databases known to lack window functions, and True otherwise."""
+    dialect_name: str = dialect.name.lower()
+    server_version_info: Optional[tuple] = getattr(dialect, "server_version_info", None)
+    if server_version_info is None:
+        return True
+
+    if dialect_name == "sqlite":
+        return server_version_info >= (3, 25)
+
+    if dialect_name == "mysql" and not getattr(dialect, "is_mariadb", False):
+        return server_version_info >= (8,)
+
+    return True
+
+
 def is_column_present_in_table(
     engine: Engine,
     table_selectable: Select,
@@ -583,6 +676,69 @@ def parse_value_set(value_set):
     return parsed_value_set
 
 
+def map_distinct_values(column: pd.Series, fn: Callable[[Any], Any]) -> pd.Series:
+    """Returns the same as "column.map(fn)", but calls "fn" only once for each distinct non-null value of the column.
+
+    Values, which are equal, must be interchangeable as arguments of "fn" (e.g., strings, but not True and 1); null
+    values are passed to "fn" one by one.
+    """
+    codes: np.ndarray
+    uniques: Any
+    codes, uniques = pd.factorize(column)
+    if len(uniques) == len(column):
+        return column.map(fn)
+
+    results: np.ndarray = np.empty(len(uniques) + 1, dtype=object)
+    idx: int
+    value: Any
+    for idx, value in enumerate(uniques):
+        results[idx] = fn(value)
+
+    values: np.ndarray = results[codes]
+    for idx in np.flatnonzero(codes == -1):
+        values[idx] = fn(column.iloc[idx])
+
+    mapped_column = pd.Series(values, index=column.index, name=column.name)
+    # As "Series.map()" does, booleans and numbers (but not, e.g., datetimes) are converted to a non-object dtype.
+    if pd.api.types.infer_dtype(values, skipna=False) in (
+        "boolean",
+        "integer",
+        "floating",
+    ):
+        mapped_column = mapped_column.infer_objects()
+
+    return mapped_column
+
+
+def map_distinct_strings(column: pd.Series, fn: Callable[[Any], Any]) -> pd.Series:
+    """Returns the same as "column.map(fn)"; if all non-null values of the column are strings, "fn" is only called once
+    for each distinct string (see "map_distinct_values()")."""
+    if pd.api.types.infer_dtype(column, skipna=True) != "string":
+        return column.map(fn)
+
+    return map_distinct_values(column=column, fn=fn)
+
+
+def map_isinstance(column: pd.Series, types: Tuple[type, ...]) -> pd.Series:
+    """Returns the same as "column.map(lambda x: isinstance(x, types))", but only checks the types of the values: once
+    for a column of a numeric or boolean NumPy dtype (the values of which "Series.map()" converts to the same Python
+    type), and once for each distinct type of the values otherwise."""
+    if (
+        isinstance(column.dtype, np.dtype)
+        and column.dtype.kind in "biufc"
+        and len(column) > 0
+    ):
+        is_instance: bool = bool(
+            column.iloc[:1].map(lambda value: isinstance(value, types)).iloc[0]
+        )
+        return pd.Series(is_instance, index=column.index, name=column.name)
+
+    return map_distinct_values(
+        column=column.map(type),
+        fn=lambda value_type: issubclass(value_type, types),
+    )
+
+
 def get_dialect_like_pattern_expression(column, dialect, like_pattern, positive=True):
     dialect_supported: bool = False
 
@@ -212,7 +212,10 @@ def get_metric_provider(
 ) -> Tuple["MetricProvider", Callable]:  # noqa: F821
     try:
         metric_definition = _registered_metrics[metric_name]
-        return metric_definition["providers"][type(execution_engine).__name__]
+        return _get_engine_provider(
+            providers=metric_definition["providers"],
+            execution_engine=execution_engine,
+        )
     except KeyError:
         raise ge_exceptions.MetricProviderError(
             f"No provider found for {metric_name} using {type(execution_engine).__name__}"
@@ -224,9 +227,10 @@ def get_metric_function_type(
 ) -> Optional[Union["MetricPartialFunctionTypes", "MetricFunctionTypes"]]:  # noqa: F821
     try:
         metric_definition = _registered_metrics[metric_name]
-        provider_fn, provider_class = metric_definition["providers"][
-            type(execution_engine).__name__
-        ]
+        provider_fn, provider_class = _get_engine_provider(
+            providers=metric_definition["providers"],
+            execution_engine=execution_engine,
+        )
         return getattr(provider_fn, "metric_fn_type", None)
     except KeyError:
         raise ge_exceptions.MetricProviderError(
@@ -234,6 +238,19 @@ def get_metric_function_type(
         )
 
 
+def _get_engine_provider(
+    providers: dict, execution_engine: "ExecutionEngine"  # noqa: F821
+) -> Tuple["MetricProvider", Callable]:  # noqa: F821
+    """Returns the provider registered for the class of the execution engine or, failing that, for the nearest of its
+    base classes (so that an engine derived from another one reuses its metric implementations, unless it registers
+    its own); raises KeyError if there is none."""
+    for engine_class in type(execution_engine).__mro__:
+        if engine_class.__name__ in providers:
+            return providers[engine_class.__name__]
+
+    raise KeyError(type(execution_engine).__name__)
+
+
 def get_metric_kwargs(
     metric_name: str,
     configuration: Optional["ExpectationConfiguration"] = None,  # noqa: F821
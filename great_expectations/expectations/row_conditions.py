@@ -1,5 +1,8 @@
+import ast
 import enum
+import re
 from dataclasses import dataclass
+from typing import Optional, Set
 
 from pyparsing import (
     CaselessLiteral,
@@ -96,6 +99,37 @@ def _parse_great_expectations_condition(row_condition: str):
         raise ConditionParserError(f"unable to parse condition: {row_condition}")
 
 
+def get_row_condition_columns(
+    row_condition: str, condition_parser: Optional[str]
+) -> Optional[Set[str]]:
+    """Returns the names of the columns, which the row condition may refer to, or None, if they cannot be determined.
+
+    For the "pandas" and "python" parsers (of DataFrame.query()), these are all names (and backtick-quoted names) in
+    the expression, so the result may include names that are not columns (e.g., of functions).
+    """
+    if condition_parser == "great_expectations__experimental__":
+        try:
+            return {_parse_great_expectations_condition(row_condition)["column"]}
+        except ConditionParserError:
+            return None
+
+    if condition_parser not in ["pandas", "python"]:
+        return None
+
+    quoted_names: Set[str] = set(re.findall(r"`([^`]*)`", row_condition))
+    try:
+        expression: ast.Expression = ast.parse(
+            re.sub(r"`[^`]*`", "(0)", row_condition).strip(), mode="eval"
+        )
+    except SyntaxError:
+        # E.g., local variables (referred to as "@name") may not be determined.
+        return None
+
+    return quoted_names | {
+        node.id for node in ast.walk(expression) if isinstance(node, ast.Name)
+    }
+
+
 # noinspection PyUnresolvedReferences
 def parse_condition_to_spark(row_condition: str) -> "pyspark.sql.Column":
     parsed = _parse_great_expectations_condition(row_condition)
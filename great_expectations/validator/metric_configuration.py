@@ -1,10 +1,27 @@
+import copy
 import json
-from typing import Tuple
+from typing import MutableMapping, Tuple
 
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict
 
 
 class MetricConfiguration:
+    """Specification of a metric (its name, domain kwargs, and value kwargs), identified by the "id" property.
+
+    The name and kwargs of a MetricConfiguration are immutable (the kwargs are held in FrozenIDDict objects); hence,
+    its id is computed only once.  Identical MetricConfiguration objects can be consolidated into a single shared
+    instance using "MetricConfiguration.intern()", within the scope of an intern table (e.g., that of a Validator).
+    """
+
+    __slots__ = (
+        "_metric_name",
+        "_metric_domain_kwargs",
+        "_metric_value_kwargs",
+        "_metric_dependencies",
+        "_id",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         metric_name: str,
@@ -13,17 +30,62 @@ class MetricConfiguration:
         metric_dependencies: dict = None,
     ) -> None:
         self._metric_name = metric_name
-        if not isinstance(metric_domain_kwargs, IDDict):
-            metric_domain_kwargs = IDDict(metric_domain_kwargs)
+        if not isinstance(metric_domain_kwargs, FrozenIDDict):
+            metric_domain_kwargs = FrozenIDDict(metric_domain_kwargs)
         self._metric_domain_kwargs = metric_domain_kwargs
-        if not isinstance(metric_value_kwargs, IDDict):
+        if not isinstance(metric_value_kwargs, FrozenIDDict):
             if metric_value_kwargs is None:
                 metric_value_kwargs = {}
-            metric_value_kwargs = IDDict(metric_value_kwargs)
+            metric_value_kwargs = FrozenIDDict(metric_value_kwargs)
         self._metric_value_kwargs = metric_value_kwargs
         if metric_dependencies is None:
             metric_dependencies = {}
         self._metric_dependencies = metric_dependencies
+        self._id = None
+
+    @staticmethod
+    def intern(
+        metric_configuration: "MetricConfiguration",
+        interned_metric_configurations: MutableMapping[
+            Tuple[str, str, str], "MetricConfiguration"
+        ],
+    ) -> "MetricConfiguration":
+        """Returns the MetricConfiguration of the intern table having the id of the given one (which is added to the
+        table, if none is)."""
+        metric_id: Tuple[str, str, str] = metric_configuration.id
+        interned_metric_configuration: "MetricConfiguration" = (
+            interned_metric_configurations.get(metric_id)
+        )
+        if interned_metric_configuration is None:
+            interned_metric_configurations[metric_id] = metric_configuration
+            return metric_configuration
+
+        if (
+            metric_configuration.metric_dependencies
+            and not interned_metric_configuration.metric_dependencies
+        ):
+            interned_metric_configuration.metric_dependencies = (
+                metric_configuration.metric_dependencies
+            )
+
+        return interned_metric_configuration
+
+    def __copy__(self) -> "MetricConfiguration":
+        return MetricConfiguration(
+            metric_name=self._metric_name,
+            metric_domain_kwargs=self._metric_domain_kwargs,
+            metric_value_kwargs=self._metric_value_kwargs,
+            metric_dependencies=self._metric_dependencies,
+        )
+
+    def __deepcopy__(self, memo) -> "MetricConfiguration":
+        # Deep copies of the (frozen) kwargs are mutable IDDict objects, which are frozen anew.
+        return MetricConfiguration(
+            metric_name=self._metric_name,
+            metric_domain_kwargs=copy.deepcopy(self._metric_domain_kwargs, memo),
+            metric_value_kwargs=copy.deepcopy(self._metric_value_kwargs, memo),
+            metric_dependencies=copy.deepcopy(self._metric_dependencies, memo),
+        )
 
     def __repr__(self):
         return json.dumps(self.to_json_dict(), indent=2)
@@ -61,11 +123,14 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+        if self._id is None:
+            self._id = (
+                self.metric_name,
+                self.metric_domain_kwargs_id,
+                self.metric_value_kwargs_id,
+            )
+
+        return self._id
 
     def to_json_dict(self) -> dict:
         json_dict: dict = {
@@ -1,5 +1,5 @@
-import copy
-from typing import Dict, List, Optional, Set, Tuple, Union, cast
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union, cast
 
 from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.validator.exception_info import ExceptionInfo
@@ -44,17 +44,120 @@ class ValidationGraph:
 
     @property
     def edges(self):
-        return copy.deepcopy(self._edges)
+        # Edges are immutable; the vertices (shared by the edges of several graphs) are not copied.
+        return list(self._edges)
 
     @property
     def edge_ids(self):
         return {edge.id for edge in self.edges}
 
 
+class MetricDependencyScheduler:
+    """Kahn-style scheduler, releasing the metrics of a ValidationGraph for resolution as their dependencies resolve.
+
+    The dependency and reverse-dependency indexes are built in a single pass over the edges of the graph.  Thereafter,
+    marking a metric as resolved only visits the metrics that depend on it, instead of rescanning every edge of the
+    graph in order to determine the next set of ready metrics.
+    """
+
+    def __init__(
+        self,
+        graph: ValidationGraph,
+        metrics: Dict[Tuple[str, str, str], Any],
+    ) -> None:
+        """
+        Args:
+            graph: ValidationGraph, whose edges define the metric dependencies to be scheduled.
+            metrics: Already-computed metrics; these are treated as resolved (and, therefore, are never scheduled).
+        """
+        self._metric_configurations: Dict[
+            Tuple[str, str, str], MetricConfiguration
+        ] = {}
+        self._unmet_dependency_ids: Dict[
+            Tuple[str, str, str], Set[Tuple[str, str, str]]
+        ] = {}
+        self._dependent_ids: Dict[
+            Tuple[str, str, str], Set[Tuple[str, str, str]]
+        ] = defaultdict(set)
+
+        edge: MetricEdge
+        for edge in graph.edges:
+            left_id: Tuple[str, str, str] = edge.left.id
+            if left_id in metrics:
+                continue
+
+            if left_id not in self._metric_configurations:
+                self._metric_configurations[left_id] = edge.left
+                self._unmet_dependency_ids[left_id] = set()
+
+            if edge.right is not None:
+                right_id: Tuple[str, str, str] = edge.right.id
+                if right_id not in metrics:
+                    self._unmet_dependency_ids[left_id].add(right_id)
+                    self._dependent_ids[right_id].add(left_id)
+
+        self._ready_metric_ids: Set[Tuple[str, str, str]] = {
+            metric_id
+            for metric_id, unmet_dependency_ids in self._unmet_dependency_ids.items()
+            if len(unmet_dependency_ids) == 0
+        }
+
+    @property
+    def ready_metrics(self) -> Set[MetricConfiguration]:
+        """Unresolved metrics, all of whose dependencies have been resolved."""
+        return {
+            self._metric_configurations[metric_id]
+            for metric_id in self._ready_metric_ids
+        }
+
+    @property
+    def needed_metrics(self) -> Set[MetricConfiguration]:
+        """Unresolved metrics, having at least one unresolved dependency."""
+        return {
+            self._metric_configurations[metric_id]
+            for metric_id, unmet_dependency_ids in self._unmet_dependency_ids.items()
+            if len(unmet_dependency_ids) > 0
+        }
+
+    @property
+    def num_unresolved_metrics(self) -> int:
+        return len(self._unmet_dependency_ids)
+
+    def mark_resolved(self, metric_ids: Iterable[Tuple[str, str, str]]) -> None:
+        """Records resolution of metrics and releases the dependent metrics, whose last dependency has been resolved.
+
+        Args:
+            metric_ids: Ids of newly resolved metrics (ids not belonging to the graph are ignored).
+        """
+        metric_id: Tuple[str, str, str]
+        dependent_id: Tuple[str, str, str]
+        for metric_id in metric_ids:
+            self._ready_metric_ids.discard(metric_id)
+            if self._unmet_dependency_ids.pop(metric_id, None) is not None:
+                self._metric_configurations.pop(metric_id)
+
+            for dependent_id in self._dependent_ids.pop(metric_id, set()):
+                unmet_dependency_ids: Optional[
+                    Set[Tuple[str, str, str]]
+                ] = self._unmet_dependency_ids.get(dependent_id)
+                if unmet_dependency_ids is None:
+                    continue
+
+                unmet_dependency_ids.discard(metric_id)
+                if len(unmet_dependency_ids) == 0:
+                    self._ready_metric_ids.add(dependent_id)
+
+
 class ExpectationValidationGraph:
-    def __init__(self, configuration: ExpectationConfiguration) -> None:
+    def __init__(
+        self,
+        configuration: ExpectationConfiguration,
+        graph: Optional[ValidationGraph] = None,
+    ) -> None:
         self._configuration = configuration
-        self._graph = ValidationGraph()
+        if graph is None:
+            graph = ValidationGraph()
+        self._graph = graph
 
     def update(self, graph: ValidationGraph) -> None:
         edge: MetricEdge
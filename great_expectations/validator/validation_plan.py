@@ -0,0 +1,313 @@
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.core.id_dict import IDDict
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationPlan:
+    """Compiled metric dependency graphs of a list of expectation configurations, reusable across batches.
+
+    A ValidationPlan is compiled once for the given expectation configurations, runtime configuration, execution
+    engine type, and column schema of a batch (which, together, comprise its key).  Validating another batch that
+    shares the key re-binds the compiled graphs to the "batch_id" of that batch, instead of calling
+    "get_validation_dependencies()" and "build_metric_dependency_graph()" for every expectation configuration again.
+
+    Graphs are stored per expectation configuration position; a position holding None (e.g., an expectation, whose
+    validation dependencies are derived from the data of the batch) is rebuilt on every validation.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        batch_id: Optional[str],
+        graphs: List[Optional[ValidationGraph]],
+    ) -> None:
+        self._key = key
+        self._batch_id = batch_id
+        self._graphs = graphs
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def batch_id(self) -> Optional[str]:
+        return self._batch_id
+
+    @property
+    def graphs(self) -> List[Optional[ValidationGraph]]:
+        return self._graphs
+
+    def bind(self, batch_id: Optional[str]) -> List[Optional[ValidationGraph]]:
+        """Returns copies of compiled graphs, whose metric domains reference the batch having the given "batch_id".
+
+        Metric configurations shared among edges (and among graphs) remain shared in the bound graphs.
+        """
+        bound_metrics: Dict[Tuple[str, str, str], MetricConfiguration] = {}
+        bound_dependency_ids: Set[Tuple[str, str, str]] = set()
+
+        bound_graphs: List[Optional[ValidationGraph]] = []
+        graph: Optional[ValidationGraph]
+        edge: MetricEdge
+        for graph in self._graphs:
+            if graph is None:
+                bound_graphs.append(None)
+                continue
+
+            bound_graphs.append(
+                ValidationGraph(
+                    edges=[
+                        MetricEdge(
+                            left=self._bind_metric(
+                                metric_configuration=edge.left,
+                                batch_id=batch_id,
+                                bound_metrics=bound_metrics,
+                                bound_dependency_ids=bound_dependency_ids,
+                            ),
+                            right=self._bind_metric(
+                                metric_configuration=edge.right,
+                                batch_id=batch_id,
+                                bound_metrics=bound_metrics,
+                                bound_dependency_ids=bound_dependency_ids,
+                            )
+                            if edge.right is not None
+                            else None,
+                        )
+                        # Compiled graphs are never mutated; hence, their edges are read without copying them.
+                        for edge in graph._edges
+                    ]
+                )
+            )
+
+        return bound_graphs
+
+    def _bind_metric(
+        self,
+        metric_configuration: MetricConfiguration,
+        batch_id: Optional[str],
+        bound_metrics: Dict[Tuple[str, str, str], MetricConfiguration],
+        bound_dependency_ids: Set[Tuple[str, str, str]],
+    ) -> MetricConfiguration:
+        metric_id: Tuple[str, str, str] = metric_configuration.id
+        bound_metric: Optional[MetricConfiguration] = bound_metrics.get(metric_id)
+        if bound_metric is None:
+            metric_domain_kwargs: dict = dict(metric_configuration.metric_domain_kwargs)
+            if (
+                "batch_id" in metric_domain_kwargs
+                and metric_domain_kwargs["batch_id"] == self._batch_id
+            ):
+                metric_domain_kwargs["batch_id"] = batch_id
+
+            bound_metric = MetricConfiguration(
+                metric_name=metric_configuration.metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=metric_configuration.metric_value_kwargs,
+            )
+            bound_metrics[metric_id] = bound_metric
+
+        # The same metric may be referenced by several configuration objects, only some of which carry dependencies;
+        # the dependency mapping is attached only once (before binding its members, so that cycles terminate).
+        if (
+            metric_configuration.metric_dependencies
+            and metric_id not in bound_dependency_ids
+        ):
+            bound_dependency_ids.add(metric_id)
+            metric_dependencies: Dict[str, MetricConfiguration] = {}
+            bound_metric.metric_dependencies = metric_dependencies
+            for (
+                name,
+                metric_dependency,
+            ) in metric_configuration.metric_dependencies.items():
+                metric_dependencies[name] = self._bind_metric(
+                    metric_configuration=metric_dependency,
+                    batch_id=batch_id,
+                    bound_metrics=bound_metrics,
+                    bound_dependency_ids=bound_dependency_ids,
+                )
+
+        return bound_metric
+
+    def to_json_dict(self) -> dict:
+        """Serializes the plan; metric configurations are stored once, in the "metrics" table, and referenced by key."""
+        metric_keys: Dict[Tuple[str, str, str], str] = {}
+        metrics: Dict[str, dict] = {}
+
+        def _metric_key(metric_configuration: MetricConfiguration) -> str:
+            metric_id: Tuple[str, str, str] = metric_configuration.id
+            if metric_id in metric_keys:
+                return metric_keys[metric_id]
+
+            metric_key: str = str(len(metric_keys))
+            metric_keys[metric_id] = metric_key
+            metrics[metric_key] = {
+                "metric_name": metric_configuration.metric_name,
+                "metric_domain_kwargs": convert_to_json_serializable(
+                    dict(metric_configuration.metric_domain_kwargs)
+                ),
+                "metric_value_kwargs": convert_to_json_serializable(
+                    dict(metric_configuration.metric_value_kwargs)
+                ),
+            }
+            metrics[metric_key]["metric_dependencies"] = {
+                name: _metric_key(metric_dependency)
+                for name, metric_dependency in (
+                    metric_configuration.metric_dependencies or {}
+                ).items()
+            }
+            return metric_key
+
+        graphs: List[Optional[List[List[Optional[str]]]]] = []
+        graph: Optional[ValidationGraph]
+        edge: MetricEdge
+        for graph in self._graphs:
+            if graph is None:
+                graphs.append(None)
+            else:
+                graphs.append(
+                    [
+                        [
+                            _metric_key(edge.left),
+                            _metric_key(edge.right) if edge.right is not None else None,
+                        ]
+                        for edge in graph._edges
+                    ]
+                )
+
+        return {
+            "key": self._key,
+            "batch_id": self._batch_id,
+            "metrics": metrics,
+            "graphs": graphs,
+        }
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> "ValidationPlan":
+        metric_dicts: Dict[str, dict] = json_dict["metrics"]
+        metric_configurations: Dict[str, MetricConfiguration] = {
+            metric_key: MetricConfiguration(
+                metric_name=metric_dict["metric_name"],
+                metric_domain_kwargs=metric_dict["metric_domain_kwargs"],
+                metric_value_kwargs=metric_dict["metric_value_kwargs"],
+            )
+            for metric_key, metric_dict in metric_dicts.items()
+        }
+        for metric_key, metric_dict in metric_dicts.items():
+            if metric_dict["metric_dependencies"]:
+                metric_configurations[metric_key].metric_dependencies = {
+                    name: metric_configurations[dependency_key]
+                    for name, dependency_key in metric_dict[
+                        "metric_dependencies"
+                    ].items()
+                }
+
+        graphs: List[Optional[ValidationGraph]] = []
+        for edge_keys in json_dict["graphs"]:
+            if edge_keys is None:
+                graphs.append(None)
+            else:
+                graphs.append(
+                    ValidationGraph(
+                        edges=[
+                            MetricEdge(
+                                left=metric_configurations[left_key],
+                                right=metric_configurations[right_key]
+                                if right_key is not None
+                                else None,
+                            )
+                            for left_key, right_key in edge_keys
+                        ]
+                    )
+                )
+
+        return cls(
+            key=json_dict["key"],
+            batch_id=json_dict["batch_id"],
+            graphs=graphs,
+        )
+
+    @staticmethod
+    def build_key(
+        configurations: List[ExpectationConfiguration],
+        runtime_configuration: Optional[dict],
+        execution_engine_type: str,
+        column_schema: Optional[List[dict]],
+    ) -> str:
+        """Hashes the content that determines the compiled graphs (the "batch_id" of configurations excluded)."""
+        configuration_dicts: List[dict] = []
+        configuration: ExpectationConfiguration
+        for configuration in configurations:
+            configuration_dict: dict = configuration.to_json_dict()
+            configuration_dict["kwargs"].pop("batch_id", None)
+            configuration_dict.pop("meta", None)
+            configuration_dict.pop("rendered_content", None)
+            configuration_dicts.append(configuration_dict)
+
+        return IDDict(
+            {
+                "expectation_configurations": configuration_dicts,
+                "runtime_configuration": convert_to_json_serializable(
+                    runtime_configuration or {}
+                ),
+                "execution_engine_type": execution_engine_type,
+                "column_schema": column_schema,
+            }
+        ).to_id()
+
+
+class ValidationPlanCache:
+    """In-memory, least-recently-used cache of compiled ValidationPlan objects, keyed by ValidationPlan.key.
+
+    The cache is bounded by the number of plans ("max_size"), rather than by their memory; the memory of a plan grows
+    with the number of its expectation configurations (and of their metrics).  "max_size" can be lowered (e.g., for
+    processes validating many large suites) or raised at any time.
+    """
+
+    DEFAULT_MAX_SIZE = 128
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._max_size = max_size
+        self._plans: "OrderedDict[str, ValidationPlan]" = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._evict()
+
+    def get(self, key: str) -> Optional[ValidationPlan]:
+        plan: Optional[ValidationPlan] = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+
+        return plan
+
+    def put(self, plan: ValidationPlan) -> None:
+        self._plans[plan.key] = plan
+        self._plans.move_to_end(plan.key)
+        self._evict()
+
+    def clear(self) -> None:
+        self._plans.clear()
+
+    def _evict(self) -> None:
+        while len(self._plans) > self._max_size:
+            self._plans.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._plans
+
+
+validation_plan_cache = ValidationPlanCache()
@@ -6,6 +6,7 @@ import json
 import logging
 import traceback
 import warnings
+import weakref
 from collections import OrderedDict, defaultdict, namedtuple
 from collections.abc import Hashable
 from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
@@ -24,7 +25,7 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationValidationResult,
 )
-from great_expectations.core.id_dict import BatchSpec
+from great_expectations.core.id_dict import BatchSpec, IDDict
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.util import convert_to_json_serializable
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
@@ -48,6 +49,7 @@ from great_expectations.expectations.registry import (
     get_metric_provider,
     list_registered_expectation_implementations,
 )
+from great_expectations.expectations.row_conditions import get_row_condition_columns
 from great_expectations.marshmallow__shade import ValidationError
 from great_expectations.rule_based_profiler import RuleBasedProfilerResult
 from great_expectations.rule_based_profiler.config import RuleBasedProfilerConfig
@@ -71,9 +73,14 @@ from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validation_graph import (
     ExpectationValidationGraph,
+    MetricDependencyScheduler,
     MetricEdge,
     ValidationGraph,
 )
+from great_expectations.validator.validation_plan import (
+    ValidationPlan,
+    validation_plan_cache,
+)
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
@@ -89,6 +96,13 @@ except ImportError:
 
 MAX_METRIC_COMPUTATION_RETRIES: int = 3
 
+# Table metrics, which do not depend on the values of any column (and, hence, do not prevent column projection).
+TABLE_METRICS_WITHOUT_COLUMN_VALUES = (
+    "table.row_count",
+    "table.columns",
+    "table.column_types",
+)
+
 
 ValidationStatistics = namedtuple(
     "ValidationStatistics",
@@ -170,6 +184,18 @@ class Validator:
         self._execution_engine = execution_engine
         self._expose_dataframe_methods = False
 
+        if self._execution_engine.batch_metrics_store is None:
+            # postpone importing to avoid circular imports
+            from great_expectations.data_context.store.batch_metrics_store import (
+                BatchMetricsStore,
+            )
+
+            batch_metrics_store = getattr(
+                self._data_context, "batch_metrics_store", None
+            )
+            if isinstance(batch_metrics_store, BatchMetricsStore):
+                self._execution_engine.batch_metrics_store = batch_metrics_store
+
         self._show_progress_bars = self._determine_progress_bars()
 
         if batches is None:
@@ -209,6 +235,19 @@ class Validator:
         else:
             self._include_rendered_content = False
 
+        self._cache_validation_plans = kwargs.get("cache_validation_plans", False)
+        # Column schemas of the batches validated using cached ValidationPlans, keyed by their (loaded) batch data, so
+        # that the "table.column_types" of a batch are only resolved once.
+        self._validation_plan_column_schemas: "weakref.WeakKeyDictionary[Any, List[dict]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Identical metrics of the graphs built by this Validator share a single vertex object (entries live only as
+        # long as the MetricConfiguration objects are referenced elsewhere).
+        self._interned_metric_configurations: "weakref.WeakValueDictionary[Tuple[str, str, str], MetricConfiguration]" = (
+            weakref.WeakValueDictionary()
+        )
+
     def __dir__(self):
         """
         This custom magic method is used to enable expectation tab completion on Validator objects.
@@ -250,6 +289,20 @@ class Validator:
 
         return enable
 
+    @property
+    def cache_validation_plans(self) -> bool:
+        """Whether metric dependency graphs are compiled once into a ValidationPlan and re-bound to each batch.
+
+        Compiled plans are kept in a process-wide, least-recently-used cache of at most "validation_plan_cache.max_size"
+        plans (ValidationPlanCache.DEFAULT_MAX_SIZE, by default); each plan holds the metric configurations of the
+        graphs of its expectation configurations.
+        """
+        return self._cache_validation_plans
+
+    @cache_validation_plans.setter
+    def cache_validation_plans(self, enable: bool) -> None:
+        self._cache_validation_plans = enable
+
     @property
     def show_progress_bars(self) -> bool:
         return self._show_progress_bars
@@ -812,27 +865,43 @@ class Validator:
         """
         graph: ValidationGraph = ValidationGraph()
 
+        # Since "MetricConfiguration" objects are immutable, defaults are filled into copies of requested metrics.
+        defaulted_metric_configurations: List[
+            Tuple[MetricConfiguration, MetricConfiguration]
+        ] = []
+
         metric_configuration: MetricConfiguration
+        defaulted_metric_configuration: MetricConfiguration
         for metric_configuration in metric_configurations:
             provider_cls, _ = get_metric_provider(
                 metric_configuration.metric_name, self.execution_engine
             )
 
-            self._get_default_domain_kwargs(
-                metric_provider_cls=provider_cls,
-                metric_configuration=metric_configuration,
+            defaulted_metric_configuration = MetricConfiguration(
+                metric_name=metric_configuration.metric_name,
+                metric_domain_kwargs=self._get_default_domain_kwargs(
+                    metric_provider_cls=provider_cls,
+                    metric_configuration=metric_configuration,
+                ),
+                metric_value_kwargs=self._get_default_value_kwargs(
+                    metric_provider_cls=provider_cls,
+                    metric_configuration=metric_configuration,
+                ),
+                metric_dependencies=metric_configuration.metric_dependencies,
             )
-            self._get_default_value_kwargs(
-                metric_provider_cls=provider_cls,
-                metric_configuration=metric_configuration,
+            defaulted_metric_configurations.append(
+                (metric_configuration, defaulted_metric_configuration)
             )
 
             self.build_metric_dependency_graph(
                 graph=graph,
                 execution_engine=self._execution_engine,
-                metric_configuration=metric_configuration,
+                metric_configuration=defaulted_metric_configuration,
             )
 
+        # Batches, which the execution engine reads by column, are (re)read with the columns the metrics depend on.
+        self._project_batch_columns(graph=graph)
+
         resolved_metrics: Dict[Tuple[str, str, str], Any] = {}
 
         # updates graph with aborted metrics
@@ -849,6 +918,16 @@ class Validator:
                 f"Exceptions\n{str(aborted_metrics_info)}\noccurred while resolving metrics."
             )
 
+        # Requested metrics are also reported under their own ids (i.e., prior to filling in defaults).
+        for (
+            metric_configuration,
+            defaulted_metric_configuration,
+        ) in defaulted_metric_configurations:
+            if defaulted_metric_configuration.id in resolved_metrics:
+                resolved_metrics[metric_configuration.id] = resolved_metrics[
+                    defaulted_metric_configuration.id
+                ]
+
         return resolved_metrics
 
     def get_metrics(self, metrics: Dict[str, MetricConfiguration]) -> Dict[str, Any]:
@@ -869,29 +948,33 @@ class Validator:
     def _get_default_domain_kwargs(
         metric_provider_cls: "MetricProvider",  # noqa: F821
         metric_configuration: MetricConfiguration,
-    ) -> None:
+    ) -> IDDict:
+        metric_domain_kwargs: IDDict = IDDict(metric_configuration.metric_domain_kwargs)
         for key in metric_provider_cls.domain_keys:
             if (
-                key not in metric_configuration.metric_domain_kwargs
+                key not in metric_domain_kwargs
                 and key in metric_provider_cls.default_kwarg_values
             ):
-                metric_configuration.metric_domain_kwargs[
+                metric_domain_kwargs[key] = metric_provider_cls.default_kwarg_values[
                     key
-                ] = metric_provider_cls.default_kwarg_values[key]
+                ]
+
+        return metric_domain_kwargs
 
     @staticmethod
     def _get_default_value_kwargs(
         metric_provider_cls: "MetricProvider",  # noqa: F821
         metric_configuration: MetricConfiguration,
-    ) -> None:
+    ) -> IDDict:
+        metric_value_kwargs: IDDict = IDDict(metric_configuration.metric_value_kwargs)
         for key in metric_provider_cls.value_keys:
             if (
-                key not in metric_configuration.metric_value_kwargs
+                key not in metric_value_kwargs
                 and key in metric_provider_cls.default_kwarg_values
             ):
-                metric_configuration.metric_value_kwargs[
-                    key
-                ] = metric_provider_cls.default_kwarg_values[key]
+                metric_value_kwargs[key] = metric_provider_cls.default_kwarg_values[key]
+
+        return metric_value_kwargs
 
     def get_metric(self, metric: MetricConfiguration) -> Any:
         """return the value of the requested metric."""
@@ -931,17 +1014,34 @@ class Validator:
 
         expectation_validation_graphs: List[ExpectationValidationGraph] = []
 
+        # Batches, which the execution engine reads by column, only read the columns referenced by the suite: those of
+        # the expectation configurations, which some expectations need to build their metric dependencies, widened to
+        # those of the metric dependency graph, once it has been built.
+        self._project_batch_columns(configurations=configurations)
+
         processed_configurations: List[ExpectationConfiguration] = []
-        (
-            evrs,
-            processed_configurations,
-        ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
-            expectation_configurations=configurations,
-            expectation_validation_graphs=expectation_validation_graphs,
-            processed_configurations=processed_configurations,
-            catch_exceptions=catch_exceptions,
-            runtime_configuration=runtime_configuration,
-        )
+        if self._cache_validation_plans:
+            (
+                evrs,
+                processed_configurations,
+            ) = self._generate_metric_dependency_subgraphs_from_validation_plan(
+                expectation_configurations=configurations,
+                expectation_validation_graphs=expectation_validation_graphs,
+                processed_configurations=processed_configurations,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
+        else:
+            (
+                evrs,
+                processed_configurations,
+            ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                expectation_configurations=configurations,
+                expectation_validation_graphs=expectation_validation_graphs,
+                processed_configurations=processed_configurations,
+                catch_exceptions=catch_exceptions,
+                runtime_configuration=runtime_configuration,
+            )
 
         if metrics is None:
             metrics = {}
@@ -953,6 +1053,8 @@ class Validator:
         )
 
         try:
+            self._project_batch_columns(graph=graph)
+            self._plan_batch_metrics(graph=graph)
             (
                 evrs,
                 processed_configurations,
@@ -965,6 +1067,8 @@ class Validator:
                 processed_configurations=processed_configurations,
             )
         except Exception as err:
+            # Queries of the failed resolution are not attributed to any later validation.
+            self._execution_engine.pop_query_records()
             # If a general Exception occurs during the execution of "Validator.resolve_validation_graph()", then all
             # expectations in the suite are impacted, because it is impossible to attribute the failure to a metric.
             if catch_exceptions:
@@ -981,6 +1085,13 @@ class Validator:
 
         include_rendered_content: bool = self._include_rendered_content
 
+        query_records_by_configuration: Dict[
+            int, List[dict]
+        ] = self._get_query_records_by_configuration(
+            expectation_validation_graphs=expectation_validation_graphs,
+            query_records=self._execution_engine.pop_query_records(),
+        )
+
         configuration: ExpectationConfiguration
         result: ExpectationValidationResult
         for configuration in processed_configurations:
@@ -991,6 +1102,10 @@ class Validator:
                     runtime_configuration=runtime_configuration,
                     include_rendered_content=include_rendered_content,
                 )
+                if id(configuration) in query_records_by_configuration:
+                    result.meta["query_records"] = query_records_by_configuration[
+                        id(configuration)
+                    ]
                 evrs.append(result)
             except Exception as err:
                 if catch_exceptions:
@@ -1006,6 +1121,53 @@ class Validator:
 
         return evrs
 
+    @staticmethod
+    def _get_query_records_by_configuration(
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        query_records: List[dict],
+    ) -> Dict[int, List[dict]]:
+        """Returns the queries, which served any metric of the graph of each expectation configuration, keyed by the
+        id() of the configuration; a query serving the metrics of several expectations is returned for each of them."""
+        # Metric ids are compared in their JSON form (that of the query records).
+        json_metric_ids: Dict[Tuple[str, str, str], str] = {}
+        configuration_ids_by_metric_id: Dict[str, Set[int]] = {}
+        expectation_validation_graph: ExpectationValidationGraph
+        edge: MetricEdge
+        for expectation_validation_graph in expectation_validation_graphs:
+            configuration_id: int = id(expectation_validation_graph.configuration)
+            for edge in expectation_validation_graph.graph.edges:
+                for metric_configuration in (edge.left, edge.right):
+                    if metric_configuration is None:
+                        continue
+
+                    json_metric_id: Optional[str] = json_metric_ids.get(
+                        metric_configuration.id
+                    )
+                    if json_metric_id is None:
+                        json_metric_id = json.dumps(
+                            convert_to_json_serializable(metric_configuration.id)
+                        )
+                        json_metric_ids[metric_configuration.id] = json_metric_id
+
+                    configuration_ids_by_metric_id.setdefault(
+                        json_metric_id, set()
+                    ).add(configuration_id)
+
+        query_records_by_configuration: Dict[int, List[dict]] = {}
+        for query_record in query_records:
+            configuration_ids: Set[int] = set()
+            for metric_id in query_record["metric_ids"]:
+                configuration_ids.update(
+                    configuration_ids_by_metric_id.get(json.dumps(metric_id), ())
+                )
+
+            for configuration_id in configuration_ids:
+                query_records_by_configuration.setdefault(configuration_id, []).append(
+                    query_record
+                )
+
+        return query_records_by_configuration
+
     def _generate_metric_dependency_subgraphs_for_each_expectation_configuration(
         self,
         expectation_configurations: List[ExpectationConfiguration],
@@ -1080,6 +1242,138 @@ class Validator:
 
         return evrs, processed_configurations
 
+    def _generate_metric_dependency_subgraphs_from_validation_plan(
+        self,
+        expectation_configurations: List[ExpectationConfiguration],
+        expectation_validation_graphs: List[ExpectationValidationGraph],
+        processed_configurations: List[ExpectationConfiguration],
+        catch_exceptions: bool,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[List[ExpectationValidationResult], List[ExpectationConfiguration]]:
+        """Re-binds the compiled ValidationPlan for these expectation configurations to the active batch, compiling
+        (and caching) the plan first if necessary.  Expectations not covered by the plan are processed as usual."""
+        include_rendered_content: bool = self._include_rendered_content
+
+        key: str = ValidationPlan.build_key(
+            configurations=expectation_configurations,
+            runtime_configuration=runtime_configuration,
+            execution_engine_type=type(self._execution_engine).__name__,
+            column_schema=self._get_column_schema_for_validation_plan(),
+        )
+        validation_plan: Optional[ValidationPlan] = validation_plan_cache.get(key=key)
+        if validation_plan is None:
+            validation_plan = self._compile_validation_plan(
+                key=key,
+                expectation_configurations=expectation_configurations,
+                runtime_configuration=runtime_configuration,
+            )
+            validation_plan_cache.put(plan=validation_plan)
+
+        evrs: List[ExpectationValidationResult] = []
+        configuration_evrs: List[ExpectationValidationResult]
+        configuration: ExpectationConfiguration
+        graph: Optional[ValidationGraph]
+        evaluated_config: ExpectationConfiguration
+        for configuration, graph in zip(
+            expectation_configurations,
+            validation_plan.bind(batch_id=self.active_batch_id),
+        ):
+            if graph is None:
+                (
+                    configuration_evrs,
+                    processed_configurations,
+                ) = self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                    expectation_configurations=[configuration],
+                    expectation_validation_graphs=expectation_validation_graphs,
+                    processed_configurations=processed_configurations,
+                    catch_exceptions=catch_exceptions,
+                    runtime_configuration=runtime_configuration,
+                )
+                evrs.extend(configuration_evrs)
+                continue
+
+            evaluated_config = copy.deepcopy(configuration)
+            evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            if include_rendered_content:
+                evaluated_config._rendered_content = None
+
+            expectation_validation_graphs.append(
+                ExpectationValidationGraph(configuration=evaluated_config, graph=graph)
+            )
+            processed_configurations.append(evaluated_config)
+
+        return evrs, processed_configurations
+
+    def _compile_validation_plan(
+        self,
+        key: str,
+        expectation_configurations: List[ExpectationConfiguration],
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationPlan:
+        graphs: List[Optional[ValidationGraph]] = []
+        expectation_validation_graphs: List[ExpectationValidationGraph]
+        configuration: ExpectationConfiguration
+        for configuration in expectation_configurations:
+            # Expectations, whose metric dependencies are derived from the data, and configurations, for which graph
+            # construction fails, are left out of the plan (to be processed, including error handling, as usual).
+            expectation_validation_graphs = []
+            try:
+                if get_expectation_impl(
+                    configuration.expectation_type
+                ).validation_dependencies_depend_on_data:
+                    graphs.append(None)
+                    continue
+
+                self._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                    expectation_configurations=[configuration],
+                    expectation_validation_graphs=expectation_validation_graphs,
+                    processed_configurations=[],
+                    catch_exceptions=False,
+                    runtime_configuration=runtime_configuration,
+                )
+                graphs.append(expectation_validation_graphs[0].graph)
+            except Exception as e:
+                logger.debug(
+                    f"Expectation configuration {configuration} is excluded from the validation plan: {e}"
+                )
+                graphs.append(None)
+
+        return ValidationPlan(key=key, batch_id=self.active_batch_id, graphs=graphs)
+
+    def _get_column_schema_for_validation_plan(self) -> Optional[List[dict]]:
+        batch_data: Any = self._execution_engine.loaded_batch_data_dict.get(
+            self.active_batch_id
+        )
+        try:
+            return self._validation_plan_column_schemas[batch_data]
+        except (KeyError, TypeError):
+            # Batch data, which cannot be referenced weakly, is looked up every time.
+            pass
+
+        table_column_types_configuration = MetricConfiguration(
+            metric_name="table.column_types",
+            metric_domain_kwargs={"batch_id": self.active_batch_id},
+            metric_value_kwargs={"include_nested": True},
+        )
+        try:
+            column_types: List[dict] = self._execution_engine.resolve_metrics(
+                metrics_to_resolve=(table_column_types_configuration,)
+            )[table_column_types_configuration.id]
+        except Exception as e:
+            logger.debug(f"Column schema of the active batch is unavailable: {e}")
+            return None
+
+        column_schema: List[dict] = [
+            {"name": str(column_type["name"]), "type": str(column_type["type"])}
+            for column_type in column_types
+        ]
+        try:
+            self._validation_plan_column_schemas[batch_data] = column_schema
+        except TypeError:
+            pass
+
+        return column_schema
+
     @staticmethod
     def _generate_suite_level_graph_from_expectation_level_sub_graphs(
         expectation_validation_graphs: List[ExpectationValidationGraph],
@@ -1097,6 +1391,121 @@ class Validator:
         validation_graph: ValidationGraph = ValidationGraph(edges=edges)
         return validation_graph
 
+    def _project_batch_columns(
+        self,
+        configurations: Optional[List[ExpectationConfiguration]] = None,
+        graph: Optional[ValidationGraph] = None,
+    ) -> None:
+        """Informs the execution engine of the columns of each batch, which are referenced by the expectation
+        configurations or, once it has been built, on the values of which the metrics of the graph depend (all columns
+        of a batch, if any of its metrics may depend on any column)."""
+        domains: List[Tuple[dict, Optional[str]]] = []
+        configuration: ExpectationConfiguration
+        for configuration in configurations or []:
+            try:
+                domains.append((configuration.get_domain_kwargs(), None))
+            except GreatExpectationsError:
+                # Invalid configurations are reported, when their metric dependencies are built.
+                pass
+
+        if graph is not None:
+            edge: MetricEdge
+            for edge in graph.edges:
+                domains.extend(
+                    (
+                        metric_configuration.metric_domain_kwargs,
+                        metric_configuration.metric_name,
+                    )
+                    for metric_configuration in (edge.left, edge.right)
+                    if metric_configuration is not None
+                )
+
+        batch_columns: Dict[str, Optional[Set[str]]] = {}
+        domain_kwargs: dict
+        metric_name: Optional[str]
+        for domain_kwargs, metric_name in domains:
+            batch_id: Optional[str] = (
+                domain_kwargs.get("batch_id") or self.active_batch_id
+            )
+            if batch_id in batch_columns and batch_columns[batch_id] is None:
+                continue
+
+            columns: Optional[Set[str]] = self._get_domain_columns(
+                domain_kwargs=domain_kwargs, metric_name=metric_name
+            )
+            if columns is None:
+                batch_columns[batch_id] = None
+            else:
+                batch_columns.setdefault(batch_id, set()).update(columns)
+
+        for batch_id, columns in batch_columns.items():
+            self._execution_engine.project_batch_columns(
+                batch_id=batch_id, columns=columns
+            )
+
+    def _plan_batch_metrics(self, graph: ValidationGraph) -> None:
+        """Informs the execution engine of the metrics of the graph, by batch, and records the batch markers returned by
+        the execution engine (e.g., how it prepared the batch for the metrics) in the markers of the batch."""
+        batch_metrics: Dict[str, Dict[Tuple[str, str, str], MetricConfiguration]] = {}
+        edge: MetricEdge
+        for edge in graph.edges:
+            for metric_configuration in (edge.left, edge.right):
+                if metric_configuration is None:
+                    continue
+
+                batch_id: Optional[str] = (
+                    metric_configuration.metric_domain_kwargs.get("batch_id")
+                    or self.active_batch_id
+                )
+                batch_metrics.setdefault(batch_id, {})[
+                    metric_configuration.id
+                ] = metric_configuration
+
+        metric_configurations: Dict[Tuple[str, str, str], MetricConfiguration]
+        for batch_id, metric_configurations in batch_metrics.items():
+            batch_markers: Optional[dict] = self._execution_engine.plan_batch_metrics(
+                batch_id=batch_id,
+                metric_configurations=list(metric_configurations.values()),
+            )
+            batch: Optional[Batch] = self._batches.get(batch_id)
+            if batch_markers and batch is not None:
+                batch.batch_markers.update(batch_markers)
+
+    @staticmethod
+    def _get_domain_columns(
+        domain_kwargs: dict, metric_name: Optional[str] = None
+    ) -> Optional[Set[str]]:
+        """Returns the columns of the domain (including those of its row condition), or None, if the metric (if given)
+        may depend on the values of any column."""
+        columns: Set[str] = {
+            domain_kwargs[key]
+            for key in ("column", "column_A", "column_B")
+            if domain_kwargs.get(key) is not None
+        }
+        column_list: Any = domain_kwargs.get("column_list")
+        if isinstance(column_list, list):
+            columns.update(column_list)
+
+        if (
+            metric_name is not None
+            and not columns
+            and metric_name not in TABLE_METRICS_WITHOUT_COLUMN_VALUES
+        ):
+            return None
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if row_condition:
+            condition_columns: Optional[Set[str]] = get_row_condition_columns(
+                row_condition=row_condition,
+                condition_parser=domain_kwargs.get("condition_parser"),
+            )
+            if condition_columns is None:
+                return None
+
+            columns.update(condition_columns)
+
+        return columns
+
     def _resolve_suite_level_graph_and_process_metric_evaluation_errors(
         self,
         validation_graph: ValidationGraph,
@@ -1194,6 +1603,12 @@ class Validator:
         """Obtain domain and value keys for metrics and proceeds to add these metrics to the validation graph
         until all metrics have been added."""
 
+        # Identical metrics, required by several expectations (or by several metrics), share a single vertex object.
+        metric_configuration = MetricConfiguration.intern(
+            metric_configuration=metric_configuration,
+            interned_metric_configurations=self._interned_metric_configurations,
+        )
+
         metric_impl = get_metric_provider(
             metric_configuration.metric_name, execution_engine=execution_engine
         )[0]
@@ -1211,6 +1626,13 @@ class Validator:
                 )
             )
         else:
+            metric_dependencies = {
+                metric_name: MetricConfiguration.intern(
+                    metric_configuration=metric_dependency,
+                    interned_metric_configurations=self._interned_metric_configurations,
+                )
+                for metric_name, metric_dependency in metric_dependencies.items()
+            }
             metric_configuration.metric_dependencies = metric_dependencies
             for metric_dependency in metric_dependencies.values():
                 # TODO: <Alex>In the future, provide a more robust cycle detection mechanism.</Alex>
@@ -1260,33 +1682,33 @@ class Validator:
             Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
         ] = {}
 
+        # Dependency and reverse-dependency indexes are built once; metrics are released as their dependencies resolve.
+        scheduler: MetricDependencyScheduler = MetricDependencyScheduler(
+            graph=graph, metrics=metrics
+        )
+
         ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        computable_metrics: Set[MetricConfiguration]
+        resolved_metrics: Dict[Tuple[str, str, str], Any]
 
         exception_info: ExceptionInfo
 
-        progress_bar: Optional[tqdm] = None
-
-        done: bool = False
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(
-                validation_graph=graph, metrics=metrics
-            )
+        # Check to see if the user has disabled progress bars
+        disable = not self._show_progress_bars
+        if len(graph.edges) < min_graph_edges_pbar_enable:
+            disable = True
 
-            # Check to see if the user has disabled progress bars
-            disable = not self._show_progress_bars
-            if len(graph.edges) < min_graph_edges_pbar_enable:
-                disable = True
+        # noinspection PyProtectedMember,SpellCheckingInspection
+        progress_bar: tqdm = tqdm(
+            total=scheduler.num_unresolved_metrics,
+            desc="Calculating Metrics",
+            disable=disable,
+        )
+        progress_bar.update(0)
+        progress_bar.refresh()
 
-            if progress_bar is None:
-                # noinspection PyProtectedMember,SpellCheckingInspection
-                progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
-                    desc="Calculating Metrics",
-                    disable=disable,
-                )
-                progress_bar.update(0)
-                progress_bar.refresh()
+        while True:
+            ready_metrics = scheduler.ready_metrics
 
             computable_metrics = set()
 
@@ -1300,15 +1722,19 @@ class Validator:
                 else:
                     computable_metrics.add(metric)
 
+            # Resolution is complete once no metric can be released (remaining metrics, if any, depend on aborted ones).
+            if len(computable_metrics) == 0:
+                break
+
             try:
-                metrics.update(
-                    self._resolve_metrics(
-                        execution_engine=self._execution_engine,
-                        metrics_to_resolve=computable_metrics,
-                        metrics=metrics,
-                        runtime_configuration=runtime_configuration,
-                    )
+                resolved_metrics = self._resolve_metrics(
+                    execution_engine=self._execution_engine,
+                    metrics_to_resolve=computable_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
                 )
+                metrics.update(resolved_metrics)
+                scheduler.mark_resolved(metric_ids=resolved_metrics.keys())
                 progress_bar.update(len(computable_metrics))
                 progress_bar.refresh()
             except MetricResolutionError as err:
@@ -1343,15 +1769,10 @@ class Validator:
 aborting graph resolution.
 """
                     )
-                    done = True
+                    break
                 else:
                     raise e
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
-                len(ready_metrics) == len(aborted_metrics_info)
-            ):
-                done = True
-
         progress_bar.close()
 
         return aborted_metrics_info
@@ -1425,6 +1846,9 @@ aborting graph resolution.
             except AssertionError as e:
                 logger.warning(str(e))
             self._execution_engine.load_batch_data(batch.id, batch.data)
+            self._execution_engine.load_batch_fingerprint(
+                batch_id=batch.id, batch_markers=batch.batch_markers
+            )
             self._batches[batch.id] = batch
             # We set the active_batch_id in each iteration of the loop to keep in sync with the active_batch_id for the
             # execution_engine. The final active_batch_id will be that of the final batch loaded.
@@ -2197,23 +2621,10 @@ set as active.
     ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
         """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
         validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+        scheduler: MetricDependencyScheduler = MetricDependencyScheduler(
+            graph=validation_graph, metrics=metrics
+        )
+        return scheduler.ready_metrics, scheduler.needed_metrics
 
     @staticmethod
     def _resolve_metrics(
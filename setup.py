@@ -19,6 +19,7 @@ def get_extras_require():
         "athena",
         "bigquery",
         "dremio",
+        "duckdb",
         "mssql",
         "mysql",
         "postgresql",
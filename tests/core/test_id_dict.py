@@ -0,0 +1,61 @@
+import copy
+import pickle
+
+import pytest
+
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+
+
+def test_frozen_id_dict_id_matches_id_dict_id():
+    kwargs: dict = {"column": "a", "batch_id": "my_batch_id", "row_condition": None}
+
+    assert FrozenIDDict(kwargs).to_id() == IDDict(kwargs).to_id()
+    assert FrozenIDDict({"column": "a"}).to_id() == "column=a"
+    assert FrozenIDDict().to_id() == tuple()
+    assert FrozenIDDict(kwargs).to_id(id_ignore_keys=["batch_id"]) == IDDict(
+        kwargs
+    ).to_id(id_ignore_keys=["batch_id"])
+
+
+def test_frozen_id_dict_is_immutable_and_hashable():
+    frozen_id_dict = FrozenIDDict({"column": "a", "batch_id": "my_batch_id"})
+
+    with pytest.raises(TypeError):
+        frozen_id_dict["column"] = "b"
+
+    with pytest.raises(TypeError):
+        frozen_id_dict.update({"column": "b"})
+
+    with pytest.raises(TypeError):
+        frozen_id_dict.pop("column")
+
+    assert frozen_id_dict == {"column": "a", "batch_id": "my_batch_id"}
+    assert hash(frozen_id_dict) == hash(
+        FrozenIDDict({"batch_id": "my_batch_id", "column": "a"})
+    )
+
+
+def test_frozen_id_dict_copies_are_mutable():
+    frozen_id_dict = FrozenIDDict({"column": "a", "filter_conditions": []})
+
+    deep_copy = copy.deepcopy(frozen_id_dict)
+    deep_copy.pop("column")
+    deep_copy["filter_conditions"].append("a > 1")
+
+    assert type(deep_copy) == IDDict
+    assert frozen_id_dict == {"column": "a", "filter_conditions": []}
+
+    shallow_copy = copy.copy(frozen_id_dict)
+    shallow_copy["column"] = "b"
+
+    assert frozen_id_dict["column"] == "a"
+
+
+def test_frozen_id_dict_pickle_round_trip():
+    frozen_id_dict = FrozenIDDict({"column": "a", "batch_id": "my_batch_id"})
+
+    loaded: FrozenIDDict = pickle.loads(pickle.dumps(frozen_id_dict))
+
+    assert type(loaded) == FrozenIDDict
+    assert loaded == frozen_id_dict
+    assert loaded.to_id() == frozen_id_dict.to_id()
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.sketches import HyperLogLog, TDigest
+
+
+@pytest.mark.parametrize("num_distinct_values", [0, 1, 10, 1000, 100000])
+def test_hyperloglog_estimates_number_of_distinct_values(num_distinct_values):
+    values = pd.Series(np.arange(num_distinct_values)).repeat(3)
+
+    sketch = HyperLogLog.from_series(values=values)
+
+    # Small cardinalities are counted (almost) exactly; large ones within a few standard errors.
+    assert sketch.estimate() == pytest.approx(
+        num_distinct_values, rel=4 * sketch.relative_error, abs=1
+    )
+
+
+def test_hyperloglog_ignores_null_values():
+    sketch = HyperLogLog.from_series(values=pd.Series(["a", None, "b", np.nan, "a"]))
+
+    assert sketch.estimate() == 2
+
+
+def test_hyperloglog_sketches_of_parts_merge_into_sketch_of_whole():
+    values = pd.Series([f"value_{idx}" for idx in range(50000)])
+
+    merged_sketch = HyperLogLog.from_series(values=values[:30000]).merge(
+        HyperLogLog.from_series(values=values[20000:])
+    )
+
+    assert merged_sketch.estimate() == HyperLogLog.from_series(values=values).estimate()
+
+
+def test_hyperloglog_rejects_merging_sketches_of_different_precisions():
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=12).merge(HyperLogLog(precision=14))
+
+    with pytest.raises(ValueError):
+        HyperLogLog(precision=2)
+
+
+def test_tdigest_quantiles_are_exact_while_every_value_is_kept():
+    values = pd.Series([5.0, 1.0, None, 3.0, 2.0, 4.0])
+
+    sketch = TDigest.from_series(values=values)
+
+    assert sketch.is_exact
+    assert sketch.count == 5
+    assert sketch.quantile(q=0.0) == 1.0
+    assert sketch.quantile(q=0.5) == 3.0
+    assert sketch.quantile(q=1.0) == 5.0
+
+
+def test_tdigest_estimates_quantiles_in_bounded_memory():
+    values = pd.Series(np.random.default_rng(seed=7).normal(size=100000))
+
+    sketch = TDigest.from_series(values=values)
+
+    means, weights = sketch.centroids
+    assert not sketch.is_exact
+    assert len(means) <= sketch.compression
+    assert weights.sum() == len(values)
+    for q in (0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999):
+        # The rank of the estimate (the fraction of values not exceeding it) is close to the quantile.
+        assert (values <= sketch.quantile(q=q)).mean() == pytest.approx(q, abs=5e-4)
+
+
+def test_tdigest_sketches_of_parts_merge_into_sketch_of_whole():
+    values = pd.Series(np.random.default_rng(seed=11).exponential(size=50000))
+
+    merged_sketch = TDigest.from_series(values=values[:20000]).merge(
+        TDigest.from_series(values=values[20000:])
+    )
+
+    assert merged_sketch.count == len(values)
+    for q in (0.01, 0.5, 0.99):
+        assert (values <= merged_sketch.quantile(q=q)).mean() == pytest.approx(
+            q, abs=5e-4
+        )
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store import BatchMetricsStore
+
+
+@pytest.fixture(
+    params=[
+        {"class_name": "InMemoryStoreBackend"},
+        {"class_name": "TupleFilesystemStoreBackend"},
+    ]
+)
+def batch_metrics_store(request, tmp_path_factory):
+    store_backend: dict = dict(request.param)
+    if store_backend["class_name"] == "TupleFilesystemStoreBackend":
+        store_backend["base_directory"] = str(
+            tmp_path_factory.mktemp("batch_metrics_store")
+        )
+
+    return BatchMetricsStore(store_backend=store_backend)
+
+
+def test_batch_metrics_store_round_trip(batch_metrics_store):
+    quantiles_key = BatchMetricIdentifier(
+        batch_fingerprint="9a6bd4e8c2f0",
+        metric_name="column.quantile_values",
+        metric_kwargs_id="0c7bb6f1d3",
+    )
+    missing_value_key = BatchMetricIdentifier(
+        batch_fingerprint="9a6bd4e8c2f0",
+        metric_name="column.max",
+        metric_kwargs_id=None,
+    )
+
+    assert not batch_metrics_store.has_key(quantiles_key)
+
+    batch_metrics_store.set(quantiles_key, np.array([1.0, 2.5, 4.0]))
+    batch_metrics_store.set(missing_value_key, None)
+
+    assert batch_metrics_store.has_key(quantiles_key)
+    np.testing.assert_array_equal(
+        batch_metrics_store.get(quantiles_key), np.array([1.0, 2.5, 4.0])
+    )
+    assert batch_metrics_store.has_key(missing_value_key)
+    assert batch_metrics_store.get(missing_value_key) is None
+    assert {key.to_tuple() for key in batch_metrics_store.list_keys()} == {
+        ("9a6bd4e8c2f0", "column.quantile_values", "0c7bb6f1d3"),
+        ("9a6bd4e8c2f0", "column.max", "__"),
+    }
+
+
+def test_batch_metrics_store_only_stores_json_representable_values(
+    batch_metrics_store,
+):
+    key = BatchMetricIdentifier(
+        batch_fingerprint="9a6bd4e8c2f0",
+        metric_name="column.value_counts",
+        metric_kwargs_id="0c7bb6f1d3",
+    )
+    value = {
+        "max": np.float64(4.5),
+        "values": [np.int64(1), "a", None, float("nan")],
+        "flags": np.array([True, False]),
+    }
+    batch_metrics_store.set(key, value)
+
+    loaded = batch_metrics_store.get(key)
+    assert loaded["max"] == 4.5
+    assert loaded["values"][:3] == [1, "a", None]
+    assert np.isnan(loaded["values"][3])
+    np.testing.assert_array_equal(loaded["flags"], np.array([True, False]))
+    assert loaded["flags"].dtype == np.bool_
+
+    for unsupported_value in (
+        np.array([object()]),
+        {1: "a"},
+        ("a", "b"),
+        np.datetime64("2022-01-01"),
+    ):
+        with pytest.raises(TypeError):
+            batch_metrics_store.set(key, unsupported_value)
+
+    # Stored values are never unpickled.
+    with pytest.raises(ValueError):
+        batch_metrics_store.deserialize(
+            key, '{"value": {"__ndarray__": [1], "dtype": "O"}}'
+        )
+
+
+def test_batch_metric_identifier_tuple_round_trip():
+    batch_metric_identifier = BatchMetricIdentifier(
+        batch_fingerprint="9a6bd4e8c2f0",
+        metric_name="column.max",
+        metric_kwargs_id=None,
+    )
+
+    loaded: BatchMetricIdentifier = BatchMetricIdentifier.from_tuple(
+        batch_metric_identifier.to_tuple()
+    )
+    assert loaded.batch_fingerprint == "9a6bd4e8c2f0"
+    assert loaded.metric_name == "column.max"
+    assert loaded.metric_kwargs_id is None
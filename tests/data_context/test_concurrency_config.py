@@ -3,6 +3,7 @@ from great_expectations.data_context.types.base import (
     ConcurrencyConfig,
     DataContextConfig,
     InMemoryStoreBackendDefaults,
+    dataContextConfigSchema,
 )
 
 
@@ -29,3 +30,18 @@ def test_data_context_concurrency_property():
         )
     )
     assert data_context.concurrency.enabled
+
+
+def test_concurrency_max_metric_resolution_workers_defaults_to_sequential():
+    assert ConcurrencyConfig().max_metric_resolution_workers == 1
+
+
+def test_concurrency_max_metric_resolution_workers_with_dict():
+    data_context_config = DataContextConfig(
+        concurrency={"enabled": True, "max_metric_resolution_workers": 8}
+    )
+    assert data_context_config.concurrency.max_metric_resolution_workers == 8
+    assert dataContextConfigSchema.dump(data_context_config)["concurrency"] == {
+        "enabled": True,
+        "max_metric_resolution_workers": 8,
+    }
@@ -88,6 +88,7 @@ def dialect_name_to_sql_statement():
             GESqlDialect.REDSHIFT: "SELECT * FROM TEST_SCHEMA_NAME.TEST_TABLE WHERE TRUE LIMIT 10",
             GESqlDialect.AWSATHENA: 'SELECT * FROM "TEST_SCHEMA_NAME"."TEST_TABLE" WHERE TRUE LIMIT 10',
             GESqlDialect.DREMIO: 'SELECT * FROM "TEST_SCHEMA_NAME"."TEST_TABLE" WHERE 1 = 1 LIMIT 10',
+            GESqlDialect.DUCKDB: "SELECT * FROM TEST_SCHEMA_NAME.TEST_TABLE WHERE TRUE LIMIT 10",
             GESqlDialect.TERADATASQL: "SELECT TOP 10 * FROM TEST_SCHEMA_NAME.TEST_TABLE WHERE 1 = 1",
             GESqlDialect.TRINO: "SELECT * FROM TEST_SCHEMA_NAME.TEST_TABLE WHERE TRUE LIMIT 10",
             GESqlDialect.HIVE: "SELECT * FROM `TEST_SCHEMA_NAME`.`TEST_TABLE` WHERE TRUE LIMIT 10",
@@ -114,6 +115,8 @@ def test_sample_using_limit_builds_correct_query_where_clause_none(
     split_on_limit should build the appropriate query based on input parameters.
     This tests dialects that differ from the standard dialect, not each dialect exhaustively.
     """
+    if dialect_name == GESqlDialect.DUCKDB:
+        pytest.importorskip("duckdb_engine")
 
     # 1. Setup
     class MockSqlAlchemyExecutionEngine:
@@ -134,6 +137,7 @@ def test_sample_using_limit_builds_correct_query_where_clause_none(
             GESqlDialect.REDSHIFT: "redshift+psycopg2://",
             GESqlDialect.AWSATHENA: f"awsathena+rest://@athena.us-east-1.amazonaws.com/some_test_db?s3_staging_dir=s3://some-s3-path/",
             GESqlDialect.DREMIO: "dremio://",
+            GESqlDialect.DUCKDB: "duckdb:///:memory:",
             GESqlDialect.TERADATASQL: "teradatasql://",
             GESqlDialect.TRINO: "trino://",
             GESqlDialect.HIVE: "hive://",
@@ -0,0 +1,338 @@
+from typing import List
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine import (
+    DaskExecutionEngine,
+    PandasExecutionEngine,
+)
+from great_expectations.execution_engine.dask_batch_data import DaskBatchData
+from great_expectations.execution_engine.dask_execution_engine import (
+    _merge_reductions,
+    _reduce_partition,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.util import is_library_loadable
+from great_expectations.validator.validator import Validator
+
+requires_dask = pytest.mark.skipif(
+    not is_library_loadable(library_name="dask"),
+    reason="requires dask",
+)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    rng = np.random.default_rng(seed=0)
+    num_rows = 1000
+    df = pd.DataFrame(
+        {
+            "a": np.round(rng.normal(loc=10.0, scale=5.0, size=num_rows), 2),
+            "b": rng.choice(["x", "y", "z", None], size=num_rows),
+            "c": rng.integers(0, 100, size=num_rows),
+        }
+    )
+    df.loc[[3, 50, 700], "a"] = None
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _validate(
+    engine: PandasExecutionEngine,
+    batch_data: PandasBatchData,
+    expectation_configurations: List[ExpectationConfiguration],
+) -> List[dict]:
+    validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+    results = validator.graph_validate(configurations=expectation_configurations)
+    return [result.result for result in results]
+
+
+@requires_dask
+def test_dask_batch_metrics_match_in_memory_batch_metrics(csv_path):
+    import dask.dataframe as dd
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type=expectation_type,
+            kwargs={"min_value": 0, "max_value": 20, **kwargs},
+        )
+        for expectation_type, kwargs in [
+            ("expect_table_row_count_to_be_between", {}),
+            ("expect_column_mean_to_be_between", {"column": "a"}),
+            ("expect_column_stdev_to_be_between", {"column": "a"}),
+            ("expect_column_min_to_be_between", {"column": "c"}),
+            ("expect_column_sum_to_be_between", {"column": "c"}),
+            (
+                "expect_column_values_to_be_between",
+                {"column": "c", "min_value": 10, "max_value": 90},
+            ),
+        ]
+    ] + [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "result_format": "COMPLETE"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["a", "b", "c"]},
+        ),
+    ]
+
+    df = pd.read_csv(csv_path)
+    pandas_engine = PandasExecutionEngine()
+    expected_results = _validate(
+        engine=pandas_engine,
+        batch_data=pandas_engine.get_batch_data(
+            batch_spec=RuntimeDataBatchSpec(batch_data=df)
+        ),
+        expectation_configurations=expectation_configurations,
+    )
+
+    dask_engine = DaskExecutionEngine(scheduler="threads")
+    batch_data = dask_engine.get_batch_data(
+        # The partitions of a dask DataFrame built from a pandas DataFrame keep its index.
+        batch_spec=RuntimeDataBatchSpec(batch_data=dd.from_pandas(df, npartitions=7))
+    )
+    results = _validate(
+        engine=dask_engine,
+        batch_data=batch_data,
+        expectation_configurations=expectation_configurations,
+    )
+
+    # Every metric was computed one partition at a time.
+    assert isinstance(batch_data, DaskBatchData)
+    assert not batch_data.is_materialized
+    for result, expected_result in zip(results, expected_results):
+        if "observed_value" in expected_result:
+            assert result["observed_value"] == pytest.approx(
+                expected_result["observed_value"]
+            )
+        else:
+            assert result == expected_result
+
+
+@requires_dask
+def test_dask_batch_is_computed_for_metrics_not_computable_from_partitions(
+    csv_path,
+):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_median_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 20},
+        ),
+    ]
+
+    pandas_engine = PandasExecutionEngine()
+    expected_results = _validate(
+        engine=pandas_engine,
+        batch_data=pandas_engine.get_batch_data(
+            batch_spec=PathBatchSpec(path=csv_path, reader_method="read_csv")
+        ),
+        expectation_configurations=expectation_configurations,
+    )
+
+    dask_engine = DaskExecutionEngine()
+    batch_data = dask_engine.get_batch_data(
+        batch_spec=PathBatchSpec(
+            path=csv_path, reader_method="read_csv", reader_options={"blocksize": 4096}
+        )
+    )
+    results = _validate(
+        engine=dask_engine,
+        batch_data=batch_data,
+        expectation_configurations=expectation_configurations,
+    )
+
+    assert isinstance(batch_data, DaskBatchData)
+    assert batch_data.dask_dataframe.npartitions > 1
+    assert batch_data.is_materialized
+    assert results == expected_results
+
+
+@requires_dask
+def test_dask_batch_metrics_comparing_rows_and_index_lists_match_in_memory_batch_metrics(
+    csv_path,
+):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type=expectation_type,
+            kwargs={**kwargs, "result_format": "COMPLETE"},
+        )
+        for expectation_type, kwargs in [
+            ("expect_column_values_to_be_unique", {"column": "c"}),
+            ("expect_compound_columns_to_be_unique", {"column_list": ["b", "c"]}),
+            ("expect_column_values_to_be_increasing", {"column": "c"}),
+            ("expect_column_values_to_be_decreasing", {"column": "c"}),
+            (
+                "expect_column_values_to_be_between",
+                {"column": "c", "min_value": 10, "max_value": 90},
+            ),
+        ]
+    ]
+
+    pandas_engine = PandasExecutionEngine()
+    expected_results = _validate(
+        engine=pandas_engine,
+        batch_data=pandas_engine.get_batch_data(
+            batch_spec=PathBatchSpec(path=csv_path, reader_method="read_csv")
+        ),
+        expectation_configurations=expectation_configurations,
+    )
+
+    dask_engine = DaskExecutionEngine()
+    batch_data = dask_engine.get_batch_data(
+        # The index of each partition of a CSV file starts at 0.
+        batch_spec=PathBatchSpec(
+            path=csv_path, reader_method="read_csv", reader_options={"blocksize": 4096}
+        )
+    )
+    results = _validate(
+        engine=dask_engine,
+        batch_data=batch_data,
+        expectation_configurations=expectation_configurations,
+    )
+
+    assert isinstance(batch_data, DaskBatchData)
+    assert batch_data.dask_dataframe.npartitions > 1
+    assert not batch_data.has_global_index
+    assert batch_data.is_materialized
+    assert results == expected_results
+
+
+@requires_dask
+def test_pandas_runtime_data_is_partitioned(csv_path):
+    df = pd.read_csv(csv_path)
+
+    batch_data = DaskExecutionEngine().get_batch_data(
+        batch_spec=RuntimeDataBatchSpec(batch_data=df)
+    )
+    assert not isinstance(batch_data, DaskBatchData)
+
+    engine = DaskExecutionEngine(npartitions=4)
+    assert engine.config["npartitions"] == 4
+    batch_data = engine.get_batch_data(batch_spec=RuntimeDataBatchSpec(batch_data=df))
+    assert isinstance(batch_data, DaskBatchData)
+    assert [len(chunk) for chunk in batch_data.iter_chunks()] == [250] * 4
+    pd.testing.assert_frame_equal(batch_data.dataframe, df)
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        DaskExecutionEngine(npartitions=0)
+
+
+@requires_dask
+def test_unknown_reader_method_raises_error(csv_path):
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        DaskExecutionEngine().get_batch_data(
+            batch_spec=PathBatchSpec(path=csv_path, reader_method="read_excel")
+        )
+
+
+def test_partition_reductions_merge_into_whole_batch_metrics(csv_path):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_mean_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 20},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "result_format": "COMPLETE"},
+        ),
+    ]
+    engine = PandasExecutionEngine(chunk_size=97)
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=csv_path, reader_method="read_csv")
+    )
+
+    reduced_metrics = {}
+    reduce_chunked_metrics = engine._reduce_chunked_metrics
+
+    def _reduce_chunked_metrics(batch_id, reducers):
+        metrics = reduce_chunked_metrics(batch_id=batch_id, reducers=reducers)
+        # The chunks are reduced again as three "partitions", which are merged.
+        df = pd.read_csv(csv_path)
+        left, middle, right = (
+            _reduce_partition(
+                partition=partition,
+                batch_id=batch_id,
+                reducers=reducers,
+                approximate_metrics=False,
+            )
+            for partition in (df.iloc[:300], df.iloc[300:301], df.iloc[301:])
+        )
+        merged_reducers, schema = _merge_reductions(
+            left=left, right=_merge_reductions(left=middle, right=right)
+        )
+        schema_engine = PandasExecutionEngine(caching=False)
+        schema_engine.load_batch_data(batch_id=batch_id, batch_data=schema)
+        for reducer in merged_reducers:
+            reduced_metrics[reducer.metric_configuration.id] = reducer.finalize(
+                execution_engine=schema_engine
+            )
+        return metrics
+
+    engine._reduce_chunked_metrics = _reduce_chunked_metrics
+    _validate(
+        engine=engine,
+        batch_data=batch_data,
+        expectation_configurations=expectation_configurations,
+    )
+
+    assert reduced_metrics
+    for metric_id, value in reduced_metrics.items():
+        assert value == pytest.approx(engine.metric_cache[metric_id], nan_ok=True)
+
+
+def test_index_lists_are_computed_from_whole_batch_without_global_index(csv_path):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_between",
+            kwargs={
+                "column": "c",
+                "min_value": 10,
+                "max_value": 90,
+                "result_format": "COMPLETE",
+            },
+        ),
+    ]
+    pandas_engine = PandasExecutionEngine()
+    expected_results = _validate(
+        engine=pandas_engine,
+        batch_data=pandas_engine.get_batch_data(
+            batch_spec=PathBatchSpec(path=csv_path, reader_method="read_csv")
+        ),
+        expectation_configurations=expectation_configurations,
+    )
+
+    engine = PandasExecutionEngine(chunk_size=97)
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=csv_path, reader_method="read_csv")
+    )
+    with mock.patch.object(
+        ChunkedPandasBatchData,
+        "has_global_index",
+        new_callable=mock.PropertyMock,
+        return_value=False,
+    ):
+        results = _validate(
+            engine=engine,
+            batch_data=batch_data,
+            expectation_configurations=expectation_configurations,
+        )
+
+    assert batch_data.is_materialized
+    assert results == expected_results
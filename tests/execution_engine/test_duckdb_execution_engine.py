@@ -0,0 +1,136 @@
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.exceptions import ExecutionEngineError
+from great_expectations.execution_engine import DuckDBExecutionEngine
+from great_expectations.execution_engine.duckdb_execution_engine import _render_literal
+from great_expectations.expectations.core.expect_column_values_to_be_of_type import (
+    _get_dialect_type_module,
+)
+from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.util import is_library_loadable
+from great_expectations.validator.validator import Validator
+
+requires_duckdb = pytest.mark.skipif(
+    not is_library_loadable(library_name="duckdb_engine"),
+    reason="requires duckdb_engine",
+)
+
+
+@pytest.mark.parametrize(
+    "path,reader_method",
+    [
+        ("data/yellow_tripdata.csv", "read_csv_auto"),
+        ("data/yellow_tripdata.tsv.gz", "read_csv_auto"),
+        ("data/yellow_tripdata.parquet", "read_parquet"),
+        ("data/yellow_tripdata.jsonl", "read_json_auto"),
+    ],
+)
+def test_guess_reader_method_from_path(path, reader_method):
+    assert DuckDBExecutionEngine.guess_reader_method_from_path(path) == reader_method
+
+
+def test_guess_reader_method_from_path_raises_error_on_unknown_extension():
+    with pytest.raises(ExecutionEngineError):
+        DuckDBExecutionEngine.guess_reader_method_from_path("data/report.xlsx")
+
+
+def test_render_literal():
+    assert _render_literal(value="it's.csv") == "'it''s.csv'"
+    assert _render_literal(value=True) == "true"
+    assert _render_literal(value=3) == "3"
+    assert _render_literal(value=None) == "NULL"
+    assert _render_literal(value=["a", 1]) == "['a', 1]"
+    assert _render_literal(value={"a": "INTEGER"}) == "{'a': 'INTEGER'}"
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, None],
+            "b": ["cat", "dog", "fish", "giraffe", "lion"],
+        }
+    ).to_csv(path, index=False)
+    return path
+
+
+@requires_duckdb
+def test_path_batch_spec_is_validated_in_place(csv_path):
+    engine = DuckDBExecutionEngine()
+    batch_data, batch_markers = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=str(csv_path))
+    )
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    validator = Validator(execution_engine=engine)
+
+    assert validator.expect_column_values_to_be_between(
+        column="a", min_value=1, max_value=4
+    ).success
+    assert not validator.expect_column_values_to_match_regex(
+        column="b", regex="^[a-f]"
+    ).success
+    assert validator.expect_column_values_to_match_regex(
+        column="b", regex="i", result_format="COMPLETE"
+    ).result["unexpected_list"] == ["cat", "dog"]
+
+
+@requires_duckdb
+def test_dialect_module_is_duckdb_engine(csv_path):
+    import duckdb_engine
+
+    engine = DuckDBExecutionEngine()
+    assert engine.dialect_module is duckdb_engine
+    assert _get_dialect_type_module(execution_engine=engine) is sa.dialects.postgresql
+    regex_expression = get_dialect_regex_expression(
+        column=sa.column("b"), regex="^[a-f]", dialect=engine.dialect_module
+    )
+    assert "regexp_matches" in str(regex_expression)
+
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=str(csv_path))
+    )
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    validator = Validator(execution_engine=engine)
+
+    assert validator.expect_column_values_to_be_in_type_list(
+        column="a", type_list=["DOUBLE_PRECISION", "FLOAT"]
+    ).success
+    assert not validator.expect_column_values_to_be_in_type_list(
+        column="b", type_list=["DOUBLE_PRECISION", "FLOAT"]
+    ).success
+    assert validator.expect_column_values_to_match_regex(
+        column="b", regex="^[c-g]", mostly=0.6
+    ).success
+
+
+@requires_duckdb
+def test_path_batch_spec_with_reader_options_and_sampling(csv_path):
+    engine = DuckDBExecutionEngine(create_temp_table=True, threads=2)
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(
+            path=str(csv_path),
+            reader_method="read_csv",
+            reader_options={"header": True, "columns": {"a": "DOUBLE", "b": "TEXT"}},
+            sampling_method="_sample_using_limit",
+            sampling_kwargs={"n": 3},
+        )
+    )
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+    assert (
+        Validator(execution_engine=engine)
+        .expect_table_row_count_to_equal(value=3)
+        .success
+    )
+
+
+def test_unsupported_reader_method_raises_error(csv_path):
+    engine = DuckDBExecutionEngine.__new__(DuckDBExecutionEngine)
+    with pytest.raises(ExecutionEngineError):
+        engine._create_file_view(
+            batch_spec=PathBatchSpec(path=str(csv_path), reader_method="read_excel")
+        )
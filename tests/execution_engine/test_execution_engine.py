@@ -5,6 +5,8 @@ import pytest
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchMarkers
+from great_expectations.core.metric import BatchMetricIdentifier
+from great_expectations.data_context.store import BatchMetricsStore
 from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
 from great_expectations.execution_engine.execution_engine import BatchData
 from great_expectations.expectations.row_conditions import (
@@ -321,3 +323,109 @@ def test_resolve_metrics_with_incomplete_metric_input():
     # Ensuring that incomplete metrics given raises a GreatExpectationsError
     with pytest.raises(ge_exceptions.GreatExpectationsError) as error:
         engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics={})
+
+
+def test_resolve_metrics_serves_batch_metrics_from_metric_cache():
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": pd.DataFrame({"a": [1, 2, 3, None]})}
+    )
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": "my_id"},
+        metric_dependencies={"table.columns": table_columns_metric},
+    )
+    resolved_metrics: dict = engine.resolve_metrics(
+        metrics_to_resolve=(column_max,), metrics=results
+    )
+    assert resolved_metrics[column_max.id] == 3
+    assert engine.metric_cache_statistics.hits == 0
+
+    resolved_metrics = engine.resolve_metrics(
+        metrics_to_resolve=(column_max,), metrics=results
+    )
+    assert resolved_metrics[column_max.id] == 3
+    assert engine.metric_cache_statistics.hits == 1
+
+    # Reloading the batch invalidates the metrics cached for it.
+    engine.load_batch_data(batch_id="my_id", batch_data=pd.DataFrame({"a": [7, 8]}))
+    assert column_max.id not in engine.metric_cache
+
+    resolved_metrics = engine.resolve_metrics(
+        metrics_to_resolve=(column_max,), metrics=results
+    )
+    assert resolved_metrics[column_max.id] == 8
+
+    engine.unload_batch_data(batch_id="my_id")
+    assert "my_id" not in engine.loaded_batch_data_ids
+    assert column_max.id not in engine.metric_cache
+
+
+def test_metric_cache_is_configurable_and_disabled_without_caching():
+    engine = PandasExecutionEngine(metric_cache={"max_entries": 2})
+    assert engine.metric_cache.max_entries == 2
+    assert engine.config["metric_cache"] == {"max_entries": 2}
+
+    engine = PandasExecutionEngine(caching=False)
+    assert engine.metric_cache is None
+    assert engine.metric_cache_statistics is None
+
+
+def test_resolve_metrics_reuses_metrics_persisted_in_batch_metrics_store():
+    batch_metrics_store = BatchMetricsStore()
+
+    def _resolve_column_max(batch_id: str, df: pd.DataFrame) -> Tuple[str, int]:
+        # Every run uses a new engine (and thus a new metric cache), but shares the same Batch Metrics Store.
+        engine = PandasExecutionEngine(caching=False)
+        engine.batch_metrics_store = batch_metrics_store
+        engine.load_batch_data(batch_id=batch_id, batch_data=df)
+
+        table_columns_metric: MetricConfiguration
+        results: dict
+        table_columns_metric, results = get_table_columns_metric(engine=engine)
+
+        column_max = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"column": "a", "batch_id": batch_id},
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        resolved_metrics: dict = engine.resolve_metrics(
+            metrics_to_resolve=(column_max,), metrics=results
+        )
+        return (
+            engine.get_batch_fingerprint(batch_id=batch_id),
+            resolved_metrics[column_max.id],
+        )
+
+    batch_fingerprint, value = _resolve_column_max(
+        batch_id="run_0", df=pd.DataFrame({"a": [1, 2, 3]})
+    )
+    assert value == 3
+    assert len(batch_metrics_store.list_keys()) == 1
+
+    batch_metric_identifier: BatchMetricIdentifier = batch_metrics_store.list_keys()[0]
+    assert batch_metric_identifier.batch_fingerprint == batch_fingerprint
+    assert batch_metric_identifier.metric_name == "column.max"
+
+    # Replace the persisted value, in order to verify that the metric is not computed again for the same data.
+    batch_metrics_store.set(batch_metric_identifier, 42)
+    assert (
+        _resolve_column_max(batch_id="run_1", df=pd.DataFrame({"a": [1, 2, 3]}))[1]
+        == 42
+    )
+
+    # Different data (or the same values under a different column type) has a different fingerprint.
+    assert (
+        _resolve_column_max(batch_id="run_2", df=pd.DataFrame({"a": [1, 2, 4]}))[1] == 4
+    )
+    assert (
+        _resolve_column_max(batch_id="run_3", df=pd.DataFrame({"a": [1.0, 2.0, 3.0]}))[
+            1
+        ]
+        == 3.0
+    )
+    assert len(batch_metrics_store.list_keys()) == 3
@@ -0,0 +1,105 @@
+import sys
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    DEFAULT_METRIC_CACHE_MAX_BYTES,
+    DEFAULT_METRIC_CACHE_MAX_ENTRIES,
+    MetricCache,
+    MetricCacheStatistics,
+)
+
+
+def test_metric_cache_counts_hits_and_misses():
+    metric_cache = MetricCache()
+    metric_cache["a"] = 1
+
+    assert metric_cache["a"] == 1
+    assert metric_cache.get("b") is None
+    with pytest.raises(KeyError):
+        _ = metric_cache["c"]
+
+    assert "a" in metric_cache
+    assert metric_cache.statistics == MetricCacheStatistics(
+        hits=1, misses=2, evictions=0, entries=1, size_in_bytes=sys.getsizeof(1)
+    )
+
+
+def test_metric_cache_evicts_least_recently_used_entries():
+    metric_cache = MetricCache(max_entries=2)
+    metric_cache["a"] = 1
+    metric_cache["b"] = 2
+    assert metric_cache["a"] == 1
+
+    metric_cache["c"] = 3
+
+    assert "a" in metric_cache
+    assert "b" not in metric_cache
+    assert "c" in metric_cache
+    assert metric_cache.statistics.evictions == 1
+
+
+def test_metric_cache_evicts_entries_over_byte_budget():
+    series = pd.Series(range(1000))
+    metric_cache = MetricCache(max_bytes=int(series.memory_usage(deep=True) * 1.5))
+
+    metric_cache["a"] = series
+    assert metric_cache.statistics.size_in_bytes == series.memory_usage(deep=True)
+
+    metric_cache["b"] = series.copy()
+
+    assert "a" not in metric_cache
+    assert "b" in metric_cache
+    assert metric_cache.statistics.evictions == 1
+    assert metric_cache.statistics.size_in_bytes <= metric_cache.max_bytes
+
+
+def test_metric_cache_invalidates_entries_of_batch():
+    metric_cache = MetricCache()
+    metric_cache.update(
+        values={"a": 1, "b": 2, "c": 3},
+        batch_ids={"a": "batch_0", "b": "batch_1", "c": "batch_0"},
+    )
+
+    assert metric_cache.invalidate_batch(batch_id="batch_0") == 2
+    assert len(metric_cache) == 1
+    assert "b" in metric_cache
+    assert metric_cache.invalidate_batch(batch_id="batch_0") == 0
+
+
+def test_metric_cache_does_not_cache_values_over_byte_budget():
+    series = pd.Series(range(1000))
+    metric_cache = MetricCache(max_bytes=int(series.memory_usage(deep=True) * 1.5))
+    metric_cache["a"] = series
+
+    metric_cache["b"] = pd.Series(range(2000))
+
+    assert "a" in metric_cache
+    assert "b" not in metric_cache
+    assert metric_cache.statistics.evictions == 0
+
+
+def test_default_metric_cache_is_bounded():
+    metric_cache = PandasExecutionEngine()._metric_cache
+    assert isinstance(metric_cache, MetricCache)
+    assert metric_cache.max_entries == DEFAULT_METRIC_CACHE_MAX_ENTRIES
+    assert metric_cache.max_bytes == DEFAULT_METRIC_CACHE_MAX_BYTES
+
+    metric_cache.update(
+        values={key: key for key in range(DEFAULT_METRIC_CACHE_MAX_ENTRIES + 10)}
+    )
+
+    assert len(metric_cache) == DEFAULT_METRIC_CACHE_MAX_ENTRIES
+    assert 0 not in metric_cache
+    assert metric_cache.statistics.evictions == 10
+
+
+def test_metric_cache_bounds_can_be_disabled():
+    metric_cache = MetricCache(max_entries=None, max_bytes=None)
+    metric_cache.update(values={key: key for key in range(10)})
+
+    assert metric_cache.statistics == MetricCacheStatistics(
+        hits=0, misses=0, evictions=0, entries=10, size_in_bytes=0
+    )
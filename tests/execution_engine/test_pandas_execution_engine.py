@@ -1,6 +1,8 @@
 import os
+from typing import List, Tuple
 from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -12,14 +14,28 @@ except:
 
 
 import great_expectations.exceptions as ge_exceptions
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+    ProjectedPandasBatchData,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    fingerprint_pandas_dataframe,
+    hash_pandas_dataframe,
     storage,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 
 
@@ -236,6 +252,70 @@ def test_get_domain_records_with_multicolumn_domain():
     ), "Data does not match after getting full access compute domain"
 
 
+def test_get_domain_records_reuses_filtered_domain_records():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4, None, 5],
+            "b": [2, 3, 4, 5, 6, 7],
+            "c": [1, 2, 3, 4, None, 6],
+        }
+    )
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    domain_kwargs: dict = {
+        "column": "a",
+        "row_condition": "b>2",
+        "condition_parser": "pandas",
+    }
+    data: pd.DataFrame = engine.get_domain_records(domain_kwargs=domain_kwargs)
+    assert engine.get_domain_records(domain_kwargs=domain_kwargs) is data
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={
+                "column": "c",
+                "row_condition": "b>2",
+                "condition_parser": "pandas",
+                "batch_id": "1234",
+            }
+        )
+        is data
+    )
+    assert (
+        engine.get_domain_records(
+            domain_kwargs={
+                "column": "a",
+                "row_condition": "b>3",
+                "condition_parser": "pandas",
+            }
+        )
+        is not data
+    )
+
+    multicolumn_domain_kwargs: dict = {
+        "column_list": ["a", "c"],
+        "row_condition": "b>2",
+        "condition_parser": "pandas",
+        "ignore_row_if": "any_value_is_missing",
+    }
+    data = engine.get_domain_records(domain_kwargs=multicolumn_domain_kwargs)
+    assert data.index.tolist() == [1, 2, 3, 5]
+    assert engine.get_domain_records(domain_kwargs=multicolumn_domain_kwargs) is data
+
+    # Reloading the batch invalidates the domain records filtered from its data.
+    engine.load_batch_data(batch_data=df.iloc[:3], batch_id="1234")
+    assert engine.get_domain_records(
+        domain_kwargs=multicolumn_domain_kwargs
+    ).index.tolist() == [1, 2]
+
+    engine = PandasExecutionEngine(domain_records_cache_max_bytes=0)
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+    assert engine.domain_records_cache is None
+    assert engine.get_domain_records(
+        domain_kwargs=domain_kwargs
+    ) is not engine.get_domain_records(domain_kwargs=domain_kwargs)
+
+
 def test_get_compute_domain_with_no_domain_kwargs():
     engine = PandasExecutionEngine()
     df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
@@ -639,3 +719,405 @@ def test_get_batch_with_gcs_misconfigured(gcs_batch_spec):
     # Raises error if batch_spec causes ExecutionEngine error
     with pytest.raises(ge_exceptions.ExecutionEngineError):
         execution_engine_no_gcs.get_batch_data(batch_spec=gcs_batch_spec)
+
+
+def test_fingerprint_pandas_dataframe_is_independent_of_chunking_and_workers():
+    df = pd.DataFrame(
+        {
+            "a": range(1000),
+            "b": [f"value_{idx % 7}" for idx in range(1000)],
+            "c": [{"key": idx % 3} for idx in range(1000)],
+        }
+    )
+    fingerprint: str = fingerprint_pandas_dataframe(df=df)
+
+    assert fingerprint_pandas_dataframe(df=df, chunk_size=64) == fingerprint
+    assert fingerprint_pandas_dataframe(df=df, chunk_size=64, max_workers=4) == (
+        fingerprint
+    )
+    assert fingerprint_pandas_dataframe(df=df.copy()) == fingerprint
+
+    changed_df: pd.DataFrame = df.copy()
+    changed_df.loc[999, "a"] = -1
+    assert fingerprint_pandas_dataframe(df=changed_df, chunk_size=64) != fingerprint
+    assert fingerprint_pandas_dataframe(df=df.rename(columns={"a": "d"})) != (
+        fingerprint
+    )
+
+    # Sampling only hashes evenly spaced rows (including the first and the last ones).
+    sampled_fingerprint: str = fingerprint_pandas_dataframe(df=df, sample_size=10)
+    assert sampled_fingerprint != fingerprint
+    changed_df = df.copy()
+    changed_df.loc[500, "a"] = -1
+    assert (
+        fingerprint_pandas_dataframe(df=changed_df, sample_size=10)
+        == sampled_fingerprint
+    )
+
+
+def test_get_batch_data_and_markers_fingerprints_large_dataframes(monkeypatch):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    batch_spec = RuntimeDataBatchSpec(batch_data=df)
+
+    markers = PandasExecutionEngine().get_batch_data_and_markers(batch_spec=batch_spec)[
+        1
+    ]
+    assert markers["pandas_data_fingerprint"] == hash_pandas_dataframe(df)
+
+    # DataFrames at or above the threshold are fingerprinted in chunks, rather than skipped.
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.pandas_execution_engine.HASH_THRESHOLD",
+        0,
+    )
+    markers = PandasExecutionEngine(
+        fingerprint_options={"chunk_size": 2}
+    ).get_batch_data_and_markers(batch_spec=RuntimeDataBatchSpec(batch_data=df))[1]
+    assert markers["pandas_data_fingerprint"] == fingerprint_pandas_dataframe(df=df)
+
+    markers = PandasExecutionEngine(
+        fingerprint_options={"mode": "sampled", "sample_size": 2}
+    ).get_batch_data_and_markers(batch_spec=RuntimeDataBatchSpec(batch_data=df))[1]
+    assert markers["pandas_data_fingerprint"] == fingerprint_pandas_dataframe(
+        df=df, sample_size=2
+    )
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        PandasExecutionEngine(fingerprint_options={"mode": "approximate"})
+
+
+@pytest.fixture
+def chunked_csv_path(tmp_path):
+    rng = np.random.default_rng(seed=0)
+    num_rows = 1000
+    df = pd.DataFrame(
+        {
+            "a": np.round(rng.normal(loc=10.0, scale=5.0, size=num_rows), 2),
+            "b": rng.choice(["x", "y", "z", None], size=num_rows),
+            "c": rng.integers(0, 100, size=num_rows),
+        }
+    )
+    df.loc[[3, 50, 700], "a"] = None
+    path = str(tmp_path / "chunked.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _validate_csv(
+    engine: PandasExecutionEngine,
+    path: str,
+    expectation_configurations: List[ExpectationConfiguration],
+) -> Tuple[PandasBatchData, List[dict]]:
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=path, reader_method="read_csv")
+    )
+    validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+    results = validator.graph_validate(configurations=expectation_configurations)
+    return batch_data, [result.result for result in results]
+
+
+def test_chunked_batch_metrics_match_in_memory_batch_metrics(chunked_csv_path):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type=expectation_type,
+            kwargs={"min_value": 0, "max_value": 20, **kwargs},
+        )
+        for expectation_type, kwargs in [
+            ("expect_table_row_count_to_be_between", {}),
+            ("expect_column_mean_to_be_between", {"column": "a"}),
+            ("expect_column_stdev_to_be_between", {"column": "a"}),
+            ("expect_column_min_to_be_between", {"column": "c"}),
+            ("expect_column_max_to_be_between", {"column": "a"}),
+            ("expect_column_sum_to_be_between", {"column": "c"}),
+            (
+                "expect_column_values_to_be_between",
+                {
+                    "column": "c",
+                    "min_value": 10,
+                    "max_value": 90,
+                    "row_condition": 'b=="x"',
+                    "condition_parser": "pandas",
+                    "result_format": "COMPLETE",
+                },
+            ),
+        ]
+    ] + [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_not_be_null",
+            kwargs={"column": "a", "result_format": "COMPLETE"},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x", "y"]},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={"column": "a", "threshold": 2, "double_sided": True},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["a", "b", "c"]},
+        ),
+    ]
+
+    _, expected_results = _validate_csv(
+        engine=PandasExecutionEngine(),
+        path=chunked_csv_path,
+        expectation_configurations=expectation_configurations,
+    )
+    batch_data, results = _validate_csv(
+        engine=PandasExecutionEngine(chunk_size=97),
+        path=chunked_csv_path,
+        expectation_configurations=expectation_configurations,
+    )
+
+    # Every metric was computed one chunk at a time.
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    assert not batch_data.is_materialized
+    for result, expected_result in zip(results, expected_results):
+        if "observed_value" in expected_result:
+            assert result["observed_value"] == pytest.approx(
+                expected_result["observed_value"]
+            )
+        else:
+            assert result == expected_result
+
+
+def test_chunked_batch_is_materialized_for_metrics_not_computable_from_chunks(
+    chunked_csv_path,
+):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_median_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 20},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={"column": "b", "value_set": ["x"], "result_format": "COMPLETE"},
+        ),
+    ]
+
+    _, expected_results = _validate_csv(
+        engine=PandasExecutionEngine(),
+        path=chunked_csv_path,
+        expectation_configurations=expectation_configurations,
+    )
+    batch_data, results = _validate_csv(
+        engine=PandasExecutionEngine(chunk_size=97),
+        path=chunked_csv_path,
+        expectation_configurations=expectation_configurations,
+    )
+
+    assert batch_data.is_materialized
+    assert results == expected_results
+
+
+def test_conditions_comparing_rows_are_not_computed_one_chunk_at_a_time(tmp_path):
+    path = str(tmp_path / "rows.csv")
+    pd.DataFrame({"a": [1, 2, 3, 1, 5, 0], "b": [1, 2, 3, 1, 6, 0]}).to_csv(
+        path, index=False
+    )
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type=expectation_type,
+            kwargs={"result_format": "COMPLETE", **kwargs},
+        )
+        for expectation_type, kwargs in [
+            ("expect_column_values_to_be_unique", {"column": "a"}),
+            ("expect_compound_columns_to_be_unique", {"column_list": ["a", "b"]}),
+            ("expect_column_values_to_be_increasing", {"column": "a"}),
+            ("expect_column_values_to_be_decreasing", {"column": "a"}),
+            ("expect_column_values_to_be_in_set", {"column": "a", "value_set": [1]}),
+        ]
+    ]
+
+    _, expected_results = _validate_csv(
+        engine=PandasExecutionEngine(),
+        path=path,
+        expectation_configurations=expectation_configurations,
+    )
+    batch_data, results = _validate_csv(
+        engine=PandasExecutionEngine(chunk_size=3),
+        path=path,
+        expectation_configurations=expectation_configurations,
+    )
+
+    assert [result["unexpected_count"] for result in expected_results] == [
+        2,
+        2,
+        2,
+        3,
+        4,
+    ]
+    assert batch_data.is_materialized
+    assert results == expected_results
+
+
+def test_chunked_batch_data_is_only_read_for_chunked_reader_methods(
+    chunked_csv_path, tmp_path
+):
+    engine = PandasExecutionEngine(chunk_size=100)
+    assert engine.config["chunk_size"] == 100
+
+    df = pd.read_csv(chunked_csv_path)
+    json_path = str(tmp_path / "chunked.json")
+    df.to_json(json_path)
+    # JSON files cannot be read in chunks.
+    assert (
+        type(engine.get_batch_data(batch_spec=PathBatchSpec(path=json_path)))
+        is PandasBatchData
+    )
+
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=chunked_csv_path, reader_method="read_csv")
+    )
+    chunks = list(batch_data.iter_chunks())
+    assert [len(chunk) for chunk in chunks] == [100] * 10
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        PandasExecutionEngine(chunk_size=0)
+
+
+def test_chunked_parquet_batch_data_has_continuous_index(tmp_path):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"a": range(10), "b": [str(value) for value in range(10)]})
+    path = str(tmp_path / "chunked.parquet")
+    df.to_parquet(path)
+
+    batch_data = PandasExecutionEngine(chunk_size=3).get_batch_data(
+        batch_spec=PathBatchSpec(path=path, reader_method="read_parquet")
+    )
+
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    pd.testing.assert_frame_equal(pd.concat(list(batch_data.iter_chunks())), df)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 97])
+def test_projected_batch_only_reads_referenced_columns(chunked_csv_path, chunk_size):
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 20},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_of_type",
+            kwargs={
+                "column": "a",
+                "type_": "float64",
+                "row_condition": "c > 50",
+                "condition_parser": "pandas",
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_equal",
+            kwargs={"value": 1000},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_table_columns_to_match_ordered_list",
+            kwargs={"column_list": ["a", "b", "c"]},
+        ),
+    ]
+
+    _, expected_results = _validate_csv(
+        engine=PandasExecutionEngine(),
+        path=chunked_csv_path,
+        expectation_configurations=expectation_configurations,
+    )
+    engine = PandasExecutionEngine(column_projection=True, chunk_size=chunk_size)
+    assert engine.config["column_projection"] is True
+    batch_data, results = _validate_csv(
+        engine=engine,
+        path=chunked_csv_path,
+        expectation_configurations=expectation_configurations,
+    )
+
+    assert isinstance(batch_data, ProjectedPandasBatchData)
+    assert batch_data.projected_columns == ["a", "c"]
+    assert results == expected_results
+    # The schema metrics cover all columns of the file, including those not read.
+    table_column_types = engine.resolve_metrics(
+        metrics_to_resolve=[MetricConfiguration("table.column_types", {}, {})]
+    )[("table.column_types", tuple(), tuple())]
+    assert [column["name"] for column in table_column_types] == ["a", "b", "c"]
+    if chunk_size is None:
+        assert list(batch_data.dataframe.columns) == ["a", "c"]
+    else:
+        assert not batch_data.is_materialized
+        assert all(
+            list(chunk.columns) == ["a", "c"] for chunk in batch_data.iter_chunks()
+        )
+
+
+def test_projected_batch_is_read_again_for_other_columns(chunked_csv_path):
+    engine = PandasExecutionEngine(column_projection=True)
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=chunked_csv_path, reader_method="read_csv")
+    )
+    validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+
+    validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "c"},
+            )
+        ]
+    )
+    assert list(batch_data.dataframe.columns) == ["c"]
+
+    results = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a", "mostly": 0.99},
+            )
+        ]
+    )
+    assert results[0].success
+    assert list(batch_data.dataframe.columns) == ["a"]
+
+    # The columns of row conditions referring to local variables cannot be determined.
+    validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={
+                    "column": "c",
+                    "row_condition": "a > @threshold",
+                    "condition_parser": "pandas",
+                },
+            )
+        ]
+    )
+    assert batch_data.projected_columns is None
+    assert list(batch_data.dataframe.columns) == ["a", "b", "c"]
+
+
+def test_projected_batch_is_read_again_for_metrics_of_other_columns(
+    chunked_csv_path,
+):
+    engine = PandasExecutionEngine(column_projection=True)
+    batch_data = engine.get_batch_data(
+        batch_spec=PathBatchSpec(path=chunked_csv_path, reader_method="read_csv")
+    )
+    validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+    expected_df = pd.read_csv(chunked_csv_path)
+
+    validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": "a"},
+            )
+        ]
+    )
+    assert list(batch_data.dataframe.columns) == ["a"]
+
+    assert (
+        validator.get_metric(MetricConfiguration("column.max", {"column": "c"}))
+        == expected_df["c"].max()
+    )
+    assert list(batch_data.dataframe.columns) == ["a", "c"]
+
+    pd.testing.assert_frame_equal(validator.head(), expected_df.head())
+    assert batch_data.projected_columns is None
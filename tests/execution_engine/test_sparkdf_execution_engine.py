@@ -1107,3 +1107,122 @@ def test_dataframe_property_given_loaded_batch(spark_session):
 
     # Ensuring Data not distorted
     assert engine.dataframe == df
+
+
+def test_batch_dataframes_are_persisted_while_loaded(
+    spark_session, spark_df_from_pandas_df
+):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame({"a": [1, 2, 3]}),
+        batch_id="1234",
+    )
+    df = engine.dataframe
+    assert df.is_cached
+
+    engine.unload_batch_data(batch_id="1234")
+    assert not df.is_cached
+
+    # DataFrames cached by the user are left cached.
+    user_df = spark_df_from_pandas_df(spark_session, pd.DataFrame({"a": [1, 2, 3]}))
+    user_df.cache()
+    engine.load_batch_data(batch_id="5678", batch_data=user_df)
+    engine.unload_batch_data(batch_id="5678")
+    assert user_df.is_cached
+    user_df.unpersist()
+
+    engine = SparkDFExecutionEngine(persist=False)
+    engine.load_batch_data(
+        batch_id="1234",
+        batch_data=spark_df_from_pandas_df(spark_session, pd.DataFrame({"a": [1]})),
+    )
+    assert not engine.dataframe.is_cached
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        SparkDFExecutionEngine(persist_storage_level="ON_THE_MOON")
+
+
+def test_resolve_metric_bundle_folds_row_condition_domains(
+    caplog, spark_session, spark_df_from_pandas_df
+):
+    engine = SparkDFExecutionEngine(bundle_row_conditions=True)
+    assert engine.config["bundle_row_conditions"]
+    engine.load_batch_data(
+        batch_id="1234",
+        batch_data=spark_df_from_pandas_df(
+            spark_session,
+            pd.DataFrame({"a": [1, 2, 1, 2, 3, None], "b": [4, 5, 4, 5, 6, 6]}),
+        ),
+    )
+
+    metrics: dict = {}
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    domains = [
+        {"column": "a"},
+        {"column": "a", "row_condition": "b > 4", "condition_parser": "spark"},
+        {
+            "column": "a",
+            "row_condition": 'col("b")==4',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+    partial_metrics = [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={"table.columns": table_columns_metric},
+        )
+        for domain_kwargs in domains
+        for metric_name in ["column.max.aggregate_fn", "column.sum.aggregate_fn"]
+    ] + [
+        MetricConfiguration(
+            metric_name="table.row_count.aggregate_fn",
+            metric_domain_kwargs={
+                key: value for key, value in domain_kwargs.items() if key != "column"
+            },
+            metric_value_kwargs=None,
+        )
+        for domain_kwargs in domains
+    ]
+    metrics.update(
+        engine.resolve_metrics(metrics_to_resolve=partial_metrics, metrics=metrics)
+    )
+
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "metric_partial_fn": partial_metric,
+                "table.columns": table_columns_metric,
+            },
+        )
+        for partial_metric in partial_metrics
+    ]
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[metric.id] for metric in desired_metrics] == [
+        3,
+        9,
+        3,
+        7,
+        1,
+        2,
+        6,
+        4,
+        2,
+    ]
+    # All metrics were computed in a single job over the unconditioned domain.
+    assert [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SparkDFExecutionEngine computed")
+    ] == ["SparkDFExecutionEngine computed 9 metrics on domain_id ()"]
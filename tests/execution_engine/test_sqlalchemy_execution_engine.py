@@ -1,16 +1,23 @@
 import logging
 import os
+from typing import Tuple
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as ge_exceptions
+from great_expectations.core.batch import Batch
 from great_expectations.core.batch_spec import (
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.data_context.types.base import ConcurrencyConfig
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_batch_data import (
+    SqlAlchemyBatchData,
+)
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
 )
@@ -23,6 +30,7 @@ from great_expectations.expectations.row_conditions import (
 from great_expectations.self_check.util import build_sa_engine
 from great_expectations.util import get_sqlalchemy_domain_data
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 from tests.test_utils import get_sqlite_table_names, get_sqlite_temp_table_names
 
@@ -752,6 +760,306 @@ def test_resolve_metric_bundle_with_nonexistent_metric(sa):
         print(e)
 
 
+def test_temp_table_batches_are_not_validated_concurrently(sa, tmp_path):
+    sqlalchemy_engine = sa.create_engine(
+        f"sqlite:///{tmp_path}/concurrency.db",
+        connect_args={"check_same_thread": False},
+        poolclass=sa.pool.QueuePool,
+        pool_size=1,
+        max_overflow=10,
+    )
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 5, 5, 6, 6]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(enabled=True, max_metric_resolution_workers=4),
+    )
+    # SQLite engines are replaced by a single (thread-bound) connection; restore the pooled engine for this test.
+    engine.engine = sqlalchemy_engine
+    batch_data = SqlAlchemyBatchData(
+        execution_engine=engine,
+        query="SELECT * FROM test WHERE b > 4",
+        create_temp_table=True,
+    )
+    assert batch_data.uses_temp_table
+    engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+    # Temporary tables are only visible on the connection creating them.
+    with engine._build_metric_resolution_executor(max_workers=3) as async_executor:
+        assert not async_executor.execute_concurrently
+
+    validator = Validator(execution_engine=engine)
+    results = validator.graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={
+                    "column": "a",
+                    "min_value": 0,
+                    "max_value": 3,
+                    "row_condition": f'col("b")>{min_value}',
+                    "condition_parser": "great_expectations__experimental__",
+                },
+            )
+            for min_value in range(4)
+        ]
+        + [
+            ExpectationConfiguration(
+                expectation_type="expect_table_row_count_to_equal",
+                kwargs={"value": 4},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "a", "value_set": [1, 2, 3]},
+            ),
+        ]
+    )
+    assert all(result.success for result in results)
+
+
+def test_resolve_metric_bundle_concurrently_for_separate_domains(sa, tmp_path):
+    sqlalchemy_engine = sa.create_engine(
+        f"sqlite:///{tmp_path}/concurrency.db",
+        connect_args={"check_same_thread": False},
+    )
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 5, 5, 6, 6]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        concurrency=ConcurrencyConfig(enabled=True, max_metric_resolution_workers=4),
+    )
+    # SQLite engines are replaced by a single (thread-bound) connection; restore the pooled engine for this test.
+    engine.engine = sqlalchemy_engine
+    engine.load_batch_data(
+        batch_id="my_id",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+
+    with engine._build_metric_resolution_executor(max_workers=3) as async_executor:
+        assert async_executor.execute_concurrently
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    domains = [
+        {"column": "a"},
+        {
+            "column": "a",
+            "row_condition": 'col("b")<6',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "column": "a",
+            "row_condition": 'col("b")>5',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+    partial_metrics = [
+        MetricConfiguration(
+            metric_name="column.max.aggregate_fn",
+            metric_domain_kwargs=domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "table.columns": table_columns_metric,
+            },
+        )
+        for domain_kwargs in domains
+    ]
+    results = engine.resolve_metrics(
+        metrics_to_resolve=partial_metrics, metrics=metrics
+    )
+    metrics.update(results)
+
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+            metric_value_kwargs=None,
+            metric_dependencies={
+                "metric_partial_fn": partial_metric,
+                "table.columns": table_columns_metric,
+            },
+        )
+        for partial_metric in partial_metrics
+    ]
+    results = engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+
+    assert [results[desired_metric.id] for desired_metric in desired_metrics] == [
+        3,
+        2,
+        3,
+    ]
+
+
+@pytest.mark.parametrize("use_filter_clause", [True, False])
+def test_resolve_metric_bundle_with_bundled_row_conditions(
+    sa, monkeypatch, use_filter_clause
+):
+    import great_expectations.execution_engine.sqlalchemy_execution_engine as sqlalchemy_execution_engine
+
+    monkeypatch.setattr(
+        sqlalchemy_execution_engine,
+        "_supports_aggregate_filter_clause",
+        lambda dialect: use_filter_clause,
+    )
+
+    df = pd.DataFrame({"a": [1, 2, None, 2, 3, 3], "b": [4, 4, 5, 5, 6, 6]})
+    domains = [
+        {},
+        {
+            "row_condition": 'col("b")<6',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "row_condition": 'col("b")>5',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "row_condition": 'col("b")==5',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+
+    def resolve_metrics(engine: SqlAlchemyExecutionEngine) -> Tuple[list, int]:
+        executed_queries: list = []
+        execute_bundled_query = engine._execute_bundled_query
+
+        def _execute_bundled_query(query: dict):
+            executed_queries.append(query)
+            return execute_bundled_query(query=query)
+
+        monkeypatch.setattr(engine, "_execute_bundled_query", _execute_bundled_query)
+
+        metrics: dict = {}
+
+        table_columns_metric: MetricConfiguration
+        results: dict
+
+        table_columns_metric, results = get_table_columns_metric(engine=engine)
+        metrics.update(results)
+
+        partial_metrics = []
+        for domain_kwargs in domains:
+            partial_metrics.extend(
+                [
+                    MetricConfiguration(
+                        metric_name="table.row_count.aggregate_fn",
+                        metric_domain_kwargs=domain_kwargs,
+                        metric_value_kwargs=None,
+                    ),
+                    MetricConfiguration(
+                        metric_name="column.max.aggregate_fn",
+                        metric_domain_kwargs={"column": "a", **domain_kwargs},
+                        metric_value_kwargs=None,
+                        metric_dependencies={
+                            "table.columns": table_columns_metric,
+                        },
+                    ),
+                    MetricConfiguration(
+                        metric_name="column.min.aggregate_fn",
+                        metric_domain_kwargs={"column": "a", **domain_kwargs},
+                        metric_value_kwargs=None,
+                        metric_dependencies={
+                            "table.columns": table_columns_metric,
+                        },
+                    ),
+                ]
+            )
+        results = engine.resolve_metrics(
+            metrics_to_resolve=partial_metrics, metrics=metrics
+        )
+        metrics.update(results)
+
+        desired_metrics = [
+            MetricConfiguration(
+                metric_name=partial_metric.metric_name[: -len(".aggregate_fn")],
+                metric_domain_kwargs=partial_metric.metric_domain_kwargs,
+                metric_value_kwargs=None,
+                metric_dependencies={
+                    "metric_partial_fn": partial_metric,
+                    **partial_metric.metric_dependencies,
+                },
+            )
+            for partial_metric in partial_metrics
+        ]
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+        return [results[desired_metric.id] for desired_metric in desired_metrics], len(
+            executed_queries
+        )
+
+    values, num_queries = resolve_metrics(engine=build_sa_engine(df, sa))
+    assert num_queries == len(domains)
+    assert values == [6, 3, 1, 4, 2, 1, 2, 3, 3, 2, 2, 2]
+
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    df.to_sql(name="test", con=sqlalchemy_engine, index=False)
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, bundle_row_conditions=True
+    )
+    engine.load_batch_data(
+        batch_id="my_id",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+    bundled_values, num_queries = resolve_metrics(engine=engine)
+    assert num_queries == 1
+    assert bundled_values == values
+    assert engine.config["bundle_row_conditions"]
+    assert "bundle_row_conditions" not in (
+        SqlAlchemyExecutionEngine(engine=sqlalchemy_engine).config
+    )
+
+
+def test_metric_resolution_is_sequential_for_connection_backed_engines(sa):
+    engine = build_sa_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, 4, 4]}), sa
+    )
+    engine._concurrency = ConcurrencyConfig(
+        enabled=True, max_metric_resolution_workers=4
+    )
+
+    # The SQLite engine is replaced by a single connection, which cannot be shared across threads.
+    with engine._build_metric_resolution_executor(max_workers=3) as async_executor:
+        assert not async_executor.execute_concurrently
+
+
+def test_get_batch_data_and_markers_with_batch_fingerprint_columns(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame(
+        {"a": [1, 2, 3], "updated_at": ["2022-01", "2022-02", "2022-03"]}
+    ).to_sql(name="test", con=sqlalchemy_engine, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=sqlalchemy_engine)
+
+    def _get_fingerprint(batch_fingerprint_columns) -> str:
+        batch_spec = SqlAlchemyDatasourceBatchSpec(table_name="test")
+        if batch_fingerprint_columns is not None:
+            batch_spec["batch_fingerprint_columns"] = batch_fingerprint_columns
+        return engine.get_batch_data_and_markers(batch_spec=batch_spec)[1].get(
+            "sqlalchemy_data_fingerprint"
+        )
+
+    # Fingerprinting is opt-in.
+    assert _get_fingerprint(batch_fingerprint_columns=None) is None
+
+    fingerprint: str = _get_fingerprint(batch_fingerprint_columns=["updated_at"])
+    assert fingerprint == _get_fingerprint(batch_fingerprint_columns=["updated_at"])
+
+    engine.engine.execute(
+        sa.text("UPDATE test SET a = 4, updated_at = '2022-04' WHERE a = 3")
+    )
+    assert fingerprint != _get_fingerprint(batch_fingerprint_columns=["updated_at"])
+
+
 def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     my_execution_engine: SqlAlchemyExecutionEngine = SqlAlchemyExecutionEngine(
         engine=sqlite_view_engine
@@ -826,3 +1134,263 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     )
 
     validate_tmp_tables()
+
+
+def test_large_value_sets_are_loaded_into_temp_tables(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4, None], "b": ["1", "2", "3", "4", "5"]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+
+    def _validate(value_set_temp_table_threshold) -> Tuple[list, set]:
+        engine = SqlAlchemyExecutionEngine(
+            engine=sqlalchemy_engine,
+            value_set_temp_table_threshold=value_set_temp_table_threshold,
+        )
+        engine.load_batch_data(
+            batch_id="my_id",
+            batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+        )
+        temp_table_names: set = get_sqlite_temp_table_names(sqlalchemy_engine)
+        validator = Validator(execution_engine=engine)
+        results = [
+            validator.expect_column_values_to_be_in_set(
+                column="a", value_set=[1, 2, 3], result_format="COMPLETE"
+            ).result,
+            validator.expect_column_values_to_not_be_in_set(
+                column="a", value_set=[1, 2, 3], result_format="COMPLETE"
+            ).result,
+            # The values are compared with the (string) column, as in a literal list.
+            validator.expect_column_values_to_be_in_set(
+                column="b", value_set=[1, 2, 3], result_format="COMPLETE"
+            ).result,
+        ]
+        return (
+            results,
+            get_sqlite_temp_table_names(sqlalchemy_engine) - temp_table_names,
+        )
+
+    expected_results, temp_table_names = _validate(value_set_temp_table_threshold=None)
+    assert not temp_table_names
+
+    results, temp_table_names = _validate(value_set_temp_table_threshold=3)
+    assert results == expected_results
+    # Equal value sets (of columns of the same type) share a temporary table.
+    assert len(temp_table_names) == 2
+
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, value_set_temp_table_threshold=3
+    )
+    assert engine.config["value_set_temp_table_threshold"] == 3
+    assert (
+        engine.get_value_set_selectable(
+            value_set=[1, 2], column_name="a", selectable=sa.table("test")
+        )
+        is None
+    )
+
+
+def test_metric_queries_are_compiled_once_for_domains_of_the_same_shape(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4, None], "b": ["1", "2", "3", "4", "5"]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(engine=sqlalchemy_engine)
+    engine.load_batch_data(
+        batch_id="my_id",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+    validator = Validator(execution_engine=engine)
+
+    def _validate(min_value: int) -> list:
+        # Domains (like batches split from the same table) differing only by values share their compiled queries.
+        row_condition_kwargs = {
+            "row_condition": f'col("a")>={min_value}',
+            "condition_parser": "great_expectations__experimental__",
+        }
+        return [
+            validator.expect_column_max_to_be_between(
+                column="a", min_value=0, max_value=10, **row_condition_kwargs
+            ).result["observed_value"],
+            validator.expect_column_values_to_be_in_set(
+                column="a",
+                value_set=[1, 3],
+                result_format="COMPLETE",
+                **row_condition_kwargs,
+            ).result["unexpected_list"],
+        ]
+
+    assert _validate(min_value=1) == [4, [2, 4]]
+    compiled_queries = len(engine._compiled_cache)
+    assert compiled_queries > 0
+
+    assert _validate(min_value=3) == [4, [4]]
+    assert len(engine._compiled_cache) == compiled_queries
+
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, compiled_cache_size=None
+    )
+    assert engine._compiled_cache is None
+    assert engine.config["compiled_cache_size"] is None
+
+
+def test_metric_queries_are_not_compiled_once_before_sqlalchemy_1_4(sa, monkeypatch):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4, None]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    monkeypatch.setattr(sa, "__version__", "1.3.24")
+    engine = SqlAlchemyExecutionEngine(engine=sqlalchemy_engine)
+    assert engine._compiled_cache is None
+
+    engine.load_batch_data(
+        batch_id="my_id",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+    validator = Validator(execution_engine=engine)
+    assert (
+        validator.expect_column_max_to_be_between(
+            column="a", min_value=0, max_value=10
+        ).result["observed_value"]
+        == 4
+    )
+
+
+@pytest.mark.parametrize(
+    "query,temp_table_min_queries,materialized",
+    [
+        ("SELECT t.id, a, b FROM t JOIN u ON t.id = u.id", 2, True),
+        ("SELECT t.id, a, b FROM t JOIN u ON t.id = u.id", 10, False),
+        ("SELECT * FROM t WHERE a > 1", 2, False),
+    ],
+)
+def test_auto_create_temp_table_materializes_expensive_batches(
+    sa, query, temp_table_min_queries, materialized
+):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"id": [1, 2, 3, 4], "a": [1, 2, 3, None]}).to_sql(
+        name="t", con=sqlalchemy_engine, index=False
+    )
+    pd.DataFrame({"id": [1, 2, 3, 4], "b": ["x", "y", "z", "w"]}).to_sql(
+        name="u", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine,
+        create_temp_table="auto",
+        temp_table_min_queries=temp_table_min_queries,
+    )
+    batch_data, batch_markers = engine.get_batch_data_and_markers(
+        batch_spec=RuntimeQueryBatchSpec(query=query)
+    )
+    batch = Batch(data=batch_data, batch_markers=batch_markers)
+    assert batch_data.has_deferred_temp_table
+    assert not get_sqlite_temp_table_names(sqlalchemy_engine)
+
+    results = Validator(execution_engine=engine, batches=[batch]).graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_max_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 5},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "a", "value_set": [1, 2, 3]},
+            ),
+        ]
+    )
+
+    assert all(result.success for result in results)
+    assert not batch_data.has_deferred_temp_table
+    assert bool(get_sqlite_temp_table_names(sqlalchemy_engine)) == materialized
+    materialization: dict = batch.batch_markers["ge_temp_table_materialization"]
+    assert materialization["materialized"] == materialized
+    assert materialization["planned_queries"] >= 2
+    assert (materialization["materialization_time"] is not None) == materialized
+
+
+def test_recorded_queries_are_attached_to_the_results_they_served(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3, 4, None], "b": ["x", "y", "z", "x", "y"]}).to_sql(
+        name="t", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, record_queries=True, explain_queries=True
+    )
+    assert engine.config["record_queries"]
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="t")
+    )
+    results = Validator(
+        execution_engine=engine, batches=[Batch(data=batch_data)]
+    ).graph_validate(
+        configurations=[
+            ExpectationConfiguration(
+                expectation_type="expect_column_median_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 5},
+            ),
+            ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": "b", "value_set": ["x", "y"]},
+            ),
+        ]
+    )
+
+    median_queries, in_set_queries = (
+        result.to_json_dict()["meta"]["query_records"] for result in results
+    )
+    # The median is computed by its metric provider, directly through the engine.
+    (median_query,) = [
+        query_record
+        for query_record in median_queries
+        if ["column.median"]
+        == [metric_id[0] for metric_id in query_record["metric_ids"]]
+    ]
+    assert "row_number()" in median_query["sql"]
+    assert median_query["duration_seconds"] >= 0
+    assert median_query["explain"]
+    assert median_query not in in_set_queries
+
+    # Bundled metrics are served by one query, which is attached to the results of each of their expectations.
+    (bundled_query,) = [
+        query_record
+        for query_record in in_set_queries
+        if len(query_record["metric_ids"]) > 1
+    ]
+    assert bundled_query in median_queries
+    assert bundled_query["rows"] == 1
+    assert ["x", "y"] == bundled_query["parameters"][:2]
+    assert engine.query_records == []
+
+
+def test_queries_are_not_recorded_by_default(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 3]}).to_sql(name="t", con=sqlalchemy_engine, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=sqlalchemy_engine)
+    batch_data, _ = engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(table_name="t")
+    )
+    validator = Validator(execution_engine=engine, batches=[Batch(data=batch_data)])
+
+    result = validator.expect_column_max_to_be_between(
+        column="a", min_value=0, max_value=5
+    )
+    assert result.success
+    assert "query_records" not in result.meta
+    assert "record_queries" not in engine.config
+
+
+def test_split_queries_are_recorded(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 2]}).to_sql(name="t", con=sqlalchemy_engine, index=False)
+    engine = SqlAlchemyExecutionEngine(engine=sqlalchemy_engine, record_queries=True)
+
+    assert engine.get_data_for_batch_identifiers(
+        table_name="t",
+        splitter_method_name="split_on_column_value",
+        splitter_kwargs={"column_name": "a"},
+    ) == [{"a": 1}, {"a": 2}]
+    (query_record,) = engine.pop_query_records()
+    assert query_record["rows"] == 2
+    assert query_record["metric_ids"] == []
+    assert query_record["explain"] is None
+    assert engine.pop_query_records() == []
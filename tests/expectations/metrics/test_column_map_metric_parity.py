@@ -0,0 +1,209 @@
+import json
+from datetime import datetime
+
+import jsonschema
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.parser import parse
+
+from great_expectations.expectations.metrics.util import (
+    map_distinct_strings,
+    map_distinct_values,
+    map_isinstance,
+)
+from great_expectations.self_check.util import build_pandas_engine
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+JSON_SCHEMA = {
+    "type": "object",
+    "properties": {"a": {"type": "integer"}},
+    "required": ["a"],
+}
+
+
+def _is_dateutil_parseable(value):
+    try:
+        parse(value)
+        return True
+    except (ValueError, OverflowError):
+        return False
+
+
+def _is_json(value):
+    try:
+        json.loads(value)
+        return True
+    except:
+        return False
+
+
+def _matches_json_schema(value):
+    try:
+        jsonschema.validate(json.loads(value), JSON_SCHEMA)
+        return True
+    except jsonschema.ValidationError:
+        return False
+
+
+def _matches_strftime_format(value):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+        return True
+    except ValueError:
+        return False
+
+
+@pytest.fixture
+def string_column():
+    # Few distinct values, each of which occurs many times (and nulls), as in real columns.
+    distinct_values = [
+        "2021-01-01",
+        "2021-02-30",
+        "01/02/2021",
+        "not a date",
+        '{"a": 1}',
+        '{"a": "1"}',
+        '{"b": 1}',
+        "[1, 2",
+        "1e400",
+        "",
+    ]
+    rng = np.random.default_rng(seed=0)
+    values = rng.choice(np.array(distinct_values + [None], dtype=object), size=500)
+    return pd.Series(values, name="a")
+
+
+def _resolve_unexpected_condition(
+    column: pd.Series, metric_name: str, metric_value_kwargs: dict
+) -> pd.Series:
+    engine = build_pandas_engine(pd.DataFrame({"a": column}))
+    table_columns_metric, metrics = get_table_columns_metric(engine=engine)
+    condition_metric = MetricConfiguration(
+        metric_name=f"{metric_name}.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+        metric_dependencies={"table.columns": table_columns_metric},
+    )
+    metrics = engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,), metrics=metrics
+    )
+    return metrics[condition_metric.id][0]
+
+
+@pytest.mark.parametrize(
+    "metric_name,metric_value_kwargs,reference_fn",
+    [
+        ("column_values.dateutil_parseable", {}, _is_dateutil_parseable),
+        ("column_values.json_parseable", {}, _is_json),
+        (
+            "column_values.match_json_schema",
+            {"json_schema": JSON_SCHEMA},
+            _matches_json_schema,
+        ),
+        (
+            "column_values.match_strftime_format",
+            {"strftime_format": "%Y-%m-%d"},
+            _matches_strftime_format,
+        ),
+    ],
+)
+def test_string_column_map_metrics_match_per_value_implementations(
+    string_column, metric_name, metric_value_kwargs, reference_fn
+):
+    if metric_name == "column_values.match_json_schema":
+        # Only JSON values can be validated against the schema.
+        string_column = string_column[
+            string_column.isin(['{"a": 1}', '{"a": "1"}', '{"b": 1}', None])
+        ]
+
+    unexpected_condition = _resolve_unexpected_condition(
+        column=string_column,
+        metric_name=metric_name,
+        metric_value_kwargs=metric_value_kwargs,
+    )
+
+    non_null_column = string_column[string_column.notnull()]
+    expected = non_null_column.map(reference_fn)
+    assert unexpected_condition.dtype == bool
+    pd.testing.assert_series_equal(
+        unexpected_condition[non_null_column.index], ~expected, check_names=False
+    )
+
+
+@pytest.mark.parametrize(
+    "column",
+    [
+        pd.Series([1, 2, 3, 2, 1]),
+        pd.Series([1.5, np.nan, 3.0]),
+        pd.Series([True, False, True]),
+        pd.Series(["a", "b", "a", None]),
+        pd.Series([1, "a", 2.5, True, None, np.int64(3), "a"]),
+        pd.Series(pd.to_datetime(["2021-01-01", None, "2021-01-01"])),
+        pd.Series([], dtype="float64"),
+    ],
+)
+@pytest.mark.parametrize(
+    "types", [(int,), (float,), (str,), (bool, np.int64), (pd.Timestamp,), (object,)]
+)
+def test_map_isinstance_matches_per_value_isinstance(column, types):
+    expected = column.map(lambda value: isinstance(value, types))
+    assert map_isinstance(column=column, types=types).tolist() == expected.tolist()
+
+
+def test_map_distinct_values_calls_fn_once_per_distinct_value():
+    column = pd.Series(["a", "b", None, "a", "b", "a"], index=[5, 4, 3, 2, 1, 0])
+    calls = []
+
+    def fn(value):
+        calls.append(value)
+        return value is not None and value > "a"
+
+    mapped_column = map_distinct_values(column=column, fn=fn)
+
+    assert calls == ["a", "b", None]
+    pd.testing.assert_series_equal(
+        mapped_column, column.map(lambda value: value is not None and value > "a")
+    )
+    # Values, which are not all strings, may not be interchangeable (e.g., True == 1), so they are not deduplicated.
+    assert map_distinct_strings(
+        column=pd.Series([True, 1, 1]), fn=lambda value: type(value).__name__
+    ).tolist() == ["bool", "int", "int"]
+
+
+@pytest.mark.parametrize(
+    "metric_value_kwargs",
+    [
+        {"min_value": 2, "max_value": 4},
+        {"min_value": 2, "max_value": 4, "strict_min": True, "strict_max": True},
+        {"min_value": 2.5},
+        {"max_value": 3, "strict_max": True},
+    ],
+)
+def test_numeric_column_values_between_matches_per_value_comparisons(
+    metric_value_kwargs,
+):
+    column = pd.Series([1, 2, 2.5, 3, 4, 5, np.nan, 2])
+    unexpected_condition = _resolve_unexpected_condition(
+        column=column,
+        metric_name="column_values.between",
+        metric_value_kwargs=metric_value_kwargs,
+    )
+
+    min_value = metric_value_kwargs.get("min_value")
+    max_value = metric_value_kwargs.get("max_value")
+    strict_min = metric_value_kwargs.get("strict_min")
+    strict_max = metric_value_kwargs.get("strict_max")
+    non_null_column = column[column.notnull()]
+    expected = non_null_column.map(
+        lambda value: (
+            min_value is None
+            or (min_value < value if strict_min else min_value <= value)
+        )
+        and (
+            max_value is None
+            or (value < max_value if strict_max else value <= max_value)
+        )
+    )
+    assert unexpected_condition[non_null_column.index].tolist() == (~expected).tolist()
@@ -29,6 +29,18 @@ def test_metric_loads_pd():
     assert get_metric_provider("column.max", PandasExecutionEngine()) is not None
 
 
+def test_metric_loads_for_derived_engine_from_base_engine():
+    class DerivedPandasExecutionEngine(PandasExecutionEngine):
+        pass
+
+    assert get_metric_provider(
+        "column.max", DerivedPandasExecutionEngine()
+    ) == get_metric_provider("column.max", PandasExecutionEngine())
+
+    with pytest.raises(ge_exceptions.MetricProviderError):
+        get_metric_provider("column.no_such_metric", DerivedPandasExecutionEngine())
+
+
 def test_basic_metric_pd():
     df = pd.DataFrame({"a": [1, 2, 3, 3, None]})
     batch = Batch(data=df)
@@ -580,6 +592,59 @@ def test_column_histogram_metric_sa(sa):
     assert results == {desired_metric.id: [1, 1, 1, 1, 1, 1, 1, 1, 1, 1]}
 
 
+@pytest.mark.parametrize(
+    "bins",
+    [
+        np.linspace(0.0, 9.0, 11),
+        np.linspace(-1.5, 10.0, 101),
+        [-np.inf, *np.linspace(0.0, 1.0, 11), np.inf],
+        [-np.inf, *np.linspace(0.0, 9.0, 4)],
+        [*np.linspace(0.0, 9.0, 4), float("inf")],
+        [0.0, 1.0, 3.0, 9.0],
+    ],
+)
+def test_column_histogram_metric_sa_using_bin_index(sa, monkeypatch, bins):
+    import great_expectations.expectations.metrics.column_aggregate_metrics.column_histogram as column_histogram
+
+    df = pd.DataFrame(
+        {"a": [-2.0, 0.0, 0.1, 0.3, 0.7, 1.0, 2.25, 3.0, 4.5, 6.0, 9.0, 12.0, None]}
+    )
+
+    engine = build_sa_engine(df, sa)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "bins": tuple(bins),
+        },
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    hist = results[desired_metric.id]
+    assert len(hist) == len(bins) - 1
+
+    # The histogram must be identical to the one computed by summing one "CASE" expression per bin.
+    monkeypatch.setattr(column_histogram, "BIN_INDEX_HISTOGRAM_DIALECTS", ())
+    engine = build_sa_engine(df, sa)
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == hist
+
+
 def test_column_histogram_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
@@ -3228,6 +3293,55 @@ def test_table_metric_spark(spark_session):
     assert results == {desired_metric.id: 3}
 
 
+@pytest.mark.parametrize(
+    "column_values,expected_median",
+    [
+        ([3, None, 1, 2], 2),
+        ([4, 1, None, 3, 2], 2.5),
+        ([5, None], 5),
+    ],
+)
+@pytest.mark.parametrize("supports_window_functions", [True, False])
+def test_median_metric_sa(
+    sa, column_values, expected_median, supports_window_functions
+):
+    engine = build_sa_engine(pd.DataFrame({"a": column_values}), sa)
+    if not supports_window_functions:
+        # SQLite versions before 3.25 lack window functions (the median is then fetched with OFFSET/LIMIT queries).
+        engine.engine.dialect.server_version_info = (3, 24, 0)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    nonnull_count_metric = MetricConfiguration(
+        metric_name="column_values.nonnull.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+    )
+    metrics[nonnull_count_metric.id] = len(
+        [column_value for column_value in column_values if column_value is not None]
+    )
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+            "column_values.nonnull.count": nonnull_count_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results == {desired_metric.id: expected_median}
+
+
 def test_median_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
         spark=spark_session,
@@ -3336,6 +3450,82 @@ def test_distinct_metric_sa(sa):
     assert results[desired_metric_b.id] == {4}
 
 
+def test_distinct_values_count_metric_pd_approximate():
+    df = pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, None]})
+    batch: Batch = Batch(data=df)
+    engine = PandasExecutionEngine(
+        batch_data_dict={batch.id: batch.data}, approximate_metrics=True
+    )
+    assert engine.config["approximate_metrics"] is True
+    assert "approximate_metrics" not in PandasExecutionEngine().config
+    assert engine.get_metric_approximation("column.distinct_values.count").method == (
+        "HyperLogLog"
+    )
+    assert engine.get_metric_approximation("column.value_counts") is None
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results == {desired_metric.id: 3}
+
+
+def test_distinct_values_count_metric_sa_approximate(sa):
+    sqlalchemy_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"a": [1, 2, 1, 2, 3, 3, None]}).to_sql(
+        name="test", con=sqlalchemy_engine, index=False
+    )
+    engine = SqlAlchemyExecutionEngine(
+        engine=sqlalchemy_engine, approximate_metrics=True
+    )
+    assert engine.config["approximate_metrics"] is True
+    assert "approximate_metrics" not in (
+        SqlAlchemyExecutionEngine(engine=sqlalchemy_engine).config
+    )
+    engine.load_batch_data(
+        batch_id="my_id",
+        batch_data=SqlAlchemyBatchData(execution_engine=engine, table_name="test"),
+    )
+    # SQLite has no approximate distinct count function; distinct values are counted exactly (but in the database).
+    assert engine.get_metric_approximation("column.distinct_values.count") is None
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.distinct_values.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=None,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results == {desired_metric.id: 3}
+
+
 def test_distinct_metric_pd():
     engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 1, 2, 3, 3]}))
 
@@ -350,3 +350,54 @@ def test_include_unexpected_rows_without_explicit_result_format_raises_error(
     )
     with pytest.raises(ValueError):
         expectation.validate(validator)
+
+
+def test_pandas_unexpected_records_are_computed_once_per_condition(monkeypatch):
+    df = pd.DataFrame(
+        {
+            "a": [1, 5, None, 3, 5, 10],
+            "b": ["cat", "fish", "dog", "giraffe", "lion", "zebra"],
+        }
+    )
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "a",
+            "value_set": [1, 5],
+            "result_format": {
+                "result_format": "COMPLETE",
+                "include_unexpected_rows": True,
+            },
+        },
+    )
+
+    engine = PandasExecutionEngine()
+    computed_unexpected_records = []
+
+    def compute_unexpected_domain_records(**kwargs):
+        computed_unexpected_records.append(kwargs)
+        return PandasExecutionEngine._compute_unexpected_domain_records(
+            engine, **kwargs
+        )
+
+    monkeypatch.setattr(
+        engine,
+        "_compute_unexpected_domain_records",
+        compute_unexpected_domain_records,
+    )
+    validator = Validator(execution_engine=engine, batches=[Batch(data=df)])
+    result = ExpectColumnValuesToBeInSet(expectation_configuration).validate(validator)
+
+    # Unexpected values, value counts, index list, and rows are all derived from the same unexpected records.
+    assert len(computed_unexpected_records) == 1
+    assert computed_unexpected_records[0]["filter_column"] == "a"
+    assert result.result["unexpected_list"] == [3.0, 10.0]
+    assert result.result["unexpected_index_list"] == [3, 5]
+    assert result.result["partial_unexpected_counts"] == [
+        {"value": 3.0, "count": 1},
+        {"value": 10.0, "count": 1},
+    ]
+    assert convert_to_json_serializable(result.result["unexpected_rows"]) == [
+        {"a": 3.0, "b": "giraffe"},
+        {"a": 10.0, "b": "zebra"},
+    ]
@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.metrics.partial_aggregates import (
+    CountPartialAggregate,
+    MeanPartialAggregate,
+    NullCountPartialAggregate,
+    SumPartialAggregate,
+)
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from tests.expectations.test_util import get_table_columns_metric
+
+
+def _resolve_column_metric(engine, metric_name, metric_value_kwargs):
+    metrics: dict = {}
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs=metric_value_kwargs,
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    return results[desired_metric.id]
+
+
+@pytest.mark.parametrize(
+    "metric_name,metric_value_kwargs",
+    [
+        ("column.min", None),
+        ("column.max", None),
+        ("column.sum", None),
+        ("column.mean", None),
+        ("column.standard_deviation", None),
+        ("column.median", None),
+        (
+            "column.quantile_values",
+            {"quantiles": [0.0, 0.1, 0.5, 0.9, 1.0], "allow_relative_error": False},
+        ),
+        ("column.histogram", {"bins": [-100.0, -10.0, 0.0, 10.0, 100.0]}),
+        ("column.distinct_values.count", None),
+    ],
+)
+@pytest.mark.parametrize("num_chunks", [1, 3, 7])
+def test_merged_partial_aggregates_of_chunks_match_in_memory_metric(
+    metric_name, metric_value_kwargs, num_chunks
+):
+    rng = np.random.default_rng(seed=42)
+    values = pd.Series(np.round(rng.normal(loc=3.0, scale=20.0, size=97), 1))
+    values[[4, 17, 60]] = None
+    df = pd.DataFrame({"a": values})
+    batch: Batch = Batch(data=df)
+    engine = PandasExecutionEngine(batch_data_dict={batch.id: batch.data})
+
+    expected = _resolve_column_metric(
+        engine=engine,
+        metric_name=metric_name,
+        metric_value_kwargs=metric_value_kwargs,
+    )
+
+    provider_class, _ = get_metric_provider(metric_name, engine)
+    chunk_states = [
+        provider_class.get_partial_aggregate(
+            execution_engine=engine, metric_value_kwargs=metric_value_kwargs
+        ).update(column=chunk)
+        for chunk in np.array_split(df["a"], num_chunks)
+    ]
+    state = chunk_states[0]
+    for chunk_state in chunk_states[1:]:
+        state = state.merge(other=chunk_state)
+
+    assert state.finalize() == pytest.approx(expected)
+
+
+def test_get_partial_aggregate_returns_none_for_metrics_without_protocol():
+    engine = PandasExecutionEngine()
+    provider_class, _ = get_metric_provider("column.value_counts", engine)
+
+    assert provider_class.get_partial_aggregate(execution_engine=engine) is None
+
+
+def test_counts_and_empty_states():
+    column = pd.Series([1.0, None, 3.0, np.nan])
+
+    assert CountPartialAggregate().update(column=column).finalize() == 4
+    assert NullCountPartialAggregate().update(column=column).finalize() == 2
+    assert SumPartialAggregate().finalize() == 0
+    assert np.isnan(MeanPartialAggregate().update(column=column[[1]]).finalize())
+
+
+def test_partial_aggregates_of_different_types_cannot_be_merged():
+    with pytest.raises(ValueError):
+        CountPartialAggregate().merge(other=NullCountPartialAggregate())
@@ -1,5 +1,6 @@
 from great_expectations.expectations.row_conditions import (
     _parse_great_expectations_condition,
+    get_row_condition_columns,
     parse_condition_to_spark,
     parse_condition_to_sqlalchemy,
 )
@@ -41,3 +42,16 @@ def test_parse_condition_to_sqlalchemy(sa):
 
     res = parse_condition_to_sqlalchemy('col("foo").notNull()')
     assert str(res) == "foo IS NOT NULL"
+
+
+def test_get_row_condition_columns():
+    assert get_row_condition_columns(
+        'foo > 5 & `foo bar`.isnull() | baz == "x"', "pandas"
+    ) == {"foo", "foo bar", "baz"}
+    assert get_row_condition_columns(
+        'col("foo") > 5', "great_expectations__experimental__"
+    ) == {"foo"}
+
+    # Columns of conditions referring to local variables, or of unknown parsers, cannot be determined.
+    assert get_row_condition_columns("foo > @threshold", "pandas") is None
+    assert get_row_condition_columns("foo > 5", "spark") is None
@@ -52,6 +52,7 @@ def test_requirements_files():
         | req_set_dict["requirements-dev-athena.txt"]
         | req_set_dict["requirements-dev-bigquery.txt"]
         | req_set_dict["requirements-dev-dremio.txt"]
+        | req_set_dict["requirements-dev-duckdb.txt"]
         | req_set_dict["requirements-dev-mssql.txt"]
         | req_set_dict["requirements-dev-mysql.txt"]
         | req_set_dict["requirements-dev-postgresql.txt"]
@@ -83,6 +84,7 @@ def test_requirements_files():
         | req_set_dict["requirements-dev-azure.txt"]
         | req_set_dict["requirements-dev-bigquery.txt"]
         | req_set_dict["requirements-dev-dremio.txt"]
+        | req_set_dict["requirements-dev-duckdb.txt"]
         | req_set_dict["requirements-dev-excel.txt"]
         | req_set_dict["requirements-dev-mssql.txt"]
         | req_set_dict["requirements-dev-mysql.txt"]
@@ -0,0 +1,100 @@
+import copy
+
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+
+def test_metric_configuration_id_is_computed_once():
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": "my_batch_id"},
+        metric_value_kwargs={"parse_strings_as_datetimes": False},
+    )
+
+    assert isinstance(metric_configuration.metric_domain_kwargs, FrozenIDDict)
+    assert isinstance(metric_configuration.metric_value_kwargs, FrozenIDDict)
+    assert metric_configuration.id == (
+        "column.max",
+        IDDict({"column": "a", "batch_id": "my_batch_id"}).to_id(),
+        "parse_strings_as_datetimes=False",
+    )
+    assert metric_configuration.id is metric_configuration.id
+
+
+def test_metric_configuration_copies_are_distinct():
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count", metric_domain_kwargs={}
+    )
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+        metric_dependencies={"table.row_count": table_row_count},
+    )
+
+    shallow_copy: MetricConfiguration = copy.copy(metric_configuration)
+    deep_copy: MetricConfiguration = copy.deepcopy(metric_configuration)
+    for metric_configuration_copy in (shallow_copy, deep_copy):
+        assert metric_configuration_copy is not metric_configuration
+        assert metric_configuration_copy.id == metric_configuration.id
+        assert isinstance(metric_configuration_copy.metric_domain_kwargs, FrozenIDDict)
+
+    assert shallow_copy.metric_dependencies is metric_configuration.metric_dependencies
+    assert deep_copy.metric_dependencies["table.row_count"] is not table_row_count
+
+    # Changing the dependencies of a copy leaves the original unchanged.
+    deep_copy.metric_dependencies = {}
+    assert metric_configuration.metric_dependencies == {
+        "table.row_count": table_row_count
+    }
+
+
+def test_metric_configuration_intern():
+    table_row_count = MetricConfiguration(
+        metric_name="table.row_count", metric_domain_kwargs={"batch_id": "abc"}
+    )
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": "abc"},
+    )
+    interned_metric_configurations: dict = {}
+    interned: MetricConfiguration = MetricConfiguration.intern(
+        metric_configuration=metric_configuration,
+        interned_metric_configurations=interned_metric_configurations,
+    )
+
+    identical_metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"batch_id": "abc", "column": "a"},
+        metric_dependencies={"table.row_count": table_row_count},
+    )
+
+    assert interned is metric_configuration
+    assert (
+        MetricConfiguration.intern(
+            metric_configuration=identical_metric_configuration,
+            interned_metric_configurations=interned_metric_configurations,
+        )
+        is metric_configuration
+    )
+    # Dependencies known only to the identical configuration are retained by the interned one.
+    assert metric_configuration.metric_dependencies == {
+        "table.row_count": table_row_count
+    }
+    assert (
+        MetricConfiguration.intern(
+            metric_configuration=MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={"column": "b", "batch_id": "abc"},
+            ),
+            interned_metric_configurations=interned_metric_configurations,
+        )
+        is not metric_configuration
+    )
+    # Intern tables are independent of one another.
+    assert (
+        MetricConfiguration.intern(
+            metric_configuration=identical_metric_configuration,
+            interned_metric_configurations={},
+        )
+        is identical_metric_configuration
+    )
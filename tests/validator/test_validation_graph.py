@@ -0,0 +1,86 @@
+from typing import Set
+
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import (
+    MetricDependencyScheduler,
+    MetricEdge,
+    ValidationGraph,
+)
+
+
+def _metric_names(metric_configurations: Set[MetricConfiguration]) -> Set[str]:
+    return {
+        metric_configuration.metric_name
+        for metric_configuration in metric_configurations
+    }
+
+
+def _build_diamond_graph() -> ValidationGraph:
+    """
+    Builds the graph: "d" -> ("b", "c"); "b" -> "a"; "c" -> "a"; where "a" has no dependencies.
+    """
+    metric_a = MetricConfiguration("a", {"column": "x"})
+    metric_b = MetricConfiguration("b", {"column": "x"})
+    metric_c = MetricConfiguration("c", {"column": "x"})
+    metric_d = MetricConfiguration("d", {"column": "x"})
+    return ValidationGraph(
+        edges=[
+            MetricEdge(left=metric_d, right=metric_b),
+            MetricEdge(left=metric_d, right=metric_c),
+            MetricEdge(left=metric_b, right=metric_a),
+            MetricEdge(left=metric_c, right=metric_a),
+            MetricEdge(left=metric_a),
+        ]
+    )
+
+
+def test_metric_dependency_scheduler_releases_metrics_in_topological_order():
+    graph: ValidationGraph = _build_diamond_graph()
+    scheduler = MetricDependencyScheduler(graph=graph, metrics={})
+
+    assert scheduler.num_unresolved_metrics == 4
+    assert _metric_names(scheduler.ready_metrics) == {"a"}
+    assert _metric_names(scheduler.needed_metrics) == {"b", "c", "d"}
+
+    scheduler.mark_resolved(
+        metric_ids=[metric.id for metric in scheduler.ready_metrics]
+    )
+    assert _metric_names(scheduler.ready_metrics) == {"b", "c"}
+
+    # "d" is released only once the last of its dependencies has been resolved.
+    metric_b_id = MetricConfiguration("b", {"column": "x"}).id
+    scheduler.mark_resolved(metric_ids=[metric_b_id])
+    assert _metric_names(scheduler.ready_metrics) == {"c"}
+
+    metric_c_id = MetricConfiguration("c", {"column": "x"}).id
+    scheduler.mark_resolved(metric_ids=[metric_c_id])
+    assert _metric_names(scheduler.ready_metrics) == {"d"}
+
+    metric_d_id = MetricConfiguration("d", {"column": "x"}).id
+    scheduler.mark_resolved(metric_ids=[metric_d_id])
+    assert scheduler.ready_metrics == set()
+    assert scheduler.needed_metrics == set()
+    assert scheduler.num_unresolved_metrics == 0
+
+
+def test_metric_dependency_scheduler_treats_computed_metrics_as_resolved():
+    graph: ValidationGraph = _build_diamond_graph()
+    metric_a_id = MetricConfiguration("a", {"column": "x"}).id
+    metric_b_id = MetricConfiguration("b", {"column": "x"}).id
+    scheduler = MetricDependencyScheduler(
+        graph=graph, metrics={metric_a_id: 1, metric_b_id: 2}
+    )
+
+    assert scheduler.num_unresolved_metrics == 2
+    assert _metric_names(scheduler.ready_metrics) == {"c"}
+    assert _metric_names(scheduler.needed_metrics) == {"d"}
+
+
+def test_metric_dependency_scheduler_ignores_unknown_metric_ids():
+    graph: ValidationGraph = _build_diamond_graph()
+    scheduler = MetricDependencyScheduler(graph=graph, metrics={})
+
+    scheduler.mark_resolved(metric_ids=[("not_a_metric", tuple(), tuple())])
+
+    assert _metric_names(scheduler.ready_metrics) == {"a"}
+    assert scheduler.num_unresolved_metrics == 4
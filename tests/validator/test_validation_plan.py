@@ -0,0 +1,124 @@
+import json
+from typing import List, Optional
+
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+from great_expectations.validator.validation_plan import (
+    ValidationPlan,
+    ValidationPlanCache,
+)
+
+
+def _build_validation_plan(key: str = "my_key") -> ValidationPlan:
+    table_row_count = MetricConfiguration(
+        "table.row_count", {"batch_id": "batch_0", "column": "a"}
+    )
+    column_max = MetricConfiguration(
+        "column.max", {"batch_id": "batch_0", "column": "a"}, {"parse_strings": False}
+    )
+    column_max.metric_dependencies = {"table.row_count": table_row_count}
+    return ValidationPlan(
+        key=key,
+        batch_id="batch_0",
+        graphs=[
+            ValidationGraph(
+                edges=[
+                    MetricEdge(left=column_max, right=table_row_count),
+                    MetricEdge(left=table_row_count),
+                ]
+            ),
+            None,
+        ],
+    )
+
+
+def test_validation_plan_bind_substitutes_batch_id_and_preserves_dependencies():
+    validation_plan: ValidationPlan = _build_validation_plan()
+
+    bound_graphs: List[Optional[ValidationGraph]] = validation_plan.bind(
+        batch_id="batch_1"
+    )
+
+    assert bound_graphs[1] is None
+    edges: List[MetricEdge] = bound_graphs[0].edges
+    assert {edge.left.metric_domain_kwargs["batch_id"] for edge in edges} == {"batch_1"}
+    column_max: MetricConfiguration = edges[0].left
+    assert column_max.metric_value_kwargs == {"parse_strings": False}
+    assert (
+        column_max.metric_dependencies["table.row_count"].metric_domain_kwargs[
+            "batch_id"
+        ]
+        == "batch_1"
+    )
+
+    # The compiled plan itself is left untouched.
+    assert all(
+        edge.left.metric_domain_kwargs["batch_id"] == "batch_0"
+        for edge in validation_plan.graphs[0].edges
+    )
+
+
+def test_validation_plan_json_round_trip():
+    validation_plan: ValidationPlan = _build_validation_plan()
+
+    loaded_plan: ValidationPlan = ValidationPlan.from_json_dict(
+        json.loads(json.dumps(validation_plan.to_json_dict()))
+    )
+
+    assert loaded_plan.key == validation_plan.key
+    assert loaded_plan.batch_id == "batch_0"
+    assert loaded_plan.graphs[1] is None
+    assert loaded_plan.graphs[0].edge_ids == validation_plan.graphs[0].edge_ids
+    assert loaded_plan.bind(batch_id="batch_1")[0].edge_ids == (
+        validation_plan.bind(batch_id="batch_1")[0].edge_ids
+    )
+
+
+def test_validation_plan_key_ignores_batch_id_and_depends_on_schema():
+    def _key(batch_id: str, column_type: str) -> str:
+        return ValidationPlan.build_key(
+            configurations=[
+                ExpectationConfiguration(
+                    expectation_type="expect_column_max_to_be_between",
+                    kwargs={"column": "a", "min_value": 0, "batch_id": batch_id},
+                )
+            ],
+            runtime_configuration={"result_format": "BASIC"},
+            execution_engine_type="PandasExecutionEngine",
+            column_schema=[{"name": "a", "type": column_type}],
+        )
+
+    assert _key(batch_id="batch_0", column_type="int64") == _key(
+        batch_id="batch_1", column_type="int64"
+    )
+    assert _key(batch_id="batch_0", column_type="int64") != _key(
+        batch_id="batch_0", column_type="float64"
+    )
+
+
+def test_validation_plan_cache_evicts_least_recently_used_plan():
+    validation_plan_cache = ValidationPlanCache(max_size=2)
+    validation_plan_cache.put(plan=_build_validation_plan(key="a"))
+    validation_plan_cache.put(plan=_build_validation_plan(key="b"))
+
+    assert validation_plan_cache.get(key="a") is not None
+
+    validation_plan_cache.put(plan=_build_validation_plan(key="c"))
+
+    assert len(validation_plan_cache) == 2
+    assert "a" in validation_plan_cache
+    assert "b" not in validation_plan_cache
+    assert validation_plan_cache.get(key="b") is None
+
+
+def test_validation_plan_cache_evicts_plans_when_max_size_is_lowered():
+    validation_plan_cache = ValidationPlanCache()
+    assert validation_plan_cache.max_size == ValidationPlanCache.DEFAULT_MAX_SIZE
+    for key in ("a", "b", "c"):
+        validation_plan_cache.put(plan=_build_validation_plan(key=key))
+
+    validation_plan_cache.max_size = 1
+
+    assert len(validation_plan_cache) == 1
+    assert "c" in validation_plan_cache
@@ -1,3 +1,4 @@
+import copy
 import os
 import shutil
 from typing import Any, Dict, List, Set, Tuple, Union
@@ -22,7 +23,13 @@ from great_expectations.core.expectation_configuration import ExpectationConfigu
 from great_expectations.core.expectation_validation_result import (
     ExpectationValidationResult,
 )
-from great_expectations.data_context.types.base import ProgressBarsConfig
+from great_expectations.core.sketches import HyperLogLog
+from great_expectations.data_context import BaseDataContext
+from great_expectations.data_context.types.base import (
+    DataContextConfig,
+    InMemoryStoreBackendDefaults,
+    ProgressBarsConfig,
+)
 from great_expectations.data_context.util import file_relative_path
 from great_expectations.datasource.data_connector.batch_filter import (
     BatchFilter,
@@ -37,6 +44,7 @@ from great_expectations.render.types import RenderedAtomicContent
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
 from great_expectations.validator.validation_graph import ValidationGraph
+from great_expectations.validator.validation_plan import validation_plan_cache
 from great_expectations.validator.validator import (
     MAX_METRIC_COMPUTATION_RETRIES,
     Validator,
@@ -208,6 +216,44 @@ def test_parse_validation_graph_with_bad_metrics_args():
     assert len(ready_metrics) == 2 and len(needed_metrics) == 9
 
 
+def test_metric_vertices_are_shared_only_within_a_validator():
+    engine = PandasExecutionEngine()
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a"},
+    )
+
+    def _build_graph(validator: Validator) -> ValidationGraph:
+        graph = ValidationGraph()
+        validator.build_metric_dependency_graph(
+            graph=graph,
+            execution_engine=engine,
+            metric_configuration=copy.copy(metric_configuration),
+        )
+        return graph
+
+    def _vertices(graph: ValidationGraph) -> Dict[Tuple[str, str, str], Any]:
+        return {
+            vertex.id: vertex
+            for edge in graph.edges
+            for vertex in (edge.left, edge.right)
+            if vertex is not None
+        }
+
+    validator = Validator(execution_engine=engine)
+    vertices = _vertices(_build_graph(validator))
+    assert (
+        _vertices(_build_graph(validator))[metric_configuration.id]
+        is vertices[metric_configuration.id]
+    )
+    assert (
+        _vertices(_build_graph(Validator(execution_engine=engine)))[
+            metric_configuration.id
+        ]
+        is not vertices[metric_configuration.id]
+    )
+
+
 def test_populate_dependencies():
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, 6]})
     expectation_configuration = ExpectationConfiguration(
@@ -341,6 +387,195 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+def test_graph_validate_with_cached_validation_plan(basic_datasource):
+    expectation_configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={
+                "column": "b",
+                "mostly": 0.9,
+                "threshold": 4,
+                "double_sided": True,
+            },
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 20},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_kl_divergence_to_be_less_than",
+            kwargs={"column": "a", "partition_object": None, "threshold": 0.1},
+        ),
+    ]
+
+    validation_plan_cache.clear()
+
+    stage: int
+    batch_results: List[List[ExpectationValidationResult]] = []
+    with mock.patch.object(
+        Validator,
+        "_compile_validation_plan",
+        side_effect=Validator._compile_validation_plan,
+        autospec=True,
+    ) as mock_compile_validation_plan:
+        for stage, df in enumerate(
+            [
+                pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]}),
+                pd.DataFrame({"a": [1, 5, 2, 3, 5, 10], "b": [1, 2, 3, 4, None, 6]}),
+            ]
+        ):
+            batch = basic_datasource.get_single_batch_from_batch_request(
+                RuntimeBatchRequest(
+                    **{
+                        "datasource_name": "my_datasource",
+                        "data_connector_name": "test_runtime_data_connector",
+                        "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                        "runtime_parameters": {
+                            "batch_data": df,
+                        },
+                        "batch_identifiers": {
+                            "pipeline_stage_name": stage,
+                            "airflow_run_id": 0,
+                            "custom_key_0": 0,
+                        },
+                    }
+                )
+            )
+            expected_results: List[ExpectationValidationResult] = Validator(
+                execution_engine=PandasExecutionEngine(), batches=[batch]
+            ).graph_validate(configurations=expectation_configurations)
+            results: List[ExpectationValidationResult] = Validator(
+                execution_engine=PandasExecutionEngine(),
+                batches=[batch],
+                cache_validation_plans=True,
+            ).graph_validate(configurations=expectation_configurations)
+
+            assert results == expected_results
+            batch_results.append(results)
+
+    # The plan is compiled for the first batch only, and re-bound to the second one.
+    assert mock_compile_validation_plan.call_count == 1
+    assert len(validation_plan_cache) == 1
+    assert [result.success for result in batch_results[0]][:2] == [True, False]
+    assert [result.success for result in batch_results[1]][:2] == [True, True]
+
+
+def test_graph_validate_resolves_column_schema_for_validation_plan_once_per_batch():
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]}))],
+        cache_validation_plans=True,
+    )
+    expectation_configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 0, "max_value": 50},
+        )
+    ]
+    validation_plan_cache.clear()
+
+    column_types_resolutions: List[int] = []
+    for _ in range(3):
+        with mock.patch.object(
+            validator.execution_engine,
+            "resolve_metrics",
+            wraps=validator.execution_engine.resolve_metrics,
+        ) as mock_resolve_metrics:
+            (result,) = validator.graph_validate(
+                configurations=expectation_configurations
+            )
+        assert result.success
+        column_types_resolutions.append(
+            sum(
+                metric_configuration.metric_name == "table.column_types"
+                for call in mock_resolve_metrics.call_args_list
+                for metric_configuration in call.kwargs["metrics_to_resolve"]
+            )
+        )
+
+    # Only the first validation resolves the column schema of the batch for the key of the validation plan.
+    first_resolutions, *later_resolutions = column_types_resolutions
+    assert later_resolutions == [first_resolutions - 1] * 2
+    assert len(validation_plan_cache) == 1
+
+
+def test_graph_validate_reuses_metrics_persisted_in_batch_metrics_store(
+    basic_datasource,
+):
+    store_backend_defaults = InMemoryStoreBackendDefaults()
+    stores: dict = store_backend_defaults.stores
+    stores["batch_metrics_store"] = {"class_name": "BatchMetricsStore"}
+    context = BaseDataContext(
+        project_config=DataContextConfig(
+            stores=stores,
+            batch_metrics_store_name="batch_metrics_store",
+            store_backend_defaults=store_backend_defaults,
+        )
+    )
+    batch_metrics_store = context.batch_metrics_store
+
+    def _validate(
+        run: int, expectation_configurations: List[ExpectationConfiguration]
+    ) -> List[ExpectationValidationResult]:
+        # Every run loads the same data as a new batch into a new Validator (and ExecutionEngine).
+        batch = basic_datasource.get_single_batch_from_batch_request(
+            RuntimeBatchRequest(
+                **{
+                    "datasource_name": "my_datasource",
+                    "data_connector_name": "test_runtime_data_connector",
+                    "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                    "runtime_parameters": {
+                        "batch_data": pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]}),
+                    },
+                    "batch_identifiers": {
+                        "pipeline_stage_name": run,
+                        "airflow_run_id": 0,
+                        "custom_key_0": 0,
+                    },
+                }
+            )
+        )
+        validator = Validator(
+            execution_engine=PandasExecutionEngine(),
+            data_context=context,
+            batches=[batch],
+        )
+        assert validator.execution_engine.batch_metrics_store is batch_metrics_store
+        return validator.graph_validate(configurations=expectation_configurations)
+
+    column_max_expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_max_to_be_between",
+        kwargs={"column": "a", "min_value": 0, "max_value": 50},
+    )
+    results: List[ExpectationValidationResult] = _validate(
+        run=0, expectation_configurations=[column_max_expectation_configuration]
+    )
+    assert results[0].result["observed_value"] == 22
+
+    # Replace the persisted value, in order to verify that re-validating the same data does not compute it again.
+    column_max_keys: list = [
+        key
+        for key in batch_metrics_store.list_keys()
+        if key.metric_name == "column.max"
+    ]
+    assert len(column_max_keys) == 1
+    batch_metrics_store.set(column_max_keys[0], 100)
+
+    results = _validate(
+        run=1,
+        expectation_configurations=[
+            column_max_expectation_configuration,
+            ExpectationConfiguration(
+                expectation_type="expect_column_min_to_be_between",
+                kwargs={"column": "a", "min_value": 0, "max_value": 50},
+            ),
+        ],
+    )
+    assert results[0].result["observed_value"] == 100
+    assert not results[0].success
+    assert results[1].result["observed_value"] == 1
+
+
 def test_graph_validate_with_exception(basic_datasource):
     def mock_error(*args, **kwargs):
         raise Exception("Mock Error")
@@ -1298,3 +1533,53 @@ def test_validator_include_rendered_content_evaluation_parameters(
         ]
         == 8000
     )
+
+
+def test_graph_validate_records_metric_approximation_details(basic_datasource):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": df,
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": 0,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_unique_value_count_to_be_between",
+            kwargs={"column": "a", "min_value": 4, "max_value": 6},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "a", "min_value": 20, "max_value": 30},
+        ),
+    ]
+    results = Validator(
+        execution_engine=PandasExecutionEngine(approximate_metrics=True),
+        batches=[batch],
+    ).graph_validate(configurations=expectation_configurations)
+
+    assert all(result.success for result in results)
+    assert results[0].result == {
+        "observed_value": 5,
+        "details": {
+            "approximation": {
+                "method": "HyperLogLog",
+                "error_bound": HyperLogLog.get_relative_error(),
+            }
+        },
+    }
+    # Metrics, which are not approximated, are reported as before.
+    assert results[1].result == {"observed_value": 22}